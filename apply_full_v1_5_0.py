@@ -3,9 +3,12 @@
 Apply the complete v1.5.0 specification with all new endpoints and schemas
 """
 
-import json
+import copy
 import sys
 
+from spec_backup_store import BackupStore
+from spec_pipeline import SPEC_PATH, SpecPipeline, Stage
+
 # The complete v1.5.0 spec provided by the user (converted to 3.0.3)
 v1_5_0_spec = {
   "openapi": "3.0.3",
@@ -107,23 +110,27 @@ v1_5_0_spec = {
   ]
 }
 
+def apply_base(base):
+    """Stage: replace everything but paths and components with base"""
+    def apply(spec):
+        updated = copy.deepcopy(base)
+        updated["paths"] = spec.get("paths", {})
+        updated["components"] = spec.get("components", {})
+        if updated == spec:
+            return None
+        spec.clear()
+        spec.update(updated)
+        return f"Applied the v{base['info']['version']} base (info, servers, tags)"
+    return Stage("apply_base", apply)
+
 def main():
     try:
-        # Read the current spec to get the paths and components
-        with open('spec.json', 'r') as f:
-            current_spec = json.load(f)
-        
-        # Start with the new v1.5.0 base
-        new_spec = v1_5_0_spec.copy()
-        
-        # Add the existing paths and components (these should be compatible)
-        new_spec["paths"] = current_spec.get("paths", {})
-        new_spec["components"] = current_spec.get("components", {})
-        
-        # Write the complete updated spec
-        with open('spec.json', 'w') as f:
-            json.dump(new_spec, f, indent=2)
+        # One parse of spec.json, the existing paths and components kept, one atomic write
+        result = SpecPipeline([apply_base(v1_5_0_spec)]).run(SPEC_PATH, store=BackupStore())
         
+        if not result['written']:
+            print("ℹ️  spec.json already matches the v1.5.0 base")
+            return True
         print("✅ Successfully applied complete v1.5.0 specification")
         print("✅ Updated title to 'Mining Development Kit API'")
         print("✅ Updated version to 1.5.0")
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Fleet-wide ASIC outlier detection over per-ASIC MetricArray payloads
+- Ingests TelemetryData (hashboards[].asics, level=asic) and HashboardStats
+  (hashboard-stats.asics as AsicStats) for many hashboards into flat arrays
+- Robust baselines per hashboard and per hashboard model (median and MAD),
+  computed for every board and model at once (one row sort per metric
+  for boards, one partition per model)
+- Flags weak (low hashrate), hot (high temperature) and erroring ASICs by
+  modified z-score against either baseline, with hb_sn and asic_id for
+  GET /api/v1/hashboards/{hb_sn}/{asic_id}
+- Models come from GET /api/v1/hashboards (HashboardInfo.board)
+- Requires NumPy for analysis (pip install numpy)
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install numpy
+    np = None
+
+# metric -> (side that is bad, label)
+METRICS = {
+    'hashrate': ('low', 'weak'),
+    'temperature': ('high', 'hot'),
+    'error_rate': ('high', 'erroring'),
+}
+# AsicStats field -> (metric, scale to the MetricArray unit)
+ASIC_STATS = {
+    'hashrate_ghs': ('hashrate', 1e-3),
+    'temp_c': ('temperature', 1.0),
+    'error_rate': ('error_rate', 1.0),
+}
+UNIT_SCALE = {'TH/s': 1.0, 'GH/s': 1e-3, 'MH/s': 1e-6}
+UNKNOWN_MODEL = 'unknown'
+
+THRESHOLD = 3.5      # modified z-score (Iglewicz and Hoaglin)
+MAD_SCALE = 0.6745   # MAD of a standard normal
+MIN_ASICS = 8        # fewer values on a board or model give no baseline
+MIN_SPREAD = 0.005   # MAD floor relative to the median, so identical chips don't flag on noise
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError('asic_outliers needs NumPy: pip install numpy')
+
+
+def _number(value):
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else math.nan
+
+
+def _floats(values):
+    """float64 array of JSON numbers, NaN for null and anything else that isn't a number"""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array([_number(value) for value in values], dtype=np.float64)
+
+
+def load_models(hashboards_info):
+    """{hb_sn: board} from a GET /api/v1/hashboards (HashboardsInfo) response"""
+    return {board['hb_sn']: board.get('board') or UNKNOWN_MODEL
+            for board in hashboards_info.get('hashboards-info') or () if board.get('hb_sn')}
+
+
+def grouped_median(values, groups, count, runs=None):
+    """Median per group id in range(count), ignoring NaN; (medians, sizes) with NaN for empty groups
+
+    runs  values per group when the groups are consecutive runs in id order
+          (ASICs of one board); they are then sorted as rows of one padded grid
+    """
+    if runs is not None:
+        runs = np.asarray(runs, dtype=np.int64)
+        grid = np.full((count, max(int(runs.max(initial=0)), 1)), np.nan)
+        grid[np.arange(grid.shape[1]) < runs[:, None]] = values
+        grid.sort(axis=1)  # NaN sorts last
+        sizes = grid.shape[1] - np.isnan(grid).sum(axis=1)
+        rows = np.arange(count)
+        low = grid[rows, np.maximum((sizes - 1) // 2, 0)]
+        high = grid[rows, np.minimum(sizes // 2, grid.shape[1] - 1)]
+        return np.where(sizes > 0, (low + high) / 2, np.nan), sizes
+    # Few, large groups (models): one partition-based median each
+    valid = ~np.isnan(values)
+    values, groups = values[valid], groups[valid]
+    sizes = np.bincount(groups, minlength=count)
+    medians = np.full(count, np.nan)
+    for group in np.flatnonzero(sizes):
+        medians[group] = np.median(values[groups == group])
+    return medians, sizes
+
+
+def robust_z(values, groups, count, min_size=MIN_ASICS, runs=None):
+    """(z, medians, mads) of each value against its group's median and MAD; z is NaN for small groups"""
+    medians, sizes = grouped_median(values, groups, count, runs)
+    mads, _ = grouped_median(np.abs(values - medians[groups]), groups, count, runs)
+    mads = np.fmax(mads, MIN_SPREAD * np.abs(medians))
+    mads[sizes < min_size] = np.nan
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z = MAD_SCALE * (values - medians[groups]) / mads[groups]
+    return z, medians, mads
+
+
+class Outlier:
+    """One flagged ASIC, with both baselines it was measured against"""
+
+    __slots__ = ('miner', 'hb_sn', 'board_index', 'asic_id', 'model', 'metric', 'kind', 'value',
+                 'board_median', 'model_median', 'board_z', 'model_z')
+
+    def __init__(self, miner, hb_sn, board_index, asic_id, model, metric, kind, value,
+                 board_median, model_median, board_z, model_z):
+        self.miner = miner
+        self.hb_sn = hb_sn
+        self.board_index = board_index
+        self.asic_id = asic_id
+        self.model = model
+        self.metric = metric
+        self.kind = kind
+        self.value = value
+        self.board_median = board_median
+        self.model_median = model_median
+        self.board_z = board_z
+        self.model_z = model_z
+
+    @property
+    def path(self):
+        """GET path for the ASIC's AsicStats, or None without a hashboard serial"""
+        return None if self.hb_sn is None else f"/api/v1/hashboards/{self.hb_sn}/{self.asic_id}"
+
+    @property
+    def severity(self):
+        return max(abs(z) for z in (self.board_z, self.model_z) if not math.isnan(z))
+
+    def to_dict(self):
+        result = {name: getattr(self, name) for name in self.__slots__}
+        for name in ('value', 'board_median', 'model_median', 'board_z', 'model_z'):
+            result[name] = None if math.isnan(result[name]) else round(result[name], 4)
+        result['path'] = self.path
+        return result
+
+
+class Analysis:
+    """Baselines and outliers for one AsicBatch
+
+    boards        (miner, hb_sn, index, model) per board id
+    models        model name per model id
+    board_median  {metric: float64 (boards,)}, likewise board_mad, model_median, model_mad
+    """
+
+    __slots__ = ('boards', 'models', 'board_median', 'board_mad', 'model_median', 'model_mad', 'outliers',
+                 'asics')
+
+    def __init__(self, boards, models):
+        self.boards = boards
+        self.models = models
+        self.board_median, self.board_mad, self.model_median, self.model_mad = {}, {}, {}, {}
+        self.outliers = []
+        self.asics = 0
+
+
+class AsicBatch:
+    """Per-ASIC values for many hashboards, kept as flat lists until analysis"""
+
+    def __init__(self, models=None):
+        self.models = dict(models or {})
+        self.boards = []
+        self._values = {metric: [] for metric in METRICS}
+        self._ids = {metric: [] for metric in METRICS}
+        self._counts = {metric: [] for metric in METRICS}
+        self._scales = {metric: [] for metric in METRICS}
+
+    def __len__(self):
+        return len(self.boards)
+
+    def _board(self, miner, hb_sn, index, model):
+        self.boards.append((miner, hb_sn, index, model or self.models.get(hb_sn) or UNKNOWN_MODEL))
+        for metric in METRICS:
+            self._counts[metric].append(0)
+            self._scales[metric].append(1.0)
+
+    def add_telemetry(self, miner, telemetry):
+        """Add every hashboard with ASIC data from a TelemetryData body; returns boards added"""
+        added = 0
+        for board in telemetry.get('hashboards') or ():
+            asics = board.get('asics') if isinstance(board, dict) else None
+            if not isinstance(asics, dict):
+                continue
+            self._board(miner, board.get('serial_number'), board.get('index'), None)
+            for metric in METRICS:
+                array = asics.get(metric)
+                if isinstance(array, dict) and isinstance(array.get('values'), list):
+                    values = array['values']
+                    # Raw values: conversion and unit scaling happen once, vectorized, in analyze()
+                    self._values[metric] += values
+                    self._ids[metric] += range(len(values))
+                    self._counts[metric][-1] = len(values)
+                    if metric == 'hashrate':
+                        self._scales[metric][-1] = UNIT_SCALE.get(array.get('unit'), 1.0)
+            added += 1
+        return added
+
+    def add_hashboard_stats(self, miner, stats, model=None):
+        """Add one GET /api/v1/hashboards/{hb_sn} (HashboardStats) body; returns boards added"""
+        stats = stats.get('hashboard-stats', stats)
+        asics = [asic for asic in stats.get('asics') or () if isinstance(asic, dict)]
+        if not asics:
+            return 0
+        self._board(miner, stats.get('hb_sn'), stats.get('slot'), model)
+        ids = [asic.get('index', position) for position, asic in enumerate(asics)]
+        for field, (metric, scale) in ASIC_STATS.items():
+            if any(field in asic for asic in asics):
+                self._values[metric] += [asic.get(field) for asic in asics]
+                self._ids[metric] += ids
+                self._counts[metric][-1] = len(asics)
+                self._scales[metric][-1] = scale
+        return 1
+
+    def analyze(self, threshold=THRESHOLD, min_asics=MIN_ASICS):
+        """Per-board and per-model baselines for every metric, and the ASICs beyond threshold"""
+        _require_numpy()
+        names = sorted({board[3] for board in self.boards})
+        model_ids = {name: position for position, name in enumerate(names)}
+        board_models = np.array([model_ids[board[3]] for board in self.boards], dtype=np.int64)
+        analysis = Analysis(self.boards, names)
+        found = []
+        for metric, (side, kind) in METRICS.items():
+            values = _floats(self._values[metric])
+            if not len(values):
+                continue
+            analysis.asics = max(analysis.asics, len(values))
+            runs = self._counts[metric]
+            boards = np.repeat(np.arange(len(self.boards)), runs)
+            values *= np.array(self._scales[metric])[boards]
+            models = board_models[boards]
+            board_z, analysis.board_median[metric], analysis.board_mad[metric] = robust_z(
+                values, boards, len(self.boards), min_asics, runs)
+            model_z, analysis.model_median[metric], analysis.model_mad[metric] = robust_z(
+                values, models, len(names), min_asics)
+            with np.errstate(invalid='ignore'):
+                if side == 'low':
+                    flagged = (board_z < -threshold) | (model_z < -threshold)
+                else:
+                    flagged = (board_z > threshold) | (model_z > threshold)
+            ids = self._ids[metric]
+            board_medians, model_medians = analysis.board_median[metric], analysis.model_median[metric]
+            for row in np.flatnonzero(flagged).tolist():
+                board = int(boards[row])
+                miner, hb_sn, index, model = self.boards[board]
+                found.append(Outlier(miner, hb_sn, index, ids[row], model, metric, kind, float(values[row]),
+                                     float(board_medians[board]), float(model_medians[model_ids[model]]),
+                                     float(board_z[row]), float(model_z[row])))
+        found.sort(key=lambda outlier: -outlier.severity)
+        analysis.outliers = found
+        return analysis
+
+
+def drill_down(client, outliers):
+    """[(outlier, AsicStats or None)] via GET /api/v1/hashboards/{hb_sn}/{asic_id} on one miner's Client"""
+    results = []
+    for outlier in outliers:
+        response = client.get_asic_status(outlier.hb_sn, outlier.asic_id) if outlier.hb_sn is not None else None
+        results.append((outlier, response.asic_stats if response is not None else None))
+    return results
+
+
+# -- benchmark -------------------------------------------------------------
+
+def synthetic_fleet(miners=10_000, hashboards=3, asics=126, weak=0.001, hot=0.001, hot_boards=0.002, seed=11):
+    """(TelemetryData bodies per miner URL, {hb_sn: model}, planted {(hb_sn, asic_id, metric)})"""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    # Each model runs at its own hashrate per chip and temperature
+    specs = {'B3a': (0.26, 72.0), 'B3b': (0.29, 75.0), 'B4': (0.34, 78.0)}
+    names = list(specs)
+    boards = miners * hashboards
+    board_models = rng.integers(0, len(names), boards)
+    base = np.array([specs[name] for name in names])[board_models]
+    hashrate = base[:, :1] * rng.normal(1.0, 0.02, (boards, asics))
+    temperature = base[:, 1:] + rng.normal(0.0, 1.5, (boards, asics)) + rng.normal(0.0, 1.0, (boards, 1))
+    planted = set()
+    serials = [f"HB{board:08d}" for board in range(boards)]
+    for board, asic in zip(*np.nonzero(rng.random((boards, asics)) < weak)):
+        hashrate[board, asic] *= rng.uniform(0.0, 0.6)
+        planted.add((serials[board], int(asic), 'hashrate'))
+    for board, asic in zip(*np.nonzero(rng.random((boards, asics)) < hot)):
+        temperature[board, asic] += rng.uniform(10.0, 25.0)
+        planted.add((serials[board], int(asic), 'temperature'))
+    # Whole boards running hot only stand out against their model's baseline
+    for board in np.flatnonzero(rng.random(boards) < hot_boards):
+        temperature[board] += 15.0
+        planted.update((serials[board], asic, 'temperature') for asic in range(asics))
+    hashrate, temperature = np.round(hashrate, 4).tolist(), np.round(temperature, 2).tolist()
+    fleet = {}
+    for miner in range(miners):
+        fleet[f"http://10.{miner // 65536}.{miner // 256 % 256}.{miner % 256}"] = {
+            'timestamp': '2024-01-15T14:30:00Z',
+            'hashboards': [{'index': index, 'serial_number': serials[board],
+                            'asics': {'hashrate': {'unit': 'TH/s', 'values': hashrate[board]},
+                                      'temperature': {'unit': '°C', 'values': temperature[board]}}}
+                           for index, board in enumerate(range(miner * hashboards, (miner + 1) * hashboards))],
+        }
+    models = {serial: names[model] for serial, model in zip(serials, board_models.tolist())}
+    return fleet, models, planted
+
+
+def _python_baselines(fleet, models):
+    """statistics.median/MAD per board and per model in plain Python, as the fleet scripts do today"""
+    flagged = 0
+    for metric, (side, _) in METRICS.items():
+        boards, by_model = [], {}
+        for telemetry in fleet:
+            for board in telemetry['hashboards']:
+                values = (board['asics'].get(metric) or {}).get('values')
+                if values:
+                    boards.append(values)
+                    by_model.setdefault(models.get(board.get('serial_number'), UNKNOWN_MODEL), []).extend(values)
+        baselines = []
+        for values in boards + list(by_model.values()):
+            median = statistics.median(values)
+            mad = max(statistics.median([abs(value - median) for value in values]), MIN_SPREAD * abs(median))
+            baselines.append((median, mad))
+        for values, (median, mad) in zip(boards, baselines):
+            for value in values:
+                z = MAD_SCALE * (value - median) / mad
+                flagged += z < -THRESHOLD if side == 'low' else z > THRESHOLD
+    return flagged
+
+
+def benchmark(miners=10_000):
+    _require_numpy()
+    fleet, models, planted = synthetic_fleet(miners)
+    start = time.perf_counter()
+    batch = AsicBatch(models)
+    for miner, telemetry in fleet.items():
+        batch.add_telemetry(miner, telemetry)
+    ingest = time.perf_counter() - start
+    start = time.perf_counter()
+    analysis = batch.analyze()
+    analyze = time.perf_counter() - start
+    flagged = {(outlier.hb_sn, outlier.asic_id, outlier.metric) for outlier in analysis.outliers}
+
+    start = time.perf_counter()
+    _python_baselines(fleet.values(), models)
+    python = time.perf_counter() - start
+    return {
+        'miners': miners, 'boards': len(batch), 'asics': analysis.asics,
+        'values': sum(len(values) for values in batch._values.values()),
+        'ingest_s': ingest, 'analyze_s': analyze, 'python_s': python,
+        'planted': len(planted), 'found': len(planted & flagged), 'extra': len(flagged - planted),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('records', nargs='*', help='telemetry_poller -o output (JSON lines with level=asic telemetry)')
+    parser.add_argument('--stats', nargs='*', default=[],
+                        help='HashboardStats JSON files, each {"miner": ..., "model": ..., "stats": {...}} or a bare body')
+    parser.add_argument('--models', help='{hb_sn: model} JSON, or a GET /api/v1/hashboards response')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='modified z-score to flag at')
+    parser.add_argument('--top', type=int, default=20, help='outliers to print')
+    parser.add_argument('-o', '--output', help='write every outlier as JSON lines')
+    parser.add_argument('--benchmark', action='store_true', help='detect planted outliers in a synthetic fleet')
+    parser.add_argument('--miners', type=int, default=10_000, help='synthetic miners for --benchmark')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.miners)
+        print(f"📊 {result['miners']:,} miners, {result['boards']:,} hashboards, {result['asics']:,} ASICs "
+              f"({result['values']:,} values)")
+        print(f"   - ingest:   {result['ingest_s']:.2f} s ({result['boards'] / result['ingest_s']:,.0f} boards/s)")
+        print(f"   - analyze:  {result['analyze_s']:.2f} s for board and model baselines of every metric "
+              f"({result['values'] / result['analyze_s'] / 1e6:.1f}M values/s)")
+        print(f"   - Python statistics.median per board and model: {result['python_s']:.1f} s "
+              f"({result['python_s'] / result['analyze_s']:.0f}x slower)")
+        print(f"✅ {result['found']:,} of {result['planted']:,} planted outliers flagged, "
+              f"{result['extra']:,} other ASICs beyond the threshold")
+        return True
+
+    if not args.records and not args.stats:
+        parser.error('telemetry records, --stats files or --benchmark is required')
+    models = {}
+    if args.models:
+        with open(args.models, encoding='utf-8') as f:
+            models = json.load(f)
+        if 'hashboards-info' in models:
+            models = load_models(models)
+    batch = AsicBatch(models)
+    for path in args.records:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line) if line.strip() else None
+                if record and record.get('telemetry'):
+                    batch.add_telemetry(record['miner'], record['telemetry'])
+    for path in args.stats:
+        with open(path, encoding='utf-8') as f:
+            document = json.load(f)
+        if 'stats' in document:
+            batch.add_hashboard_stats(document.get('miner'), document['stats'], document.get('model'))
+        else:
+            batch.add_hashboard_stats(None, document)
+
+    analysis = batch.analyze(args.threshold)
+    print(f"📊 {len(batch):,} hashboards across {len(analysis.models)} models "
+          f"({', '.join(analysis.models)}), {analysis.asics:,} ASICs")
+    for outlier in analysis.outliers[:args.top]:
+        print(f"   - {outlier.kind:<8} {outlier.miner} {outlier.path or outlier.board_index}: {outlier.metric} "
+              f"{outlier.value:g} (board {outlier.board_median:g}, {outlier.model} {outlier.model_median:g}, "
+              f"z {outlier.board_z:+.1f}/{outlier.model_z:+.1f})")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for outlier in analysis.outliers:
+                f.write(json.dumps(outlier.to_dict(), ensure_ascii=False) + '\n')
+        print(f"✅ Wrote {len(analysis.outliers):,} outliers to {args.output}")
+    else:
+        print(f"{'⚠️ ' if analysis.outliers else '✅'} {len(analysis.outliers):,} outlier ASICs")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Generate proto_client.py, typed blocking and asyncio clients for spec.json
+- One __slots__ model class per object schema (named components and inline
+  objects), decoded straight from the parsed JSON by generated code
+- Client and AsyncClient with one method per operation, on the kept-alive
+  per-miner transports in proto_http.py
+- --benchmark measures requests/s and client CPU per request against a
+  local stub server
+"""
+
+import argparse
+import asyncio
+import json
+import keyword
+import multiprocessing
+import re
+import statistics
+import sys
+import textwrap
+import time
+import urllib.request
+from pathlib import Path
+
+from spec_pipeline import SPEC_PATH, load_spec, write_spec_atomic
+from spec_refs import RefGraph, operations
+
+CLIENT_PATH = Path(__file__).parent / 'proto_client.py'
+JSON_TYPES = {'string': 'str', 'integer': 'int', 'number': 'float', 'boolean': 'bool'}
+
+
+def identifier(name):
+    """A valid Python identifier for a JSON key"""
+    name = re.sub(r'\W', '_', name)
+    if name[:1].isdigit():
+        name = f"_{name}"
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def snake_case(name):
+    name = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name)
+    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
+    return identifier(name.lower())
+
+
+def camel_case(name):
+    return ''.join(part[:1].upper() + part[1:] for part in re.split(r'[\W_]+', name) if part)
+
+
+def _docstring(text, indent, width=96):
+    text = ' '.join((text or '').split()).replace('\\', '\\\\').replace('"""', "'''")
+    if not text:
+        return None
+    if len(indent) + len(text) + 6 <= width:
+        return f'{indent}"""{text}"""'
+    body = textwrap.fill(text, width, initial_indent=indent, subsequent_indent=indent)
+    return f'{indent}"""\n{body}\n{indent}"""'
+
+
+def _tuple(name, items, indent='    ', width=96):
+    line = f"{indent}{name} = {tuple(items)!r}"
+    if len(line) <= width:
+        return line
+    body = textwrap.fill(', '.join(map(repr, items)) + ',', width, initial_indent=indent * 2,
+                         subsequent_indent=indent * 2, break_long_words=False)
+    return f"{indent}{name} = (\n{body}\n{indent})"
+
+
+class ClientGenerator:
+    """Turns one parsed spec into the source of proto_client.py"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.graph = RefGraph(spec)
+        self.schemas = spec.get('components', {}).get('schemas', {})
+        self.classes = {}       # class name -> schema
+        self.inline = {}        # id(inline schema) -> class name
+        self.aliases = {}       # schema name -> annotation
+        for name, schema in self.schemas.items():
+            if self._is_model(schema):
+                self.classes[identifier(name)] = schema
+            else:
+                self.aliases[identifier(name)] = None
+        for name, schema in self.schemas.items():
+            if not self._is_model(schema):
+                self.aliases[identifier(name)] = self.annotation(schema, name)
+
+    # -- schema helpers ----------------------------------------------------
+
+    @staticmethod
+    def _is_model(schema):
+        return isinstance(schema, dict) and bool(schema.get('properties'))
+
+    def _target(self, schema):
+        """(schema, component class name or None) with one $ref followed"""
+        ref = schema.get('$ref')
+        if isinstance(ref, str) and ref.startswith('#/components/schemas/'):
+            name = ref.rsplit('/', 1)[-1]
+            return self.graph.resolve(ref), identifier(name)
+        return schema, None
+
+    def _class_for(self, schema, hint):
+        """Class name for an object schema, registering inline ones"""
+        schema, named = self._target(schema)
+        if not self._is_model(schema):
+            return None
+        if named:
+            return named
+        if id(schema) not in self.inline:
+            name = camel_case(hint)
+            base, n = name, 2
+            while name in self.classes or name in self.aliases:
+                name, n = f"{base}{n}", n + 1
+            self.inline[id(schema)] = name
+            self.classes[name] = schema
+        return self.inline[id(schema)]
+
+    def annotation(self, schema, hint):
+        target, named = self._target(schema)
+        if named:
+            return named
+        schema = target
+        cls = self._class_for(schema, hint)
+        if cls:
+            return cls
+        kind = schema.get('type')
+        if isinstance(kind, list):
+            kind = next((k for k in kind if k != 'null'), None)
+        if kind == 'array':
+            return f"List[{self.annotation(schema.get('items', {}), hint + 'Item')}]"
+        if kind == 'object' or isinstance(schema.get('additionalProperties'), dict):
+            extra = schema.get('additionalProperties')
+            if isinstance(extra, dict):
+                return f"Dict[str, {self.annotation(extra, hint + 'Value')}]"
+            return 'Dict[str, Any]'
+        return JSON_TYPES.get(kind, 'Any')
+
+    def decoder(self, schema, value, hint, depth=0):
+        """Expression decoding value per schema, or None when it is plain JSON"""
+        target, _ = self._target(schema)
+        cls = self._class_for(schema, hint)
+        if cls:
+            return f"{cls}.from_dict({value})"
+        if target.get('type') == 'array':
+            item = f"item{depth}"
+            inner = self.decoder(target.get('items', {}), item, hint + 'Item', depth + 1)
+            return f"[{inner} for {item} in {value}]" if inner else None
+        extra = target.get('additionalProperties')
+        if isinstance(extra, dict):
+            key, item = f"key{depth}", f"item{depth}"
+            inner = self.decoder(extra, item, hint + 'Value', depth + 1)
+            return f"{{{key}: {inner} for {key}, {item} in {value}.items()}}" if inner else None
+        return None
+
+    # -- emitters ----------------------------------------------------------
+
+    def emit_class(self, name, schema):
+        properties = schema.get('properties', {})
+        slots = [identifier(key) for key in properties]
+        keys = list(properties)
+        extra = schema.get('additionalProperties')
+        if isinstance(extra, dict) or extra is True:
+            slot = 'extra'
+            while slot in slots:
+                slot += '_'
+            slots.append(slot)
+            keys.append(None)
+
+        lines = [f"class {name}(Model):"]
+        doc = _docstring(schema.get('description'), '    ')
+        if doc:
+            lines += [doc, '']
+        lines.append(_tuple('__slots__', slots))
+        lines.append(_tuple('_keys', keys))
+        lines.append('')
+        body = []
+        for slot, key in zip(slots, keys):
+            if key is None:
+                annotation = (f"Dict[str, {self.annotation(extra, name + 'Value')}]"
+                              if isinstance(extra, dict) else 'Dict[str, Any]')
+                lines.append(f"    {slot}: {annotation}")
+                declared = 'cls._keys'
+                inner = self.decoder(extra, 'item', name + 'Value', 1) if isinstance(extra, dict) else None
+                body.append(f"        self.{slot} = {{key: {inner or 'item'} for key, item in data.items() "
+                            f"if key not in {declared}}}")
+                continue
+            annotation = self.annotation(properties[key], name + camel_case(key))
+            lines.append(f"    {slot}: Optional[{annotation}]")
+            decode = self.decoder(properties[key], 'value', name + camel_case(key))
+            if decode:
+                body.append(f"        value = get({key!r})")
+                body.append(f"        self.{slot} = None if value is None else {decode}")
+            else:
+                body.append(f"        self.{slot} = get({key!r})")
+        lines += [
+            '',
+            '    @classmethod',
+            f"    def from_dict(cls, data) -> '{name}':",
+            '        self = cls.__new__(cls)',
+            '        get = data.get',
+            *body,
+            '        return self',
+        ]
+        return '\n'.join(lines)
+
+    def _parameters(self, path_item, operation):
+        params = {}
+        for param in list(path_item.get('parameters', [])) + list(operation.get('parameters', [])):
+            if '$ref' in param:
+                param = self.graph.resolve(param['$ref'])
+            params[(param['name'], param['in'])] = param
+        return list(params.values())
+
+    def emit_method(self, op_id, method, path, operation, path_item, is_async):
+        name = snake_case(operation.get('operationId') or f"{method}_{path}")
+        params = self._parameters(path_item, operation)
+        path_params = [p for p in params if p['in'] == 'path']
+        query_params = [p for p in params if p['in'] == 'query']
+
+        args = ['self']
+        for p in path_params:
+            args.append(f"{identifier(p['name'])}: {self.annotation(p.get('schema', {}), 'Param')}")
+        request_call = [repr(method.upper())]
+        path_expr = path
+        for p in path_params:
+            path_expr = path_expr.replace('{' + p['name'] + '}',
+                                          '{quote(str(' + identifier(p['name']) + "), safe='')}")
+        request_call.append(f"f{path_expr!r}" if path_params else repr(path))
+
+        body_args = []
+        content = operation.get('requestBody', {}).get('content', {})
+        keyword_args = []
+        if 'application/json' in content:
+            schema = content['application/json'].get('schema', {})
+            required = operation['requestBody'].get('required', False)
+            annotation = self.annotation(schema, camel_case(name) + 'Body')
+            if required:
+                args.append(f"body: {annotation}")
+            else:
+                keyword_args.append(f"body: Optional[{annotation}] = None")
+            body_args.append('body=body')
+        elif 'multipart/form-data' in content:
+            schema = content['multipart/form-data'].get('schema', {})
+            fields = []
+            for field, sub in schema.get('properties', {}).items():
+                kind = 'Upload' if sub.get('format') == 'binary' else self.annotation(sub, 'Field')
+                if field in schema.get('required', []):
+                    args.append(f"{identifier(field)}: {kind}")
+                else:
+                    keyword_args.append(f"{identifier(field)}: Optional[{kind}] = None")
+                fields.append(f"{field!r}: {identifier(field)}")
+            body_args.append(f"files={{{', '.join(fields)}}}")
+
+        if query_params:
+            keyword_args += [f"{identifier(p['name'])}: Optional[{self.annotation(p.get('schema', {}), 'Param')}] = None"
+                             for p in query_params]
+            query = ', '.join(f"{p['name']!r}: {identifier(p['name'])}" for p in query_params)
+            body_args.insert(0, f"query={{{query}}}")
+        if keyword_args:
+            args += ['*'] + keyword_args
+
+        returns, decode = 'None', None
+        for status, response in operation.get('responses', {}).items():
+            if not status.startswith('2') or '$ref' in response:
+                continue
+            schema = response.get('content', {}).get('application/json', {}).get('schema')
+            if schema is not None:
+                returns = f"Optional[{self.annotation(schema, camel_case(name) + 'Response')}]"
+                decode = self.decoder(schema, 'data', camel_case(name) + 'Response')
+                break
+
+        signature = ', '.join(args)
+        prefix = 'async def' if is_async else 'def'
+        call = f"{'await ' if is_async else ''}self.transport.request({', '.join(request_call + body_args)})"
+        lines = [f"    {prefix} {name}({signature}) -> {returns}:"]
+        summary = operation.get('summary') or operation.get('description') or ''
+        lines.append(_docstring(f"{op_id}: {summary}" if summary else op_id, '        '))
+        if decode:
+            lines.append(f"        data = {call}")
+            lines.append(f"        return None if data is None else {decode}")
+        elif returns == 'None':
+            lines.append(f"        {call}")
+        else:
+            lines.append(f"        return {call}")
+        return '\n'.join(lines)
+
+    def emit_client(self, is_async):
+        name = 'AsyncClient' if is_async else 'Client'
+        transport = 'AsyncTransport' if is_async else 'Transport'
+        if is_async:
+            head = [
+                f"class {name}:",
+                '    """asyncio client for one miner, keeping up to max_connections alive"""',
+                '',
+                '    def __init__(self, base_url=DEFAULT_SERVER, auth=None, timeout=DEFAULT_TIMEOUT, max_connections=4,',
+                '                 scheduler=None):',
+                f"        self.transport = {transport}(base_url, auth, timeout, max_connections, scheduler)",
+                '',
+                '    async def close(self):',
+                '        await self.transport.close()',
+                '',
+                '    async def __aenter__(self):',
+                '        return self',
+                '',
+                '    async def __aexit__(self, *exc):',
+                '        await self.close()',
+            ]
+        else:
+            head = [
+                f"class {name}:",
+                '    """Blocking client for one miner over a single kept-alive connection"""',
+                '',
+                '    def __init__(self, base_url=DEFAULT_SERVER, auth=None, timeout=DEFAULT_TIMEOUT):',
+                f"        self.transport = {transport}(base_url, auth, timeout)",
+                '',
+                '    def close(self):',
+                '        self.transport.close()',
+                '',
+                '    def __enter__(self):',
+                '        return self',
+                '',
+                '    def __exit__(self, *exc):',
+                '        self.close()',
+            ]
+        methods = [self.emit_method(op_id, method, path, operation, self.spec['paths'][path], is_async)
+                   for op_id, method, path, operation, _ in operations(self.spec)]
+        return '\n'.join(head) + '\n\n' + '\n\n'.join(methods)
+
+    def generate(self):
+        info = self.spec.get('info', {})
+        servers = self.spec.get('servers') or [{'url': 'http://127.0.0.1'}]
+        # Methods first: they register inline request/response classes
+        clients = [self.emit_client(False), self.emit_client(True)]
+        emitted = set()
+        class_sources = []
+        while len(emitted) < len(self.classes):
+            for name, schema in list(self.classes.items()):
+                if name not in emitted:
+                    emitted.add(name)
+                    class_sources.append(self.emit_class(name, schema))
+        # Aliases go after the classes they name; plain ones first
+        aliases = [f"{name} = {annotation}" for name, annotation in
+                   sorted(self.aliases.items(), key=lambda item: '[' in item[1])]
+
+        header = f'''# Generated by build_client.py from spec.json ({info.get('title')} {info.get('version')}).
+# Do not edit; rerun `python3 build_client.py` after updating the spec.
+"""
+Typed clients for the {info.get('title')}
+- Client: blocking, one kept-alive connection per miner
+- AsyncClient: asyncio, a small keep-alive pool per miner
+- Responses are decoded into the __slots__ models below
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+from proto_http import (DEFAULT_TIMEOUT, ApiError, AsyncTransport, BearerAuth, Model, Transport,
+                        Upload)
+
+API_VERSION = {info.get('version')!r}
+DEFAULT_SERVER = {servers[0]['url']!r}
+
+'''
+        sections = [header.rstrip('\n')] + class_sources + ['\n'.join(aliases)] + clients
+        return '\n\n\n'.join(sections) + '\n'
+
+
+def generate_client(spec):
+    return ClientGenerator(spec).generate()
+
+
+# -- benchmark -------------------------------------------------------------
+
+def _largest_example(spec, path, method='get'):
+    content = spec['paths'][path][method]['responses']['200']['content']['application/json']
+    examples = [entry['value'] for entry in content.get('examples', {}).values()]
+    if 'example' in content:
+        examples.append(content['example'])
+    return max(examples, key=lambda value: len(json.dumps(value)))
+
+
+def _serve_stub(ports, body, ready):
+    """Keep-alive HTTP/1.1 server answering every request with body"""
+    response = (b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body)
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                length = re.search(rb'(?i)\r\ncontent-length: *(\d+)', head)
+                if length:
+                    await reader.readexactly(int(length.group(1)))
+                writer.write(response)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        servers = [await asyncio.start_server(handle, '127.0.0.1', port) for port in ports]
+        ready.set()
+        await asyncio.gather(*(server.serve_forever() for server in servers))
+
+    asyncio.run(main())
+
+
+def benchmark(spec_path=SPEC_PATH, miners=50, requests=5000, base_port=18400):
+    """Telemetry calls/s: urllib per request vs. the generated clients"""
+    import proto_client
+
+    spec, _ = load_spec(spec_path)
+    body = json.dumps(_largest_example(spec, '/api/v1/telemetry'), separators=(',', ':')).encode('utf-8')
+    ports = list(range(base_port, base_port + miners))
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=_serve_stub, args=(ports, body, ready), daemon=True)
+    server.start()
+    ready.wait(10)
+    urls = [f"http://127.0.0.1:{port}" for port in ports]
+    level = ['miner', 'hashboard', 'PSU', 'asic']
+    results = {'miners': miners, 'requests': requests, 'body_bytes': len(body)}
+
+    def measure(label, run, count):
+        wall, cpu = time.perf_counter(), time.process_time()
+        run(count)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        results[label] = {'rps': count / wall, 'cpu_us': cpu / count * 1e6}
+
+    def baseline(count):
+        for i in range(count):
+            with urllib.request.urlopen(f"{urls[i % miners]}/api/v1/telemetry?level=miner,hashboard,PSU,asic") as r:
+                json.loads(r.read())
+
+    clients = [proto_client.Client(url) for url in urls]
+
+    def blocking(count):
+        for i in range(count):
+            clients[i % miners].get_current_telemetry(level=level)
+
+    def concurrent(count):
+        async def run():
+            fleet = [proto_client.AsyncClient(url, max_connections=1) for url in urls]
+
+            async def poll(client, n):
+                for _ in range(n):
+                    await client.get_current_telemetry(level=level)
+
+            await asyncio.gather(*(poll(client, count // miners) for client in fleet))
+            for client in fleet:
+                await client.close()
+        asyncio.run(run())
+
+    try:
+        measure('urllib', baseline, max(requests // 5, miners))
+        measure('sync', blocking, requests)
+        measure('async', concurrent, requests - requests % miners)
+        # Decoding alone, to separate it from the transport
+        payload = json.loads(body)
+        samples = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(1000):
+                proto_client.TelemetryData.from_dict(payload)
+            samples.append((time.perf_counter() - start) / 1000)
+        results['decode_us'] = statistics.median(samples) * 1e6
+    finally:
+        for client in clients:
+            client.close()
+        server.terminate()
+        server.join()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--spec', default=str(SPEC_PATH), help='spec file to generate from')
+    parser.add_argument('-o', '--output', default=str(CLIENT_PATH), help='client module to write')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='measure the generated clients against a local stub server')
+    parser.add_argument('--miners', type=int, default=50, help='stub miners for --benchmark')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.spec, miners=args.miners)
+        print(f"📊 GET /api/v1/telemetry, {result['miners']} stub miners, "
+              f"{result['body_bytes']} byte snapshot")
+        for label, name in (('urllib', 'urllib, new connection'), ('sync', 'Client, kept alive'),
+                            ('async', 'AsyncClient, kept alive')):
+            row = result[label]
+            print(f"   - {name:<24} {row['rps']:>7.0f} req/s {row['cpu_us']:>6.0f} µs CPU/request")
+        print(f"   - Model decode:            {result['decode_us']:.1f} µs")
+        per_core = 30 / (result['async']['cpu_us'] / 1e6)
+        print(f"   - One core at one snapshot per 30 s: ~{per_core:,.0f} miners (client side)")
+        return True
+
+    spec, _ = load_spec(args.spec)
+    source = generate_client(spec)
+    compile(source, args.output, 'exec')
+    write_spec_atomic(source, args.output)
+    print(f"✅ Wrote {args.output} for {spec['info'].get('title')} {spec['info'].get('version')}")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Split spec.json into per-tag fragments for the docs page
+- One fragment per tag (Mining, Pools, Telemetry, ...) holding that tag's
+  operations and only the components they reference
+- A small manifest listing the fragments, read by index.html
+- The page downloads the manifest plus the group being viewed
+"""
+
+import argparse
+import gzip
+import json
+import re
+import shutil
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from spec_pipeline import SPEC_PATH, load_spec, write_spec_atomic
+from spec_refs import RefGraph, operations
+
+FRAGMENTS_PATH = Path(__file__).parent / 'fragments'
+MANIFEST_NAME = 'manifest.json'
+UNTAGGED = 'default'
+
+
+def slugify(name):
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def _encode(document):
+    return json.dumps(document, separators=(',', ':'), ensure_ascii=False)
+
+
+def split_spec(spec):
+    """Return (manifest, {file name: fragment}) for a parsed spec"""
+    graph = RefGraph(spec)
+    tag_info = {tag['name']: tag for tag in spec.get('tags', [])}
+
+    grouped = {}
+    for op_id, method, path, operation, shared_params in operations(spec):
+        for tag in operation.get('tags') or [UNTAGGED]:
+            grouped.setdefault(tag, []).append((op_id, method, path, operation, shared_params))
+
+    # Keep the spec's tag order, then any tags only used on operations
+    order = [name for name in tag_info if name in grouped]
+    order += [name for name in grouped if name not in tag_info]
+
+    manifest = {
+        'version': spec.get('info', {}).get('version'),
+        'title': spec.get('info', {}).get('title'),
+        'tags': [],
+    }
+    fragments = {}
+    for tag in order:
+        paths = {}
+        needed = set()
+        for op_id, method, path, operation, shared_params in grouped[tag]:
+            item = paths.setdefault(path, {})
+            if shared_params and 'parameters' not in item:
+                item['parameters'] = shared_params
+            # Each operation is listed under this group only, otherwise
+            # Swagger UI would render empty sections for its other tags
+            tagged = dict(operation, tags=[tag]) if operation.get('tags') else operation
+            item[method] = tagged
+            needed |= graph.dependencies(op_id)
+
+        components = {}
+        for section, entries in spec.get('components', {}).items():
+            if section == 'securitySchemes':
+                components[section] = entries
+                continue
+            kept = {name: node for name, node in entries.items()
+                    if f"#/components/{section}/{name}" in needed}
+            if kept:
+                components[section] = kept
+
+        fragment = {key: value for key, value in spec.items()
+                    if key not in ('tags', 'paths', 'components')}
+        if tag in tag_info:
+            fragment['tags'] = [tag_info[tag]]
+        fragment['paths'] = paths
+        fragment['components'] = components
+
+        file_name = f"{slugify(tag)}.json"
+        fragments[file_name] = fragment
+        manifest['tags'].append({
+            'name': tag,
+            'description': tag_info.get(tag, {}).get('description', ''),
+            'file': file_name,
+            'operations': len(grouped[tag]),
+            'bytes': len(_encode(fragment).encode('utf-8')),
+        })
+    return manifest, fragments
+
+
+def write_fragments(spec, out_dir=FRAGMENTS_PATH):
+    manifest, fragments = split_spec(spec)
+    out_dir = Path(out_dir)
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+    for file_name, fragment in fragments.items():
+        write_spec_atomic(_encode(fragment) + '\n', out_dir / file_name)
+    write_spec_atomic(json.dumps(manifest, indent=2, ensure_ascii=False) + '\n', out_dir / MANIFEST_NAME)
+    return manifest
+
+
+def benchmark(spec_path=SPEC_PATH, repeat=50):
+    """Bytes and parse time for the first render, monolithic vs. fragments"""
+    spec_text = Path(spec_path).read_text(encoding='utf-8')
+    manifest, fragments = split_spec(json.loads(spec_text))
+    manifest_text = json.dumps(manifest, indent=2, ensure_ascii=False)
+    first_text = _encode(fragments[manifest['tags'][0]['file']])
+    largest = max(manifest['tags'], key=lambda entry: entry['bytes'])
+    largest_text = _encode(fragments[largest['file']])
+
+    def size(text):
+        data = text.encode('utf-8')
+        return len(data), len(gzip.compress(data))
+
+    def parse_ms(*texts):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for text in texts:
+                json.loads(text)
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples) * 1000
+
+    return {
+        'tags': len(manifest['tags']),
+        'before': size(spec_text),
+        'before_parse_ms': parse_ms(spec_text),
+        'first_tag': manifest['tags'][0]['name'],
+        'after': tuple(a + b for a, b in zip(size(manifest_text), size(first_text))),
+        'after_parse_ms': parse_ms(manifest_text, first_text),
+        'largest_tag': largest['name'],
+        'largest': tuple(a + b for a, b in zip(size(manifest_text), size(largest_text))),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--spec', default=str(SPEC_PATH), help='spec file to split')
+    parser.add_argument('-o', '--output', default=str(FRAGMENTS_PATH), help='fragments directory')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare first-render bytes and parse time with spec.json')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.spec)
+        print(f"📊 First render, {result['tags']} tag fragments")
+        print(f"   - Before, spec.json:              {result['before'][0]:>7} bytes "
+              f"({result['before'][1]} gzipped), parse {result['before_parse_ms']:.2f} ms")
+        print(f"   - After, manifest + {result['first_tag']:<14} {result['after'][0]:>7} bytes "
+              f"({result['after'][1]} gzipped), parse {result['after_parse_ms']:.2f} ms")
+        print(f"   - Worst case, manifest + {result['largest_tag']}: {result['largest'][0]} bytes "
+              f"({result['largest'][1]} gzipped)")
+        return True
+
+    spec, _ = load_spec(args.spec)
+    manifest = write_fragments(spec, args.output)
+    print(f"✅ Wrote {len(manifest['tags'])} fragments to {args.output}/")
+    for entry in manifest['tags']:
+        print(f"   - {entry['name']:<20} {entry['operations']:>3} operations {entry['bytes']:>7} bytes")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Build search-index.json for the Proto API Assistant (chat-widget.js)
+- Inverted index from lower-cased search keys (path, method, operationId,
+  tag) to operations, so a query scans a few hundred keys instead of
+  every operation
+- Precomputed cURL snippets and resolved schema summaries
+- Loaded lazily by the widget the first time the chat is opened
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from spec_pipeline import SPEC_PATH, load_spec, write_spec_atomic
+from spec_refs import RefGraph, operations
+
+INDEX_PATH = Path(__file__).parent / 'search-index.json'
+CURL_HOST = 'http://miner.local'
+
+
+def curl_snippet(method, path, operation):
+    """The cURL command the widget used to build on every query"""
+    parts = [f"curl -X {method.upper()}", '-H "Content-Type: application/json"']
+    if operation.get('security'):
+        parts.append('-H "Authorization: Bearer <TOKEN>"')
+    example = operation.get('requestBody', {}).get('content', {}).get('application/json', {}).get('example')
+    if example is not None:
+        parts.append(f"-d '{json.dumps(example, separators=(',', ':'), ensure_ascii=False)}'")
+    parts.append(f'"{CURL_HOST}{path}"')
+    return ' '.join(parts)
+
+
+def _ref_name(ref):
+    return ref.rsplit('/', 1)[-1]
+
+
+def type_label(graph, schema):
+    """Short type description for a (possibly $ref) schema"""
+    if '$ref' in schema:
+        target = graph.resolve(schema['$ref'])
+        name = _ref_name(schema['$ref'])
+        if 'enum' in target:
+            return f"{name} (enum: {', '.join(map(str, target['enum']))})"
+        return name
+    for combiner in ('oneOf', 'anyOf', 'allOf'):
+        if combiner in schema:
+            joiner = ' & ' if combiner == 'allOf' else ' | '
+            return joiner.join(type_label(graph, s) for s in schema[combiner])
+    kind = schema.get('type', 'object')
+    if isinstance(kind, list):
+        kind = '|'.join(kind)
+    if kind == 'array':
+        return f"{type_label(graph, schema.get('items', {}))}[]"
+    if 'enum' in schema:
+        return f"{kind} (enum: {', '.join(map(str, schema['enum']))})"
+    if schema.get('format'):
+        return f"{kind} ({schema['format']})"
+    return kind
+
+
+def schema_summary(graph, name, pointer):
+    """Readable one-screen summary of a component schema"""
+    schema = graph.resolve(pointer)
+    lines = [name]
+    if schema.get('description'):
+        lines.append(schema['description'])
+    lines.append(f"Type: {type_label(graph, {k: v for k, v in schema.items() if k != 'properties'})}")
+
+    required = set(schema.get('required', []))
+    properties = schema.get('properties', {})
+    if properties:
+        lines.append('')
+        lines.append('Properties (* = required):')
+        for prop, sub in properties.items():
+            marker = '*' if prop in required else ''
+            lines.append(f"  {prop}{marker}: {type_label(graph, sub)}")
+    extra = schema.get('additionalProperties')
+    if isinstance(extra, dict):
+        lines.append(f"  [any key]: {type_label(graph, extra)}")
+
+    users = graph.used_by(pointer)
+    if users:
+        lines.append('')
+        lines.append(f"Used by: {', '.join(sorted(users))}")
+    return '\n'.join(lines)
+
+
+def build_index(spec):
+    """Return the search index document for a parsed spec"""
+    graph = RefGraph(spec)
+    ops = []
+    keys = {}
+    for _, method, path, operation, _ in operations(spec):
+        position = len(ops)
+        ops.append({
+            'method': method.upper(),
+            'path': path,
+            'operationId': operation.get('operationId', ''),
+            'summary': operation.get('summary', ''),
+            'tags': operation.get('tags', []),
+            'curl': curl_snippet(method, path, operation),
+        })
+        search_keys = [path, method, operation.get('operationId', '')] + operation.get('tags', [])
+        for key in search_keys:
+            if key:
+                postings = keys.setdefault(key.lower(), [])
+                if not postings or postings[-1] != position:
+                    postings.append(position)
+
+    schemas = {
+        name: schema_summary(graph, name, f"#/components/schemas/{name}")
+        for name in spec.get('components', {}).get('schemas', {})
+    }
+    return {
+        'version': spec.get('info', {}).get('version'),
+        'operations': ops,
+        'keys': keys,
+        'schemas': schemas,
+    }
+
+
+def _encode(index):
+    return json.dumps(index, separators=(',', ':'), ensure_ascii=False) + '\n'
+
+
+def _scan_query(spec, term):
+    """Port of the widget's old per-query loop over spec.paths"""
+    results = []
+    for path in spec.get('paths', {}):
+        for method, op in spec['paths'][path].items():
+            if (term == 'all' or term in path.lower() or term in method.lower()
+                    or term in (op.get('operationId') or '').lower()
+                    or any(term in t.lower() for t in op.get('tags', []))):
+                results.append(f"{method.upper()} {path}")
+    return results
+
+
+def _index_query(index, term):
+    """The widget's new lookup: scan the key list, then merge postings"""
+    if term == 'all':
+        hits = range(len(index['operations']))
+    else:
+        hits = sorted({p for key, postings in index['keys'].items() if term in key for p in postings})
+    return [f"{index['operations'][i]['method']} {index['operations'][i]['path']}" for i in hits]
+
+
+def benchmark(spec_path=SPEC_PATH, repeat=200):
+    spec_text = Path(spec_path).read_text(encoding='utf-8')
+    spec = json.loads(spec_text)
+    index = build_index(spec)
+    index_text = _encode(index)
+    terms = ['pools', 'hash', 'system', 'get', 'telemetry', 'psu', 'asic', 'all', 'zzz']
+
+    scan_times = []
+    index_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for term in terms:
+            _scan_query(spec, term)
+        scan_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for term in terms:
+            _index_query(index, term)
+        index_times.append(time.perf_counter() - start)
+    for term in terms:
+        if sorted(_scan_query(spec, term)) != sorted(_index_query(index, term)):
+            raise AssertionError(f"Index and scan disagree for '{term}'")
+
+    return {
+        'spec_bytes': len(spec_text.encode('utf-8')),
+        'spec_gzip_bytes': len(gzip.compress(spec_text.encode('utf-8'))),
+        'index_bytes': len(index_text.encode('utf-8')),
+        'index_gzip_bytes': len(gzip.compress(index_text.encode('utf-8'))),
+        'scan_us': statistics.median(scan_times) / len(terms) * 1e6,
+        'index_us': statistics.median(index_times) / len(terms) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--spec', default=str(SPEC_PATH), help='spec file to index')
+    parser.add_argument('-o', '--output', default=str(INDEX_PATH), help='index file to write')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare query time and bytes against scanning spec.json')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.spec)
+        print("📊 Chat widget search")
+        print(f"   - Page load, before:  {result['spec_bytes']:>7} bytes ({result['spec_gzip_bytes']} gzipped) spec.json")
+        print("   - Page load, after:         0 bytes (index fetched on first open)")
+        print(f"   - First open, after:  {result['index_bytes']:>7} bytes ({result['index_gzip_bytes']} gzipped) search-index.json")
+        print(f"   - Query, spec scan:   {result['scan_us']:.1f} µs")
+        print(f"   - Query, index:       {result['index_us']:.1f} µs")
+        return True
+
+    spec, _ = load_spec(args.spec)
+    index = build_index(spec)
+    write_spec_atomic(_encode(index), args.output)
+    print(f"✅ Wrote {args.output}: {len(index['operations'])} operations, "
+          f"{len(index['keys'])} search keys, {len(index['schemas'])} schemas")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -1,18 +1,69 @@
 (function() {
+  let index = null;
+  let indexPromise = null;
   let spec = null;
+  let specPromise = null;
   let chatBox = null;
   let messages = null;
   let input = null;
+  const queryCache = new Map();
 
-  async function init() {
-    try {
-      const res = await fetch('spec.json');
-      spec = await res.json();
-      console.log('Spec loaded:', spec.info.version);
-      createUI();
-    } catch (e) {
-      console.error('Failed to load spec:', e);
+  function init() {
+    createUI();
+  }
+
+  // search-index.json is built by build_search_index.py and only fetched
+  // the first time the chat is opened
+  function loadIndex() {
+    if (!indexPromise) {
+      indexPromise = fetch('search-index.json')
+        .then(res => res.json())
+        .then(data => {
+          index = data;
+          index.byOperation = new Map(index.operations.map(op => [`${op.method} ${op.path.toLowerCase()}`, op]));
+          index.schemaNames = new Map(Object.keys(index.schemas).map(name => [name.toLowerCase(), name]));
+          console.log('Search index loaded:', index.version);
+          return index;
+        })
+        .catch(e => {
+          indexPromise = null;
+          throw e;
+        });
+    }
+    return indexPromise;
+  }
+
+  // Full operation details come from the docs page's per-tag fragment when
+  // it is available (already fetched if that group is on screen), otherwise,
+  // or when the fragment does not have the operation, from spec.json
+  function loadSpec() {
+    if (!specPromise) {
+      specPromise = fetch('spec.json')
+        .then(res => res.json())
+        .then(data => spec = data)
+        .catch(e => {
+          specPromise = null;
+          throw e;
+        });
+    }
+    return specPromise;
+  }
+
+  async function loadOperation(op) {
+    const method = op.method.toLowerCase();
+    if (window.protoDocs && op.tags.length) {
+      try {
+        const fragment = await window.protoDocs.loadFragment(op.tags[0]);
+        const operation = (fragment.paths[op.path] || {})[method];
+        if (operation) {
+          return { ...operation, tags: op.tags };
+        }
+      } catch (e) {
+        // Unknown group or a failed fetch; spec.json has every operation
+      }
     }
+    await loadSpec();
+    return spec.paths[op.path][method];
   }
 
   function createUI() {
@@ -45,7 +96,10 @@
 
     btn.onclick = () => {
       chatBox.style.display = chatBox.style.display === 'none' ? 'flex' : 'none';
-      if (chatBox.style.display === 'flex') input.focus();
+      if (chatBox.style.display === 'flex') {
+        input.focus();
+        loadIndex().catch(e => console.error('Failed to load search index:', e));
+      }
     };
 
     close.onclick = () => chatBox.style.display = 'none';
@@ -63,7 +117,7 @@
     messages.scrollTop = 0;
   }
 
-  function sendQuery() {
+  async function sendQuery() {
     const query = input.value.trim();
     if (!query) return;
     
@@ -72,7 +126,8 @@
     input.value = '';
     
     try {
-      const response = handleQuery(query);
+      await loadIndex();
+      const response = await handleQuery(query);
       addMessage(response, false);
     } catch (e) {
       addMessage('Error: ' + e.message, false);
@@ -80,60 +135,60 @@
     }
   }
 
-  function handleQuery(query) {
+  function findOperations(term) {
+    let hits = queryCache.get(term);
+    if (!hits) {
+      if (term === 'all') {
+        hits = index.operations.map((_, i) => i);
+      } else {
+        const seen = new Set();
+        for (const key in index.keys) {
+          if (key.includes(term)) index.keys[key].forEach(i => seen.add(i));
+        }
+        hits = Array.from(seen).sort((a, b) => a - b);
+      }
+      queryCache.set(term, hits);
+    }
+    return hits.map(i => index.operations[i]);
+  }
+
+  function matchOperation(q) {
+    const pathMatch = q.match(/\/api\/v\d+\/[^\s]+/i);
+    const methodMatch = q.match(/\b(get|post|put|delete|patch)\b/i);
+    if (!pathMatch || !methodMatch) return null;
+    return index.byOperation.get(`${methodMatch[0].toUpperCase()} ${pathMatch[0].toLowerCase()}`) || false;
+  }
+
+  async function handleQuery(query) {
     const q = query.toLowerCase();
 
     if (q.includes('find') || q.includes('search') || q.includes('list')) {
       const term = q.replace(/find|search|list/gi, '').trim() || 'all';
-      const results = [];
-      for (const path of Object.keys(spec.paths || {})) {
-        for (const method of Object.keys(spec.paths[path] || {})) {
-          const op = spec.paths[path][method];
-          if (term === 'all' || 
-              path.toLowerCase().includes(term) ||
-              method.toLowerCase().includes(term) ||
-              (op.operationId || '').toLowerCase().includes(term) ||
-              (op.tags || []).some(t => t.toLowerCase().includes(term))) {
-            results.push(`${method.toUpperCase()} ${path}${op.operationId ? ' (' + op.operationId + ')' : ''}`);
-          }
-        }
-      }
+      const results = findOperations(term).map(op =>
+        `${op.method} ${op.path}${op.operationId ? ' (' + op.operationId + ')' : ''}`);
       return `Found ${results.length} endpoints:\n\n${results.slice(0, 15).join('\n')}${results.length > 15 ? '\n\n... and ' + (results.length - 15) + ' more' : ''}`;
     }
 
     if (q.includes('operation') || q.includes('endpoint')) {
-      const pathMatch = q.match(/\/api\/v\d+\/[^\s]+/);
-      const methodMatch = q.match(/\b(get|post|put|delete|patch)\b/i);
-      if (pathMatch && methodMatch) {
-        const op = spec.paths?.[pathMatch[0]]?.[methodMatch[0].toLowerCase()];
-        return op ? JSON.stringify(op, null, 2) : 'Operation not found';
-      }
+      const op = matchOperation(query);
+      if (op) return JSON.stringify(await loadOperation(op), null, 2);
+      if (op === false) return 'Operation not found';
       return 'Please specify method and path, e.g., "get operation GET /api/v1/pools"';
     }
 
     if (q.includes('schema')) {
-      const nameMatch = q.match(/schema\s+(\w+)/i) || q.match(/(\w+)\s+schema/i);
+      const nameMatch = query.match(/schema\s+(\w+)/i) || query.match(/(\w+)\s+schema/i);
       if (nameMatch) {
-        const s = spec.components?.schemas?.[nameMatch[1]];
-        return s ? JSON.stringify(s, null, 2) : `Schema "${nameMatch[1]}" not found`;
+        const name = index.schemaNames.get(nameMatch[1].toLowerCase());
+        return name ? index.schemas[name] : `Schema "${nameMatch[1]}" not found`;
       }
       return 'Please specify schema name, e.g., "schema Pool"';
     }
 
     if (q.includes('curl')) {
-      const pathMatch = q.match(/\/api\/v\d+\/[^\s]+/);
-      const methodMatch = q.match(/\b(get|post|put|delete|patch)\b/i);
-      if (pathMatch && methodMatch) {
-        const op = spec.paths?.[pathMatch[0]]?.[methodMatch[0].toLowerCase()];
-        if (!op) return 'Operation not found';
-        const url = `http://miner.local${pathMatch[0]}`;
-        const headers = ['-H "Content-Type: application/json"'];
-        const auth = op.security ? ['-H "Authorization: Bearer <TOKEN>"'] : [];
-        let data = '';
-        const rb = op.requestBody?.content?.['application/json'];
-        if (rb?.example) data = `-d '${JSON.stringify(rb.example)}'`;
-        return `curl -X ${methodMatch[0].toUpperCase()} ${headers.concat(auth).join(' ')} ${data} "${url}"`.replace(/\s+/g, ' ').trim();
-      }
+      const op = matchOperation(query);
+      if (op) return op.curl;
+      if (op === false) return 'Operation not found';
       return 'Please specify method and path, e.g., "curl PUT /api/v1/mining/target"';
     }
 
@@ -1,22 +1,9 @@
-import json
 import sys
 
-# Read the original spec to preserve structure
-try:
-    with open('spec.json.old', 'r') as f:
-        original_spec = json.load(f)
-    print("Loaded original spec successfully")
-except Exception as e:
-    print(f"Error loading original spec: {e}")
-    sys.exit(1)
+from spec_pipeline import (SpecPipeline, Stage, merge_tags, set_openapi,
+                           set_title, set_version)
 
-# Update the key fields to match the new version
-original_spec["openapi"] = "3.1.1"
-original_spec["info"]["title"] = "Mining Development Kit API"
-original_spec["info"]["version"] = "1.4.1"
-
-# Update the server URL
-original_spec["servers"][0]["url"] = "https://virtserver.swaggerhub.com/mining_development_kit_api/1.4.1"
+SERVER_URL = "https://virtserver.swaggerhub.com/mining_development_kit_api/1.4.1"
 
 # Add the new tags that weren't in the original
 new_tags = [
@@ -30,25 +17,32 @@ new_tags = [
     }
 ]
 
-# Check if these tags already exist, if not add them
-existing_tag_names = [tag["name"] for tag in original_spec.get("tags", [])]
-for new_tag in new_tags:
-    if new_tag["name"] not in existing_tag_names:
-        original_spec["tags"].append(new_tag)
-        print(f"Added new tag: {new_tag['name']}")
 
-# Write the updated spec
+def set_server_url(url):
+    """Stage: point the first server entry at url"""
+    def apply(spec):
+        server = spec["servers"][0]
+        if server.get("url") == url:
+            return None
+        server["url"] = url
+        return f"Server URL: {url}"
+    return Stage("set_server_url", apply)
+
+
+# Read the original spec once, apply every update, write spec.json once
 try:
-    with open('spec.json', 'w') as f:
-        json.dump(original_spec, f, indent=2)
-    print("Updated spec.json successfully!")
-    print("Key changes made:")
-    print("- Updated OpenAPI version to 3.1.1")
-    print("- Updated title to 'Mining Development Kit API'")
-    print("- Updated version to 1.4.1")
-    print("- Updated server URL to 1.4.1")
-    print("- Added Telemetry and System Tag endpoint groups")
+    result = SpecPipeline([
+        set_openapi("3.1.1"),
+        set_title("Mining Development Kit API"),
+        set_version("1.4.1"),
+        set_server_url(SERVER_URL),
+        merge_tags(new_tags),
+    ]).run('spec.json.old', output='spec.json')
 except Exception as e:
-    print(f"Error writing updated spec: {e}")
+    print(f"Error updating spec: {e}")
     sys.exit(1)
 
+print("Updated spec.json successfully!")
+print("Key changes made:")
+for change in result['changes']:
+    print(f"- {change}")
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Rolling-wave firmware rollout over PUT /api/v1/system/update
+- Memory-maps the .swu image once and streams it to every miner from the
+  same pages (no per-device reads or copies)
+- Bounded concurrency overall and per rack, and a bandwidth cap per rack
+  shared by all uploads into it
+- Waves of growing size, interleaved across racks; after each wave a miner
+  passes when GET /api/v1/system reports sw_update_status (UpdateStatus)
+  success, installed or current on --version, and GET /api/v1/mining
+  reports Mining
+- The rollout halts when a wave's failure share exceeds --max-failures
+- --plan prints the waves; --dry-run rolls out to a local mock fleet
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import mmap
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from proto_client import AsyncClient, BearerAuth
+from proto_http import ApiError, Upload
+from telemetry_poller import load_inventory
+
+UPDATE_PATH = '/api/v1/system/update'
+DEFAULT_WAVES = (0.01, 0.1, 0.5, 1.0)  # cumulative share of the fleet after each wave
+DEFAULT_CONCURRENCY = 64
+DEFAULT_PER_RACK = 8
+DEFAULT_RACK_MBPS = 200.0
+DEFAULT_MAX_FAILURES = 0.02
+DEFAULT_GATE_INTERVAL = 15.0
+DEFAULT_GATE_TIMEOUT = 900.0
+UPLOAD_DEADLINE = 60.0   # per chunk written, then for the response
+CHUNK_SIZE = 256 * 1024
+
+# UpdateStatus.status values
+UPDATE_DONE = {'success', 'installed', 'current'}
+UPDATE_FAILED = {'error'}
+UPDATE_INSTALLING = {'installing', 'confirming'}
+# MiningStatus.status values that pass the health gate
+HEALTHY = {'Mining'}
+
+
+class FirmwareImage:
+    """A read-only mapping of one .swu file, shared by every upload"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        if not self.size:
+            self._file.close()
+            raise ValueError(f"Firmware image {self.path} is empty")
+        self.map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.sha256 = hashlib.sha256(self.map).hexdigest()
+
+    @property
+    def upload(self):
+        return Upload(self.path.name, self.map)
+
+    def close(self):
+        self.map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TokenBucket:
+    """Bandwidth cap shared by concurrent uploads: take(n) waits until n more bytes fit under rate"""
+
+    __slots__ = ('rate', 'tokens', 'updated')
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = 0.0
+        self.updated = None
+
+    async def take(self, amount):
+        now = time.monotonic()
+        if self.updated is not None:
+            # Idle time refills at most one second of burst
+            self.tokens = min(self.tokens + (now - self.updated) * self.rate, self.rate)
+        self.updated = now
+        # Reserve first, then wait out the debt, so concurrent takers queue fairly
+        self.tokens -= amount
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
+def plan_waves(inventory, waves=DEFAULT_WAVES):
+    """[[(url, rack), ...] per wave]: racks interleaved so every wave spans as many racks as it can"""
+    racks = {}
+    for url, rack in inventory:
+        racks.setdefault(rack, []).append((url, rack))
+    order = []
+    queues = list(racks.values())
+    for position in range(max(map(len, queues), default=0)):
+        order.extend(queue[position] for queue in queues if position < len(queue))
+    planned, start = [], 0
+    for share in waves:
+        end = min(len(order), max(start + 1, math.ceil(share * len(order))))
+        if end > start:
+            planned.append(order[start:end])
+        start = end
+    if start < len(order):
+        planned.append(order[start:])
+    return planned
+
+
+class DeviceResult:
+    """Outcome for one miner
+
+    status: updated, current (already on --version), upload_failed,
+    update_error, unhealthy, timeout or skipped (after a halted wave);
+    previous_version is the current_version reported before the upload
+    """
+
+    __slots__ = ('miner', 'rack', 'wave', 'status', 'upload_s', 'total_s', 'update_status', 'mining_status', 'error',
+                 'previous_version')
+
+    def __init__(self, miner, rack, wave, status, upload_s=0.0, total_s=0.0, update_status=None,
+                 mining_status=None, error=None, previous_version=None):
+        self.miner = miner
+        self.rack = rack
+        self.wave = wave
+        self.status = status
+        self.upload_s = upload_s
+        self.total_s = total_s
+        self.update_status = update_status
+        self.mining_status = mining_status
+        self.error = error
+        self.previous_version = previous_version
+
+    def to_dict(self):
+        result = {name: getattr(self, name) for name in self.__slots__}
+        result['upload_s'] = round(self.upload_s, 3)
+        result['total_s'] = round(self.total_s, 3)
+        return result
+
+
+class WaveReport:
+    __slots__ = ('wave', 'devices', 'counts', 'seconds', 'bytes', 'halted')
+
+    def __init__(self, wave, results, seconds, sent, halted):
+        self.wave = wave
+        self.devices = len(results)
+        self.counts = {}
+        for result in results:
+            self.counts[result.status] = self.counts.get(result.status, 0) + 1
+        self.seconds = seconds
+        self.bytes = sent
+        self.halted = halted
+
+    @property
+    def failures(self):
+        return self.devices - self.counts.get('updated', 0) - self.counts.get('current', 0)
+
+    def line(self):
+        counts = ', '.join(f"{count} {status}" for status, count in sorted(self.counts.items()))
+        rate = self.bytes * 8 / self.seconds / 1e6 if self.seconds else 0.0
+        return (f"wave {self.wave}: {self.devices} miners ({counts}) in {self.seconds:.1f} s, "
+                f"{self.bytes / 1e6:.0f} MB sent at {rate:.0f} Mbit/s" + (' | HALTED' if self.halted else ''))
+
+
+class Rollout:
+    """Pushes one FirmwareImage to an inventory of (url, rack) in gated waves"""
+
+    def __init__(self, inventory, image, waves=DEFAULT_WAVES, concurrency=DEFAULT_CONCURRENCY,
+                 per_rack=DEFAULT_PER_RACK, rack_mbps=DEFAULT_RACK_MBPS, max_failures=DEFAULT_MAX_FAILURES,
+                 gate_interval=DEFAULT_GATE_INTERVAL, gate_timeout=DEFAULT_GATE_TIMEOUT, version=None, auth=None,
+                 chunk_size=CHUNK_SIZE, on_device=None, on_wave=None):
+        self.waves = plan_waves(inventory, waves)
+        self.image = image
+        self.concurrency = concurrency
+        self.per_rack = per_rack
+        self.rack_rate = rack_mbps * 1e6 / 8
+        self.max_failures = max_failures
+        self.gate_interval = gate_interval
+        self.gate_timeout = gate_timeout
+        self.version = version
+        self.auth = auth
+        self.chunk_size = chunk_size
+        self.on_device = on_device
+        self.on_wave = on_wave
+        self.sent = 0
+        self.results = []
+        self._slots = None
+        self._racks = {}
+
+    async def _state(self, client):
+        """(UpdateStatus dict, MiningStatus.status) from one miner"""
+        system = await client.transport.request('GET', '/api/v1/system') or {}
+        update = (system.get('system-info') or {}).get('sw_update_status') or {}
+        mining = await client.transport.request('GET', '/api/v1/mining') or {}
+        return update, (mining.get('mining-status') or {}).get('status')
+
+    def _done(self, update, before=None, installing=False):
+        """Whether update shows the pushed image in place, not the miner's state from before the upload
+
+        With a version that is a match on it. Without one the miner must have
+        changed current_version since before, or been seen installing.
+        """
+        if update.get('status') not in UPDATE_DONE:
+            return False
+        if self.version is not None:
+            return update.get('current_version') == self.version
+        changed = before is not None and update.get('current_version') != before.get('current_version')
+        return changed or installing
+
+    async def _gate(self, client, result, before):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.gate_timeout
+        installing = False
+        while True:
+            await asyncio.sleep(min(self.gate_interval, max(deadline - loop.time(), 0)))
+            try:
+                update, mining = await self._state(client)
+            except (OSError, ApiError, ValueError, TimeoutError, asyncio.IncompleteReadError) as e:
+                # Rebooting into the new image: keep asking until the gate times out
+                result.error = str(e) or type(e).__name__
+                update, mining = None, None
+            if update is not None:
+                result.update_status, result.mining_status, result.error = update.get('status'), mining, None
+                if update.get('status') in UPDATE_FAILED:
+                    result.status, result.error = 'update_error', update.get('error') or update.get('message')
+                    return
+                installing = installing or update.get('status') in UPDATE_INSTALLING
+                if self._done(update, before, installing) and mining in HEALTHY:
+                    result.status = 'updated'
+                    return
+            if loop.time() >= deadline:
+                done = update is not None and self._done(update, before, installing)
+                result.status = 'unhealthy' if done else 'timeout'
+                return
+
+    async def _device(self, url, rack, wave):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = DeviceResult(url, rack, wave, 'upload_failed')
+        client = AsyncClient(url, auth=self.auth, timeout=UPLOAD_DEADLINE, max_connections=1)
+        bucket = self._racks[rack]
+        try:
+            # What the miner runs before the upload, so the gate can tell the new image from it
+            before = None
+            try:
+                before, mining = await self._state(client)
+                result.previous_version = before.get('current_version')
+                if self.version is not None and self._done(before):
+                    result.status, result.update_status, result.mining_status = 'current', before['status'], mining
+                    return result
+            except (OSError, ApiError, ValueError, TimeoutError, asyncio.IncompleteReadError):
+                pass
+            async with self._slots, bucket[0]:
+                upload_started = loop.time()
+                try:
+                    await client.transport.upload('PUT', UPDATE_PATH, 'file', self.image.upload, self.chunk_size,
+                                                  throttle=bucket[1].take)
+                    self.sent += self.image.size
+                except (OSError, ApiError, ValueError, TimeoutError, asyncio.IncompleteReadError) as e:
+                    result.error = str(e) or type(e).__name__
+                    return result
+                finally:
+                    result.upload_s = loop.time() - upload_started
+            await self._gate(client, result, before)
+            return result
+        finally:
+            result.total_s = loop.time() - started
+            await client.close()
+            if self.on_device is not None:
+                self.on_device(result)
+
+    async def run(self):
+        """Roll out wave by wave; [WaveReport], stopping after the first wave over max_failures"""
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._racks = {rack: (asyncio.Semaphore(self.per_rack), TokenBucket(self.rack_rate))
+                       for wave in self.waves for _, rack in wave}
+        reports = []
+        for number, wave in enumerate(self.waves):
+            started, sent = time.monotonic(), self.sent
+            results = await asyncio.gather(*(self._device(url, rack, number) for url, rack in wave))
+            self.results.extend(results)
+            report = WaveReport(number, results, time.monotonic() - started, self.sent - sent, False)
+            report.halted = report.failures > self.max_failures * len(wave)
+            reports.append(report)
+            if self.on_wave is not None:
+                self.on_wave(report)
+            if report.halted:
+                for later, devices in enumerate(self.waves[number + 1:], number + 1):
+                    self.results.extend(DeviceResult(url, rack, later, 'skipped') for url, rack in devices)
+                break
+        return reports
+
+
+# -- dry run ---------------------------------------------------------------
+
+DRY_RUN_PREVIOUS = '9.9.8-dry-run'
+DRY_RUN_VERSION = '9.9.9-dry-run'
+
+
+def _serve_mock(port, miners, failing, ready):
+    import copy
+    from urllib.parse import urlsplit
+
+    from mock_server import MINER_PATH, build_server, http_response, response_examples
+    from spec_pipeline import load_spec
+    from spec_refs import RefGraph
+
+    spec, _ = load_spec()
+    graph = RefGraph(spec)
+    response = spec['paths']['/api/v1/system']['get']['responses']['200']
+    system = next(iter(response_examples(graph, response).values()))
+    # A simulated miner runs DRY_RUN_PREVIOUS until an upload to it succeeds, then reports DRY_RUN_VERSION
+    states = {}
+    for name, update in (('before', {'status': 'current', 'current_version': DRY_RUN_PREVIOUS,
+                                     'message': 'System is up to date'}),
+                         ('after', {'status': 'success', 'current_version': DRY_RUN_VERSION,
+                                    'message': 'Update installed', 'progress': 100})):
+        states[name] = copy.deepcopy(system)
+        states[name]['system-info']['sw_update_status'] = update
+        states[name] = http_response(200, states[name])
+    server = build_server(miners=miners, failing=failing)
+    respond = server.respond
+    updated = set()
+
+    def stateful(method, target, headers, body):
+        response, delay = respond(method, target, headers, body)
+        match = MINER_PATH.match(urlsplit(target).path)
+        miner, path = (int(match.group(1)), match.group(2)) if match else (0, urlsplit(target).path)
+        if response.startswith(b'HTTP/1.1 2'):
+            if method == 'PUT' and path == UPDATE_PATH:
+                updated.add(miner)
+            elif method == 'GET' and path == '/api/v1/system':
+                response = states['after' if miner in updated else 'before']
+        return response, delay
+
+    server.respond = stateful
+    asyncio.run(server.serve('127.0.0.1', port, ready))
+
+
+def dry_run(image_path=None, miners=200, racks=10, image_mb=16, failing=0.0, port=18760, **options):
+    """Roll out to a local mock fleet; (reports, results, image size, sha256, peak RSS growth in bytes)"""
+    context = multiprocessing.get_context('spawn')
+    ready = context.Event()
+    server = context.Process(target=_serve_mock, args=(port, miners, failing, ready), daemon=True)
+    server.start()
+    temporary = None
+    try:
+        if not ready.wait(60):
+            raise RuntimeError('mock server did not start')
+        if image_path is None:
+            temporary = tempfile.NamedTemporaryFile(suffix='.swu', delete=False)
+            with temporary:
+                for _ in range(image_mb):
+                    temporary.write(os.urandom(1024 * 1024))
+            image_path = temporary.name
+        inventory = [(f"http://127.0.0.1:{port}/m/{n}", f"rack-{n % racks:02d}") for n in range(miners)]
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        with FirmwareImage(image_path) as image:
+            rollout = Rollout(inventory, image, **options)
+            reports = asyncio.run(rollout.run())
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 - before
+            return reports, rollout.results, image.size, image.sha256, peak
+    finally:
+        server.terminate()
+        server.join()
+        if temporary is not None:
+            os.unlink(temporary.name)
+
+
+def _waves(text):
+    shares = [float(part) / 100 for part in text.split(',') if part.strip()]
+    if not shares or shares != sorted(shares) or not 0 < shares[-1] <= 1:
+        raise argparse.ArgumentTypeError('waves are increasing cumulative percentages, e.g. 1,10,50,100')
+    return tuple(shares)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('image', nargs='?', help='.swu firmware image')
+    parser.add_argument('inventory', nargs='?', help='file with one miner per line, optionally followed by its rack')
+    parser.add_argument('--waves', type=_waves, default=DEFAULT_WAVES,
+                        help='cumulative percentages of the fleet per wave (default 1,10,50,100)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='uploads in flight overall')
+    parser.add_argument('--per-rack', type=int, default=DEFAULT_PER_RACK, help='uploads in flight per rack')
+    parser.add_argument('--rack-mbps', type=float, default=DEFAULT_RACK_MBPS, help='upload cap per rack in Mbit/s')
+    parser.add_argument('--max-failures', type=float, default=DEFAULT_MAX_FAILURES,
+                        help='share of a wave allowed to fail before the rollout halts')
+    parser.add_argument('--gate-interval', type=float, default=DEFAULT_GATE_INTERVAL,
+                        help='seconds between health checks after an upload')
+    parser.add_argument('--gate-timeout', type=float, default=DEFAULT_GATE_TIMEOUT,
+                        help='seconds a miner has to report the update and mine again')
+    parser.add_argument('--version', help='expected current_version after the update; miners already on it are '
+                                       'skipped (required unless --dry-run or --plan)')
+    parser.add_argument('--token', help='JWT bearer token')
+    parser.add_argument('-o', '--output', help='write one JSON line per miner here')
+    parser.add_argument('--plan', action='store_true', help='print the waves and exit')
+    parser.add_argument('--dry-run', action='store_true', help='roll out to a local mock fleet instead')
+    parser.add_argument('--miners', type=int, default=200, help='mock miners for --dry-run')
+    parser.add_argument('--racks', type=int, default=10, help='mock racks for --dry-run')
+    parser.add_argument('--image-mb', type=int, default=16, help='random image size for --dry-run without an image')
+    parser.add_argument('--failing', type=float, default=0.0, help='share of mock miners answering 5xx')
+    args = parser.parse_args()
+
+    def device(result):
+        if result.status not in ('updated', 'current'):
+            print(f"   ⚠️  {result.miner} ({result.rack}): {result.status}"
+                  + (f" - {result.error}" if result.error else ''), flush=True)
+
+    options = dict(waves=args.waves, concurrency=args.concurrency, per_rack=args.per_rack,
+                   rack_mbps=args.rack_mbps, max_failures=args.max_failures, on_device=device,
+                   on_wave=lambda report: print(f"{'❌' if report.halted else '✅'} {report.line()}", flush=True))
+
+    if args.dry_run:
+        # Without --version the gate looks for the mock's change from DRY_RUN_PREVIOUS to DRY_RUN_VERSION
+        options.update(gate_interval=min(args.gate_interval, 0.2), gate_timeout=min(args.gate_timeout, 10.0),
+                       version=args.version)
+        print(f"🧪 Dry run: {args.miners} mock miners in {args.racks} racks, {args.rack_mbps:g} Mbit/s per rack")
+        reports, results, size, digest, peak = dry_run(args.image, args.miners, args.racks, args.image_mb,
+                                                       args.failing, **options)
+        updated = sum(result.status in ('updated', 'current') for result in results)
+        print(f"📊 {size / 1e6:.1f} MB image (sha256 {digest[:12]}) mapped once; {updated}/{len(results)} miners "
+              f"passed the gates; peak RSS grew {peak / 1e6:.1f} MB")
+    else:
+        if not args.image or not args.inventory:
+            parser.error('an image and an inventory are required (or --dry-run)')
+        inventory = load_inventory(args.inventory)
+        if args.plan:
+            for number, wave in enumerate(plan_waves(inventory, args.waves)):
+                print(f"wave {number}: {len(wave)} miners across {len({rack for _, rack in wave})} racks")
+            return True
+        if not args.version:
+            parser.error('--version is required: the gate passes a miner only once it reports that version')
+        options.update(gate_interval=args.gate_interval, gate_timeout=args.gate_timeout, version=args.version,
+                       auth=BearerAuth(args.token) if args.token else None)
+        with FirmwareImage(args.image) as image:
+            print(f"🚀 {image.path.name}: {image.size / 1e6:.1f} MB, sha256 {image.sha256}")
+            rollout = Rollout(inventory, image, **options)
+            reports = asyncio.run(rollout.run())
+            results = rollout.results
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps(result.to_dict()) + '\n')
+        print(f"✅ Wrote {len(results)} results to {args.output}")
+    return not any(report.halted for report in reports)
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Per-operation load test driven by the spec
+- Enumerates operations from spec.json and generates valid requests from
+  the schemas: path parameters, every value of enum query parameters
+  (duration, granularity, level) and one request body per oneOf branch
+  (a TimeSeriesRequest per level)
+- Drives each operation in turn at a fixed concurrency against any base
+  URL, on the asyncio transport of the generated client
+- Reports throughput, error rates and latency percentiles per operation
+  as JSON, keyed by "METHOD /path" with the spec version and hash, so runs
+  against different spec versions can be compared (--compare)
+- Read-only operations by default; --include-writes adds the rest (reboot,
+  update, pool changes), meant for mock_server.py rather than real miners
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import multiprocessing
+import re
+import sys
+import time
+from datetime import datetime, timezone
+
+from mock_server import example_for
+from proto_http import ApiError, AsyncTransport, BearerAuth, Upload
+from spec_pipeline import SPEC_PATH, load_spec
+from spec_refs import RefGraph, operations
+
+# POST operations that only read, so they run without --include-writes
+READ_ONLY = {'POST /api/v1/timeseries'}
+PERCENTILES = (50, 90, 95, 99)
+
+
+class RequestPlan:
+    """The request variants generated for one operation"""
+
+    __slots__ = ('id', 'method', 'writes', 'variants')
+
+    def __init__(self, operation_id, method, writes, variants):
+        self.id = operation_id
+        self.method = method.upper()
+        self.writes = writes
+        # (path, query, body, files) tuples, used round robin
+        self.variants = variants
+
+
+def _branches(graph, schema, active=()):
+    """The most oneOf/anyOf branches anywhere in schema"""
+    if not isinstance(schema, dict):
+        return 1
+    ref = schema.get('$ref')
+    if ref is not None:
+        return 1 if ref in active else _branches(graph, graph.resolve(ref), active + (ref,))
+    counts = [len(schema.get(key, ())) for key in ('oneOf', 'anyOf')]
+    for key, value in schema.items():
+        if isinstance(value, dict):
+            counts.append(_branches(graph, value, active))
+        elif isinstance(value, list) and key != 'enum':
+            counts.extend(_branches(graph, item, active) for item in value)
+    return max(counts + [1])
+
+
+def _query_values(graph, parameter):
+    """The values a query parameter cycles through; None to leave it out"""
+    schema = parameter.get('schema', {})
+    if '$ref' in schema:
+        schema = graph.resolve(schema['$ref'])
+    if schema.get('enum'):
+        return list(schema['enum'])
+    items = schema.get('items', {})
+    if '$ref' in items:
+        items = graph.resolve(items['$ref'])
+    if schema.get('type') == 'array' and items.get('enum'):
+        return [[value] for value in items['enum']] + [list(items['enum'])]
+    if parameter.get('required'):
+        return [example_for(graph, schema)]
+    return None
+
+
+def plan_requests(spec, upload_size=65536):
+    """One RequestPlan per operation, in spec order"""
+    graph = RefGraph(spec)
+    plans = []
+    for operation_id, method, path, operation, path_parameters in operations(spec):
+        parameters = [graph.resolve(p['$ref']) if '$ref' in p else p
+                      for p in path_parameters + operation.get('parameters', [])]
+        target = path
+        query = {}
+        for parameter in parameters:
+            if parameter.get('in') == 'path':
+                value = example_for(graph, parameter.get('schema', {}))
+                target = target.replace(f"{{{parameter['name']}}}", str(value))
+            elif parameter.get('in') == 'query':
+                values = _query_values(graph, parameter)
+                if values:
+                    query[parameter['name']] = values
+
+        bodies, files = [None], None
+        request = operation.get('requestBody') or {}
+        if '$ref' in request:
+            request = graph.resolve(request['$ref'])
+        content = request.get('content', {})
+        if 'multipart/form-data' in content:
+            schema = content['multipart/form-data'].get('schema', {})
+            if '$ref' in schema:
+                schema = graph.resolve(schema['$ref'])
+            files = {field: Upload('update.swu', b'\0' * upload_size)
+                     if schema.get('properties', {}).get(field, {}).get('format') == 'binary'
+                     else example_for(graph, schema['properties'][field])
+                     for field in schema.get('required', [])}
+        elif 'application/json' in content:
+            media = content['application/json']
+            if media.get('examples'):
+                bodies = [entry.get('value') for entry in media['examples'].values()]
+            elif 'example' in media:
+                bodies = [media['example']]
+            else:
+                schema = media.get('schema', {})
+                bodies = [example_for(graph, schema, choice=choice, required=True)
+                          for choice in range(_branches(graph, schema))]
+
+        count = max([len(bodies)] + [len(values) for values in query.values()])
+        variants = [(target, {name: values[index % len(values)] for name, values in query.items()} or None,
+                     bodies[index % len(bodies)], files) for index in range(count)]
+        writes = method != 'get' and operation_id not in READ_ONLY
+        plans.append(RequestPlan(operation_id, method, writes, variants))
+    return plans
+
+
+def percentile(ordered, q):
+    """Nearest-rank percentile of an ascending list"""
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class OperationResult:
+    """Outcomes of the requests sent for one operation"""
+
+    def __init__(self, operation_id):
+        self.id = operation_id
+        self.latencies = []
+        self.errors = {}
+        self.bytes = 0
+        self.wall = 0.0
+
+    def record(self, latency, error=None, size=0):
+        self.latencies.append(latency)
+        if error is None:
+            self.bytes += size
+        else:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def summary(self):
+        ordered = sorted(self.latencies)
+        requests = len(ordered)
+        failed = sum(self.errors.values())
+        ms = lambda value: None if value is None else round(value * 1000, 3)
+        return {
+            'requests': requests,
+            'ok': requests - failed,
+            'error_rate': round(failed / requests, 6) if requests else None,
+            'errors': dict(sorted(self.errors.items())),
+            'throughput_rps': round(requests / self.wall, 2) if self.wall else None,
+            'latency_ms': {
+                **{f"p{q}": ms(percentile(ordered, q)) for q in PERCENTILES},
+                'mean': ms(sum(ordered) / requests) if requests else None,
+                'max': ms(ordered[-1]) if ordered else None,
+            },
+            'mean_response_bytes': round(self.bytes / (requests - failed)) if requests > failed else None,
+        }
+
+
+async def run_operation(transport, plan, concurrency, requests=None, duration=None, timeout=None):
+    """Send plan's variants round robin from concurrency workers
+
+    Stops after requests requests, or after duration seconds.
+    """
+    result = OperationResult(plan.id)
+    deadline = time.perf_counter() + duration if duration else None
+    sent = 0
+
+    async def worker():
+        nonlocal sent
+        while (requests is None or sent < requests) and (deadline is None or time.perf_counter() < deadline):
+            path, query, body, files = plan.variants[sent % len(plan.variants)]
+            sent += 1
+            start = time.perf_counter()
+            try:
+                data = await transport.request(plan.method, path, query, body, files, timeout=timeout, raw=True)
+            except ApiError as e:
+                result.record(time.perf_counter() - start, f"HTTP {e.status}")
+            except TimeoutError:
+                result.record(time.perf_counter() - start, 'timeout')
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                result.record(time.perf_counter() - start, type(e).__name__)
+            else:
+                result.record(time.perf_counter() - start, size=len(data or b''))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.wall = time.perf_counter() - start
+    return result
+
+
+async def run(base_url, plans, concurrency=8, requests=None, duration=None, token=None, timeout=10.0,
+              progress=None):
+    """{operation id: summary} for each plan, one operation at a time"""
+    transport = AsyncTransport(base_url, BearerAuth(token) if token else None, timeout,
+                               max_connections=concurrency)
+    results = {}
+    try:
+        for plan in plans:
+            # One unmeasured request opens a connection and warms the device's caches
+            await run_operation(transport, plan, 1, requests=1, timeout=timeout)
+            result = await run_operation(transport, plan, concurrency, requests, duration, timeout)
+            results[plan.id] = result.summary()
+            if progress is not None:
+                progress(plan.id, results[plan.id])
+    finally:
+        await transport.close()
+    return results
+
+
+def report(spec_text, spec, base_url, results, concurrency, requests, duration):
+    return {
+        'spec_version': spec.get('info', {}).get('version'),
+        'spec_sha256': hashlib.sha256(spec_text.encode('utf-8')).hexdigest()[:12],
+        'base_url': base_url,
+        'started': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'concurrency': concurrency,
+        'requests_per_operation': requests,
+        'duration_per_operation_s': duration,
+        'operations': results,
+    }
+
+
+def compare(old, new):
+    """(rows for operations in both reports, added ids, removed ids)"""
+    rows = []
+    for operation_id, after in new['operations'].items():
+        before = old['operations'].get(operation_id)
+        if before is None:
+            continue
+        rows.append({
+            'operation': operation_id,
+            'p50_ms': (before['latency_ms']['p50'], after['latency_ms']['p50']),
+            'p95_ms': (before['latency_ms']['p95'], after['latency_ms']['p95']),
+            'throughput_rps': (before['throughput_rps'], after['throughput_rps']),
+            'error_rate': (before['error_rate'], after['error_rate']),
+        })
+    added = sorted(set(new['operations']) - set(old['operations']))
+    removed = sorted(set(old['operations']) - set(new['operations']))
+    return rows, added, removed
+
+
+def _change(before, after):
+    if before is None or after is None:
+        return '-'
+    if not before:
+        return f"{after:g}"
+    return f"{(after - before) / before:+.0%}"
+
+
+def _serve_mock(spec_path, port, ready):
+    from mock_server import build_server
+    asyncio.run(build_server(spec_path).serve('127.0.0.1', port, ready))
+
+
+def _print_row(operation_id, summary):
+    latency = summary['latency_ms']
+    fmt = lambda value: '-' if value is None else f"{value:.1f}"
+    print(f"   {operation_id:<44} {summary['throughput_rps'] or 0:>8,.0f}/s  "
+          f"p50 {fmt(latency['p50']):>7}  p95 {fmt(latency['p95']):>7}  p99 {fmt(latency['p99']):>7} ms  "
+          f"errors {summary['error_rate'] or 0:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('base_url', nargs='?', help='miner or mock to load, e.g. http://192.168.1.100')
+    parser.add_argument('--spec', default=str(SPEC_PATH), help='spec file to generate requests from')
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help='requests in flight per operation')
+    parser.add_argument('-n', '--requests', type=int, help='requests per operation (default: 200)')
+    parser.add_argument('-d', '--duration', type=float,
+                        help='seconds per operation (with -n, whichever comes first)')
+    parser.add_argument('--operations', help='regex selecting operations by "METHOD /path"')
+    parser.add_argument('--include-writes', action='store_true',
+                        help='also run operations that change device state')
+    parser.add_argument('--token', help='JWT bearer token')
+    parser.add_argument('--timeout', type=float, default=10.0, help='per-request deadline in seconds')
+    parser.add_argument('--upload-size', type=int, default=65536, help='bytes per multipart upload')
+    parser.add_argument('--mock', action='store_true', help='start mock_server.py locally and load it')
+    parser.add_argument('-o', '--output', help='write the JSON report here')
+    parser.add_argument('--compare', help='earlier JSON report to compare against')
+    args = parser.parse_args()
+    if not args.base_url and not args.mock:
+        parser.error('a base URL or --mock is required')
+    requests = args.requests if args.requests or args.duration else 200
+
+    spec, text = load_spec(args.spec)
+    planned = plan_requests(spec, args.upload_size)
+    plans = [plan for plan in planned
+             if (args.include_writes or not plan.writes)
+             and (not args.operations or re.search(args.operations, plan.id))]
+    skipped = sum(plan.writes for plan in planned) if not args.include_writes else 0
+    if not plans:
+        raise ValueError('No operations selected')
+
+    server = None
+    base_url = args.base_url
+    if args.mock:
+        port = 18650
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(target=_serve_mock, args=(args.spec, port, ready), daemon=True)
+        server.start()
+        if not ready.wait(10):
+            raise RuntimeError('mock server did not start')
+        base_url = f"http://127.0.0.1:{port}"
+        args.token = args.token or 'mock'
+
+    print(f"📊 {len(plans)} operations against {base_url}, concurrency {args.concurrency}, "
+          + (f"{requests} requests" if requests else '') + (' or ' if requests and args.duration else '')
+          + (f"{args.duration:g} s" if args.duration else '') + ' each'
+          + (f" ({skipped} state-changing operations skipped, see --include-writes)" if skipped else ''))
+    try:
+        results = asyncio.run(run(base_url, plans, args.concurrency, requests, args.duration, args.token,
+                                  args.timeout, _print_row))
+    finally:
+        if server is not None:
+            server.terminate()
+
+    result = report(text, spec, base_url, results, args.concurrency, requests, args.duration)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+            f.write('\n')
+        print(f"✅ Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            old = json.load(f)
+        rows, added, removed = compare(old, result)
+        print(f"\n📊 Against {args.compare} (spec {old.get('spec_version')} -> {result['spec_version']})")
+        for row in rows:
+            print(f"   {row['operation']:<44} p50 {_change(*row['p50_ms']):>6}  p95 {_change(*row['p95_ms']):>6}  "
+                  f"throughput {_change(*row['throughput_rps']):>6}  "
+                  f"errors {row['error_rate'][0] or 0:.1%} -> {row['error_rate'][1] or 0:.1%}")
+        for operation_id in added:
+            print(f"   + {operation_id} (new)")
+        for operation_id in removed:
+            print(f"   - {operation_id} (no longer in the spec)")
+    failed = [operation_id for operation_id, summary in results.items() if summary['error_rate']]
+    if failed:
+        print(f"   ⚠️  {len(failed)} operations returned errors")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
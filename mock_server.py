@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Local mock of the Proto API generated from spec.json
+- Serves every operation in the spec; responses are precomputed at startup
+  from the spec's examples, or built from the response schemas
+- Checks path parameters, JSON and multipart/form-data bodies, and (with
+  --auth) the bearer token on secured operations
+- Many simulated miners on one listener at /m/<n>/api/v1/..., with latency,
+  jitter and error injection for all miners or a share of them
+- "Prefer: code=500, example=all_data" picks a documented response, as
+  with other OpenAPI mock servers
+- GET /__mock__/stats reports request counts and server CPU time
+- --benchmark: requests/s and server CPU per request, for sizing CI runs
+"""
+
+import argparse
+import asyncio
+import http
+import json
+import multiprocessing
+import random
+import re
+import statistics
+import sys
+import time
+from urllib.parse import unquote, urlsplit
+
+from spec_pipeline import SPEC_PATH, load_spec
+from spec_refs import RefGraph, operations
+
+STATS_PATH = '/__mock__/stats'
+MINER_PATH = re.compile(r'^/m/(\d+)(/.*)$')
+PARAMETER = re.compile(r'\{([^}/]+)\}')
+HTTP_STATUSES = frozenset(http.HTTPStatus)
+
+# Values for string formats that have no example in the spec
+FORMATS = {
+    'date-time': '2024-01-15T00:00:00Z',
+    'date': '2024-01-15',
+    'uuid': '123e4567-e89b-42d3-a456-426614174000',
+    'email': 'operator@example.com',
+    'uri': 'http://127.0.0.1:8080',
+    'ipv4': '192.168.1.100',
+    'hostname': 'miner.local',
+    'password': 'password',
+}
+
+
+def example_for(graph, schema, active=(), choice=0, required=False):
+    """A value for schema: its own example, else one built from the schema
+
+    choice picks the branch of every oneOf/anyOf (modulo its length);
+    required=True leaves optional properties out, as request bodies want.
+    """
+    ref = schema.get('$ref')
+    if ref is not None:
+        if ref in active:
+            return None
+        return example_for(graph, graph.resolve(ref), active + (ref,), choice, required)
+    for key in ('example', 'default'):
+        if key in schema:
+            return schema[key]
+    if schema.get('enum'):
+        return schema['enum'][0]
+    if 'allOf' in schema:
+        merged = {}
+        for part in schema['allOf']:
+            value = example_for(graph, part, active, choice, required)
+            if isinstance(value, dict):
+                merged.update(value)
+        return merged
+    for key in ('oneOf', 'anyOf'):
+        if schema.get(key):
+            return example_for(graph, schema[key][choice % len(schema[key])], active, choice, required)
+
+    kind = schema.get('type')
+    if isinstance(kind, list):
+        kind = next((item for item in kind if item != 'null'), 'null')
+    if kind is None:
+        kind = 'object' if 'properties' in schema or 'additionalProperties' in schema else (
+            'array' if 'items' in schema else None)
+    if kind == 'object':
+        needed = set(schema.get('required', []))
+        value = {name: example_for(graph, prop, active, choice, required)
+                 for name, prop in schema.get('properties', {}).items()
+                 if not prop.get('writeOnly') and (not required or name in needed)}
+        extra = schema.get('additionalProperties')
+        if isinstance(extra, dict) and extra and not required:
+            value['additionalProp1'] = example_for(graph, extra, active, choice, required)
+        return value
+    if kind == 'array':
+        item = example_for(graph, schema.get('items', {}), active, choice, required)
+        return [] if item is None else [item] * max(schema.get('minItems', 1), 1)
+    if kind == 'string':
+        value = FORMATS.get(schema.get('format'), 'string')
+        return value.ljust(schema.get('minLength', 0), 'x')
+    if kind == 'integer':
+        return int(schema.get('minimum', 0))
+    if kind == 'number':
+        return float(schema.get('minimum', 0))
+    if kind == 'boolean':
+        return True
+    return None
+
+
+def response_examples(graph, response):
+    """{example name: JSON value} for one documented response, {} without a body"""
+    if '$ref' in response:
+        response = graph.resolve(response['$ref'])
+    content = response.get('content') or {}
+    media = content.get('application/json') or next(iter(content.values()), None)
+    if media is None:
+        return {}
+    if media.get('examples'):
+        return {name: (graph.resolve(entry['$ref']) if '$ref' in entry else entry).get('value')
+                for name, entry in media['examples'].items()}
+    if 'example' in media:
+        return {'default': media['example']}
+    return {'default': example_for(graph, media.get('schema', {}))}
+
+
+def http_response(status, value=None, empty=False):
+    """Complete HTTP/1.1 response bytes for a JSON value"""
+    try:
+        reason = http.HTTPStatus(status).phrase
+    except ValueError:
+        reason = 'Unknown'
+    body = b'' if empty else json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    head = f"HTTP/1.1 {status} {reason}\r\n"
+    if body:
+        head += 'Content-Type: application/json\r\n'
+    if status != 204:
+        head += f"Content-Length: {len(body)}\r\n"
+    return (head + '\r\n').encode('latin-1') + body
+
+
+def message(status, text):
+    """Body for errors the spec does not document (MessageResponse shape)"""
+    return http_response(status, {'message': text})
+
+
+class Operation:
+    """One spec operation with its responses rendered to bytes"""
+
+    __slots__ = ('id', 'method', 'path', 'pattern', 'integers', 'secured', 'body', 'body_required',
+                 'fields', 'success', 'failure', 'invalid', 'responses')
+
+    def __init__(self, graph, spec, operation_id, method, path, operation, path_parameters):
+        self.id = operation_id
+        self.method = method.upper()
+        self.path = path
+        parameters = [graph.resolve(p['$ref']) if '$ref' in p else p
+                      for p in path_parameters + operation.get('parameters', [])]
+        self.integers = {p['name'] for p in parameters if p.get('in') == 'path'
+                         and p.get('schema', {}).get('type') == 'integer'}
+        self.pattern = None
+        if '{' in path:
+            regex = ''.join(f"(?P<{identifier(name)}>[^/]+)" if index % 2 else re.escape(name)
+                            for index, name in enumerate(PARAMETER.split(path)))
+            self.pattern = re.compile(f"^{regex}$")
+        self.secured = bool(operation.get('security', spec.get('security')))
+
+        request = operation.get('requestBody') or {}
+        if '$ref' in request:
+            request = graph.resolve(request['$ref'])
+        content = request.get('content', {})
+        self.body = 'multipart' if 'multipart/form-data' in content else ('json' if content else None)
+        self.body_required = bool(request.get('required'))
+        self.fields = []
+        if self.body == 'multipart':
+            schema = content['multipart/form-data'].get('schema', {})
+            if '$ref' in schema:
+                schema = graph.resolve(schema['$ref'])
+            self.fields = list(schema.get('required', []))
+
+        self.responses = {}
+        for code, response in operation.get('responses', {}).items():
+            if not code.isdigit():
+                continue
+            status = int(code)
+            examples = response_examples(graph, response)
+            self.responses[status] = ({name: http_response(status, value) for name, value in examples.items()}
+                                      or {'default': http_response(status, empty=True)})
+        codes = sorted(self.responses)
+        self.success = next((code for code in codes if 200 <= code < 300), 200)
+        if self.success not in self.responses:
+            self.responses[self.success] = {'default': http_response(self.success, empty=True)}
+        self.failure = next((code for code in codes if code >= 500), 500)
+        self.invalid = next((code for code in (400, 422) if code in self.responses), 400)
+
+    def render(self, status, example=None):
+        """Response bytes for a status; documented bodies first, then a generic one"""
+        variants = self.responses.get(status)
+        if variants is None:
+            return message(status, f"{http.HTTPStatus(status).phrase} (mock)")
+        if example is not None and example in variants:
+            return variants[example]
+        return next(iter(variants.values()))
+
+    def check(self, params, headers, body):
+        """None when the request is acceptable, else a short reason"""
+        for name in self.integers:
+            if not re.fullmatch(r'-?\d+', params.get(identifier(name), '')):
+                return f"path parameter {name} must be an integer"
+        if self.body is None:
+            return None
+        if not body:
+            return 'request body is required' if self.body_required else None
+        content_type = headers.get('content-type', '')
+        if self.body == 'json':
+            try:
+                json.loads(body)
+            except ValueError:
+                return 'request body is not valid JSON'
+            return None
+        if not content_type.startswith('multipart/form-data') or 'boundary=' not in content_type:
+            return 'expected a multipart/form-data body'
+        for field in self.fields:
+            if f'name="{field}"'.encode() not in body:
+                return f"multipart field {field} is required"
+        return None
+
+
+def identifier(name):
+    return re.sub(r'\W', '_', name)
+
+
+class MockApi:
+    """Every operation of one spec, routed by method and path"""
+
+    def __init__(self, spec, auth=False, overrides=None):
+        graph = RefGraph(spec)
+        self.version = spec.get('info', {}).get('version', '')
+        self.auth = auth
+        self.static = {}
+        self.templated = []
+        self.paths = {}
+        for operation_id, method, path, operation, path_parameters in operations(spec):
+            op = Operation(graph, spec, operation_id, method, path, operation, path_parameters)
+            if op.pattern is None:
+                self.static[(op.method, path)] = op
+            else:
+                self.templated.append(op)
+            self.paths.setdefault(path, []).append(op.method)
+        for operation_id, value in (overrides or {}).items():
+            op = self.operation(operation_id)
+            op.responses[op.success] = {'default': http_response(op.success, value)}
+
+    @property
+    def operations(self):
+        return list(self.static.values()) + self.templated
+
+    def operation(self, operation_id):
+        for op in self.operations:
+            if op.id == operation_id:
+                return op
+        raise KeyError(f"No operation {operation_id}")
+
+    def route(self, method, path):
+        """(operation, path params), or (None, status) when nothing matches"""
+        op = self.static.get((method, path))
+        if op is not None:
+            return op, {}
+        allowed = path in self.paths
+        for op in self.templated:
+            match = op.pattern.match(path)
+            if match:
+                if op.method == method:
+                    return op, {name: unquote(value) for name, value in match.groupdict().items()}
+                allowed = True
+        return None, 405 if allowed else 404
+
+
+class MockServer:
+    """The HTTP side: miners, injected latency and errors, statistics"""
+
+    def __init__(self, api, miners=1, latency=0.0, jitter=0.0, error_rate=0.0, slow=0.0,
+                 slow_latency=5.0, failing=0.0, seed=7):
+        self.api = api
+        self.miners = miners
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.slow_latency = slow_latency
+        self.rng = random.Random(seed)
+        self.slow = set(self.rng.sample(range(miners), round(miners * slow)))
+        self.failing = set(self.rng.sample(range(miners), round(miners * failing)))
+        self.counts = {}
+        self.seen = set()
+        self.requests = 0
+        self.started = time.monotonic()
+
+    def stats(self):
+        return {
+            'version': self.api.version,
+            'requests': self.requests,
+            'miners_seen': len(self.seen),
+            'uptime_s': round(time.monotonic() - self.started, 3),
+            'cpu_s': round(time.process_time(), 6),
+            'operations': dict(sorted(self.counts.items())),
+        }
+
+    def respond(self, method, target, headers, body):
+        """(response bytes, delay in seconds) for one request"""
+        path = urlsplit(target).path
+        miner = 0
+        match = MINER_PATH.match(path)
+        if match:
+            miner, path = int(match.group(1)), match.group(2)
+            if miner >= self.miners:
+                return message(404, f"No simulated miner {miner}"), 0
+        if path == STATS_PATH:
+            return http_response(200, self.stats()), 0
+
+        op, params = self.api.route(method, path)
+        if op is None:
+            text = 'Method not allowed' if params == 405 else f"No operation for {method} {path}"
+            return message(params, text), 0
+        self.requests += 1
+        self.counts[op.id] = self.counts.get(op.id, 0) + 1
+        self.seen.add(miner)
+
+        prefer = dict(part.strip().partition('=')[::2] for part in headers.get('prefer', '').split(',') if '=' in part)
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0)
+        if miner in self.slow:
+            delay += self.slow_latency
+        if self.api.auth and op.secured and not headers.get('authorization', '').startswith('Bearer '):
+            return op.render(401), delay
+        problem = op.check(params, headers, body)
+        if problem is not None:
+            return http_response(op.invalid, {'message': problem}), delay
+        if miner in self.failing or (self.error_rate and self.rng.random() < self.error_rate):
+            return op.render(op.failure), delay
+        status = int(prefer['code']) if prefer.get('code', '').isdigit() else op.success
+        if status not in op.responses and status not in HTTP_STATUSES:
+            return message(400, f"Prefer code={status} is not an HTTP status"), delay
+        return op.render(status, prefer.get('example')), delay
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                lines = head.decode('latin-1').split('\r\n')
+                method, target, version = lines[0].split(' ', 2)
+                headers = {}
+                for line in lines[1:]:
+                    if line:
+                        name, _, value = line.partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                body = b''
+                if 'content-length' in headers:
+                    body = await reader.readexactly(int(headers['content-length']))
+                elif headers.get('transfer-encoding', '').lower() == 'chunked':
+                    chunks = []
+                    while size := int((await reader.readuntil(b'\r\n')).split(b';', 1)[0], 16):
+                        chunks.append(await reader.readexactly(size))
+                        await reader.readexactly(2)
+                    while await reader.readuntil(b'\r\n') != b'\r\n':
+                        pass
+                    body = b''.join(chunks)
+
+                response, delay = self.respond(method, target, headers, body)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                writer.write(response)
+                if len(response) > 65536:
+                    await writer.drain()
+                if headers.get('connection', '').lower() == 'close' or version != 'HTTP/1.1':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8080, ready=None):
+        server = await asyncio.start_server(self.handle, host, port, backlog=4096)
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
+
+def load_overrides(pairs):
+    """{operation id: JSON value} from "METHOD /path=file.json" arguments"""
+    overrides = {}
+    for pair in pairs or []:
+        operation_id, _, path = pair.rpartition('=')
+        with open(path, encoding='utf-8') as f:
+            overrides[operation_id.strip()] = json.load(f)
+    return overrides
+
+
+def build_server(spec_path=SPEC_PATH, auth=False, overrides=None, **options):
+    spec, _ = load_spec(spec_path)
+    return MockServer(MockApi(spec, auth, overrides), **options)
+
+
+# -- benchmark -------------------------------------------------------------
+
+def request_bytes(method, path, body=None, content_type='application/json', headers=()):
+    lines = [f"{method} {path} HTTP/1.1", 'Host: 127.0.0.1', 'Authorization: Bearer mock', *headers]
+    if body is not None:
+        lines += [f"Content-Type: {content_type}", f"Content-Length: {len(body)}"]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b'')
+
+
+def example_requests(spec, upload_size=65536):
+    """One valid request (bytes) per operation, with its expected status"""
+    graph = RefGraph(spec)
+    api = MockApi(spec)
+    requests = []
+    for operation_id, _, path, operation, path_parameters in operations(spec):
+        op = api.operation(operation_id)
+        parameters = [graph.resolve(p['$ref']) if '$ref' in p else p
+                      for p in path_parameters + operation.get('parameters', [])]
+        target = path
+        for parameter in parameters:
+            if parameter.get('in') == 'path':
+                value = example_for(graph, parameter.get('schema', {}))
+                target = target.replace(f"{{{parameter['name']}}}", str(value))
+        body, content_type = None, 'application/json'
+        content = (operation.get('requestBody') or {}).get('content', {})
+        if op.body == 'json':
+            media = content['application/json']
+            value = media.get('example', example_for(graph, media.get('schema', {})))
+            body = json.dumps(value).encode('utf-8')
+        elif op.body == 'multipart':
+            boundary = 'mockboundary'
+            parts = b''.join(f'--{boundary}\r\nContent-Disposition: form-data; name="{field}"; filename="update.swu"\r\n'
+                             f'Content-Type: application/octet-stream\r\n\r\n'.encode() + b'\0' * upload_size + b'\r\n'
+                             for field in op.fields)
+            body, content_type = parts + f"--{boundary}--\r\n".encode(), f"multipart/form-data; boundary={boundary}"
+        requests.append((operation_id, request_bytes(op.method, target, body, content_type), op.success))
+    return requests
+
+
+def _serve(spec_path, port, ready):
+    asyncio.run(build_server(spec_path, auth=True, miners=10000).serve('127.0.0.1', port, ready))
+
+
+async def _load(port, requests, connections, duration):
+    """Requests/s from connections keep-alive clients cycling through requests"""
+    status_line = re.compile(rb'HTTP/1\.1 (\d+)')
+    length = re.compile(rb'(?i)\r\ncontent-length: *(\d+)')
+    counts = []
+    deadline = time.monotonic() + duration
+
+    async def client(offset):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        done = 0
+        while time.monotonic() < deadline:
+            _, request, expected = requests[(offset + done) % len(requests)]
+            writer.write(request)
+            head = await reader.readuntil(b'\r\n\r\n')
+            match = length.search(head)
+            if match:
+                await reader.readexactly(int(match.group(1)))
+            status = int(status_line.match(head).group(1))
+            if status != expected:
+                raise AssertionError(f"{requests[(offset + done) % len(requests)][0]}: HTTP {status}")
+            done += 1
+        writer.close()
+        counts.append(done)
+
+    start = time.monotonic()
+    await asyncio.gather(*(client(index) for index in range(connections)))
+    return sum(counts) / (time.monotonic() - start)
+
+
+def _server_cpu(port):
+    import urllib.request
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{STATS_PATH}") as response:
+        stats = json.load(response)
+    return stats['cpu_s'], stats['requests']
+
+
+def benchmark(spec_path=SPEC_PATH, connections=32, duration=3.0, port=18600):
+    """Requests/s and server CPU per request for a few request mixes"""
+    spec, _ = load_spec(spec_path)
+    requests = example_requests(spec)
+    by_id = {request[0]: request for request in requests}
+    telemetry = ('GET /api/v1/telemetry', request_bytes('GET', '/m/42/api/v1/telemetry?level=miner,hashboard,asic,PSU',
+                                                       headers=['Prefer: example=all_data']), 200)
+    mixes = [
+        ('every operation, round robin', requests),
+        ('GET /api/v1/telemetry (all_data)', [telemetry]),
+        ('POST /api/v1/timeseries', [by_id['POST /api/v1/timeseries']]),
+        ('PUT /api/v1/system/update (64 KiB upload)', [by_id['PUT /api/v1/system/update']]),
+    ]
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=_serve, args=(spec_path, port, ready), daemon=True)
+    server.start()
+    ready.wait(10)
+    results = {'operations': len(requests), 'connections': connections, 'mixes': []}
+    try:
+        # Every operation once, on its own, before timing anything
+        asyncio.run(_load(port, requests, 1, 0.2))
+        for label, mix in mixes:
+            cpu_before, count_before = _server_cpu(port)
+            rates = [asyncio.run(_load(port, mix, connections, duration / 3)) for _ in range(3)]
+            cpu_after, count_after = _server_cpu(port)
+            served = count_after - count_before
+            results['mixes'].append({'mix': label, 'requests_per_s': statistics.median(rates),
+                                     'server_cpu_us': (cpu_after - cpu_before) / served * 1e6})
+    finally:
+        server.terminate()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--spec', default=str(SPEC_PATH), help='spec file to mock')
+    parser.add_argument('--host', help='listen address (default: from the spec servers)')
+    parser.add_argument('--port', type=int, help='listen port (default: from the spec servers)')
+    parser.add_argument('--miners', type=int, default=1, help='simulated miners, served at /m/<n>/')
+    parser.add_argument('--latency', type=float, default=0.0, help='added latency per response in ms')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random latency of up to this many ms')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='share of responses replaced by the documented 5xx response')
+    parser.add_argument('--slow', type=float, default=0.0, help='share of miners answering slowly')
+    parser.add_argument('--slow-latency', type=float, default=5000.0, help='latency of the slow miners in ms')
+    parser.add_argument('--failing', type=float, default=0.0, help='share of miners always answering 5xx')
+    parser.add_argument('--auth', action='store_true', help='answer 401 to secured operations without a bearer token')
+    parser.add_argument('--response', action='append', metavar='"METHOD /path=FILE"',
+                        help='serve FILE as the success body of an operation (repeatable)')
+    parser.add_argument('--benchmark', action='store_true', help='measure throughput and exit')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.spec)
+        print(f"📊 {result['operations']} operations, {result['connections']} keep-alive connections, "
+              f"client and server on one machine")
+        for mix in result['mixes']:
+            print(f"   - {mix['mix']:<44} {mix['requests_per_s']:>8,.0f} req/s, "
+                  f"server {mix['server_cpu_us']:5.0f} µs CPU/request")
+        return True
+
+    spec, _ = load_spec(args.spec)
+    default = urlsplit(spec.get('servers', [{}])[0].get('url', 'http://127.0.0.1:8080'))
+    host = args.host or default.hostname or '127.0.0.1'
+    port = args.port or default.port or 8080
+    server = MockServer(MockApi(spec, args.auth, load_overrides(args.response)), miners=args.miners,
+                        latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate,
+                        slow=args.slow, slow_latency=args.slow_latency / 1000, failing=args.failing)
+    print(f"✅ Mock Proto API {server.api.version}: {len(server.api.operations)} operations "
+          f"on http://{host}:{port}" + (f" ({args.miners} miners at /m/<n>/)" if args.miners > 1 else ''))
+    try:
+        asyncio.run(server.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Desired-state pool configuration sync across a fleet
+- Reads every miner's GET /api/v1/pools concurrently and diffs it against
+  the desired pools (at most three), matched by PoolPriority
+- Only changed pools are written: PUT /api/v1/pools/{id} for an edit,
+  DELETE for a pool no longer wanted, and a single POST /api/v1/pools
+  (which replaces the whole set) when pools must be added or all change
+- POST /api/v1/pools/test-connection runs once per PoolUrl and
+  PoolUsername about to be written, not once per miner; miners that would
+  get a failing pool are left alone
+- Requests run with bounded parallelism overall and per subnet (the
+  miner's own, not its inventory group)
+- --plan prints the operations without writing; --benchmark compares with
+  blind per-miner writes against a simulated fleet
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import re
+import sys
+import time
+from pathlib import Path
+
+from proto_client import AsyncClient, BearerAuth, PoolConfig_inner, TestConnection
+from proto_http import ApiError
+from telemetry_poller import DEFAULT_PER_SUBNET, load_inventory, subnet_of
+
+MAX_POOLS = 3
+DEFAULT_CONCURRENCY = 64
+DEFAULT_DEADLINE = 10.0
+TEST_ATTEMPTS = 3        # miners tried for one connectivity test before the pool counts as failed
+COMPARED = (('name', 'name'), ('url', 'url'), ('username', 'user'))  # (PoolConfig key, Pool key)
+ERRORS = (OSError, ApiError, ValueError, TimeoutError, asyncio.IncompleteReadError)
+
+
+def normalize_pools(pools):
+    """PoolConfig dicts sorted by priority; priority defaults to the list position"""
+    if len(pools) > MAX_POOLS:
+        raise ValueError(f"At most {MAX_POOLS} pools can be configured, got {len(pools)}")
+    configs = []
+    for index, pool in enumerate(pools):
+        if not pool.get('url'):
+            raise ValueError(f"Pool {index} has no url")
+        config = {'name': pool.get('name'), 'url': pool['url'], 'username': pool.get('username', pool.get('user')),
+                  'password': pool.get('password'), 'priority': pool.get('priority', index)}
+        configs.append({key: value for key, value in config.items() if value is not None})
+    priorities = [config['priority'] for config in configs]
+    if len(set(priorities)) != len(priorities):
+        raise ValueError(f"Duplicate pool priorities: {priorities}")
+    return sorted(configs, key=lambda config: config['priority'])
+
+
+def load_desired(path):
+    """{group: [PoolConfig dict]} from a JSON file
+
+    The file holds either one PoolConfig list for every miner, or an object
+    mapping inventory groups (and "default") to PoolConfig lists.
+    """
+    data = json.loads(Path(path).read_text(encoding='utf-8'))
+    groups = {'default': data} if isinstance(data, list) else data
+    return {group: normalize_pools(pools) for group, pools in groups.items()}
+
+
+class PoolOp:
+    """One write to a miner: POST (the whole set), PUT (one pool by id) or DELETE"""
+
+    __slots__ = ('method', 'pool_id', 'config')
+
+    def __init__(self, method, pool_id=None, config=None):
+        self.method = method
+        self.pool_id = pool_id
+        self.config = config
+
+    @property
+    def pools(self):
+        """PoolConfig dicts this write installs"""
+        if self.method == 'POST':
+            return self.config
+        return [self.config] if self.method == 'PUT' else []
+
+    async def send(self, client):
+        if self.method == 'POST':
+            await client.create_pools(body=[PoolConfig_inner.from_dict(config) for config in self.config])
+        elif self.method == 'PUT':
+            await client.edit_pool(self.pool_id, PoolConfig_inner.from_dict(self.config))
+        else:
+            await client.delete_pool(self.pool_id)
+
+    def __str__(self):
+        if self.method == 'POST':
+            return 'POST ' + ', '.join(f"{config['priority']}={config['url']}" for config in self.config)
+        if self.method == 'PUT':
+            return f"PUT {self.pool_id} -> {self.config['url']}"
+        return f"DELETE {self.pool_id}"
+
+
+def _matches(pool, config):
+    # Passwords are write-only in the API, so they cannot be compared
+    return all(config.get(key) is None or pool.get(current) == config[key] for key, current in COMPARED)
+
+
+def plan_miner(pools, desired, replace=False):
+    """The fewest writes turning a miner's PoolsList into the desired PoolConfig
+
+    pools are Pool dicts as listed by the miner. An existing pool is edited
+    in place or deleted, so an unchanged (possibly active) pool keeps its
+    connection; one POST replaces the set when a priority has no pool yet,
+    or when every pool would be rewritten anyway.
+    """
+    if replace:
+        return [PoolOp('POST', config=desired)]
+    current = {pool['priority'] if pool.get('priority') is not None else pool['id']: pool for pool in pools}
+    wanted = {config['priority']: config for config in desired}
+    edits = [PoolOp('PUT', current[priority]['id'], config) for priority, config in wanted.items()
+             if priority in current and not _matches(current[priority], config)]
+    removals = [PoolOp('DELETE', pool['id']) for priority, pool in current.items() if priority not in wanted]
+    changed = len(edits) + len(removals)
+    if any(priority not in current for priority in wanted) or (changed > 1 and changed == len(current)):
+        return [PoolOp('POST', config=desired)]
+    return removals + edits
+
+
+def pool_key(config):
+    return config['url'], config.get('username')
+
+
+class MinerSync:
+    """One miner's plan and outcome
+
+    status: in_sync, planned, applied, fetch_failed, pool_failed (a pool it
+    would get failed its connectivity test) or write_failed
+    """
+
+    __slots__ = ('miner', 'group', 'status', 'ops', 'writes', 'error')
+
+    def __init__(self, miner, group, status, ops=(), error=None):
+        self.miner = miner
+        self.group = group
+        self.status = status
+        self.ops = list(ops)
+        self.writes = 0
+        self.error = error
+
+    def to_dict(self):
+        return {'miner': self.miner, 'group': self.group, 'status': self.status,
+                'ops': [str(op) for op in self.ops], 'writes': self.writes, 'error': self.error}
+
+
+class SyncReport:
+    __slots__ = ('miners', 'counts', 'writes', 'pools_written', 'tests', 'failed_pools', 'seconds')
+
+    def __init__(self, results, tests, seconds):
+        self.miners = len(results)
+        self.counts = {}
+        for result in results:
+            self.counts[result.status] = self.counts.get(result.status, 0) + 1
+        self.writes = sum(result.writes for result in results)
+        self.pools_written = sum(len(op.pools) or 1 for result in results for op in result.ops[:result.writes])
+        self.tests = len(tests)
+        self.failed_pools = sorted(f"{url} ({user})" for (url, user), error in tests.items() if error)
+        self.seconds = seconds
+
+    def line(self):
+        counts = ', '.join(f"{count} {status}" for status, count in sorted(self.counts.items()))
+        return (f"{self.miners} miners ({counts}): {self.writes} writes touching {self.pools_written} pools, "
+                f"{self.tests} connectivity tests, {self.seconds:.1f} s")
+
+
+class PoolSync:
+    """Brings the pools of every miner in an inventory to the desired state
+
+    desired is {group: [PoolConfig dict]}; miners whose group is missing
+    get desired['default'], and are skipped when there is none. The group
+    only picks the pools; per_subnet limits requests by each miner's own
+    subnet, whatever its group.
+    """
+
+    def __init__(self, inventory, desired, concurrency=DEFAULT_CONCURRENCY, per_subnet=DEFAULT_PER_SUBNET,
+                 deadline=DEFAULT_DEADLINE, auth=None, test=True, replace=False, on_miner=None):
+        self.inventory = [(url, group) for url, group in inventory if group in desired or 'default' in desired]
+        self.desired = desired
+        self.concurrency = concurrency
+        self.per_subnet = per_subnet
+        self.test = test
+        self.replace = replace
+        self.on_miner = on_miner
+        self.clients = {url: AsyncClient(url, auth=auth, timeout=deadline, max_connections=1)
+                        for url, _ in self.inventory}
+        self.subnets = {url: subnet_of(url) for url, _ in self.inventory}
+        self.results = []
+        self.tests = {}
+        self._slots = None
+        self._limits = {}
+
+    async def _limited(self, url, work):
+        async with self._slots, self._limits[self.subnets[url]]:
+            return await work
+
+    async def _plan(self, url, group):
+        try:
+            listed = await self._limited(url, self.clients[url].transport.request('GET', '/api/v1/pools'))
+        except ERRORS as e:
+            return MinerSync(url, group, 'fetch_failed', error=str(e) or type(e).__name__)
+        ops = plan_miner((listed or {}).get('pools') or [], self.desired.get(group, self.desired.get('default')),
+                         self.replace)
+        return MinerSync(url, group, 'planned' if ops else 'in_sync', ops)
+
+    async def plan(self):
+        """Fetch every PoolsList and diff it; [MinerSync]"""
+        self._slots = asyncio.Semaphore(self.concurrency)
+        for subnet in self.subnets.values():
+            self._limits.setdefault(subnet, asyncio.Semaphore(self.per_subnet))
+        self.results = list(await asyncio.gather(*(self._plan(url, group) for url, group in self.inventory)))
+        return self.results
+
+    async def _test(self, key, config, candidates):
+        """None when the pool answered, else the error; tried from up to TEST_ATTEMPTS miners"""
+        error = 'not tested'
+        for url in candidates[:TEST_ATTEMPTS]:
+            try:
+                await self._limited(url, self.clients[url].test_pool_connection(TestConnection.from_dict(config)))
+                return None
+            except ApiError as e:
+                error = str(e)
+                if e.status == 503:
+                    # Unable to establish connection: the pool, not the miner
+                    return error
+            except ERRORS as e:
+                error = str(e) or type(e).__name__
+        return error
+
+    async def test_pools(self):
+        """One connectivity test per PoolUrl/PoolUsername in the plan; {key: None or error}"""
+        pending = {}
+        for result in self.results:
+            for op in result.ops:
+                for config in op.pools:
+                    entry = pending.setdefault(pool_key(config), (config, []))
+                    if result.miner not in entry[1]:
+                        entry[1].append(result.miner)
+        errors = await asyncio.gather(*(self._test(key, config, candidates)
+                                        for key, (config, candidates) in pending.items()))
+        self.tests = dict(zip(pending, errors))
+        return self.tests
+
+    async def _apply(self, result):
+        if result.status == 'planned' and any(self.tests.get(pool_key(config))
+                                              for op in result.ops for config in op.pools):
+            result.status = 'pool_failed'
+            result.error = '; '.join(sorted({self.tests[pool_key(config)] for op in result.ops
+                                             for config in op.pools if self.tests.get(pool_key(config))}))
+        elif result.status == 'planned':
+            client = self.clients[result.miner]
+            try:
+                for op in result.ops:
+                    await self._limited(result.miner, op.send(client))
+                    result.writes += 1
+                result.status = 'applied'
+            except ERRORS as e:
+                result.status, result.error = 'write_failed', str(e) or type(e).__name__
+        if self.on_miner is not None:
+            self.on_miner(result)
+
+    async def run(self, apply=True):
+        """Plan, test and (unless apply is False) write; a SyncReport"""
+        started = time.monotonic()
+        try:
+            await self.plan()
+            if self.test:
+                await self.test_pools()
+            if apply:
+                await asyncio.gather(*(self._apply(result) for result in self.results))
+        finally:
+            await self.close()
+        return SyncReport(self.results, self.tests, time.monotonic() - started)
+
+    async def close(self):
+        for client in self.clients.values():
+            await client.close()
+
+
+# -- benchmark -------------------------------------------------------------
+
+DESIRED = [
+    {'name': 'Primary', 'url': 'stratum+tcp://stratum.braiins.com:3333', 'username': 'fleet.worker', 'password': 'x'},
+    {'name': 'Backup', 'url': 'stratum+tcp://btc.viabtc.io:3333', 'username': 'fleet.worker', 'password': 'x'},
+    {'name': 'Fallback', 'url': 'stratum+tcp://ss.antpool.com:3333', 'username': 'fleet.worker', 'password': 'x'},
+]
+OLD_PRIMARY = {'name': 'Primary', 'url': 'stratum+tcp://us-east.stratum.slushpool.com:3333', 'username': 'old.worker'}
+
+
+def _serve_pools(port, miners, write_latency, test_latency, ready):
+    """One listener standing in for many miners' /m/<n>/api/v1/pools with per-miner state
+
+    Half the fleet starts in the DESIRED state, a third on an old primary
+    pool, and the rest with only the old primary configured. Writes take
+    write_latency and connectivity tests test_latency; GET /__stats__
+    counts writes, pools written and tests.
+    """
+    import random
+    rng = random.Random(3)
+    state = {}
+    for miner in range(miners):
+        draw = rng.random()
+        pools = normalize_pools(DESIRED)
+        if draw >= 0.5:
+            pools[0] = dict(OLD_PRIMARY, priority=0)
+        if draw >= 0.83:
+            pools = pools[:1]
+        state[miner] = [dict(config, id=index) for index, config in enumerate(pools)]
+    stats = {'writes': 0, 'pools_written': 0, 'tests': 0}
+    request_line = re.compile(rb'^(\w+) (?:/m/(\d+))?(/\S*) ')
+
+    def listed(pools):
+        return {'pools': [{'id': pool['id'], 'name': pool.get('name', ''), 'priority': pool['priority'],
+                           'url': pool['url'], 'user': pool.get('username'), 'status': 'Active' if not index else 'Idle',
+                           'protocol': 'Stratum V1', 'accepted': 100, 'rejected': 1}
+                          for index, pool in enumerate(pools)]}
+
+    async def respond(method, miner, path, body):
+        if path == '/__stats__':
+            return 200, stats
+        pools = state[miner]
+        if path == '/api/v1/pools/test-connection':
+            stats['tests'] += 1
+            await asyncio.sleep(test_latency)
+            if 'unreachable' in body['url']:
+                return 503, {'message': 'Unable to establish connection.'}
+            return 200, {'message': 'Connection test passed.'}
+        if method == 'GET':
+            return 200, listed(pools)
+        stats['writes'] += 1
+        await asyncio.sleep(write_latency)
+        if method == 'POST':
+            stats['pools_written'] += len(body)
+            state[miner] = [dict(config, id=index) for index, config in enumerate(normalize_pools(body))]
+            return 200, {'message': 'Pools configured.'}
+        pool_id = int(path.rsplit('/', 1)[1])
+        stats['pools_written'] += 1
+        if method == 'PUT':
+            state[miner] = [dict(body, id=pool_id) if pool['id'] == pool_id else pool for pool in pools]
+        else:
+            state[miner] = [pool for pool in pools if pool['id'] != pool_id]
+        return 200, {'message': 'Pool updated.'}
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                match = request_line.match(head)
+                length = re.search(rb'(?i)\r\ncontent-length: *(\d+)', head)
+                data = await reader.readexactly(int(length.group(1))) if length else b''
+                status, result = await respond(match.group(1).decode(), int(match.group(2) or 0),
+                                               match.group(3).decode(), json.loads(data) if data else None)
+                body = json.dumps(result, separators=(',', ':')).encode()
+                writer.write(f"HTTP/1.1 {status} {'OK' if status == 200 else 'Service Unavailable'}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, AttributeError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, '127.0.0.1', port, backlog=1024)
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def _naive(inventory, desired, concurrency):
+    """Today's approach: every pool tested from every miner, one at a time, then a blind POST per miner"""
+    clients = [AsyncClient(url, timeout=None, max_connections=1) for url, _ in inventory]
+    started = time.monotonic()
+    try:
+        for client in clients:
+            for config in desired:
+                await client.test_pool_connection(TestConnection.from_dict(config))
+        slots = asyncio.Semaphore(concurrency)
+
+        async def write(client):
+            async with slots:
+                await PoolOp('POST', config=desired).send(client)
+
+        await asyncio.gather(*(write(client) for client in clients))
+    finally:
+        for client in clients:
+            await client.close()
+    return time.monotonic() - started
+
+
+def benchmark(miners=100, write_latency=0.05, test_latency=0.03, concurrency=DEFAULT_CONCURRENCY, port=18780):
+    context = multiprocessing.get_context('spawn')
+    desired = {'default': normalize_pools(DESIRED)}
+    servers = []
+    try:
+        for offset in range(2):
+            ready = context.Event()
+            server = context.Process(target=_serve_pools, daemon=True,
+                                     args=(port + offset, miners, write_latency, test_latency, ready))
+            server.start()
+            servers.append(server)
+            if not ready.wait(30):
+                raise RuntimeError('simulated pool server did not start')
+
+        def inventory(offset):
+            return [(f"http://127.0.0.1:{port + offset}/m/{n}", 'sim') for n in range(miners)]
+
+        async def stats(offset):
+            client = AsyncClient(f"http://127.0.0.1:{port + offset}", timeout=None)
+            try:
+                return await client.transport.request('GET', '/__stats__')
+            finally:
+                await client.close()
+
+        naive_s = asyncio.run(_naive(inventory(0), desired['default'], concurrency))
+        report = asyncio.run(PoolSync(inventory(1), desired, concurrency).run())
+        # A second pass must find nothing left to do
+        again = asyncio.run(PoolSync(inventory(1), desired, concurrency).run(apply=False))
+        return {'miners': miners, 'naive_s': naive_s, 'naive': asyncio.run(stats(0)), 'sync': asyncio.run(stats(1)),
+                'report': report, 'left': again.miners - again.counts.get('in_sync', 0)}
+    finally:
+        for server in servers:
+            server.terminate()
+            server.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('inventory', nargs='?', help='file with one miner per line, optionally followed by its group')
+    parser.add_argument('desired', nargs='?',
+                        help='JSON PoolConfig list, or an object of PoolConfig lists by group and "default"')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='requests in flight overall')
+    parser.add_argument('--per-subnet', type=int, default=DEFAULT_PER_SUBNET, help='requests in flight per subnet')
+    parser.add_argument('--deadline', type=float, default=DEFAULT_DEADLINE, help='per-request deadline in seconds')
+    parser.add_argument('--no-test', action='store_true', help='skip POST /api/v1/pools/test-connection')
+    parser.add_argument('--replace', action='store_true',
+                        help='POST the whole set to every miner (e.g. to push a new password, which cannot be read)')
+    parser.add_argument('--plan', action='store_true', help='print the operations per miner without writing')
+    parser.add_argument('--token', help='JWT bearer token')
+    parser.add_argument('-o', '--output', help='write one JSON line per miner here')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare with serial tests and blind writes against a simulated fleet')
+    parser.add_argument('--miners', type=int, default=100, help='simulated miners for --benchmark')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.miners)
+        report, naive, sync = result['report'], result['naive'], result['sync']
+        print(f"📊 {result['miners']} simulated miners, half already on the desired pools")
+        print(f"   - {'Blind writes:':<14} {naive['writes']:4d} writes touching {naive['pools_written']:4d} pools, "
+              f"{naive['tests']:4d} serial tests, {result['naive_s']:6.2f} s")
+        print(f"   - {'Sync:':<14} {sync['writes']:4d} writes touching {sync['pools_written']:4d} pools, "
+              f"{sync['tests']:4d} tests, {report.seconds:6.2f} s ({report.line()})")
+        print(f"✅ {naive['writes'] / max(sync['writes'], 1):.1f}x fewer writes, "
+              f"{naive['pools_written'] / max(sync['pools_written'], 1):.1f}x fewer pools rewritten, "
+              f"{result['naive_s'] / report.seconds:.0f}x faster; {result['left']} miners out of sync afterwards")
+        return True
+
+    if not args.inventory or not args.desired:
+        parser.error('an inventory and a desired pools file are required (or --benchmark)')
+
+    def miner(result):
+        if result.status not in ('applied', 'in_sync'):
+            print(f"   ⚠️  {result.miner}: {result.status} - {result.error}", flush=True)
+
+    sync = PoolSync(load_inventory(args.inventory), load_desired(args.desired), args.concurrency, args.per_subnet,
+                    args.deadline, BearerAuth(args.token) if args.token else None, not args.no_test, args.replace,
+                    on_miner=miner)
+    report = asyncio.run(sync.run(apply=not args.plan))
+    if args.plan:
+        for result in sync.results:
+            if result.ops or result.error:
+                print(f"{result.miner}: " + ('; '.join(map(str, result.ops)) or f"{result.status} - {result.error}"))
+    for pool in report.failed_pools:
+        print(f"⚠️  Connectivity test failed: {pool}")
+    print(f"{'📊' if args.plan else '✅'} {report.line()}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for result in sync.results:
+                f.write(json.dumps(result.to_dict()) + '\n')
+        print(f"✅ Wrote {len(sync.results)} results to {args.output}")
+    return not any(status in report.counts for status in ('fetch_failed', 'pool_failed', 'write_failed'))
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
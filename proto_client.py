@@ -0,0 +1,3111 @@
+# Generated by build_client.py from spec.json (Proto Mining API 1.7.7).
+# Do not edit; rerun `python3 build_client.py` after updating the spec.
+"""
+Typed clients for the Proto Mining API
+- Client: blocking, one kept-alive connection per miner
+- AsyncClient: asyncio, a small keep-alive pool per miner
+- Responses are decoded into the __slots__ models below
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+from proto_http import (DEFAULT_TIMEOUT, ApiError, AsyncTransport, BearerAuth, Model, Transport,
+                        Upload)
+
+API_VERSION = '1.7.7'
+DEFAULT_SERVER = 'http://127.0.0.1:8080'
+
+
+class Error(Model):
+    """Error information with code and message details"""
+
+    __slots__ = ('code', 'message')
+    _keys = ('code', 'message')
+
+    code: Optional[str]
+    message: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'Error':
+        self = cls.__new__(cls)
+        get = data.get
+        self.code = get('code')
+        self.message = get('message')
+        return self
+
+
+class ErrorResponse(Model):
+    """Error response containing error details"""
+
+    __slots__ = ('error',)
+    _keys = ('error',)
+
+    error: Optional[Error]
+
+    @classmethod
+    def from_dict(cls, data) -> 'ErrorResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('error')
+        self.error = None if value is None else Error.from_dict(value)
+        return self
+
+
+class NotificationError(Model):
+    """Notification error information with source and details"""
+
+    __slots__ = ('source', 'slot', 'error_code', 'timestamp', 'message')
+    _keys = ('source', 'slot', 'error_code', 'timestamp', 'message')
+
+    source: Optional[str]
+    slot: Optional[int]
+    error_code: Optional[str]
+    timestamp: Optional[int]
+    message: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'NotificationError':
+        self = cls.__new__(cls)
+        get = data.get
+        self.source = get('source')
+        self.slot = get('slot')
+        self.error_code = get('error_code')
+        self.timestamp = get('timestamp')
+        self.message = get('message')
+        return self
+
+
+class CoolingConfig(Model):
+    """Cooling system configuration for fan control modes"""
+
+    __slots__ = ('mode', 'speed_percentage')
+    _keys = ('mode', 'speed_percentage')
+
+    mode: Optional[str]
+    speed_percentage: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data) -> 'CoolingConfig':
+        self = cls.__new__(cls)
+        get = data.get
+        self.mode = get('mode')
+        self.speed_percentage = get('speed_percentage')
+        return self
+
+
+class MiningTarget(Model):
+    """Mining target configuration for power and performance settings"""
+
+    __slots__ = ('power_target_watts', 'performance_mode', 'balance_bays', 'hash_on_disconnect')
+    _keys = ('power_target_watts', 'performance_mode', 'balance_bays', 'hash_on_disconnect')
+
+    power_target_watts: Optional[int]
+    performance_mode: Optional[PerformanceMode]
+    balance_bays: Optional[bool]
+    hash_on_disconnect: Optional[bool]
+
+    @classmethod
+    def from_dict(cls, data) -> 'MiningTarget':
+        self = cls.__new__(cls)
+        get = data.get
+        self.power_target_watts = get('power_target_watts')
+        self.performance_mode = get('performance_mode')
+        self.balance_bays = get('balance_bays')
+        self.hash_on_disconnect = get('hash_on_disconnect')
+        return self
+
+
+class MiningTargetResponse(Model):
+    """Response containing current mining target configuration"""
+
+    __slots__ = (
+        'power_target_watts', 'performance_mode', 'balance_bays', 'power_target_min_watts',
+        'power_target_max_watts', 'default_power_target_watts', 'hash_on_disconnect',
+    )
+    _keys = (
+        'power_target_watts', 'performance_mode', 'balance_bays', 'power_target_min_watts',
+        'power_target_max_watts', 'default_power_target_watts', 'hash_on_disconnect',
+    )
+
+    power_target_watts: Optional[int]
+    performance_mode: Optional[PerformanceMode]
+    balance_bays: Optional[bool]
+    power_target_min_watts: Optional[int]
+    power_target_max_watts: Optional[int]
+    default_power_target_watts: Optional[int]
+    hash_on_disconnect: Optional[bool]
+
+    @classmethod
+    def from_dict(cls, data) -> 'MiningTargetResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        self.power_target_watts = get('power_target_watts')
+        self.performance_mode = get('performance_mode')
+        self.balance_bays = get('balance_bays')
+        self.power_target_min_watts = get('power_target_min_watts')
+        self.power_target_max_watts = get('power_target_max_watts')
+        self.default_power_target_watts = get('default_power_target_watts')
+        self.hash_on_disconnect = get('hash_on_disconnect')
+        return self
+
+
+class MiningTuningConfig(Model):
+    """Mining tuning configuration for setting hashboard optimization algorithms"""
+
+    __slots__ = ('algorithm',)
+    _keys = ('algorithm',)
+
+    algorithm: Optional[MiningTuning]
+
+    @classmethod
+    def from_dict(cls, data) -> 'MiningTuningConfig':
+        self = cls.__new__(cls)
+        get = data.get
+        self.algorithm = get('algorithm')
+        return self
+
+
+class Pool(Model):
+    """Mining pool configuration with connection details and priorities"""
+
+    __slots__ = (
+        'id', 'name', 'priority', 'url', 'user', 'status', 'protocol', 'accepted', 'rejected',
+        'invalid', 'duplicate', 'notifys_received', 'works_generated', 'blocks_seen',
+        'current_works', 'current_difficulty', 'best_difficulty_share', 'last_share_difficulty',
+        'last_share_time', 'difficulty_accepted_shares', 'difficulty_rejected_shares',
+        'hashrate',
+    )
+    _keys = (
+        'id', 'name', 'priority', 'url', 'user', 'status', 'protocol', 'accepted', 'rejected',
+        'invalid', 'duplicate', 'notifys_received', 'works_generated', 'blocks_seen',
+        'current_works', 'current_difficulty', 'best_difficulty_share', 'last_share_difficulty',
+        'last_share_time', 'difficulty_accepted_shares', 'difficulty_rejected_shares',
+        'hashrate',
+    )
+
+    id: Optional[int]
+    name: Optional[str]
+    priority: Optional[int]
+    url: Optional[PoolUrl]
+    user: Optional[PoolUsername]
+    status: Optional[str]
+    protocol: Optional[str]
+    accepted: Optional[int]
+    rejected: Optional[int]
+    invalid: Optional[int]
+    duplicate: Optional[int]
+    notifys_received: Optional[int]
+    works_generated: Optional[int]
+    blocks_seen: Optional[int]
+    current_works: Optional[float]
+    current_difficulty: Optional[float]
+    best_difficulty_share: Optional[int]
+    last_share_difficulty: Optional[float]
+    last_share_time: Optional[int]
+    difficulty_accepted_shares: Optional[float]
+    difficulty_rejected_shares: Optional[float]
+    hashrate: Optional[List[HashrateWindow]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'Pool':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.priority = get('priority')
+        self.url = get('url')
+        self.user = get('user')
+        self.status = get('status')
+        self.protocol = get('protocol')
+        self.accepted = get('accepted')
+        self.rejected = get('rejected')
+        self.invalid = get('invalid')
+        self.duplicate = get('duplicate')
+        self.notifys_received = get('notifys_received')
+        self.works_generated = get('works_generated')
+        self.blocks_seen = get('blocks_seen')
+        self.current_works = get('current_works')
+        self.current_difficulty = get('current_difficulty')
+        self.best_difficulty_share = get('best_difficulty_share')
+        self.last_share_difficulty = get('last_share_difficulty')
+        self.last_share_time = get('last_share_time')
+        self.difficulty_accepted_shares = get('difficulty_accepted_shares')
+        self.difficulty_rejected_shares = get('difficulty_rejected_shares')
+        value = get('hashrate')
+        self.hashrate = None if value is None else [HashrateWindow.from_dict(item0) for item0 in value]
+        return self
+
+
+class PoolsList(Model):
+    """List of configured mining pools with their settings"""
+
+    __slots__ = ('pools',)
+    _keys = ('pools',)
+
+    pools: Optional[List[Pool]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PoolsList':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('pools')
+        self.pools = None if value is None else [Pool.from_dict(item0) for item0 in value]
+        return self
+
+
+class PoolResponse(Model):
+    """Response containing a single pool configuration"""
+
+    __slots__ = ('pool',)
+    _keys = ('pool',)
+
+    pool: Optional[Pool]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PoolResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('pool')
+        self.pool = None if value is None else Pool.from_dict(value)
+        return self
+
+
+class MiningStatus(Model):
+    """Mining statistics"""
+
+    __slots__ = ('mining_status',)
+    _keys = ('mining-status',)
+
+    mining_status: Optional[MiningStatus_miningstatus]
+
+    @classmethod
+    def from_dict(cls, data) -> 'MiningStatus':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('mining-status')
+        self.mining_status = None if value is None else MiningStatus_miningstatus.from_dict(value)
+        return self
+
+
+class HashboardStats(Model):
+    """Statistics and status information for a hashboard"""
+
+    __slots__ = ('hashboard_stats',)
+    _keys = ('hashboard-stats',)
+
+    hashboard_stats: Optional[HashboardStats_hashboardstats]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HashboardStats':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('hashboard-stats')
+        self.hashboard_stats = None if value is None else HashboardStats_hashboardstats.from_dict(value)
+        return self
+
+
+class AsicStats(Model):
+    """Statistics and performance data for an individual ASIC chip"""
+
+    __slots__ = (
+        'index', 'row', 'column', 'freq_mhz', 'temp_c', 'voltage_mv', 'hashrate_ghs',
+        'ideal_hashrate_ghs', 'error_rate',
+    )
+    _keys = (
+        'index', 'row', 'column', 'freq_mhz', 'temp_c', 'voltage_mv', 'hashrate_ghs',
+        'ideal_hashrate_ghs', 'error_rate',
+    )
+
+    index: Optional[int]
+    row: Optional[int]
+    column: Optional[int]
+    freq_mhz: Optional[float]
+    temp_c: Optional[float]
+    voltage_mv: Optional[float]
+    hashrate_ghs: Optional[float]
+    ideal_hashrate_ghs: Optional[float]
+    error_rate: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'AsicStats':
+        self = cls.__new__(cls)
+        get = data.get
+        self.index = get('index')
+        self.row = get('row')
+        self.column = get('column')
+        self.freq_mhz = get('freq_mhz')
+        self.temp_c = get('temp_c')
+        self.voltage_mv = get('voltage_mv')
+        self.hashrate_ghs = get('hashrate_ghs')
+        self.ideal_hashrate_ghs = get('ideal_hashrate_ghs')
+        self.error_rate = get('error_rate')
+        return self
+
+
+class AsicStatsResponse(Model):
+    """Response containing statistics data for a specific ASIC chip"""
+
+    __slots__ = ('asic_stats',)
+    _keys = ('asic-stats',)
+
+    asic_stats: Optional[AsicStats]
+
+    @classmethod
+    def from_dict(cls, data) -> 'AsicStatsResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('asic-stats')
+        self.asic_stats = None if value is None else AsicStats.from_dict(value)
+        return self
+
+
+class CoolingStatus(Model):
+    """Current cooling system status and fan information"""
+
+    __slots__ = ('cooling_status',)
+    _keys = ('cooling-status',)
+
+    cooling_status: Optional[CoolingStatus_coolingstatus]
+
+    @classmethod
+    def from_dict(cls, data) -> 'CoolingStatus':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('cooling-status')
+        self.cooling_status = None if value is None else CoolingStatus_coolingstatus.from_dict(value)
+        return self
+
+
+class FanStatus(Model):
+    """Current status and performance metrics for individual cooling fans"""
+
+    __slots__ = ('slot', 'rpm', 'percentage')
+    _keys = ('slot', 'rpm', 'percentage')
+
+    slot: Optional[int]
+    rpm: Optional[int]
+    percentage: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data) -> 'FanStatus':
+        self = cls.__new__(cls)
+        get = data.get
+        self.slot = get('slot')
+        self.rpm = get('rpm')
+        self.percentage = get('percentage')
+        return self
+
+
+class HardwareInfo(Model):
+    """Complete hardware information including hashboards, PSUs, and cooling components"""
+
+    __slots__ = ('hardware_info',)
+    _keys = ('hardware-info',)
+
+    hardware_info: Optional[HardwareInfo_hardwareinfo]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HardwareInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('hardware-info')
+        self.hardware_info = None if value is None else HardwareInfo_hardwareinfo.from_dict(value)
+        return self
+
+
+class HashboardsInfo(Model):
+    """Information about all hashboards connected to the mining device"""
+
+    __slots__ = ('hashboards_info',)
+    _keys = ('hashboards-info',)
+
+    hashboards_info: Optional[List[HashboardInfo]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HashboardsInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('hashboards-info')
+        self.hashboards_info = None if value is None else [HashboardInfo.from_dict(item0) for item0 in value]
+        return self
+
+
+class PSUsInfo(Model):
+    """Information about all power supply units in the mining device"""
+
+    __slots__ = ('PSUs_info',)
+    _keys = ('PSUs-info',)
+
+    PSUs_info: Optional[List[PSUInfo]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PSUsInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('PSUs-info')
+        self.PSUs_info = None if value is None else [PSUInfo.from_dict(item0) for item0 in value]
+        return self
+
+
+class PowerSuppliesResponse(Model):
+    """Power supply information including firmware update status"""
+
+    __slots__ = ('PSUs_info', 'PSU_update_status')
+    _keys = ('PSUs_info', 'PSU_update_status')
+
+    PSUs_info: Optional[List[PSUInfo]]
+    PSU_update_status: Optional[PSUUpdateStatus]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PowerSuppliesResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('PSUs_info')
+        self.PSUs_info = None if value is None else [PSUInfo.from_dict(item0) for item0 in value]
+        value = get('PSU_update_status')
+        self.PSU_update_status = None if value is None else PSUUpdateStatus.from_dict(value)
+        return self
+
+
+class SystemInfo(Model):
+    """Complete system information including hardware, software, and OS details"""
+
+    __slots__ = ('system_info',)
+    _keys = ('system-info',)
+
+    system_info: Optional[SystemInfo_systeminfo]
+
+    @classmethod
+    def from_dict(cls, data) -> 'SystemInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('system-info')
+        self.system_info = None if value is None else SystemInfo_systeminfo.from_dict(value)
+        return self
+
+
+class OSInfo(Model):
+    """Operating system information and version details"""
+
+    __slots__ = (
+        'name', 'version', 'git_hash', 'variant', 'build_datetime_utc', 'machine', 'status',
+    )
+    _keys = (
+        'name', 'version', 'git_hash', 'variant', 'build_datetime_utc', 'machine', 'status',
+    )
+
+    name: Optional[str]
+    version: Optional[str]
+    git_hash: Optional[str]
+    variant: Optional[str]
+    build_datetime_utc: Optional[str]
+    machine: Optional[str]
+    status: Optional[OSStatus]
+
+    @classmethod
+    def from_dict(cls, data) -> 'OSInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.name = get('name')
+        self.version = get('version')
+        self.git_hash = get('git_hash')
+        self.variant = get('variant')
+        self.build_datetime_utc = get('build_datetime_utc')
+        self.machine = get('machine')
+        value = get('status')
+        self.status = None if value is None else OSStatus.from_dict(value)
+        return self
+
+
+class OSStatus(Model):
+    """Operating system status including memory, CPU, and filesystem usage"""
+
+    __slots__ = (
+        'mem_total_kb', 'mem_free_kb', 'cpu_load_percent', 'rootfs_total_mb', 'rootfs_free_mb',
+    )
+    _keys = (
+        'mem_total_kb', 'mem_free_kb', 'cpu_load_percent', 'rootfs_total_mb', 'rootfs_free_mb',
+    )
+
+    mem_total_kb: Optional[int]
+    mem_free_kb: Optional[int]
+    cpu_load_percent: Optional[float]
+    rootfs_total_mb: Optional[int]
+    rootfs_free_mb: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data) -> 'OSStatus':
+        self = cls.__new__(cls)
+        get = data.get
+        self.mem_total_kb = get('mem_total_kb')
+        self.mem_free_kb = get('mem_free_kb')
+        self.cpu_load_percent = get('cpu_load_percent')
+        self.rootfs_total_mb = get('rootfs_total_mb')
+        self.rootfs_free_mb = get('rootfs_free_mb')
+        return self
+
+
+class FWInfo(Model):
+    """Firmware version and build information"""
+
+    __slots__ = ('version', 'git_hash', 'image_hash', 'build')
+    _keys = ('version', 'git_hash', 'image_hash', 'build')
+
+    version: Optional[str]
+    git_hash: Optional[str]
+    image_hash: Optional[str]
+    build: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'FWInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.version = get('version')
+        self.git_hash = get('git_hash')
+        self.image_hash = get('image_hash')
+        self.build = get('build')
+        return self
+
+
+class SWInfo(Model):
+    """Software component name and version information"""
+
+    __slots__ = ('name', 'version')
+    _keys = ('name', 'version')
+
+    name: Optional[str]
+    version: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'SWInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.name = get('name')
+        self.version = get('version')
+        return self
+
+
+class UpdateStatus(Model):
+    """Current status and information about system software updates"""
+
+    __slots__ = (
+        'status', 'current_version', 'new_version', 'message', 'progress', 'error',
+        'release_notes',
+    )
+    _keys = (
+        'status', 'current_version', 'new_version', 'message', 'progress', 'error',
+        'release_notes',
+    )
+
+    status: Optional[str]
+    current_version: Optional[str]
+    new_version: Optional[str]
+    message: Optional[str]
+    progress: Optional[int]
+    error: Optional[str]
+    release_notes: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'UpdateStatus':
+        self = cls.__new__(cls)
+        get = data.get
+        self.status = get('status')
+        self.current_version = get('current_version')
+        self.new_version = get('new_version')
+        self.message = get('message')
+        self.progress = get('progress')
+        self.error = get('error')
+        self.release_notes = get('release_notes')
+        return self
+
+
+class NetworkInfo(Model):
+    """Network configuration and status information for the mining device"""
+
+    __slots__ = ('network_info',)
+    _keys = ('network-info',)
+
+    network_info: Optional[NetworkInfo_networkinfo]
+
+    @classmethod
+    def from_dict(cls, data) -> 'NetworkInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('network-info')
+        self.network_info = None if value is None else NetworkInfo_networkinfo.from_dict(value)
+        return self
+
+
+class NetworkConfig(Model):
+    """Network configuration settings for DHCP or static IP setup"""
+
+    __slots__ = ('network_config',)
+    _keys = ('network-config',)
+
+    network_config: Optional[NetworkConfig_networkconfig]
+
+    @classmethod
+    def from_dict(cls, data) -> 'NetworkConfig':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('network-config')
+        self.network_config = None if value is None else NetworkConfig_networkconfig.from_dict(value)
+        return self
+
+
+class LogsResponse(Model):
+    """System log entries from various sources (OS, miner software, pool software)"""
+
+    __slots__ = ('logs',)
+    _keys = ('logs',)
+
+    logs: Optional[LogsResponse_logs]
+
+    @classmethod
+    def from_dict(cls, data) -> 'LogsResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('logs')
+        self.logs = None if value is None else LogsResponse_logs.from_dict(value)
+        return self
+
+
+class PasswordRequest(Model):
+    """Password data for authentication operations"""
+
+    __slots__ = ('password',)
+    _keys = ('password',)
+
+    password: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PasswordRequest':
+        self = cls.__new__(cls)
+        get = data.get
+        self.password = get('password')
+        return self
+
+
+class FanInfo(Model):
+    """Individual fan information including status and RPM data"""
+
+    __slots__ = ('slot', 'name', 'min_rpm', 'max_rpm')
+    _keys = ('slot', 'name', 'min_rpm', 'max_rpm')
+
+    slot: Optional[int]
+    name: Optional[str]
+    min_rpm: Optional[int]
+    max_rpm: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data) -> 'FanInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.slot = get('slot')
+        self.name = get('name')
+        self.min_rpm = get('min_rpm')
+        self.max_rpm = get('max_rpm')
+        return self
+
+
+class ChangePasswordRequest(Model):
+    """Request data for changing a user's password with current password verification"""
+
+    __slots__ = ('current_password', 'new_password')
+    _keys = ('current_password', 'new_password')
+
+    current_password: Optional[str]
+    new_password: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'ChangePasswordRequest':
+        self = cls.__new__(cls)
+        get = data.get
+        self.current_password = get('current_password')
+        self.new_password = get('new_password')
+        return self
+
+
+class AuthTokens(Model):
+    """JWT authentication tokens for access and refresh operations"""
+
+    __slots__ = ('refresh_token', 'access_token')
+    _keys = ('refresh_token', 'access_token')
+
+    refresh_token: Optional[str]
+    access_token: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'AuthTokens':
+        self = cls.__new__(cls)
+        get = data.get
+        self.refresh_token = get('refresh_token')
+        self.access_token = get('access_token')
+        return self
+
+
+class RefreshRequest(Model):
+    """Request data for refreshing JWT access tokens"""
+
+    __slots__ = ('refresh_token',)
+    _keys = ('refresh_token',)
+
+    refresh_token: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'RefreshRequest':
+        self = cls.__new__(cls)
+        get = data.get
+        self.refresh_token = get('refresh_token')
+        return self
+
+
+class RefreshResponse(Model):
+    """Response containing a new JWT access token"""
+
+    __slots__ = ('access_token',)
+    _keys = ('access_token',)
+
+    access_token: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'RefreshResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        self.access_token = get('access_token')
+        return self
+
+
+class TimeSeriesData(Model):
+    """Time series data point with timestamp and value for historical metrics"""
+
+    __slots__ = ('datetime', 'value')
+    _keys = ('datetime', 'value')
+
+    datetime: Optional[int]
+    value: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesData':
+        self = cls.__new__(cls)
+        get = data.get
+        self.datetime = get('datetime')
+        self.value = get('value')
+        return self
+
+
+class HashrateWindow(Model):
+    """Hashrate calculated over a specific time window"""
+
+    __slots__ = ('duration_minutes', 'hashrate_ths')
+    _keys = ('duration_minutes', 'hashrate_ths')
+
+    duration_minutes: Optional[int]
+    hashrate_ths: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HashrateWindow':
+        self = cls.__new__(cls)
+        get = data.get
+        self.duration_minutes = get('duration_minutes')
+        self.hashrate_ths = get('hashrate_ths')
+        return self
+
+
+class HashrateResponse(Model):
+    """Response containing historical hashrate data over time"""
+
+    __slots__ = ('hashrate_data',)
+    _keys = ('hashrate-data',)
+
+    hashrate_data: Optional[HashrateResponse_hashratedata]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HashrateResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('hashrate-data')
+        self.hashrate_data = None if value is None else HashrateResponse_hashratedata.from_dict(value)
+        return self
+
+
+class TemperatureResponse(Model):
+    """Response containing historical temperature data over time"""
+
+    __slots__ = ('temperature_data',)
+    _keys = ('temperature-data',)
+
+    temperature_data: Optional[TemperatureResponse_temperaturedata]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TemperatureResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('temperature-data')
+        self.temperature_data = None if value is None else TemperatureResponse_temperaturedata.from_dict(value)
+        return self
+
+
+class PowerResponse(Model):
+    """Response containing historical power consumption data over time"""
+
+    __slots__ = ('power_data',)
+    _keys = ('power-data',)
+
+    power_data: Optional[PowerResponse_powerdata]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PowerResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('power-data')
+        self.power_data = None if value is None else PowerResponse_powerdata.from_dict(value)
+        return self
+
+
+class EfficiencyResponse(Model):
+    """Response containing historical mining efficiency data over time"""
+
+    __slots__ = ('efficiency_data',)
+    _keys = ('efficiency-data',)
+
+    efficiency_data: Optional[EfficiencyResponse_efficiencydata]
+
+    @classmethod
+    def from_dict(cls, data) -> 'EfficiencyResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('efficiency-data')
+        self.efficiency_data = None if value is None else EfficiencyResponse_efficiencydata.from_dict(value)
+        return self
+
+
+class PoolConfig_inner(Model):
+    """Individual pool configuration with connection details"""
+
+    __slots__ = ('name', 'url', 'username', 'password', 'priority')
+    _keys = ('name', 'url', 'username', 'password', 'priority')
+
+    name: Optional[str]
+    url: Optional[PoolUrl]
+    username: Optional[PoolUsername]
+    password: Optional[PoolPassword]
+    priority: Optional[PoolPriority]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PoolConfig_inner':
+        self = cls.__new__(cls)
+        get = data.get
+        self.name = get('name')
+        self.url = get('url')
+        self.username = get('username')
+        self.password = get('password')
+        self.priority = get('priority')
+        return self
+
+
+class MiningStatus_miningstatus(Model):
+    """Mining operation status and performance data"""
+
+    __slots__ = (
+        'status', 'mining_uptime_s', 'reboot_uptime_s', 'average_hashrate_ghs',
+        'ideal_hashrate_ghs', 'power_usage_watts', 'power_target_watts',
+        'average_hb_efficiency_jth', 'power_efficiency_jth', 'average_asic_temp_c',
+        'average_hb_temp_c', 'hw_errors', 'hashboards_installed', 'hashboards_mining',
+    )
+    _keys = (
+        'status', 'mining_uptime_s', 'reboot_uptime_s', 'average_hashrate_ghs',
+        'ideal_hashrate_ghs', 'power_usage_watts', 'power_target_watts',
+        'average_hb_efficiency_jth', 'power_efficiency_jth', 'average_asic_temp_c',
+        'average_hb_temp_c', 'hw_errors', 'hashboards_installed', 'hashboards_mining',
+    )
+
+    status: Optional[str]
+    mining_uptime_s: Optional[int]
+    reboot_uptime_s: Optional[int]
+    average_hashrate_ghs: Optional[float]
+    ideal_hashrate_ghs: Optional[float]
+    power_usage_watts: Optional[float]
+    power_target_watts: Optional[float]
+    average_hb_efficiency_jth: Optional[float]
+    power_efficiency_jth: Optional[float]
+    average_asic_temp_c: Optional[float]
+    average_hb_temp_c: Optional[float]
+    hw_errors: Optional[int]
+    hashboards_installed: Optional[int]
+    hashboards_mining: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data) -> 'MiningStatus_miningstatus':
+        self = cls.__new__(cls)
+        get = data.get
+        self.status = get('status')
+        self.mining_uptime_s = get('mining_uptime_s')
+        self.reboot_uptime_s = get('reboot_uptime_s')
+        self.average_hashrate_ghs = get('average_hashrate_ghs')
+        self.ideal_hashrate_ghs = get('ideal_hashrate_ghs')
+        self.power_usage_watts = get('power_usage_watts')
+        self.power_target_watts = get('power_target_watts')
+        self.average_hb_efficiency_jth = get('average_hb_efficiency_jth')
+        self.power_efficiency_jth = get('power_efficiency_jth')
+        self.average_asic_temp_c = get('average_asic_temp_c')
+        self.average_hb_temp_c = get('average_hb_temp_c')
+        self.hw_errors = get('hw_errors')
+        self.hashboards_installed = get('hashboards_installed')
+        self.hashboards_mining = get('hashboards_mining')
+        return self
+
+
+class HashboardStats_hashboardstats(Model):
+    """Hashboard performance statistics and metrics"""
+
+    __slots__ = (
+        'hb_sn', 'slot', 'status', 'power_usage_watts', 'voltage_mv', 'avg_asic_temp_c',
+        'max_asic_temp_c', 'hashrate_ghs', 'ideal_hashrate_ghs', 'efficiency_jth',
+        'inlet_temp_c', 'outlet_temp_c', 'asics',
+    )
+    _keys = (
+        'hb_sn', 'slot', 'status', 'power_usage_watts', 'voltage_mv', 'avg_asic_temp_c',
+        'max_asic_temp_c', 'hashrate_ghs', 'ideal_hashrate_ghs', 'efficiency_jth',
+        'inlet_temp_c', 'outlet_temp_c', 'asics',
+    )
+
+    hb_sn: Optional[str]
+    slot: Optional[int]
+    status: Optional[str]
+    power_usage_watts: Optional[float]
+    voltage_mv: Optional[float]
+    avg_asic_temp_c: Optional[float]
+    max_asic_temp_c: Optional[float]
+    hashrate_ghs: Optional[float]
+    ideal_hashrate_ghs: Optional[float]
+    efficiency_jth: Optional[float]
+    inlet_temp_c: Optional[float]
+    outlet_temp_c: Optional[float]
+    asics: Optional[List[AsicStats]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HashboardStats_hashboardstats':
+        self = cls.__new__(cls)
+        get = data.get
+        self.hb_sn = get('hb_sn')
+        self.slot = get('slot')
+        self.status = get('status')
+        self.power_usage_watts = get('power_usage_watts')
+        self.voltage_mv = get('voltage_mv')
+        self.avg_asic_temp_c = get('avg_asic_temp_c')
+        self.max_asic_temp_c = get('max_asic_temp_c')
+        self.hashrate_ghs = get('hashrate_ghs')
+        self.ideal_hashrate_ghs = get('ideal_hashrate_ghs')
+        self.efficiency_jth = get('efficiency_jth')
+        self.inlet_temp_c = get('inlet_temp_c')
+        self.outlet_temp_c = get('outlet_temp_c')
+        value = get('asics')
+        self.asics = None if value is None else [AsicStats.from_dict(item0) for item0 in value]
+        return self
+
+
+class CoolingStatus_coolingstatus(Model):
+    """Cooling system status and performance information"""
+
+    __slots__ = ('fan_mode', 'speed_percentage', 'fans')
+    _keys = ('fan_mode', 'speed_percentage', 'fans')
+
+    fan_mode: Optional[str]
+    speed_percentage: Optional[int]
+    fans: Optional[List[FanStatus]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'CoolingStatus_coolingstatus':
+        self = cls.__new__(cls)
+        get = data.get
+        self.fan_mode = get('fan_mode')
+        self.speed_percentage = get('speed_percentage')
+        value = get('fans')
+        self.fans = None if value is None else [FanStatus.from_dict(item0) for item0 in value]
+        return self
+
+
+class HardwareInfo_hardwareinfo(Model):
+    """Hardware information and specifications"""
+
+    __slots__ = ('hashboards_info', 'PSUs_info', 'fans_info', 'cb_info')
+    _keys = ('hashboards-info', 'PSUs-info', 'fans-info', 'cb-info')
+
+    hashboards_info: Optional[List[HashboardInfo]]
+    PSUs_info: Optional[List[PSUInfo]]
+    fans_info: Optional[List[FanInfo]]
+    cb_info: Optional[ControlBoardInfo]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HardwareInfo_hardwareinfo':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('hashboards-info')
+        self.hashboards_info = None if value is None else [HashboardInfo.from_dict(item0) for item0 in value]
+        value = get('PSUs-info')
+        self.PSUs_info = None if value is None else [PSUInfo.from_dict(item0) for item0 in value]
+        value = get('fans-info')
+        self.fans_info = None if value is None else [FanInfo.from_dict(item0) for item0 in value]
+        value = get('cb-info')
+        self.cb_info = None if value is None else ControlBoardInfo.from_dict(value)
+        return self
+
+
+class HashboardInfo(Model):
+    """Information about mining hashboards configuration and status"""
+
+    __slots__ = (
+        'hb_sn', 'firmware', 'bootloader', 'api_version', 'board', 'chip_id', 'mining_asic',
+        'mining_asic_count', 'temp_sensor_count', 'port', 'ec_logs_path', 'slot',
+    )
+    _keys = (
+        'hb_sn', 'firmware', 'bootloader', 'api_version', 'board', 'chip_id', 'mining_asic',
+        'mining_asic_count', 'temp_sensor_count', 'port', 'ec_logs_path', 'slot',
+    )
+
+    hb_sn: Optional[str]
+    firmware: Optional[FWInfo]
+    bootloader: Optional[FWInfo]
+    api_version: Optional[str]
+    board: Optional[str]
+    chip_id: Optional[str]
+    mining_asic: Optional[str]
+    mining_asic_count: Optional[int]
+    temp_sensor_count: Optional[int]
+    port: Optional[int]
+    ec_logs_path: Optional[str]
+    slot: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HashboardInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.hb_sn = get('hb_sn')
+        value = get('firmware')
+        self.firmware = None if value is None else FWInfo.from_dict(value)
+        value = get('bootloader')
+        self.bootloader = None if value is None else FWInfo.from_dict(value)
+        self.api_version = get('api_version')
+        self.board = get('board')
+        self.chip_id = get('chip_id')
+        self.mining_asic = get('mining_asic')
+        self.mining_asic_count = get('mining_asic_count')
+        self.temp_sensor_count = get('temp_sensor_count')
+        self.port = get('port')
+        self.ec_logs_path = get('ec_logs_path')
+        self.slot = get('slot')
+        return self
+
+
+class PSUInfo(Model):
+    """Power supply unit information and status"""
+
+    __slots__ = (
+        'PSU_sn', 'slot', 'manufacturer', 'hw_revision', 'model', 'vendor', 'firmware', 'power',
+        'temperatures',
+    )
+    _keys = (
+        'PSU_sn', 'slot', 'manufacturer', 'hw_revision', 'model', 'vendor', 'firmware', 'power',
+        'temperatures',
+    )
+
+    PSU_sn: Optional[str]
+    slot: Optional[int]
+    manufacturer: Optional[str]
+    hw_revision: Optional[str]
+    model: Optional[str]
+    vendor: Optional[str]
+    firmware: Optional[PSUInfoFirmware]
+    power: Optional[PSUInfoPower]
+    temperatures: Optional[List[TemperatureMeasurement]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PSUInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.PSU_sn = get('PSU_sn')
+        self.slot = get('slot')
+        self.manufacturer = get('manufacturer')
+        self.hw_revision = get('hw_revision')
+        self.model = get('model')
+        self.vendor = get('vendor')
+        value = get('firmware')
+        self.firmware = None if value is None else PSUInfoFirmware.from_dict(value)
+        value = get('power')
+        self.power = None if value is None else PSUInfoPower.from_dict(value)
+        value = get('temperatures')
+        self.temperatures = None if value is None else [TemperatureMeasurement.from_dict(item0) for item0 in value]
+        return self
+
+
+class PSUUpdateStatus(Model):
+    """PSU firmware update status information"""
+
+    __slots__ = ('available_firmware', 'last_update', 'status')
+    _keys = ('available_firmware', 'last_update', 'status')
+
+    available_firmware: Optional[List[AvailablePSUFirmware]]
+    last_update: Optional[str]
+    status: Optional[PSUUpdateResultStatus]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PSUUpdateStatus':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('available_firmware')
+        self.available_firmware = None if value is None else [AvailablePSUFirmware.from_dict(item0) for item0 in value]
+        self.last_update = get('last_update')
+        self.status = get('status')
+        return self
+
+
+class AvailablePSUFirmware(Model):
+    """Information about an available PSU firmware file"""
+
+    __slots__ = ('filename', 'firmware_version', 'size_bytes', 'sha256', 'model')
+    _keys = ('filename', 'firmware_version', 'size_bytes', 'sha256', 'model')
+
+    filename: Optional[str]
+    firmware_version: Optional[str]
+    size_bytes: Optional[int]
+    sha256: Optional[str]
+    model: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'AvailablePSUFirmware':
+        self = cls.__new__(cls)
+        get = data.get
+        self.filename = get('filename')
+        self.firmware_version = get('firmware_version')
+        self.size_bytes = get('size_bytes')
+        self.sha256 = get('sha256')
+        self.model = get('model')
+        return self
+
+
+class SystemInfo_systeminfo(Model):
+    """System information and device details"""
+
+    __slots__ = (
+        'product_name', 'os', 'pool_interface_sw', 'mining_driver_sw', 'web_server',
+        'web_dashboard', 'hashboard_firmware', 'uptime_seconds', 'board', 'soc', 'cb_sn',
+        'sw_update_status',
+    )
+    _keys = (
+        'product_name', 'os', 'pool_interface_sw', 'mining_driver_sw', 'web_server',
+        'web_dashboard', 'hashboard_firmware', 'uptime_seconds', 'board', 'soc', 'cb_sn',
+        'sw_update_status',
+    )
+
+    product_name: Optional[str]
+    os: Optional[OSInfo]
+    pool_interface_sw: Optional[SWInfo]
+    mining_driver_sw: Optional[SWInfo]
+    web_server: Optional[SWInfo]
+    web_dashboard: Optional[SWInfo]
+    hashboard_firmware: Optional[SWInfo]
+    uptime_seconds: Optional[int]
+    board: Optional[str]
+    soc: Optional[str]
+    cb_sn: Optional[str]
+    sw_update_status: Optional[UpdateStatus]
+
+    @classmethod
+    def from_dict(cls, data) -> 'SystemInfo_systeminfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.product_name = get('product_name')
+        value = get('os')
+        self.os = None if value is None else OSInfo.from_dict(value)
+        value = get('pool_interface_sw')
+        self.pool_interface_sw = None if value is None else SWInfo.from_dict(value)
+        value = get('mining_driver_sw')
+        self.mining_driver_sw = None if value is None else SWInfo.from_dict(value)
+        value = get('web_server')
+        self.web_server = None if value is None else SWInfo.from_dict(value)
+        value = get('web_dashboard')
+        self.web_dashboard = None if value is None else SWInfo.from_dict(value)
+        value = get('hashboard_firmware')
+        self.hashboard_firmware = None if value is None else SWInfo.from_dict(value)
+        self.uptime_seconds = get('uptime_seconds')
+        self.board = get('board')
+        self.soc = get('soc')
+        self.cb_sn = get('cb_sn')
+        value = get('sw_update_status')
+        self.sw_update_status = None if value is None else UpdateStatus.from_dict(value)
+        return self
+
+
+class NetworkInfo_networkinfo(Model):
+    """Network configuration and connection information"""
+
+    __slots__ = ('mac', 'dhcp', 'ip', 'netmask', 'gateway', 'hostname')
+    _keys = ('mac', 'dhcp', 'ip', 'netmask', 'gateway', 'hostname')
+
+    mac: Optional[str]
+    dhcp: Optional[bool]
+    ip: Optional[str]
+    netmask: Optional[str]
+    gateway: Optional[str]
+    hostname: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'NetworkInfo_networkinfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.mac = get('mac')
+        self.dhcp = get('dhcp')
+        self.ip = get('ip')
+        self.netmask = get('netmask')
+        self.gateway = get('gateway')
+        self.hostname = get('hostname')
+        return self
+
+
+class NetworkConfig_networkconfig(Model):
+    """Network configuration settings and parameters"""
+
+    __slots__ = ('dhcp', 'ip', 'netmask', 'gateway', 'hostname')
+    _keys = ('dhcp', 'ip', 'netmask', 'gateway', 'hostname')
+
+    dhcp: Optional[bool]
+    ip: Optional[str]
+    netmask: Optional[str]
+    gateway: Optional[str]
+    hostname: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'NetworkConfig_networkconfig':
+        self = cls.__new__(cls)
+        get = data.get
+        self.dhcp = get('dhcp')
+        self.ip = get('ip')
+        self.netmask = get('netmask')
+        self.gateway = get('gateway')
+        self.hostname = get('hostname')
+        return self
+
+
+class LogsResponse_logs(Model):
+    """Log data response containing system and mining logs"""
+
+    __slots__ = ('source', 'lines', 'content')
+    _keys = ('source', 'lines', 'content')
+
+    source: Optional[str]
+    lines: Optional[int]
+    content: Optional[List[str]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'LogsResponse_logs':
+        self = cls.__new__(cls)
+        get = data.get
+        self.source = get('source')
+        self.lines = get('lines')
+        self.content = get('content')
+        return self
+
+
+class HashrateResponse_hashratedata(Model):
+    """Hashrate data response with time series information"""
+
+    __slots__ = ('duration', 'data', 'aggregates')
+    _keys = ('duration', 'data', 'aggregates')
+
+    duration: Optional[TimeSeriesDuration]
+    data: Optional[List[TimeSeriesData]]
+    aggregates: Optional[Aggregates]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HashrateResponse_hashratedata':
+        self = cls.__new__(cls)
+        get = data.get
+        self.duration = get('duration')
+        value = get('data')
+        self.data = None if value is None else [TimeSeriesData.from_dict(item0) for item0 in value]
+        value = get('aggregates')
+        self.aggregates = None if value is None else Aggregates.from_dict(value)
+        return self
+
+
+class TemperatureMeasurement(Model):
+    """Temperature measurement from a sensor"""
+
+    __slots__ = ('temperature_type', 'temperature_c')
+    _keys = ('temperature_type', 'temperature_c')
+
+    temperature_type: Optional[str]
+    temperature_c: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TemperatureMeasurement':
+        self = cls.__new__(cls)
+        get = data.get
+        self.temperature_type = get('temperature_type')
+        self.temperature_c = get('temperature_c')
+        return self
+
+
+class TemperatureResponse_temperaturedata(Model):
+    """Temperature data response with time series information"""
+
+    __slots__ = ('duration', 'data', 'aggregates')
+    _keys = ('duration', 'data', 'aggregates')
+
+    duration: Optional[TimeSeriesDuration]
+    data: Optional[List[TimeSeriesData]]
+    aggregates: Optional[Aggregates]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TemperatureResponse_temperaturedata':
+        self = cls.__new__(cls)
+        get = data.get
+        self.duration = get('duration')
+        value = get('data')
+        self.data = None if value is None else [TimeSeriesData.from_dict(item0) for item0 in value]
+        value = get('aggregates')
+        self.aggregates = None if value is None else Aggregates.from_dict(value)
+        return self
+
+
+class PowerResponse_powerdata(Model):
+    """Power data response with time series information"""
+
+    __slots__ = ('duration', 'data', 'aggregates')
+    _keys = ('duration', 'data', 'aggregates')
+
+    duration: Optional[TimeSeriesDuration]
+    data: Optional[List[TimeSeriesData]]
+    aggregates: Optional[Aggregates]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PowerResponse_powerdata':
+        self = cls.__new__(cls)
+        get = data.get
+        self.duration = get('duration')
+        value = get('data')
+        self.data = None if value is None else [TimeSeriesData.from_dict(item0) for item0 in value]
+        value = get('aggregates')
+        self.aggregates = None if value is None else Aggregates.from_dict(value)
+        return self
+
+
+class EfficiencyResponse_efficiencydata(Model):
+    """Efficiency data response with time series information"""
+
+    __slots__ = ('duration', 'data', 'aggregates')
+    _keys = ('duration', 'data', 'aggregates')
+
+    duration: Optional[TimeSeriesDuration]
+    data: Optional[List[TimeSeriesData]]
+    aggregates: Optional[Aggregates]
+
+    @classmethod
+    def from_dict(cls, data) -> 'EfficiencyResponse_efficiencydata':
+        self = cls.__new__(cls)
+        get = data.get
+        self.duration = get('duration')
+        value = get('data')
+        self.data = None if value is None else [TimeSeriesData.from_dict(item0) for item0 in value]
+        value = get('aggregates')
+        self.aggregates = None if value is None else Aggregates.from_dict(value)
+        return self
+
+
+class Aggregates(Model):
+    """Statistical aggregates for time series data"""
+
+    __slots__ = ('min', 'avg', 'max')
+    _keys = ('min', 'avg', 'max')
+
+    min: Optional[float]
+    avg: Optional[float]
+    max: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'Aggregates':
+        self = cls.__new__(cls)
+        get = data.get
+        self.min = get('min')
+        self.avg = get('avg')
+        self.max = get('max')
+        return self
+
+
+class MessageResponse(Model):
+    """Generic response message"""
+
+    __slots__ = ('message',)
+    _keys = ('message',)
+
+    message: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'MessageResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        self.message = get('message')
+        return self
+
+
+class TestConnection(Model):
+    """Configuration for testing connection to a mining pool"""
+
+    __slots__ = ('url', 'username', 'password')
+    _keys = ('url', 'username', 'password')
+
+    url: Optional[PoolUrl]
+    username: Optional[PoolUsername]
+    password: Optional[PoolPassword]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TestConnection':
+        self = cls.__new__(cls)
+        get = data.get
+        self.url = get('url')
+        self.username = get('username')
+        self.password = get('password')
+        return self
+
+
+class UnlockConfig(Model):
+    """Configuration for device unlock operation"""
+
+    __slots__ = ('unlock_password',)
+    _keys = ('unlock-password',)
+
+    unlock_password: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'UnlockConfig':
+        self = cls.__new__(cls)
+        get = data.get
+        self.unlock_password = get('unlock-password')
+        return self
+
+
+class UnlockResponse(Model):
+    """Response containing device lock status"""
+
+    __slots__ = ('lock_status',)
+    _keys = ('lock-status',)
+
+    lock_status: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'UnlockResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        self.lock_status = get('lock-status')
+        return self
+
+
+class SshConfig(Model):
+    """Configuration for SSH access"""
+
+    __slots__ = ('ssh_status',)
+    _keys = ('ssh-status',)
+
+    ssh_status: Optional[SshStatus]
+
+    @classmethod
+    def from_dict(cls, data) -> 'SshConfig':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('ssh-status')
+        self.ssh_status = None if value is None else SshStatus.from_dict(value)
+        return self
+
+
+class SshResponse(Model):
+    """Response containing SSH status"""
+
+    __slots__ = ('ssh_status',)
+    _keys = ('ssh-status',)
+
+    ssh_status: Optional[SshStatus]
+
+    @classmethod
+    def from_dict(cls, data) -> 'SshResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('ssh-status')
+        self.ssh_status = None if value is None else SshStatus.from_dict(value)
+        return self
+
+
+class SshStatus(Model):
+    """SSH service status information"""
+
+    __slots__ = ('enabled',)
+    _keys = ('enabled',)
+
+    enabled: Optional[bool]
+
+    @classmethod
+    def from_dict(cls, data) -> 'SshStatus':
+        self = cls.__new__(cls)
+        get = data.get
+        self.enabled = get('enabled')
+        return self
+
+
+class SystemStatuses(Model):
+    """System status information including onboarding and password setup"""
+
+    __slots__ = ('onboarded', 'password_set')
+    _keys = ('onboarded', 'password_set')
+
+    onboarded: Optional[bool]
+    password_set: Optional[bool]
+
+    @classmethod
+    def from_dict(cls, data) -> 'SystemStatuses':
+        self = cls.__new__(cls)
+        get = data.get
+        self.onboarded = get('onboarded')
+        self.password_set = get('password_set')
+        return self
+
+
+class TelemetryConfig(Model):
+    """Configuration for telemetry data collection"""
+
+    __slots__ = ('enabled',)
+    _keys = ('enabled',)
+
+    enabled: Optional[bool]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TelemetryConfig':
+        self = cls.__new__(cls)
+        get = data.get
+        self.enabled = get('enabled')
+        return self
+
+
+class TelemetryResponse(Model):
+    """Response containing telemetry status information"""
+
+    __slots__ = ('enabled', 'message')
+    _keys = ('enabled', 'message')
+
+    enabled: Optional[bool]
+    message: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TelemetryResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        self.enabled = get('enabled')
+        self.message = get('message')
+        return self
+
+
+class ControlBoardInfoMpuinfo(Model):
+    """CPU and processor information from the control board"""
+
+    __slots__ = (
+        'processor', 'model_name', 'cpu_implementer', 'cpu_architecture', 'cpu_variant',
+        'cpu_part', 'cpu_revision', 'hardware', 'revision', 'serial',
+    )
+    _keys = (
+        'processor', 'model_name', 'cpu_implementer', 'cpu_architecture', 'cpu_variant',
+        'cpu_part', 'cpu_revision', 'hardware', 'revision', 'serial',
+    )
+
+    processor: Optional[int]
+    model_name: Optional[str]
+    cpu_implementer: Optional[str]
+    cpu_architecture: Optional[int]
+    cpu_variant: Optional[str]
+    cpu_part: Optional[str]
+    cpu_revision: Optional[int]
+    hardware: Optional[str]
+    revision: Optional[str]
+    serial: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'ControlBoardInfoMpuinfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.processor = get('processor')
+        self.model_name = get('model_name')
+        self.cpu_implementer = get('cpu_implementer')
+        self.cpu_architecture = get('cpu_architecture')
+        self.cpu_variant = get('cpu_variant')
+        self.cpu_part = get('cpu_part')
+        self.cpu_revision = get('cpu_revision')
+        self.hardware = get('hardware')
+        self.revision = get('revision')
+        self.serial = get('serial')
+        return self
+
+
+class ControlBoardInfoControlboardlinuxasset(Model):
+    """Control board Linux firmware information"""
+
+    __slots__ = ('name', 'version', 'git_hash', 'image_hash', 'variant')
+    _keys = ('name', 'version', 'git_hash', 'image_hash', 'variant')
+
+    name: Optional[str]
+    version: Optional[str]
+    git_hash: Optional[str]
+    image_hash: Optional[str]
+    variant: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'ControlBoardInfoControlboardlinuxasset':
+        self = cls.__new__(cls)
+        get = data.get
+        self.name = get('name')
+        self.version = get('version')
+        self.git_hash = get('git_hash')
+        self.image_hash = get('image_hash')
+        self.variant = get('variant')
+        return self
+
+
+class ControlBoardInfo(Model):
+    """Complete control board hardware and firmware information"""
+
+    __slots__ = ('mpu', 'firmware', 'machine_name', 'board_id', 'serial_number')
+    _keys = ('mpu', 'firmware', 'machine_name', 'board_id', 'serial_number')
+
+    mpu: Optional[ControlBoardInfoMpuinfo]
+    firmware: Optional[ControlBoardInfoControlboardlinuxasset]
+    machine_name: Optional[str]
+    board_id: Optional[str]
+    serial_number: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'ControlBoardInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('mpu')
+        self.mpu = None if value is None else ControlBoardInfoMpuinfo.from_dict(value)
+        value = get('firmware')
+        self.firmware = None if value is None else ControlBoardInfoControlboardlinuxasset.from_dict(value)
+        self.machine_name = get('machine_name')
+        self.board_id = get('board_id')
+        self.serial_number = get('serial_number')
+        return self
+
+
+class TimeSeriesRequest(Model):
+    """Request parameters for time series data query"""
+
+    __slots__ = ('start_time', 'end_time', 'duration', 'interval', 'levels', 'aggregation')
+    _keys = ('start_time', 'end_time', 'duration', 'interval', 'levels', 'aggregation')
+
+    start_time: Optional[str]
+    end_time: Optional[str]
+    duration: Optional[str]
+    interval: Optional[str]
+    levels: Optional[List[TimeSeriesLevelConfig]]
+    aggregation: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesRequest':
+        self = cls.__new__(cls)
+        get = data.get
+        self.start_time = get('start_time')
+        self.end_time = get('end_time')
+        self.duration = get('duration')
+        self.interval = get('interval')
+        self.levels = get('levels')
+        self.aggregation = get('aggregation')
+        return self
+
+
+class TimeSeriesResponse(Model):
+    """Response containing time series data for requested metrics"""
+
+    __slots__ = ('meta', 'data')
+    _keys = ('meta', 'data')
+
+    meta: Optional[TimeSeriesMeta]
+    data: Optional[TimeSeriesResponseData]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesResponse':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('meta')
+        self.meta = None if value is None else TimeSeriesMeta.from_dict(value)
+        value = get('data')
+        self.data = None if value is None else TimeSeriesResponseData.from_dict(value)
+        return self
+
+
+class TimeSeriesMeta(Model):
+    """Metadata about the time series query and response"""
+
+    __slots__ = ('start_time', 'end_time', 'interval', 'levels', 'aggregation')
+    _keys = ('start_time', 'end_time', 'interval', 'levels', 'aggregation')
+
+    start_time: Optional[str]
+    end_time: Optional[str]
+    interval: Optional[str]
+    levels: Optional[List[TimeSeriesLevelConfig]]
+    aggregation: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesMeta':
+        self = cls.__new__(cls)
+        get = data.get
+        self.start_time = get('start_time')
+        self.end_time = get('end_time')
+        self.interval = get('interval')
+        self.levels = get('levels')
+        self.aggregation = get('aggregation')
+        return self
+
+
+class TimeSeriesMetricData(Model):
+    """Data series for a specific metric"""
+
+    __slots__ = ('unit', 'values', 'aggregates')
+    _keys = ('unit', 'values', 'aggregates')
+
+    unit: Optional[MetricUnit]
+    values: Optional[List[float]]
+    aggregates: Optional[TimeSeriesAggregates]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesMetricData':
+        self = cls.__new__(cls)
+        get = data.get
+        self.unit = get('unit')
+        self.values = get('values')
+        value = get('aggregates')
+        self.aggregates = None if value is None else TimeSeriesAggregates.from_dict(value)
+        return self
+
+
+class TimeSeriesAggregates(Model):
+    """Statistical aggregates for the entire time series"""
+
+    __slots__ = ('min', 'avg', 'max')
+    _keys = ('min', 'avg', 'max')
+
+    min: Optional[float]
+    avg: Optional[float]
+    max: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesAggregates':
+        self = cls.__new__(cls)
+        get = data.get
+        self.min = get('min')
+        self.avg = get('avg')
+        self.max = get('max')
+        return self
+
+
+class TelemetryData(Model):
+    """
+    Current telemetry data response. Contains 'miner' field with aggregated metrics (included
+    when level=miner or by default if no level specified), 'hashboards' array with per-hashboard
+    data (included when level=hashboard or level=asic), 'PSUs' array with per-PSU data (included
+    when level=PSU). ASIC data is nested within each hashboard when level=asic is specified. All
+    fields except 'timestamp' are optional based on requested levels.
+    """
+
+    __slots__ = ('timestamp', 'miner', 'hashboards', 'PSUs')
+    _keys = ('timestamp', 'miner', 'hashboards', 'PSUs')
+
+    timestamp: Optional[str]
+    miner: Optional[MinerTelemetry]
+    hashboards: Optional[List[HashboardTelemetry]]
+    PSUs: Optional[List[PSUTelemetry]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TelemetryData':
+        self = cls.__new__(cls)
+        get = data.get
+        self.timestamp = get('timestamp')
+        value = get('miner')
+        self.miner = None if value is None else MinerTelemetry.from_dict(value)
+        value = get('hashboards')
+        self.hashboards = None if value is None else [HashboardTelemetry.from_dict(item0) for item0 in value]
+        value = get('PSUs')
+        self.PSUs = None if value is None else [PSUTelemetry.from_dict(item0) for item0 in value]
+        return self
+
+
+class MinerTelemetry(Model):
+    """Miner-level telemetry metrics"""
+
+    __slots__ = ('hashrate', 'temperature', 'power', 'efficiency')
+    _keys = ('hashrate', 'temperature', 'power', 'efficiency')
+
+    hashrate: Optional[MetricValue]
+    temperature: Optional[MetricValue]
+    power: Optional[MetricValue]
+    efficiency: Optional[MetricValue]
+
+    @classmethod
+    def from_dict(cls, data) -> 'MinerTelemetry':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('hashrate')
+        self.hashrate = None if value is None else MetricValue.from_dict(value)
+        value = get('temperature')
+        self.temperature = None if value is None else MetricValue.from_dict(value)
+        value = get('power')
+        self.power = None if value is None else MetricValue.from_dict(value)
+        value = get('efficiency')
+        self.efficiency = None if value is None else MetricValue.from_dict(value)
+        return self
+
+
+class HashboardTelemetry(Model):
+    """
+    Individual hashboard telemetry metrics. Contains hashboard-specific measurements. The
+    'asics' field with ASIC-level detail is only populated when the level parameter is 'asic'
+    """
+
+    __slots__ = (
+        'index', 'serial_number', 'hashrate', 'temperature', 'power', 'efficiency', 'voltage',
+        'current', 'asics',
+    )
+    _keys = (
+        'index', 'serial_number', 'hashrate', 'temperature', 'power', 'efficiency', 'voltage',
+        'current', 'asics',
+    )
+
+    index: Optional[int]
+    serial_number: Optional[str]
+    hashrate: Optional[MetricValue]
+    temperature: Optional[HashboardTemperature]
+    power: Optional[MetricValue]
+    efficiency: Optional[MetricValue]
+    voltage: Optional[MetricValue]
+    current: Optional[MetricValue]
+    asics: Optional[AsicTelemetry]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HashboardTelemetry':
+        self = cls.__new__(cls)
+        get = data.get
+        self.index = get('index')
+        self.serial_number = get('serial_number')
+        value = get('hashrate')
+        self.hashrate = None if value is None else MetricValue.from_dict(value)
+        value = get('temperature')
+        self.temperature = None if value is None else HashboardTemperature.from_dict(value)
+        value = get('power')
+        self.power = None if value is None else MetricValue.from_dict(value)
+        value = get('efficiency')
+        self.efficiency = None if value is None else MetricValue.from_dict(value)
+        value = get('voltage')
+        self.voltage = None if value is None else MetricValue.from_dict(value)
+        value = get('current')
+        self.current = None if value is None else MetricValue.from_dict(value)
+        value = get('asics')
+        self.asics = None if value is None else AsicTelemetry.from_dict(value)
+        return self
+
+
+class HashboardTemperature(Model):
+    """Hashboard temperature measurements"""
+
+    __slots__ = ('unit', 'inlet', 'outlet', 'average')
+    _keys = ('unit', 'inlet', 'outlet', 'average')
+
+    unit: Optional[MetricUnit]
+    inlet: Optional[float]
+    outlet: Optional[float]
+    average: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'HashboardTemperature':
+        self = cls.__new__(cls)
+        get = data.get
+        self.unit = get('unit')
+        self.inlet = get('inlet')
+        self.outlet = get('outlet')
+        self.average = get('average')
+        return self
+
+
+class AsicTelemetry(Model):
+    """ASIC-level telemetry metrics"""
+
+    __slots__ = ('hashrate', 'temperature')
+    _keys = ('hashrate', 'temperature')
+
+    hashrate: Optional[MetricArray]
+    temperature: Optional[MetricArray]
+
+    @classmethod
+    def from_dict(cls, data) -> 'AsicTelemetry':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('hashrate')
+        self.hashrate = None if value is None else MetricArray.from_dict(value)
+        value = get('temperature')
+        self.temperature = None if value is None else MetricArray.from_dict(value)
+        return self
+
+
+class PSUInputOutputMetric(Model):
+    """PSU metric with input and output values"""
+
+    __slots__ = ('unit', 'input', 'output')
+    _keys = ('unit', 'input', 'output')
+
+    unit: Optional[MetricUnit]
+    input: Optional[float]
+    output: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PSUInputOutputMetric':
+        self = cls.__new__(cls)
+        get = data.get
+        self.unit = get('unit')
+        self.input = get('input')
+        self.output = get('output')
+        return self
+
+
+class PSUTemperature(Model):
+    """PSU temperature measurements"""
+
+    __slots__ = ('unit', 'hotspot', 'ambient', 'average')
+    _keys = ('unit', 'hotspot', 'ambient', 'average')
+
+    unit: Optional[MetricUnit]
+    hotspot: Optional[float]
+    ambient: Optional[float]
+    average: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PSUTemperature':
+        self = cls.__new__(cls)
+        get = data.get
+        self.unit = get('unit')
+        self.hotspot = get('hotspot')
+        self.ambient = get('ambient')
+        self.average = get('average')
+        return self
+
+
+class PSUTelemetry(Model):
+    """Individual PSU telemetry metrics"""
+
+    __slots__ = ('index', 'serial_number', 'voltage', 'current', 'power', 'temperature')
+    _keys = ('index', 'serial_number', 'voltage', 'current', 'power', 'temperature')
+
+    index: Optional[int]
+    serial_number: Optional[str]
+    voltage: Optional[PSUInputOutputMetric]
+    current: Optional[PSUInputOutputMetric]
+    power: Optional[PSUInputOutputMetric]
+    temperature: Optional[PSUTemperature]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PSUTelemetry':
+        self = cls.__new__(cls)
+        get = data.get
+        self.index = get('index')
+        self.serial_number = get('serial_number')
+        value = get('voltage')
+        self.voltage = None if value is None else PSUInputOutputMetric.from_dict(value)
+        value = get('current')
+        self.current = None if value is None else PSUInputOutputMetric.from_dict(value)
+        value = get('power')
+        self.power = None if value is None else PSUInputOutputMetric.from_dict(value)
+        value = get('temperature')
+        self.temperature = None if value is None else PSUTemperature.from_dict(value)
+        return self
+
+
+class MetricValue(Model):
+    """A metric value with its unit"""
+
+    __slots__ = ('value', 'unit')
+    _keys = ('value', 'unit')
+
+    value: Optional[float]
+    unit: Optional[MetricUnit]
+
+    @classmethod
+    def from_dict(cls, data) -> 'MetricValue':
+        self = cls.__new__(cls)
+        get = data.get
+        self.value = get('value')
+        self.unit = get('unit')
+        return self
+
+
+class MetricArray(Model):
+    """An array of metric values with a shared unit"""
+
+    __slots__ = ('unit', 'values')
+    _keys = ('unit', 'values')
+
+    unit: Optional[MetricUnit]
+    values: Optional[List[float]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'MetricArray':
+        self = cls.__new__(cls)
+        get = data.get
+        self.unit = get('unit')
+        self.values = get('values')
+        return self
+
+
+class PSUInfoFirmware(Model):
+    __slots__ = ('app_version', 'bootloader_version')
+    _keys = ('app_version', 'bootloader_version')
+
+    app_version: Optional[str]
+    bootloader_version: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PSUInfoFirmware':
+        self = cls.__new__(cls)
+        get = data.get
+        self.app_version = get('app_version')
+        self.bootloader_version = get('bootloader_version')
+        return self
+
+
+class PSUInfoPower(Model):
+    __slots__ = (
+        'input_voltage_mv', 'output_voltage_mv', 'input_current_ma', 'output_current_ma',
+        'input_power_mw', 'output_power_mw',
+    )
+    _keys = (
+        'input_voltage_mv', 'output_voltage_mv', 'input_current_ma', 'output_current_ma',
+        'input_power_mw', 'output_power_mw',
+    )
+
+    input_voltage_mv: Optional[float]
+    output_voltage_mv: Optional[float]
+    input_current_ma: Optional[float]
+    output_current_ma: Optional[float]
+    input_power_mw: Optional[float]
+    output_power_mw: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data) -> 'PSUInfoPower':
+        self = cls.__new__(cls)
+        get = data.get
+        self.input_voltage_mv = get('input_voltage_mv')
+        self.output_voltage_mv = get('output_voltage_mv')
+        self.input_current_ma = get('input_current_ma')
+        self.output_current_ma = get('output_current_ma')
+        self.input_power_mw = get('input_power_mw')
+        self.output_power_mw = get('output_power_mw')
+        return self
+
+
+class TimeSeriesResponseData(Model):
+    """Hierarchical data organized by level"""
+
+    __slots__ = ('miner', 'hashboards', 'asics', 'PSUs')
+    _keys = ('miner', 'hashboards', 'asics', 'PSUs')
+
+    miner: Optional[Dict[str, TimeSeriesMetricData]]
+    hashboards: Optional[List[TimeSeriesResponseDataHashboardsItem]]
+    asics: Optional[List[TimeSeriesResponseDataAsicsItem]]
+    PSUs: Optional[List[TimeSeriesResponseDataPSUsItem]]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesResponseData':
+        self = cls.__new__(cls)
+        get = data.get
+        value = get('miner')
+        self.miner = None if value is None else {key0: TimeSeriesMetricData.from_dict(item0) for key0, item0 in value.items()}
+        value = get('hashboards')
+        self.hashboards = None if value is None else [TimeSeriesResponseDataHashboardsItem.from_dict(item0) for item0 in value]
+        value = get('asics')
+        self.asics = None if value is None else [TimeSeriesResponseDataAsicsItem.from_dict(item0) for item0 in value]
+        value = get('PSUs')
+        self.PSUs = None if value is None else [TimeSeriesResponseDataPSUsItem.from_dict(item0) for item0 in value]
+        return self
+
+
+class TimeSeriesResponseDataHashboardsItem(Model):
+    __slots__ = ('index', 'serial_number', 'extra')
+    _keys = ('index', 'serial_number', None)
+
+    index: Optional[int]
+    serial_number: Optional[str]
+    extra: Dict[str, TimeSeriesMetricData]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesResponseDataHashboardsItem':
+        self = cls.__new__(cls)
+        get = data.get
+        self.index = get('index')
+        self.serial_number = get('serial_number')
+        self.extra = {key: TimeSeriesMetricData.from_dict(item) for key, item in data.items() if key not in cls._keys}
+        return self
+
+
+class TimeSeriesResponseDataAsicsItem(Model):
+    __slots__ = ('index', 'hashboard_index', 'extra')
+    _keys = ('index', 'hashboard_index', None)
+
+    index: Optional[int]
+    hashboard_index: Optional[int]
+    extra: Dict[str, TimeSeriesMetricData]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesResponseDataAsicsItem':
+        self = cls.__new__(cls)
+        get = data.get
+        self.index = get('index')
+        self.hashboard_index = get('hashboard_index')
+        self.extra = {key: TimeSeriesMetricData.from_dict(item) for key, item in data.items() if key not in cls._keys}
+        return self
+
+
+class TimeSeriesResponseDataPSUsItem(Model):
+    __slots__ = ('index', 'serial_number', 'extra')
+    _keys = ('index', 'serial_number', None)
+
+    index: Optional[int]
+    serial_number: Optional[str]
+    extra: Dict[str, TimeSeriesMetricData]
+
+    @classmethod
+    def from_dict(cls, data) -> 'TimeSeriesResponseDataPSUsItem':
+        self = cls.__new__(cls)
+        get = data.get
+        self.index = get('index')
+        self.serial_number = get('serial_number')
+        self.extra = {key: TimeSeriesMetricData.from_dict(item) for key, item in data.items() if key not in cls._keys}
+        return self
+
+
+MiningTuning = str
+PSUUpdateResultStatus = str
+PoolPassword = str
+PoolUrl = str
+PoolUsername = str
+PoolPriority = int
+TimeSeriesDuration = str
+PerformanceMode = str
+MinerFieldType = str
+HashboardFieldType = str
+AsicFieldType = str
+PSUFieldType = str
+TimeSeriesLevelConfig = Any
+MetricUnit = str
+ErrorListResponse = List[NotificationError]
+PoolConfig = List[PoolConfig_inner]
+
+
+class Client:
+    """Blocking client for one miner over a single kept-alive connection"""
+
+    def __init__(self, base_url=DEFAULT_SERVER, auth=None, timeout=DEFAULT_TIMEOUT):
+        self.transport = Transport(base_url, auth, timeout)
+
+    def close(self):
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def list_pools(self) -> Optional[PoolsList]:
+        """
+        GET /api/v1/pools: The get pools endpoint returns the full list of currently configured
+        pools.
+        """
+        data = self.transport.request('GET', '/api/v1/pools')
+        return None if data is None else PoolsList.from_dict(data)
+
+    def create_pools(self, *, body: Optional[PoolConfig] = None) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/pools: The post pools endpoint allows up to three pools to be configured,
+        replacing the previous pool configuration.
+        """
+        data = self.transport.request('POST', '/api/v1/pools', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def get_pool(self, id: int) -> Optional[PoolResponse]:
+        """GET /api/v1/pools/{id}: Get configuration for a specific pool by ID"""
+        data = self.transport.request('GET', f"/api/v1/pools/{quote(str(id), safe='')}")
+        return None if data is None else PoolResponse.from_dict(data)
+
+    def edit_pool(self, id: int, body: PoolConfig_inner) -> Optional[MessageResponse]:
+        """
+        PUT /api/v1/pools/{id}: Using this pool configuration endpoint, users can edit the
+        properties of an existing pool.
+        """
+        data = self.transport.request('PUT', f"/api/v1/pools/{quote(str(id), safe='')}", body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def delete_pool(self, id: int) -> Optional[MessageResponse]:
+        """DELETE /api/v1/pools/{id}: Delete a specific pool configuration by ID"""
+        data = self.transport.request('DELETE', f"/api/v1/pools/{quote(str(id), safe='')}")
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def test_pool_connection(self, body: TestConnection) -> Optional[MessageResponse]:
+        """POST /api/v1/pools/test-connection: Used to test a pool connection"""
+        data = self.transport.request('POST', '/api/v1/pools/test-connection', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def set_password(self, body: PasswordRequest) -> Optional[MessageResponse]:
+        """
+        PUT /api/v1/auth/password: The password endpoint allows users to set a password during
+        onboarding
+        """
+        data = self.transport.request('PUT', '/api/v1/auth/password', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def change_password(self, body: ChangePasswordRequest) -> Optional[MessageResponse]:
+        """
+        PUT /api/v1/auth/change-password: Change the current password to a new password.
+        Requires the current password for verification.
+        """
+        data = self.transport.request('PUT', '/api/v1/auth/change-password', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def login(self, body: PasswordRequest) -> Optional[AuthTokens]:
+        """
+        POST /api/v1/auth/login: Authenticates a user using a password and returns a JWT access
+        and refresh token pair.
+        """
+        data = self.transport.request('POST', '/api/v1/auth/login', body=body)
+        return None if data is None else AuthTokens.from_dict(data)
+
+    def logout(self, body: AuthTokens) -> Optional[MessageResponse]:
+        """POST /api/v1/auth/logout: User logout"""
+        data = self.transport.request('POST', '/api/v1/auth/logout', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def refresh_token(self, body: RefreshRequest) -> Optional[RefreshResponse]:
+        """POST /api/v1/auth/refresh: Refresh JWT access token"""
+        data = self.transport.request('POST', '/api/v1/auth/refresh', body=body)
+        return None if data is None else RefreshResponse.from_dict(data)
+
+    def get_system_info(self) -> Optional[SystemInfo]:
+        """
+        GET /api/v1/system: The system endpoint provides information related to the control
+        board including OS, software, and hardware component details.
+        """
+        data = self.transport.request('GET', '/api/v1/system')
+        return None if data is None else SystemInfo.from_dict(data)
+
+    def get_system_status(self) -> Optional[SystemStatuses]:
+        """GET /api/v1/system/status: Get system statuses"""
+        data = self.transport.request('GET', '/api/v1/system/status')
+        return None if data is None else SystemStatuses.from_dict(data)
+
+    def get_mining_status(self) -> Optional[MiningStatus]:
+        """
+        GET /api/v1/mining: The mining endpoint provides summary information about the mining
+        operations of the device. This includes device level hashrate statistics, overall miner
+        status, and current power usage and target information.
+        """
+        data = self.transport.request('GET', '/api/v1/mining')
+        return None if data is None else MiningStatus.from_dict(data)
+
+    def get_mining_target(self) -> Optional[MiningTargetResponse]:
+        """
+        GET /api/v1/mining/target: The mining target endpoint returns the current power target
+        in watts that the miner is controlling for.
+        """
+        data = self.transport.request('GET', '/api/v1/mining/target')
+        return None if data is None else MiningTargetResponse.from_dict(data)
+
+    def edit_mining_target(self, body: MiningTarget) -> Optional[MiningTargetResponse]:
+        """
+        PUT /api/v1/mining/target: The mining target endpoint can be used to set a target power
+        consumption for the miner. Once set, the mining device will operate to consume as close
+        to that amount of power as possible. In the event that the device is unable to maintain
+        its temperature within the allowed range, it may scale down and use less power.
+        """
+        data = self.transport.request('PUT', '/api/v1/mining/target', body=body)
+        return None if data is None else MiningTargetResponse.from_dict(data)
+
+    def edit_mining_tuning(self, body: MiningTuningConfig) -> Optional[MiningTuningConfig]:
+        """
+        PUT /api/v1/mining/tuning: The mining tuning endpoint can be used to set a hashboard
+        level optimization algorithm
+        """
+        data = self.transport.request('PUT', '/api/v1/mining/tuning', body=body)
+        return None if data is None else MiningTuningConfig.from_dict(data)
+
+    def start_mining(self) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/mining/start: The start mining endpoint can be used to make the device
+        start mining, into account the current power target of the system.
+        """
+        data = self.transport.request('POST', '/api/v1/mining/start')
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def stop_mining(self) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/mining/stop: The stop mining endpoint can be used to stop the device from
+        mining, going into a minimal power mode with only the control board running.
+        """
+        data = self.transport.request('POST', '/api/v1/mining/stop')
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def reboot_system(self) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/system/reboot: The reboot endpoint can be used to reboot the entire system.
+        """
+        data = self.transport.request('POST', '/api/v1/system/reboot')
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def locate_system(self, *, led_on_time: Optional[int] = None) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/system/locate: The locate system endpoint can be used to flash the
+        indicator LED on the control board to assist in finding the miner.
+        """
+        data = self.transport.request('POST', '/api/v1/system/locate', query={'led_on_time': led_on_time})
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def get_system_logs(self, *, lines: Optional[int] = None, source: Optional[str] = None) -> Optional[LogsResponse]:
+        """
+        GET /api/v1/system/logs: The logs endpoint provides the most recent log lines from a
+        given source, either OS, pool software, or miner logs.
+        """
+        data = self.transport.request('GET', '/api/v1/system/logs', query={'lines': lines, 'source': source})
+        return None if data is None else LogsResponse.from_dict(data)
+
+    def update_check(self) -> None:
+        """
+        POST /api/v1/system/update/check: Initiates a check with the update server to determine
+        whether a new version of the miner software is available. This request does not perform
+        a download or installation, only a version availability check.
+        """
+        self.transport.request('POST', '/api/v1/system/update/check')
+
+    def post_update_system(self) -> None:
+        """
+        POST /api/v1/system/update: Initiates a system update of the miner software. This will
+        download the update and automatically install it once the download completes.
+        """
+        self.transport.request('POST', '/api/v1/system/update')
+
+    def put_update_system(self, file: Upload) -> None:
+        """
+        PUT /api/v1/system/update: Uploads a firmware update file to the device. This endpoint
+        will also install it once the upload completes.
+        """
+        self.transport.request('PUT', '/api/v1/system/update', files={'file': file})
+
+    def get_ssh(self) -> Optional[SshResponse]:
+        """
+        GET /api/v1/system/ssh: The get ssh endpoint returns if SSH is enabled or disabled on
+        the control board
+        """
+        data = self.transport.request('GET', '/api/v1/system/ssh')
+        return None if data is None else SshResponse.from_dict(data)
+
+    def set_ssh(self, body: SshConfig) -> Optional[SshResponse]:
+        """
+        PUT /api/v1/system/ssh: The put ssh endpoint enables/disables SSH on the control board
+        """
+        data = self.transport.request('PUT', '/api/v1/system/ssh', body=body)
+        return None if data is None else SshResponse.from_dict(data)
+
+    def get_unlock(self) -> Optional[UnlockResponse]:
+        """
+        GET /api/v1/system/unlock: The get UNLOCK endpoint returns current lock status of the
+        control board.
+        """
+        data = self.transport.request('GET', '/api/v1/system/unlock')
+        return None if data is None else UnlockResponse.from_dict(data)
+
+    def set_unlock(self, body: UnlockConfig) -> Optional[UnlockResponse]:
+        """
+        PUT /api/v1/system/unlock: The put UNLOCK endpoint execute device unlock on the control
+        board when correct password is used.
+        """
+        data = self.transport.request('PUT', '/api/v1/system/unlock', body=body)
+        return None if data is None else UnlockResponse.from_dict(data)
+
+    def get_all_hashboards(self) -> Optional[HashboardsInfo]:
+        """
+        GET /api/v1/hashboards: The hashboards endpoint provides information about all of the
+        hashboards connected to the system, including firmware version, MCU, ASIC count, API
+        version, and hardware serial numbers.
+        """
+        data = self.transport.request('GET', '/api/v1/hashboards')
+        return None if data is None else HashboardsInfo.from_dict(data)
+
+    def get_hashboard_status(self, hb_sn: str) -> Optional[HashboardStats]:
+        """
+        GET /api/v1/hashboards/{hb_sn}: The hashboard status endpoint returns current operating
+        statistics for a single hashboard in the system based on its serial number.
+        """
+        data = self.transport.request('GET', f"/api/v1/hashboards/{quote(str(hb_sn), safe='')}")
+        return None if data is None else HashboardStats.from_dict(data)
+
+    def get_asic_status(self, hb_sn: str, asic_id: int) -> Optional[AsicStatsResponse]:
+        """
+        GET /api/v1/hashboards/{hb_sn}/{asic_id}: The hashboard status endpoint returns current
+        operating statistics for a single ASIC on the specified hashboard in the system based on
+        serial number and ASIC ID.
+        """
+        data = self.transport.request('GET', f"/api/v1/hashboards/{quote(str(hb_sn), safe='')}/{quote(str(asic_id), safe='')}")
+        return None if data is None else AsicStatsResponse.from_dict(data)
+
+    def get_miner_hashrate(self, *, duration: Optional[str] = None) -> Optional[HashrateResponse]:
+        """
+        GET /api/v1/hashrate: The hashrate endpoint provides miner-level historical hashrate
+        operation data.
+        """
+        data = self.transport.request('GET', '/api/v1/hashrate', query={'duration': duration})
+        return None if data is None else HashrateResponse.from_dict(data)
+
+    def get_hashboard_hashrate(self, hb_sn: str, *, duration: Optional[str] = None) -> Optional[HashrateResponse]:
+        """
+        GET /api/v1/hashrate/{hb_sn}: The hashrate endpoint provides hashboard-level historical
+        operation data.
+        """
+        data = self.transport.request('GET', f"/api/v1/hashrate/{quote(str(hb_sn), safe='')}", query={'duration': duration})
+        return None if data is None else HashrateResponse.from_dict(data)
+
+    def get_asic_hashrate(self, hb_sn: str, asic_id: int, *, duration: Optional[str] = None, granularity: Optional[str] = None) -> Optional[HashrateResponse]:
+        """
+        GET /api/v1/hashrate/{hb_sn}/{asic_id}: The hashrate endpoint provides ASIC-level
+        historical hashrate operation data.
+        """
+        data = self.transport.request('GET', f"/api/v1/hashrate/{quote(str(hb_sn), safe='')}/{quote(str(asic_id), safe='')}", query={'duration': duration, 'granularity': granularity})
+        return None if data is None else HashrateResponse.from_dict(data)
+
+    def get_miner_temperature(self, *, duration: Optional[str] = None) -> Optional[TemperatureResponse]:
+        """
+        GET /api/v1/temperature: The temperature endpoint provides miner-level historical
+        temperature operation data.
+        """
+        data = self.transport.request('GET', '/api/v1/temperature', query={'duration': duration})
+        return None if data is None else TemperatureResponse.from_dict(data)
+
+    def get_hashboard_temperature(self, hb_sn: str, *, duration: Optional[str] = None) -> Optional[TemperatureResponse]:
+        """
+        GET /api/v1/temperature/{hb_sn}: The temperature endpoint provides hashboard-level
+        historical operation data.
+        """
+        data = self.transport.request('GET', f"/api/v1/temperature/{quote(str(hb_sn), safe='')}", query={'duration': duration})
+        return None if data is None else TemperatureResponse.from_dict(data)
+
+    def get_asic_temperature(self, hb_sn: str, asic_id: int, *, duration: Optional[str] = None, granularity: Optional[str] = None) -> Optional[TemperatureResponse]:
+        """
+        GET /api/v1/temperature/{hb_sn}/{asic_id}: The hashrate endpoint provides ASIC-level
+        historical temperature operation data.
+        """
+        data = self.transport.request('GET', f"/api/v1/temperature/{quote(str(hb_sn), safe='')}/{quote(str(asic_id), safe='')}", query={'duration': duration, 'granularity': granularity})
+        return None if data is None else TemperatureResponse.from_dict(data)
+
+    def get_miner_power(self, *, duration: Optional[str] = None) -> Optional[PowerResponse]:
+        """
+        GET /api/v1/power: The power endpoint provides miner-level historical power operation
+        data.
+        """
+        data = self.transport.request('GET', '/api/v1/power', query={'duration': duration})
+        return None if data is None else PowerResponse.from_dict(data)
+
+    def get_hardware(self) -> Optional[HardwareInfo]:
+        """
+        GET /api/v1/hardware: The hardware endpoint provides information about the hardware
+        components of the miner. This includes hashboards, power supplies, and fans.
+        """
+        data = self.transport.request('GET', '/api/v1/hardware')
+        return None if data is None else HardwareInfo.from_dict(data)
+
+    def list_power_supplies(self) -> Optional[PSUsInfo]:
+        """
+        GET /api/v1/hardware/PSUs: The get power supplies endpoint returns the full list of
+        currently configured power supplies.
+        """
+        data = self.transport.request('GET', '/api/v1/hardware/PSUs')
+        return None if data is None else PSUsInfo.from_dict(data)
+
+    def get_power_supplies(self) -> Optional[PowerSuppliesResponse]:
+        """
+        GET /api/v1/power-supplies: Returns information about all PSUs including firmware update
+        status and available firmware updates.
+        """
+        data = self.transport.request('GET', '/api/v1/power-supplies')
+        return None if data is None else PowerSuppliesResponse.from_dict(data)
+
+    def post_update_psu(self, *, force: Optional[bool] = None) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/power-supplies/update: Schedules a PSU firmware update. This command
+        enables the PSU update service so that the update will automatically run on the next
+        reboot of the miner. Use the `force` parameter to bypass scheduling checks and allow re-
+        flashing the same firmware version.
+        """
+        data = self.transport.request('POST', '/api/v1/power-supplies/update', query={'force': force})
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def get_hashboard_power(self, hb_sn: str, *, duration: Optional[str] = None) -> Optional[PowerResponse]:
+        """
+        GET /api/v1/power/{hb_sn}: The power endpoint provides hashboard-level historical
+        operation data.
+        """
+        data = self.transport.request('GET', f"/api/v1/power/{quote(str(hb_sn), safe='')}", query={'duration': duration})
+        return None if data is None else PowerResponse.from_dict(data)
+
+    def get_miner_efficiency(self, *, duration: Optional[str] = None) -> Optional[EfficiencyResponse]:
+        """
+        GET /api/v1/efficiency: The efficiency endpoint provides miner-level historical power
+        operation data.
+        """
+        data = self.transport.request('GET', '/api/v1/efficiency', query={'duration': duration})
+        return None if data is None else EfficiencyResponse.from_dict(data)
+
+    def get_hashboard_efficiency(self, hb_sn: str, *, duration: Optional[str] = None) -> Optional[EfficiencyResponse]:
+        """
+        GET /api/v1/efficiency/{hb_sn}: The efficiency endpoint provides hashboard-level
+        historical operation data.
+        """
+        data = self.transport.request('GET', f"/api/v1/efficiency/{quote(str(hb_sn), safe='')}", query={'duration': duration})
+        return None if data is None else EfficiencyResponse.from_dict(data)
+
+    def get_cooling(self) -> Optional[CoolingStatus]:
+        """
+        GET /api/v1/cooling: The cooling endpoint provides information on the cooling status of
+        the device, including mode and current fan RPM.
+        """
+        data = self.transport.request('GET', '/api/v1/cooling')
+        return None if data is None else CoolingStatus.from_dict(data)
+
+    def set_cooling_mode(self, body: CoolingConfig) -> Optional[CoolingConfig]:
+        """
+        PUT /api/v1/cooling: The cooling configuration endpoint allows the user to control the
+        fan mode.
+        """
+        data = self.transport.request('PUT', '/api/v1/cooling', body=body)
+        return None if data is None else CoolingConfig.from_dict(data)
+
+    def get_network(self) -> Optional[NetworkInfo]:
+        """
+        GET /api/v1/network: The network GET endpoint provides information related to the
+        network configuration of the miner including IP address, gateways, and MAC address.
+        """
+        data = self.transport.request('GET', '/api/v1/network')
+        return None if data is None else NetworkInfo.from_dict(data)
+
+    def set_network_config(self, body: NetworkConfig) -> Optional[NetworkInfo]:
+        """
+        PUT /api/v1/network: The network PUT endpoint allows the user to change the
+        configuration of the miner between DHCP and a static IP.
+        """
+        data = self.transport.request('PUT', '/api/v1/network', body=body)
+        return None if data is None else NetworkInfo.from_dict(data)
+
+    def get_errors(self) -> Optional[ErrorListResponse]:
+        """
+        GET /api/v1/errors: The errors endpoint provides alerts to be surfaced on the UI with
+        different severity levels such as errors or warnings. This endpoint should be polled
+        periodically to surface any issues that arise during mining operation.
+        """
+        data = self.transport.request('GET', '/api/v1/errors')
+        return None if data is None else [NotificationError.from_dict(item0) for item0 in data]
+
+    def get_system_tag(self) -> Optional[Any]:
+        """GET /api/v1/system/tag: Retrieve the current system tag value."""
+        return self.transport.request('GET', '/api/v1/system/tag')
+
+    def put_system_tag(self, body: Any) -> Optional[MessageResponse]:
+        """
+        PUT /api/v1/system/tag: Set or update the system tag value. Accepts any non-null JSON
+        value (string, number, boolean, object, or array). Maximum size is 10 KiB when
+        serialized.
+        """
+        data = self.transport.request('PUT', '/api/v1/system/tag', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    def delete_system_tag(self) -> None:
+        """DELETE /api/v1/system/tag: Remove the current system tag."""
+        self.transport.request('DELETE', '/api/v1/system/tag')
+
+    def get_system_telemetry_enabled(self) -> Optional[TelemetryResponse]:
+        """GET /api/v1/system/telemetry: Get the current system telemetry enabled status."""
+        data = self.transport.request('GET', '/api/v1/system/telemetry')
+        return None if data is None else TelemetryResponse.from_dict(data)
+
+    def set_system_telemetry_enabled(self, body: TelemetryConfig) -> Optional[TelemetryResponse]:
+        """PUT /api/v1/system/telemetry: Configure system telemetry enabled settings."""
+        data = self.transport.request('PUT', '/api/v1/system/telemetry', body=body)
+        return None if data is None else TelemetryResponse.from_dict(data)
+
+    def get_time_series(self, body: TimeSeriesRequest) -> Optional[TimeSeriesResponse]:
+        """
+        POST /api/v1/timeseries: The time series endpoint provides unified access to historical
+        data for multiple metrics and levels. It allows querying hashrate, temperature, power,
+        and efficiency data for miner, hashboard, ASIC, and PSU levels in a single request with
+        flexible time ranges and aggregation options.
+        """
+        data = self.transport.request('POST', '/api/v1/timeseries', body=body)
+        return None if data is None else TimeSeriesResponse.from_dict(data)
+
+    def get_current_telemetry(self, *, level: Optional[List[str]] = None) -> Optional[TelemetryData]:
+        """GET /api/v1/telemetry: Get current telemetry data"""
+        data = self.transport.request('GET', '/api/v1/telemetry', query={'level': level})
+        return None if data is None else TelemetryData.from_dict(data)
+
+
+class AsyncClient:
+    """asyncio client for one miner, keeping up to max_connections alive"""
+
+    def __init__(self, base_url=DEFAULT_SERVER, auth=None, timeout=DEFAULT_TIMEOUT, max_connections=4,
+                 scheduler=None):
+        self.transport = AsyncTransport(base_url, auth, timeout, max_connections, scheduler)
+
+    async def close(self):
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def list_pools(self) -> Optional[PoolsList]:
+        """
+        GET /api/v1/pools: The get pools endpoint returns the full list of currently configured
+        pools.
+        """
+        data = await self.transport.request('GET', '/api/v1/pools')
+        return None if data is None else PoolsList.from_dict(data)
+
+    async def create_pools(self, *, body: Optional[PoolConfig] = None) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/pools: The post pools endpoint allows up to three pools to be configured,
+        replacing the previous pool configuration.
+        """
+        data = await self.transport.request('POST', '/api/v1/pools', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def get_pool(self, id: int) -> Optional[PoolResponse]:
+        """GET /api/v1/pools/{id}: Get configuration for a specific pool by ID"""
+        data = await self.transport.request('GET', f"/api/v1/pools/{quote(str(id), safe='')}")
+        return None if data is None else PoolResponse.from_dict(data)
+
+    async def edit_pool(self, id: int, body: PoolConfig_inner) -> Optional[MessageResponse]:
+        """
+        PUT /api/v1/pools/{id}: Using this pool configuration endpoint, users can edit the
+        properties of an existing pool.
+        """
+        data = await self.transport.request('PUT', f"/api/v1/pools/{quote(str(id), safe='')}", body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def delete_pool(self, id: int) -> Optional[MessageResponse]:
+        """DELETE /api/v1/pools/{id}: Delete a specific pool configuration by ID"""
+        data = await self.transport.request('DELETE', f"/api/v1/pools/{quote(str(id), safe='')}")
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def test_pool_connection(self, body: TestConnection) -> Optional[MessageResponse]:
+        """POST /api/v1/pools/test-connection: Used to test a pool connection"""
+        data = await self.transport.request('POST', '/api/v1/pools/test-connection', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def set_password(self, body: PasswordRequest) -> Optional[MessageResponse]:
+        """
+        PUT /api/v1/auth/password: The password endpoint allows users to set a password during
+        onboarding
+        """
+        data = await self.transport.request('PUT', '/api/v1/auth/password', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def change_password(self, body: ChangePasswordRequest) -> Optional[MessageResponse]:
+        """
+        PUT /api/v1/auth/change-password: Change the current password to a new password.
+        Requires the current password for verification.
+        """
+        data = await self.transport.request('PUT', '/api/v1/auth/change-password', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def login(self, body: PasswordRequest) -> Optional[AuthTokens]:
+        """
+        POST /api/v1/auth/login: Authenticates a user using a password and returns a JWT access
+        and refresh token pair.
+        """
+        data = await self.transport.request('POST', '/api/v1/auth/login', body=body)
+        return None if data is None else AuthTokens.from_dict(data)
+
+    async def logout(self, body: AuthTokens) -> Optional[MessageResponse]:
+        """POST /api/v1/auth/logout: User logout"""
+        data = await self.transport.request('POST', '/api/v1/auth/logout', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def refresh_token(self, body: RefreshRequest) -> Optional[RefreshResponse]:
+        """POST /api/v1/auth/refresh: Refresh JWT access token"""
+        data = await self.transport.request('POST', '/api/v1/auth/refresh', body=body)
+        return None if data is None else RefreshResponse.from_dict(data)
+
+    async def get_system_info(self) -> Optional[SystemInfo]:
+        """
+        GET /api/v1/system: The system endpoint provides information related to the control
+        board including OS, software, and hardware component details.
+        """
+        data = await self.transport.request('GET', '/api/v1/system')
+        return None if data is None else SystemInfo.from_dict(data)
+
+    async def get_system_status(self) -> Optional[SystemStatuses]:
+        """GET /api/v1/system/status: Get system statuses"""
+        data = await self.transport.request('GET', '/api/v1/system/status')
+        return None if data is None else SystemStatuses.from_dict(data)
+
+    async def get_mining_status(self) -> Optional[MiningStatus]:
+        """
+        GET /api/v1/mining: The mining endpoint provides summary information about the mining
+        operations of the device. This includes device level hashrate statistics, overall miner
+        status, and current power usage and target information.
+        """
+        data = await self.transport.request('GET', '/api/v1/mining')
+        return None if data is None else MiningStatus.from_dict(data)
+
+    async def get_mining_target(self) -> Optional[MiningTargetResponse]:
+        """
+        GET /api/v1/mining/target: The mining target endpoint returns the current power target
+        in watts that the miner is controlling for.
+        """
+        data = await self.transport.request('GET', '/api/v1/mining/target')
+        return None if data is None else MiningTargetResponse.from_dict(data)
+
+    async def edit_mining_target(self, body: MiningTarget) -> Optional[MiningTargetResponse]:
+        """
+        PUT /api/v1/mining/target: The mining target endpoint can be used to set a target power
+        consumption for the miner. Once set, the mining device will operate to consume as close
+        to that amount of power as possible. In the event that the device is unable to maintain
+        its temperature within the allowed range, it may scale down and use less power.
+        """
+        data = await self.transport.request('PUT', '/api/v1/mining/target', body=body)
+        return None if data is None else MiningTargetResponse.from_dict(data)
+
+    async def edit_mining_tuning(self, body: MiningTuningConfig) -> Optional[MiningTuningConfig]:
+        """
+        PUT /api/v1/mining/tuning: The mining tuning endpoint can be used to set a hashboard
+        level optimization algorithm
+        """
+        data = await self.transport.request('PUT', '/api/v1/mining/tuning', body=body)
+        return None if data is None else MiningTuningConfig.from_dict(data)
+
+    async def start_mining(self) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/mining/start: The start mining endpoint can be used to make the device
+        start mining, into account the current power target of the system.
+        """
+        data = await self.transport.request('POST', '/api/v1/mining/start')
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def stop_mining(self) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/mining/stop: The stop mining endpoint can be used to stop the device from
+        mining, going into a minimal power mode with only the control board running.
+        """
+        data = await self.transport.request('POST', '/api/v1/mining/stop')
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def reboot_system(self) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/system/reboot: The reboot endpoint can be used to reboot the entire system.
+        """
+        data = await self.transport.request('POST', '/api/v1/system/reboot')
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def locate_system(self, *, led_on_time: Optional[int] = None) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/system/locate: The locate system endpoint can be used to flash the
+        indicator LED on the control board to assist in finding the miner.
+        """
+        data = await self.transport.request('POST', '/api/v1/system/locate', query={'led_on_time': led_on_time})
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def get_system_logs(self, *, lines: Optional[int] = None, source: Optional[str] = None) -> Optional[LogsResponse]:
+        """
+        GET /api/v1/system/logs: The logs endpoint provides the most recent log lines from a
+        given source, either OS, pool software, or miner logs.
+        """
+        data = await self.transport.request('GET', '/api/v1/system/logs', query={'lines': lines, 'source': source})
+        return None if data is None else LogsResponse.from_dict(data)
+
+    async def update_check(self) -> None:
+        """
+        POST /api/v1/system/update/check: Initiates a check with the update server to determine
+        whether a new version of the miner software is available. This request does not perform
+        a download or installation, only a version availability check.
+        """
+        await self.transport.request('POST', '/api/v1/system/update/check')
+
+    async def post_update_system(self) -> None:
+        """
+        POST /api/v1/system/update: Initiates a system update of the miner software. This will
+        download the update and automatically install it once the download completes.
+        """
+        await self.transport.request('POST', '/api/v1/system/update')
+
+    async def put_update_system(self, file: Upload) -> None:
+        """
+        PUT /api/v1/system/update: Uploads a firmware update file to the device. This endpoint
+        will also install it once the upload completes.
+        """
+        await self.transport.request('PUT', '/api/v1/system/update', files={'file': file})
+
+    async def get_ssh(self) -> Optional[SshResponse]:
+        """
+        GET /api/v1/system/ssh: The get ssh endpoint returns if SSH is enabled or disabled on
+        the control board
+        """
+        data = await self.transport.request('GET', '/api/v1/system/ssh')
+        return None if data is None else SshResponse.from_dict(data)
+
+    async def set_ssh(self, body: SshConfig) -> Optional[SshResponse]:
+        """
+        PUT /api/v1/system/ssh: The put ssh endpoint enables/disables SSH on the control board
+        """
+        data = await self.transport.request('PUT', '/api/v1/system/ssh', body=body)
+        return None if data is None else SshResponse.from_dict(data)
+
+    async def get_unlock(self) -> Optional[UnlockResponse]:
+        """
+        GET /api/v1/system/unlock: The get UNLOCK endpoint returns current lock status of the
+        control board.
+        """
+        data = await self.transport.request('GET', '/api/v1/system/unlock')
+        return None if data is None else UnlockResponse.from_dict(data)
+
+    async def set_unlock(self, body: UnlockConfig) -> Optional[UnlockResponse]:
+        """
+        PUT /api/v1/system/unlock: The put UNLOCK endpoint execute device unlock on the control
+        board when correct password is used.
+        """
+        data = await self.transport.request('PUT', '/api/v1/system/unlock', body=body)
+        return None if data is None else UnlockResponse.from_dict(data)
+
+    async def get_all_hashboards(self) -> Optional[HashboardsInfo]:
+        """
+        GET /api/v1/hashboards: The hashboards endpoint provides information about all of the
+        hashboards connected to the system, including firmware version, MCU, ASIC count, API
+        version, and hardware serial numbers.
+        """
+        data = await self.transport.request('GET', '/api/v1/hashboards')
+        return None if data is None else HashboardsInfo.from_dict(data)
+
+    async def get_hashboard_status(self, hb_sn: str) -> Optional[HashboardStats]:
+        """
+        GET /api/v1/hashboards/{hb_sn}: The hashboard status endpoint returns current operating
+        statistics for a single hashboard in the system based on its serial number.
+        """
+        data = await self.transport.request('GET', f"/api/v1/hashboards/{quote(str(hb_sn), safe='')}")
+        return None if data is None else HashboardStats.from_dict(data)
+
+    async def get_asic_status(self, hb_sn: str, asic_id: int) -> Optional[AsicStatsResponse]:
+        """
+        GET /api/v1/hashboards/{hb_sn}/{asic_id}: The hashboard status endpoint returns current
+        operating statistics for a single ASIC on the specified hashboard in the system based on
+        serial number and ASIC ID.
+        """
+        data = await self.transport.request('GET', f"/api/v1/hashboards/{quote(str(hb_sn), safe='')}/{quote(str(asic_id), safe='')}")
+        return None if data is None else AsicStatsResponse.from_dict(data)
+
+    async def get_miner_hashrate(self, *, duration: Optional[str] = None) -> Optional[HashrateResponse]:
+        """
+        GET /api/v1/hashrate: The hashrate endpoint provides miner-level historical hashrate
+        operation data.
+        """
+        data = await self.transport.request('GET', '/api/v1/hashrate', query={'duration': duration})
+        return None if data is None else HashrateResponse.from_dict(data)
+
+    async def get_hashboard_hashrate(self, hb_sn: str, *, duration: Optional[str] = None) -> Optional[HashrateResponse]:
+        """
+        GET /api/v1/hashrate/{hb_sn}: The hashrate endpoint provides hashboard-level historical
+        operation data.
+        """
+        data = await self.transport.request('GET', f"/api/v1/hashrate/{quote(str(hb_sn), safe='')}", query={'duration': duration})
+        return None if data is None else HashrateResponse.from_dict(data)
+
+    async def get_asic_hashrate(self, hb_sn: str, asic_id: int, *, duration: Optional[str] = None, granularity: Optional[str] = None) -> Optional[HashrateResponse]:
+        """
+        GET /api/v1/hashrate/{hb_sn}/{asic_id}: The hashrate endpoint provides ASIC-level
+        historical hashrate operation data.
+        """
+        data = await self.transport.request('GET', f"/api/v1/hashrate/{quote(str(hb_sn), safe='')}/{quote(str(asic_id), safe='')}", query={'duration': duration, 'granularity': granularity})
+        return None if data is None else HashrateResponse.from_dict(data)
+
+    async def get_miner_temperature(self, *, duration: Optional[str] = None) -> Optional[TemperatureResponse]:
+        """
+        GET /api/v1/temperature: The temperature endpoint provides miner-level historical
+        temperature operation data.
+        """
+        data = await self.transport.request('GET', '/api/v1/temperature', query={'duration': duration})
+        return None if data is None else TemperatureResponse.from_dict(data)
+
+    async def get_hashboard_temperature(self, hb_sn: str, *, duration: Optional[str] = None) -> Optional[TemperatureResponse]:
+        """
+        GET /api/v1/temperature/{hb_sn}: The temperature endpoint provides hashboard-level
+        historical operation data.
+        """
+        data = await self.transport.request('GET', f"/api/v1/temperature/{quote(str(hb_sn), safe='')}", query={'duration': duration})
+        return None if data is None else TemperatureResponse.from_dict(data)
+
+    async def get_asic_temperature(self, hb_sn: str, asic_id: int, *, duration: Optional[str] = None, granularity: Optional[str] = None) -> Optional[TemperatureResponse]:
+        """
+        GET /api/v1/temperature/{hb_sn}/{asic_id}: The hashrate endpoint provides ASIC-level
+        historical temperature operation data.
+        """
+        data = await self.transport.request('GET', f"/api/v1/temperature/{quote(str(hb_sn), safe='')}/{quote(str(asic_id), safe='')}", query={'duration': duration, 'granularity': granularity})
+        return None if data is None else TemperatureResponse.from_dict(data)
+
+    async def get_miner_power(self, *, duration: Optional[str] = None) -> Optional[PowerResponse]:
+        """
+        GET /api/v1/power: The power endpoint provides miner-level historical power operation
+        data.
+        """
+        data = await self.transport.request('GET', '/api/v1/power', query={'duration': duration})
+        return None if data is None else PowerResponse.from_dict(data)
+
+    async def get_hardware(self) -> Optional[HardwareInfo]:
+        """
+        GET /api/v1/hardware: The hardware endpoint provides information about the hardware
+        components of the miner. This includes hashboards, power supplies, and fans.
+        """
+        data = await self.transport.request('GET', '/api/v1/hardware')
+        return None if data is None else HardwareInfo.from_dict(data)
+
+    async def list_power_supplies(self) -> Optional[PSUsInfo]:
+        """
+        GET /api/v1/hardware/PSUs: The get power supplies endpoint returns the full list of
+        currently configured power supplies.
+        """
+        data = await self.transport.request('GET', '/api/v1/hardware/PSUs')
+        return None if data is None else PSUsInfo.from_dict(data)
+
+    async def get_power_supplies(self) -> Optional[PowerSuppliesResponse]:
+        """
+        GET /api/v1/power-supplies: Returns information about all PSUs including firmware update
+        status and available firmware updates.
+        """
+        data = await self.transport.request('GET', '/api/v1/power-supplies')
+        return None if data is None else PowerSuppliesResponse.from_dict(data)
+
+    async def post_update_psu(self, *, force: Optional[bool] = None) -> Optional[MessageResponse]:
+        """
+        POST /api/v1/power-supplies/update: Schedules a PSU firmware update. This command
+        enables the PSU update service so that the update will automatically run on the next
+        reboot of the miner. Use the `force` parameter to bypass scheduling checks and allow re-
+        flashing the same firmware version.
+        """
+        data = await self.transport.request('POST', '/api/v1/power-supplies/update', query={'force': force})
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def get_hashboard_power(self, hb_sn: str, *, duration: Optional[str] = None) -> Optional[PowerResponse]:
+        """
+        GET /api/v1/power/{hb_sn}: The power endpoint provides hashboard-level historical
+        operation data.
+        """
+        data = await self.transport.request('GET', f"/api/v1/power/{quote(str(hb_sn), safe='')}", query={'duration': duration})
+        return None if data is None else PowerResponse.from_dict(data)
+
+    async def get_miner_efficiency(self, *, duration: Optional[str] = None) -> Optional[EfficiencyResponse]:
+        """
+        GET /api/v1/efficiency: The efficiency endpoint provides miner-level historical power
+        operation data.
+        """
+        data = await self.transport.request('GET', '/api/v1/efficiency', query={'duration': duration})
+        return None if data is None else EfficiencyResponse.from_dict(data)
+
+    async def get_hashboard_efficiency(self, hb_sn: str, *, duration: Optional[str] = None) -> Optional[EfficiencyResponse]:
+        """
+        GET /api/v1/efficiency/{hb_sn}: The efficiency endpoint provides hashboard-level
+        historical operation data.
+        """
+        data = await self.transport.request('GET', f"/api/v1/efficiency/{quote(str(hb_sn), safe='')}", query={'duration': duration})
+        return None if data is None else EfficiencyResponse.from_dict(data)
+
+    async def get_cooling(self) -> Optional[CoolingStatus]:
+        """
+        GET /api/v1/cooling: The cooling endpoint provides information on the cooling status of
+        the device, including mode and current fan RPM.
+        """
+        data = await self.transport.request('GET', '/api/v1/cooling')
+        return None if data is None else CoolingStatus.from_dict(data)
+
+    async def set_cooling_mode(self, body: CoolingConfig) -> Optional[CoolingConfig]:
+        """
+        PUT /api/v1/cooling: The cooling configuration endpoint allows the user to control the
+        fan mode.
+        """
+        data = await self.transport.request('PUT', '/api/v1/cooling', body=body)
+        return None if data is None else CoolingConfig.from_dict(data)
+
+    async def get_network(self) -> Optional[NetworkInfo]:
+        """
+        GET /api/v1/network: The network GET endpoint provides information related to the
+        network configuration of the miner including IP address, gateways, and MAC address.
+        """
+        data = await self.transport.request('GET', '/api/v1/network')
+        return None if data is None else NetworkInfo.from_dict(data)
+
+    async def set_network_config(self, body: NetworkConfig) -> Optional[NetworkInfo]:
+        """
+        PUT /api/v1/network: The network PUT endpoint allows the user to change the
+        configuration of the miner between DHCP and a static IP.
+        """
+        data = await self.transport.request('PUT', '/api/v1/network', body=body)
+        return None if data is None else NetworkInfo.from_dict(data)
+
+    async def get_errors(self) -> Optional[ErrorListResponse]:
+        """
+        GET /api/v1/errors: The errors endpoint provides alerts to be surfaced on the UI with
+        different severity levels such as errors or warnings. This endpoint should be polled
+        periodically to surface any issues that arise during mining operation.
+        """
+        data = await self.transport.request('GET', '/api/v1/errors')
+        return None if data is None else [NotificationError.from_dict(item0) for item0 in data]
+
+    async def get_system_tag(self) -> Optional[Any]:
+        """GET /api/v1/system/tag: Retrieve the current system tag value."""
+        return await self.transport.request('GET', '/api/v1/system/tag')
+
+    async def put_system_tag(self, body: Any) -> Optional[MessageResponse]:
+        """
+        PUT /api/v1/system/tag: Set or update the system tag value. Accepts any non-null JSON
+        value (string, number, boolean, object, or array). Maximum size is 10 KiB when
+        serialized.
+        """
+        data = await self.transport.request('PUT', '/api/v1/system/tag', body=body)
+        return None if data is None else MessageResponse.from_dict(data)
+
+    async def delete_system_tag(self) -> None:
+        """DELETE /api/v1/system/tag: Remove the current system tag."""
+        await self.transport.request('DELETE', '/api/v1/system/tag')
+
+    async def get_system_telemetry_enabled(self) -> Optional[TelemetryResponse]:
+        """GET /api/v1/system/telemetry: Get the current system telemetry enabled status."""
+        data = await self.transport.request('GET', '/api/v1/system/telemetry')
+        return None if data is None else TelemetryResponse.from_dict(data)
+
+    async def set_system_telemetry_enabled(self, body: TelemetryConfig) -> Optional[TelemetryResponse]:
+        """PUT /api/v1/system/telemetry: Configure system telemetry enabled settings."""
+        data = await self.transport.request('PUT', '/api/v1/system/telemetry', body=body)
+        return None if data is None else TelemetryResponse.from_dict(data)
+
+    async def get_time_series(self, body: TimeSeriesRequest) -> Optional[TimeSeriesResponse]:
+        """
+        POST /api/v1/timeseries: The time series endpoint provides unified access to historical
+        data for multiple metrics and levels. It allows querying hashrate, temperature, power,
+        and efficiency data for miner, hashboard, ASIC, and PSU levels in a single request with
+        flexible time ranges and aggregation options.
+        """
+        data = await self.transport.request('POST', '/api/v1/timeseries', body=body)
+        return None if data is None else TimeSeriesResponse.from_dict(data)
+
+    async def get_current_telemetry(self, *, level: Optional[List[str]] = None) -> Optional[TelemetryData]:
+        """GET /api/v1/telemetry: Get current telemetry data"""
+        data = await self.transport.request('GET', '/api/v1/telemetry', query={'level': level})
+        return None if data is None else TelemetryData.from_dict(data)
@@ -0,0 +1,641 @@
+"""
+HTTP/1.1 transports for the generated Proto API client (proto_client.py)
+- Blocking transport keeping one connection alive per miner
+- asyncio transport with a small keep-alive pool per miner
+- BearerAuth, JSON and multipart request bodies, ApiError for non-2xx
+- Hooks for session auth that refreshes tokens ahead of expiry and renews
+  them once after a 401 (session_cache.py), and for a per-miner request
+  scheduler that all asyncio traffic can go through (request_scheduler.py)
+- Chunked reads of large response bodies as they arrive (stream), and
+  multipart file uploads streamed from a buffer or mmap (upload)
+- Standard library only, so it runs anywhere the spec tooling runs
+"""
+
+import asyncio
+import contextlib
+import http.client
+import json
+import ssl
+import uuid
+from urllib.parse import quote, urlsplit
+
+DEFAULT_TIMEOUT = 10.0
+USER_AGENT = 'proto-client/1'
+
+# Raised when a kept-alive connection turns out to be closed by the miner;
+# the request is retried once on a fresh connection if it is idempotent or
+# never made it onto the wire in full (so the miner cannot have acted on it)
+STALE_ERRORS = (ConnectionResetError, BrokenPipeError, http.client.RemoteDisconnected,
+                asyncio.IncompleteReadError)
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+
+
+class ApiError(Exception):
+    """A non-2xx response; body is the decoded JSON error when there is one"""
+
+    def __init__(self, status, reason, body=None, method=None, path=None):
+        self.status = status
+        self.reason = reason
+        self.body = body
+        self.method = method
+        self.path = path
+        detail = body.get('error', body.get('message')) if isinstance(body, dict) else body
+        if isinstance(detail, dict):
+            detail = detail.get('message', detail)
+        super().__init__(f"{method} {path}: HTTP {status} {reason}" + (f" - {detail}" if detail else ''))
+
+
+class BearerAuth:
+    """JWT bearer token; assign .token to rotate it for later requests
+
+    Transports accept other auth objects with the same apply(headers) and
+    token. One with bind(base_url) is bound to each miner first, and the
+    bound auth may define prepare() / async aprepare(), run before each
+    request, and renew(token) / async arenew(token), called with the
+    rejected token after a 401 and returning True to send the request again.
+    """
+
+    __slots__ = ('token',)
+
+    def __init__(self, token):
+        self.token = token
+
+    def apply(self, headers):
+        headers['Authorization'] = f"Bearer {self.token}"
+
+
+class Upload:
+    """A file sent as one part of a multipart/form-data body"""
+
+    __slots__ = ('filename', 'data', 'content_type')
+
+    def __init__(self, filename, data, content_type='application/octet-stream'):
+        self.filename = filename
+        self.data = data
+        self.content_type = content_type
+
+
+class Model:
+    """Base for generated schema classes
+
+    Subclasses define __slots__ (Python attribute names) and _keys (the JSON
+    keys, in the same order); from_dict is generated per class.
+    """
+
+    __slots__ = ()
+    _keys = ()
+
+    def __init__(self, **fields):
+        unknown = set(fields) - set(self.__slots__)
+        if unknown:
+            raise TypeError(f"{type(self).__name__} has no field(s) {', '.join(sorted(unknown))}")
+        for slot in self.__slots__:
+            setattr(self, slot, fields.get(slot))
+
+    def to_dict(self):
+        result = {}
+        for slot, key in zip(self.__slots__, self._keys):
+            value = getattr(self, slot)
+            if value is None:
+                continue
+            if key is None:
+                # Additional properties are merged back in
+                result.update(plain(value))
+            else:
+                result[key] = plain(value)
+        return result
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self):
+        fields = ', '.join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__
+                           if getattr(self, slot) is not None)
+        return f"{type(self).__name__}({fields})"
+
+
+def plain(value):
+    """Models (possibly nested in lists and dicts) back to JSON values"""
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    return value
+
+
+def bind_auth(auth, base_url):
+    """The auth a transport for base_url uses; session caches hand out one per miner"""
+    bind = getattr(auth, 'bind', None)
+    return auth if bind is None else bind(base_url)
+
+
+def encode_query(params):
+    """Form-style query string; None is skipped, lists are comma-separated"""
+    if not params:
+        return ''
+    parts = []
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        elif isinstance(value, (list, tuple)):
+            value = ','.join(map(str, value))
+        parts.append(f"{name}={quote(str(value), safe=',')}")
+    return '?' + '&'.join(parts) if parts else ''
+
+
+def encode_body(body=None, files=None):
+    """(bytes, content type) for a JSON body or multipart form fields"""
+    if files is not None:
+        boundary = uuid.uuid4().hex
+        chunks = []
+        for name, value in files.items():
+            if value is None:
+                continue
+            if isinstance(value, (bytes, bytearray)):
+                value = Upload(name, bytes(value))
+            if isinstance(value, Upload):
+                head = (f'Content-Disposition: form-data; name="{name}"; filename="{value.filename}"\r\n'
+                        f'Content-Type: {value.content_type}\r\n')
+                data = value.data
+            else:
+                head = f'Content-Disposition: form-data; name="{name}"\r\n'
+                data = str(value).encode('utf-8')
+            chunks.append(f"--{boundary}\r\n{head}\r\n".encode('utf-8') + data + b'\r\n')
+        chunks.append(f"--{boundary}--\r\n".encode('utf-8'))
+        return b''.join(chunks), f'multipart/form-data; boundary={boundary}'
+    if body is None:
+        return None, None
+    return json.dumps(plain(body), separators=(',', ':')).encode('utf-8'), 'application/json'
+
+
+def decode_body(data, content_type):
+    if not data:
+        return None
+    if 'json' in (content_type or ''):
+        return json.loads(data)
+    try:
+        return json.loads(data)
+    except ValueError:
+        return data.decode('utf-8', 'replace')
+
+
+class _Target:
+    """Host, port and base path parsed once from a miner URL"""
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url if '://' in base_url else f"http://{base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.base_path = parts.path.rstrip('/')
+        default_port = self.port == (443 if self.scheme == 'https' else 80)
+        self.host_header = self.host if default_port else f"{self.host}:{self.port}"
+
+
+class Transport:
+    """Blocking transport for one miner, reusing a single connection
+
+    Not thread-safe; use one transport (client) per thread.
+    """
+
+    def __init__(self, base_url, auth=None, timeout=DEFAULT_TIMEOUT):
+        self.target = _Target(base_url)
+        self.auth = bind_auth(auth, base_url)
+        self.timeout = timeout
+        self._connection = None
+
+    def _connect(self):
+        if self.target.scheme == 'https':
+            return http.client.HTTPSConnection(self.target.host, self.target.port,
+                                               timeout=self.timeout, context=ssl.create_default_context())
+        return http.client.HTTPConnection(self.target.host, self.target.port, timeout=self.timeout)
+
+    def _authorize(self):
+        """The token about to be sent, after the auth had a chance to refresh it"""
+        prepare = getattr(self.auth, 'prepare', None)
+        if prepare is not None:
+            prepare()
+        return getattr(self.auth, 'token', None)
+
+    def _renewed(self, status, token):
+        """Whether a 401 for token was renewed by the auth, so the request goes out again"""
+        renew = getattr(self.auth, 'renew', None)
+        return status == 401 and renew is not None and renew(token)
+
+    def _send(self, method, path, query, body, files, read=True):
+        """(response, body) with body None when read is False"""
+        url = self.target.base_path + path + encode_query(query)
+        payload, content_type = encode_body(body, files)
+        headers = {'Accept': 'application/json', 'User-Agent': USER_AGENT}
+        if content_type:
+            headers['Content-Type'] = content_type
+        if self.auth is not None:
+            self.auth.apply(headers)
+
+        idempotent = method in IDEMPOTENT_METHODS
+        while True:
+            connection = self._connection
+            reused = connection is not None
+            if not reused:
+                connection = self._connection = self._connect()
+            sent = False
+            try:
+                connection.request(method, url, payload, headers)
+                sent = True
+                response = connection.getresponse()
+                data = response.read() if read else None
+            except STALE_ERRORS:
+                self.close()
+                if reused and (idempotent or not sent):
+                    continue
+                raise
+            except BaseException:
+                self.close()
+                raise
+            return response, data
+
+    def request(self, method, path, query=None, body=None, files=None, raw=False):
+        """Send one request and return the decoded response body
+
+        With raw=True the undecoded body bytes are returned instead.
+        """
+        for attempt in range(2):
+            token = self._authorize()
+            response, data = self._send(method, path, query, body, files)
+            if response.will_close:
+                self.close()
+            if attempt or not self._renewed(response.status, token):
+                break
+        if raw and response.status < 400:
+            return data
+        result = decode_body(data, response.getheader('Content-Type'))
+        if response.status >= 400:
+            raise ApiError(response.status, response.reason, result, method, path)
+        return result
+
+    def stream(self, method, path, query=None, body=None, files=None, chunk_size=65536):
+        """Send one request and yield the response body in chunks as it arrives
+
+        Error responses are read in full and raised as ApiError before the
+        first chunk. Closing the generator early drops the connection.
+        """
+        for attempt in range(2):
+            token = self._authorize()
+            response, _ = self._send(method, path, query, body, files, read=False)
+            if response.status < 400:
+                break
+            data = response.read()
+            if response.will_close:
+                self.close()
+            if attempt or not self._renewed(response.status, token):
+                raise ApiError(response.status, response.reason,
+                               decode_body(data, response.getheader('Content-Type')), method, path)
+        complete = False
+        try:
+            while True:
+                chunk = response.read1(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+            complete = True
+        finally:
+            if not complete or response.will_close:
+                self.close()
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+async def _read_head(reader):
+    """(status, reason, headers, keep alive) for one HTTP/1.1 response"""
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    version, status, *reason = lines[0].split(' ', 2)
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+    keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+    return int(status), reason[0] if reason else '', headers, keep_alive
+
+
+async def _iter_body(reader, status, headers, chunk_size):
+    """Body chunks of at most chunk_size bytes as they arrive"""
+    if 'content-length' in headers:
+        remaining = int(headers['content-length'])
+        while remaining:
+            chunk = await reader.read(min(remaining, chunk_size))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b'', remaining)
+            remaining -= len(chunk)
+            yield chunk
+    elif headers.get('transfer-encoding', '').lower() == 'chunked':
+        while True:
+            size = int((await reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+            if size == 0:
+                while await reader.readuntil(b'\r\n') != b'\r\n':
+                    pass
+                break
+            while size:
+                chunk = await reader.read(min(size, chunk_size))
+                if not chunk:
+                    raise asyncio.IncompleteReadError(b'', size)
+                size -= len(chunk)
+                yield chunk
+            await reader.readexactly(2)
+    elif not (status in (204, 304) or status < 200):
+        while chunk := await reader.read(chunk_size):
+            yield chunk
+
+
+def _delimited(status, headers):
+    """Whether the body ends before the connection does"""
+    return ('content-length' in headers or headers.get('transfer-encoding', '').lower() == 'chunked'
+            or status in (204, 304) or status < 200)
+
+
+async def _read_response(reader):
+    """(status, reason, headers, body, keep alive) for one HTTP/1.1 response"""
+    status, reason, headers, keep_alive = await _read_head(reader)
+    if 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    else:
+        body = b''.join([chunk async for chunk in _iter_body(reader, status, headers, 1 << 20)])
+    return status, reason, headers, body, keep_alive and _delimited(status, headers)
+
+
+class AsyncTransport:
+    """asyncio transport for one miner with up to max_connections kept alive
+
+    Requests beyond max_connections wait for a free connection. Each request
+    has a deadline of timeout seconds covering connect, send and receive.
+    With a scheduler, requests are admitted by it first; the class attribute
+    is the process-wide default (RequestScheduler.install).
+    """
+
+    scheduler = None
+
+    def __init__(self, base_url, auth=None, timeout=DEFAULT_TIMEOUT, max_connections=4, scheduler=None):
+        if scheduler is not None:
+            self.scheduler = scheduler
+        self.target = _Target(base_url)
+        self.auth = bind_auth(auth, base_url)
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._idle = []
+        self._slots = None
+        self._prefix = (f" HTTP/1.1\r\nHost: {self.target.host_header}\r\n"
+                        f"User-Agent: {USER_AGENT}\r\nAccept: application/json\r\n")
+
+    async def _connect(self):
+        context = ssl.create_default_context() if self.target.scheme == 'https' else None
+        return await asyncio.open_connection(self.target.host, self.target.port, ssl=context)
+
+    async def _authorize(self):
+        """The token about to be sent, after the auth had a chance to refresh it"""
+        prepare = getattr(self.auth, 'aprepare', None)
+        if prepare is not None:
+            await prepare()
+        return getattr(self.auth, 'token', None)
+
+    async def _renewed(self, status, token):
+        """Whether a 401 for token was renewed by the auth, so the request goes out again"""
+        renew = getattr(self.auth, 'arenew', None)
+        return status == 401 and renew is not None and await renew(token)
+
+    def _head(self, method, path, query, content_type, length):
+        lines = [method, ' ', self.target.base_path, path, encode_query(query), self._prefix]
+        if self.auth is not None:
+            headers = {}
+            self.auth.apply(headers)
+            lines.extend(f"{name}: {value}\r\n" for name, value in headers.items())
+        if content_type:
+            lines.append(f"Content-Type: {content_type}\r\n")
+        if length is not None:
+            lines.append(f"Content-Length: {length}\r\n")
+        lines.append('\r\n')
+        return ''.join(lines).encode('latin-1')
+
+    def _encode(self, method, path, query, body, files):
+        payload, content_type = encode_body(body, files)
+        length = len(payload or b'') if payload is not None or method in ('POST', 'PUT', 'PATCH') else None
+        request = self._head(method, path, query, content_type, length)
+        return request + payload if payload else request
+
+    async def _exchange(self, method, request, head_only=False):
+        idempotent = method in IDEMPOTENT_METHODS
+        while True:
+            connection = self._idle.pop() if self._idle else None
+            reused = connection is not None
+            if reused and connection[0].at_eof():
+                connection[1].close()
+                continue
+            if not reused:
+                connection = await self._connect()
+            reader, writer = connection
+            sent = False
+            try:
+                writer.write(request)
+                if not idempotent:
+                    await writer.drain()
+                sent = True
+                response = await (_read_head(reader) if head_only else _read_response(reader))
+            except STALE_ERRORS:
+                writer.close()
+                if reused and (idempotent or not sent):
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            if head_only:
+                # The caller reads the body and decides whether to pool the connection
+                return response, connection
+            if response[4]:
+                self._idle.append(connection)
+            else:
+                writer.close()
+            return response
+
+    async def request(self, method, path, query=None, body=None, files=None, timeout=None, raw=False):
+        """Send one request and return the decoded response body
+
+        With raw=True the undecoded body bytes are returned instead. Under a
+        scheduler, identical GETs in flight with the same auth object share
+        one response.
+        """
+        if self.scheduler is not None:
+            # The auth is alive while its request is in flight, so its id cannot be reused meanwhile
+            key = ((id(self.auth), path, encode_query(query), raw)
+                   if method == 'GET' and body is None and files is None else None)
+            return await self.scheduler.submit(self, method, path, key,
+                                               lambda: self._request(method, path, query, body, files, timeout, raw))
+        return await self._request(method, path, query, body, files, timeout, raw)
+
+    async def _request(self, method, path, query, body, files, timeout, raw):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        for attempt in range(2):
+            token = await self._authorize()
+            request = self._encode(method, path, query, body, files)
+            async with self._slots:
+                async with asyncio.timeout(self.timeout if timeout is None else timeout):
+                    status, reason, headers, data, _ = await self._exchange(method, request)
+            if attempt or not await self._renewed(status, token):
+                break
+        if raw and status < 400:
+            return data
+        result = decode_body(data, headers.get('content-type'))
+        if status >= 400:
+            raise ApiError(status, reason, result, method, path)
+        return result
+
+    async def stream(self, method, path, query=None, body=None, files=None, timeout=None,
+                     chunk_size=65536):
+        """Send one request and yield the response body in chunks as it arrives
+
+        The deadline covers the response head and then each chunk, so a slow
+        but steady body is not cut off. Error responses are read in full and
+        raised as ApiError. The connection slot is held until the generator
+        finishes; use contextlib.aclosing when leaving early.
+        """
+        chunks = self._stream(method, path, query, body, files, timeout, chunk_size)
+        async with contextlib.aclosing(chunks):
+            if self.scheduler is None:
+                async for chunk in chunks:
+                    yield chunk
+            else:
+                async with self.scheduler.slot(self, method, path):
+                    async for chunk in chunks:
+                        yield chunk
+
+    async def _stream(self, method, path, query, body, files, timeout, chunk_size):
+        deadline = self.timeout if timeout is None else timeout
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        for attempt in range(2):
+            token = await self._authorize()
+            request = self._encode(method, path, query, body, files)
+            error = None
+            async with self._slots:
+                async with asyncio.timeout(deadline):
+                    (status, reason, headers, keep_alive), connection = await self._exchange(method, request, True)
+                reader, writer = connection
+                chunks = _iter_body(reader, status, headers, chunk_size)
+                complete = False
+                try:
+                    if status >= 400:
+                        async with asyncio.timeout(deadline):
+                            data = b''.join([chunk async for chunk in chunks])
+                        complete = True
+                        error = ApiError(status, reason, decode_body(data, headers.get('content-type')),
+                                         method, path)
+                    else:
+                        while True:
+                            async with asyncio.timeout(deadline):
+                                chunk = await anext(chunks, None)
+                            if chunk is None:
+                                break
+                            yield chunk
+                        complete = True
+                finally:
+                    if complete and keep_alive and _delimited(status, headers):
+                        self._idle.append(connection)
+                    else:
+                        writer.close()
+            if error is None:
+                return
+            # Nothing was yielded yet, so a renewed token can still go out again
+            if attempt or not await self._renewed(status, token):
+                raise error
+
+    async def upload(self, method, path, name, upload, chunk_size=262144, throttle=None, timeout=None):
+        """Send upload as multipart/form-data field name, streamed from upload.data
+
+        upload.data may be bytes, a memoryview or an mmap; it is written in
+        chunk_size slices without being copied into the request, awaiting
+        throttle(size) before each slice when given. The deadline covers each
+        slice and then the response.
+        """
+        if self.scheduler is not None:
+            async with self.scheduler.slot(self, method, path):
+                return await self._upload(method, path, name, upload, chunk_size, throttle, timeout)
+        return await self._upload(method, path, name, upload, chunk_size, throttle, timeout)
+
+    async def _upload(self, method, path, name, upload, chunk_size, throttle, timeout):
+        for attempt in range(2):
+            token = await self._authorize()
+            status, reason, headers, body = await self._send_upload(method, path, name, upload, chunk_size,
+                                                                    throttle, timeout)
+            if attempt or not await self._renewed(status, token):
+                break
+        result = decode_body(body, headers.get('content-type'))
+        if status >= 400:
+            raise ApiError(status, reason, result, method, path)
+        return result
+
+    async def _send_upload(self, method, path, name, upload, chunk_size, throttle, timeout):
+        boundary = uuid.uuid4().hex
+        part = (f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{upload.filename}"\r\n'
+                f'Content-Type: {upload.content_type}\r\n\r\n').encode('utf-8')
+        closing = f"\r\n--{boundary}--\r\n".encode('utf-8')
+        data = memoryview(upload.data)
+        head = self._head(method, path, None, f'multipart/form-data; boundary={boundary}',
+                          len(part) + data.nbytes + len(closing)) + part
+        deadline = self.timeout if timeout is None else timeout
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        async with self._slots:
+            while True:
+                connection = self._idle.pop() if self._idle else None
+                reused = connection is not None
+                if reused and connection[0].at_eof():
+                    connection[1].close()
+                    continue
+                if not reused:
+                    async with asyncio.timeout(deadline):
+                        connection = await self._connect()
+                reader, writer = connection
+                sent = False
+                try:
+                    writer.write(head)
+                    for start in range(0, data.nbytes, chunk_size):
+                        chunk = data[start:start + chunk_size]
+                        if throttle is not None:
+                            await throttle(chunk.nbytes)
+                        writer.write(chunk)
+                        async with asyncio.timeout(deadline):
+                            await writer.drain()
+                    writer.write(closing)
+                    async with asyncio.timeout(deadline):
+                        await writer.drain()
+                    sent = True
+                    async with asyncio.timeout(deadline):
+                        status, reason, headers, body, keep_alive = await _read_response(reader)
+                except STALE_ERRORS:
+                    writer.close()
+                    if reused and (method in IDEMPOTENT_METHODS or not sent):
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                break
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                writer.close()
+        return status, reason, headers, body
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
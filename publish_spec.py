@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Publish the docs page assets with content-hashed file names
+- Minified spec.json, search-index.json and per-tag fragments, plus
+  chat-widget.js and style.css, written to published/ as name.<hash>.ext
+- Precompressed .gz (and .br when the brotli module is installed) next to
+  each file, for hosts that serve precompressed variants
+- References in index.html and the published chat-widget.js are rewritten
+  to the hashed names, replacing the hand-edited ?v= query strings
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import shutil
+import sys
+from pathlib import Path, PurePosixPath
+
+from spec_pipeline import write_spec_atomic
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+ROOT = Path(__file__).parent
+PUBLISH_PATH = ROOT / 'published'
+ASSETS_NAME = 'assets.json'
+HASH_LENGTH = 12
+
+JSON_ASSETS = ['spec.json', 'search-index.json']
+# Asset -> the published assets it references
+REFERENCES = {
+    'chat-widget.js': ['spec.json', 'search-index.json'],
+    'index.html': ['style.css', 'chat-widget.js', 'fragments/manifest.json', 'spec.json'],
+}
+
+# (label, downstream kbit/s, round trip ms) for the transfer estimates
+NETWORKS = [
+    ('Slow 4G', 1600, 150),
+    ('Broadband', 20000, 20),
+]
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(logical, data):
+    path = PurePosixPath(logical)
+    return str(path.with_name(f"{path.stem}.{content_hash(data)}{path.suffix}"))
+
+
+def minify_json(text):
+    return json.dumps(json.loads(text), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def compress(data):
+    """Precompressed variants keyed by file suffix"""
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, quality=11)
+    return variants
+
+
+def reference_pattern(logical, prefix):
+    """A quoted reference to logical, hashed or not, with or without ?v="""
+    path = PurePosixPath(logical)
+    parent = '' if str(path.parent) == '.' else re.escape(f"{path.parent}/")
+    return re.compile(
+        rf"""(?<=['"])(?:{re.escape(prefix)}/)?{parent}{re.escape(path.stem)}"""
+        rf"""(?:\.[0-9a-f]{{{HASH_LENGTH}}})?{re.escape(path.suffix)}(?:\?[^'"]*)?(?=['"])""")
+
+
+class Publisher:
+    """Collects hashed assets and writes them out in one go"""
+
+    def __init__(self, root=ROOT, out_dir=PUBLISH_PATH):
+        self.root = Path(root)
+        self.out_dir = Path(out_dir)
+        self.prefix = self.out_dir.resolve().relative_to(self.root.resolve()).as_posix()
+        self.assets = {}
+        self.files = {}
+
+    def url(self, logical):
+        return f"{self.prefix}/{self.assets[logical]['file']}"
+
+    def add(self, logical, data, source):
+        name = hashed_name(logical, data)
+        variants = compress(data)
+        self.files[name] = data
+        for suffix, compressed in variants.items():
+            self.files[name + suffix] = compressed
+        self.assets[logical] = {
+            'file': name,
+            'source_bytes': len(source),
+            'source_gz': len(gzip.compress(source, compresslevel=6, mtime=0)),
+            'bytes': len(data),
+            **{suffix.lstrip('.'): len(compressed) for suffix, compressed in variants.items()},
+        }
+        return self.url(logical)
+
+    def rewrite(self, text, logical):
+        """Point every reference logical makes at its published file"""
+        for target in REFERENCES.get(logical, []):
+            text = reference_pattern(target, self.prefix).sub(self.url(target), text)
+        return text
+
+    def collect(self):
+        fragments_dir = self.root / 'fragments'
+        manifest_path = fragments_dir / 'manifest.json'
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        for entry in manifest['tags']:
+            source = (fragments_dir / entry['file']).read_bytes()
+            published = self.add(f"fragments/{entry['file']}", minify_json(source), source)
+            # Fragment files resolve relative to the manifest
+            entry['file'] = PurePosixPath(published).name
+        self.add('fragments/manifest.json',
+                 json.dumps(manifest, separators=(',', ':'), ensure_ascii=False).encode('utf-8'),
+                 manifest_path.read_bytes())
+
+        for logical in JSON_ASSETS:
+            source = (self.root / logical).read_bytes()
+            self.add(logical, minify_json(source), source)
+
+        widget = (self.root / 'chat-widget.js').read_bytes()
+        rewritten = self.rewrite(widget.decode('utf-8'), 'chat-widget.js')
+        self.add('chat-widget.js', rewritten.encode('utf-8'), widget)
+        style = (self.root / 'style.css').read_bytes()
+        self.add('style.css', style, style)
+
+    def write(self):
+        """Replace the published directory and rewrite index.html in place
+
+        Returns True when index.html changed.
+        """
+        if self.out_dir.exists():
+            shutil.rmtree(self.out_dir)
+        self.out_dir.mkdir(parents=True)
+        for name, data in self.files.items():
+            target = self.out_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+        write_spec_atomic(json.dumps(self.assets, indent=2, ensure_ascii=False) + '\n',
+                          self.out_dir / ASSETS_NAME)
+
+        index_path = self.root / 'index.html'
+        page = index_path.read_text(encoding='utf-8')
+        rewritten = self.rewrite(page, 'index.html')
+        if rewritten != page:
+            write_spec_atomic(rewritten, index_path)
+        return rewritten != page
+
+
+def publish(root=ROOT, out_dir=PUBLISH_PATH):
+    publisher = Publisher(root, out_dir)
+    publisher.collect()
+    changed = publisher.write()
+    return publisher.assets, changed
+
+
+def transfer_ms(size, kbps, rtt_ms):
+    """One request on a warm connection: a round trip plus the payload"""
+    return rtt_ms + size * 8 / kbps
+
+
+def report(assets):
+    """Size and transfer estimates for each asset against its source file
+
+    Transfer estimates compare the source as served today (gzipped on the
+    fly at the default level) with the smallest published variant.
+    """
+    rows = []
+    for logical, asset in assets.items():
+        best = min(asset.get('br', asset['gz']), asset['gz'])
+        rows.append({
+            'asset': logical,
+            'source_bytes': asset['source_bytes'],
+            'source_gz': asset['source_gz'],
+            'bytes': asset['bytes'],
+            'gz': asset['gz'],
+            'br': asset.get('br'),
+            'networks': {
+                label: (transfer_ms(asset['source_gz'], kbps, rtt), transfer_ms(best, kbps, rtt))
+                for label, kbps, rtt in NETWORKS
+            },
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-o', '--output', default=str(PUBLISH_PATH), help='published directory')
+    parser.add_argument('--report', action='store_true',
+                        help='print sizes and transfer estimates against the source files')
+    args = parser.parse_args()
+
+    assets, changed = publish(ROOT, args.output)
+    print(f"✅ Published {len(assets)} assets to {args.output}/"
+          f"{' (index.html updated)' if changed else ''}")
+    if brotli is None:
+        print("   ⚠️  brotli not installed, skipped .br variants (pip install brotli)")
+
+    if args.report:
+        print("\n📊 Source vs. published (bytes)")
+        print(f"   {'asset':<34} {'source':>8} {'(gzip)':>7} {'minified':>9} {'gzip':>7} {'brotli':>7}")
+        rows = report(assets)
+        for row in rows:
+            br = row['br'] if row['br'] is not None else '-'
+            print(f"   {row['asset']:<34} {row['source_bytes']:>8} {row['source_gz']:>7} "
+                  f"{row['bytes']:>9} {row['gz']:>7} {br:>7}")
+        total = {key: sum(row[key] or 0 for row in rows) for key in ('source_bytes', 'source_gz', 'bytes', 'gz')}
+        print(f"   {'total':<34} {total['source_bytes']:>8} {total['source_gz']:>7} "
+              f"{total['bytes']:>9} {total['gz']:>7}")
+        spec = next(row for row in rows if row['asset'] == 'spec.json')
+        print("\n📊 spec.json transfer estimate, source gzipped on the fly vs. smallest variant")
+        for label, (before, after) in spec['networks'].items():
+            print(f"   - {label:<10} {before:>7.0f} ms -> {after:>5.0f} ms")
+        print("   - Repeat visit: hashed files never change, so they can be cached as immutable")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,203 @@
+(function() {
+  let index = null;
+  let indexPromise = null;
+  let spec = null;
+  let specPromise = null;
+  let chatBox = null;
+  let messages = null;
+  let input = null;
+  const queryCache = new Map();
+
+  function init() {
+    createUI();
+  }
+
+  // search-index.json is built by build_search_index.py and only fetched
+  // the first time the chat is opened
+  function loadIndex() {
+    if (!indexPromise) {
+      indexPromise = fetch('published/search-index.298593dc38cd.json')
+        .then(res => res.json())
+        .then(data => {
+          index = data;
+          index.byOperation = new Map(index.operations.map(op => [`${op.method} ${op.path.toLowerCase()}`, op]));
+          index.schemaNames = new Map(Object.keys(index.schemas).map(name => [name.toLowerCase(), name]));
+          console.log('Search index loaded:', index.version);
+          return index;
+        })
+        .catch(e => {
+          indexPromise = null;
+          throw e;
+        });
+    }
+    return indexPromise;
+  }
+
+  // Full operation details come from the docs page's per-tag fragment when
+  // it is available (already fetched if that group is on screen), otherwise,
+  // or when the fragment does not have the operation, from spec.json
+  function loadSpec() {
+    if (!specPromise) {
+      specPromise = fetch('published/spec.0202ef303d29.json')
+        .then(res => res.json())
+        .then(data => spec = data)
+        .catch(e => {
+          specPromise = null;
+          throw e;
+        });
+    }
+    return specPromise;
+  }
+
+  async function loadOperation(op) {
+    const method = op.method.toLowerCase();
+    if (window.protoDocs && op.tags.length) {
+      try {
+        const fragment = await window.protoDocs.loadFragment(op.tags[0]);
+        const operation = (fragment.paths[op.path] || {})[method];
+        if (operation) {
+          return { ...operation, tags: op.tags };
+        }
+      } catch (e) {
+        // Unknown group or a failed fetch; spec.json has every operation
+      }
+    }
+    await loadSpec();
+    return spec.paths[op.path][method];
+  }
+
+  function createUI() {
+    const btn = document.createElement('button');
+    btn.innerHTML = '💬';
+    btn.style.cssText = 'position:fixed;bottom:20px;right:20px;width:60px;height:60px;border-radius:50%;background:#FF6B35;color:#fff;border:none;font-size:24px;cursor:pointer;box-shadow:0 4px 12px rgba(0,0,0,0.3);z-index:10000;transition:transform 0.2s;';
+    btn.onmouseover = () => btn.style.transform = 'scale(1.1)';
+    btn.onmouseout = () => btn.style.transform = 'scale(1)';
+    document.body.appendChild(btn);
+
+    chatBox = document.createElement('div');
+    chatBox.style.cssText = 'position:fixed;bottom:90px;right:20px;width:400px;max-width:calc(100vw - 40px);height:500px;max-height:calc(100vh - 120px);background:#1a1a1a;border:2px solid #FF6B35;border-radius:12px;display:none;flex-direction:column;z-index:10000;box-shadow:0 8px 24px rgba(0,0,0,0.4);';
+    chatBox.innerHTML = `
+      <div style="padding:16px;background:#FF6B35;color:#000;font-weight:bold;border-radius:10px 10px 0 0;display:flex;justify-content:space-between;align-items:center;">
+        <span>Proto API Assistant</span>
+        <button id="chat-close" style="background:none;border:none;color:#000;font-size:20px;cursor:pointer;padding:0;width:24px;height:24px;">×</button>
+      </div>
+      <div id="chat-messages" style="flex:1;overflow-y:auto;padding:16px;color:#fff;font-family:monospace;font-size:13px;line-height:1.5;display:flex;flex-direction:column-reverse;"></div>
+      <div style="padding:12px;border-top:1px solid #333;display:flex;gap:8px;">
+        <input id="chat-input" type="text" placeholder="Ask about the API..." style="flex:1;padding:10px;background:#2a2a2a;border:1px solid #444;color:#fff;border-radius:6px;font-size:14px;" />
+        <button id="chat-send" style="padding:10px 20px;background:#FF6B35;color:#000;border:none;border-radius:6px;cursor:pointer;font-weight:bold;font-size:14px;">Send</button>
+      </div>
+    `;
+    document.body.appendChild(chatBox);
+
+    messages = document.getElementById('chat-messages');
+    input = document.getElementById('chat-input');
+    const send = document.getElementById('chat-send');
+    const close = document.getElementById('chat-close');
+
+    btn.onclick = () => {
+      chatBox.style.display = chatBox.style.display === 'none' ? 'flex' : 'none';
+      if (chatBox.style.display === 'flex') {
+        input.focus();
+        loadIndex().catch(e => console.error('Failed to load search index:', e));
+      }
+    };
+
+    close.onclick = () => chatBox.style.display = 'none';
+    send.onclick = sendQuery;
+    input.onkeypress = (e) => { if (e.key === 'Enter') sendQuery(); };
+
+    addMessage('Hi! Ask me about the Proto API.\n\nTry:\n• "find pools"\n• "get operation GET /api/v1/pools"\n• "schema Pool"\n• "curl PUT /api/v1/mining/target"', false);
+  }
+
+  function addMessage(text, isUser) {
+    const msg = document.createElement('div');
+    msg.style.cssText = `margin-top:12px;padding:10px 14px;background:${isUser ? '#FF6B35' : '#2a2a2a'};color:${isUser ? '#000' : '#fff'};border-radius:8px;white-space:pre-wrap;word-break:break-word;line-height:1.4;`;
+    msg.textContent = text;
+    messages.prepend(msg);
+    messages.scrollTop = 0;
+  }
+
+  async function sendQuery() {
+    const query = input.value.trim();
+    if (!query) return;
+    
+    console.log('Query:', query);
+    addMessage(query, true);
+    input.value = '';
+    
+    try {
+      await loadIndex();
+      const response = await handleQuery(query);
+      addMessage(response, false);
+    } catch (e) {
+      addMessage('Error: ' + e.message, false);
+      console.error('Query error:', e);
+    }
+  }
+
+  function findOperations(term) {
+    let hits = queryCache.get(term);
+    if (!hits) {
+      if (term === 'all') {
+        hits = index.operations.map((_, i) => i);
+      } else {
+        const seen = new Set();
+        for (const key in index.keys) {
+          if (key.includes(term)) index.keys[key].forEach(i => seen.add(i));
+        }
+        hits = Array.from(seen).sort((a, b) => a - b);
+      }
+      queryCache.set(term, hits);
+    }
+    return hits.map(i => index.operations[i]);
+  }
+
+  function matchOperation(q) {
+    const pathMatch = q.match(/\/api\/v\d+\/[^\s]+/i);
+    const methodMatch = q.match(/\b(get|post|put|delete|patch)\b/i);
+    if (!pathMatch || !methodMatch) return null;
+    return index.byOperation.get(`${methodMatch[0].toUpperCase()} ${pathMatch[0].toLowerCase()}`) || false;
+  }
+
+  async function handleQuery(query) {
+    const q = query.toLowerCase();
+
+    if (q.includes('find') || q.includes('search') || q.includes('list')) {
+      const term = q.replace(/find|search|list/gi, '').trim() || 'all';
+      const results = findOperations(term).map(op =>
+        `${op.method} ${op.path}${op.operationId ? ' (' + op.operationId + ')' : ''}`);
+      return `Found ${results.length} endpoints:\n\n${results.slice(0, 15).join('\n')}${results.length > 15 ? '\n\n... and ' + (results.length - 15) + ' more' : ''}`;
+    }
+
+    if (q.includes('operation') || q.includes('endpoint')) {
+      const op = matchOperation(query);
+      if (op) return JSON.stringify(await loadOperation(op), null, 2);
+      if (op === false) return 'Operation not found';
+      return 'Please specify method and path, e.g., "get operation GET /api/v1/pools"';
+    }
+
+    if (q.includes('schema')) {
+      const nameMatch = query.match(/schema\s+(\w+)/i) || query.match(/(\w+)\s+schema/i);
+      if (nameMatch) {
+        const name = index.schemaNames.get(nameMatch[1].toLowerCase());
+        return name ? index.schemas[name] : `Schema "${nameMatch[1]}" not found`;
+      }
+      return 'Please specify schema name, e.g., "schema Pool"';
+    }
+
+    if (q.includes('curl')) {
+      const op = matchOperation(query);
+      if (op) return op.curl;
+      if (op === false) return 'Operation not found';
+      return 'Please specify method and path, e.g., "curl PUT /api/v1/mining/target"';
+    }
+
+    return 'I can help with:\n• "find [term]" - search endpoints\n• "get operation [METHOD] [path]" - show operation details\n• "schema [Name]" - show schema definition\n• "curl [METHOD] [path]" - generate cURL command';
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+})();
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Per-miner request scheduler for asyncio API traffic
+- Every request to a miner is admitted through that miner's token bucket
+  and concurrency limit, so bursts from several pollers do not pile up on
+  one small device
+- Priority classes derived from the operation: control (mining start/stop,
+  target, tuning, reboot, locate, auth) before config (other writes)
+  before telemetry (reads) before logs; control skips the bucket and has
+  a slot of its own
+- Identical GETs in flight to the same miner share one response
+- The concurrency limit adapts to each miner's observed latency: it is
+  halved while responses are much slower than that miner's best recent
+  ones, and grows back by one while they are not
+- stats() (or GET /stats from serve_stats) reports queue depth, waits and
+  latency per class; --benchmark compares with unscheduled bursts
+- A request not admitted within admission_timeout raises TimeoutError
+  instead of waiting on a miner that never frees a slot
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import multiprocessing
+import re
+import sys
+import time
+from collections import deque
+
+from proto_http import AsyncTransport
+
+CLASSES = ('control', 'config', 'telemetry', 'logs')
+CONTROL = {
+    ('POST', '/api/v1/mining/start'), ('POST', '/api/v1/mining/stop'), ('PUT', '/api/v1/mining/target'),
+    ('PUT', '/api/v1/mining/tuning'), ('POST', '/api/v1/system/reboot'), ('POST', '/api/v1/system/locate'),
+}
+QUERIES = {('POST', '/api/v1/timeseries')}  # reads sent as POST
+LOG_PATHS = ('/api/v1/system/logs',)
+DEFAULT_RATE = 20.0          # requests/s per miner, control excluded
+DEFAULT_BURST = 10
+DEFAULT_CONCURRENCY = 4      # requests in flight per miner, plus one for control
+DEFAULT_ADMISSION_TIMEOUT = 60.0  # seconds a request may wait for admission
+SLOW_FACTOR = 3.0            # latency above this multiple of the miner's best recent one backs off
+BACKOFF = 0.5
+FLOOR_DRIFT = 1.02           # the best recent latency creeps up per sample, so a slower miner gets a new baseline
+LATENCY_SMOOTHING = 0.2      # weight of the newest latency sample
+SAMPLES = 1024               # latencies and waits kept per class for percentiles
+
+
+def classify(method, path):
+    """The priority class of one operation"""
+    path = path.split('?', 1)[0]
+    if (method, path) in CONTROL or path.startswith('/api/v1/auth/'):
+        return 'control'
+    if path in LOG_PATHS:
+        return 'logs'
+    if method in ('GET', 'HEAD') or (method, path) in QUERIES:
+        return 'telemetry'
+    return 'config'
+
+
+def _percentile(values, share):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+class _Device:
+    """Admission state for one miner"""
+
+    __slots__ = ('key', 'tokens', 'updated', 'limit', 'active', 'queues', 'latency', 'floor', 'since', 'timer')
+
+    def __init__(self, key, burst, limit):
+        self.key = key
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.limit = float(limit)
+        self.active = 0
+        self.queues = [deque() for _ in CLASSES]
+        self.latency = {}
+        self.floor = {}
+        self.since = 0
+        self.timer = None
+
+
+class _Shared:
+    """One coalesced call, run as its own task, and how many callers still wait on it"""
+
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class _ClassStats:
+    __slots__ = ('queued', 'max_queued', 'completed', 'coalesced', 'latencies', 'waits')
+
+    def __init__(self):
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.coalesced = 0
+        self.latencies = deque(maxlen=SAMPLES)
+        self.waits = deque(maxlen=SAMPLES)
+
+
+class RequestScheduler:
+    """Admits AsyncTransport requests per miner by priority class
+
+    Pass it as scheduler= to AsyncClient or AsyncTransport, or install() it
+    for every transport in the process. Use it from one event loop.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, concurrency=DEFAULT_CONCURRENCY,
+                 slow_factor=SLOW_FACTOR, admission_timeout=DEFAULT_ADMISSION_TIMEOUT):
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self.slow_factor = slow_factor
+        self.admission_timeout = admission_timeout
+        self.devices = {}
+        self.classes = {name: _ClassStats() for name in CLASSES}
+        self.backoffs = 0
+        self._inflight = {}
+
+    def install(self):
+        """Make this the scheduler of every AsyncTransport created without one"""
+        AsyncTransport.scheduler = self
+        return self
+
+    def _device(self, transport):
+        target = transport.target
+        key = f"{target.host}:{target.port}{target.base_path}"
+        device = self.devices.get(key)
+        if device is None:
+            device = self.devices[key] = _Device(key, self.burst, self.concurrency)
+        return device
+
+    async def submit(self, transport, method, path, key, call):
+        """Run call() once the miner admits it; callers with the same key share one in-flight call
+
+        The shared call runs in a task of its own. A caller that is
+        cancelled leaves only itself; the call is cancelled when its last
+        caller has left. Each caller gets its own copy of the result.
+        """
+        kind = classify(method, path)
+        device = self._device(transport)
+        if key is None:
+            return await self._run(device, kind, call)
+        slot = (device.key, key)
+        shared = self._inflight.get(slot)
+        if shared is None or shared.task.done():
+            shared = self._inflight[slot] = _Shared(asyncio.create_task(self._run(device, kind, call)))
+            shared.task.add_done_callback(lambda _: self._forget(slot, shared))
+        else:
+            self.classes[kind].coalesced += 1
+        shared.waiters += 1
+        try:
+            result = await asyncio.shield(shared.task)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.task.done():
+                # Nobody wants the response any more; later callers start afresh
+                self._forget(slot, shared)
+                shared.task.cancel()
+        # The last caller out takes the result itself, earlier ones a copy
+        return result if not shared.waiters else copy.deepcopy(result)
+
+    def _forget(self, slot, shared):
+        if self._inflight.get(slot) is shared:
+            del self._inflight[slot]
+
+    def slot(self, transport, method, path):
+        """Async context manager admitting one streamed request or upload"""
+        return _Slot(self, self._device(transport), classify(method, path))
+
+    async def _run(self, device, kind, call):
+        started = await self._acquire(device, kind)
+        try:
+            return await call()
+        finally:
+            self._release(device, kind, time.monotonic() - started)
+
+    async def _acquire(self, device, kind):
+        """Wait for admission, at most admission_timeout; the admission time"""
+        rank = CLASSES.index(kind)
+        stats = self.classes[kind]
+        queued = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        device.queues[rank].append(waiter)
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        self._dispatch(device)
+        try:
+            async with asyncio.timeout(self.admission_timeout):
+                await waiter
+        except (asyncio.CancelledError, TimeoutError):
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just as the caller gave up: hand the slot on
+                self._release(device, None, 0.0)
+            else:
+                stats.queued -= 1
+            raise
+        started = time.monotonic()
+        stats.waits.append(started - queued)
+        return started
+
+    def _dispatch(self, device):
+        now = time.monotonic()
+        device.tokens = min(self.burst, device.tokens + (now - device.updated) * self.rate)
+        device.updated = now
+        for rank, queue in enumerate(device.queues):
+            control = rank == 0
+            while queue:
+                if queue[0].done():
+                    queue.popleft()
+                    continue
+                if device.active >= int(device.limit) + control:
+                    return
+                if not control and device.tokens < 1:
+                    if device.timer is None:
+                        device.timer = asyncio.get_running_loop().call_later(
+                            (1 - device.tokens) / self.rate, self._wake, device)
+                    return
+                if not control:
+                    device.tokens -= 1
+                device.active += 1
+                self.classes[CLASSES[rank]].queued -= 1
+                queue.popleft().set_result(None)
+
+    def _wake(self, device):
+        device.timer = None
+        self._dispatch(device)
+
+    def _release(self, device, kind, elapsed):
+        device.active -= 1
+        if kind is not None:
+            self._observe(device, kind, elapsed)
+        self._dispatch(device)
+
+    def _observe(self, device, kind, elapsed):
+        stats = self.classes[kind]
+        stats.completed += 1
+        stats.latencies.append(elapsed)
+        latency = device.latency.get(kind)
+        latency = elapsed if latency is None else latency + LATENCY_SMOOTHING * (elapsed - latency)
+        device.latency[kind] = latency
+        floor = device.floor[kind] = min(device.floor.get(kind, elapsed) * FLOOR_DRIFT, elapsed)
+        device.since += 1
+        # At most one change per round of requests at the current limit
+        if device.since < device.limit:
+            return
+        if latency > floor * self.slow_factor:
+            if device.limit > 1:
+                device.limit = max(1.0, device.limit * BACKOFF)
+                device.since = 0
+                self.backoffs += 1
+        elif device.limit < self.concurrency:
+            device.limit += 1
+            device.since = 0
+
+    def stats(self):
+        """Queue depth, completions, waits and latency per class, and the miners' admission state"""
+        classes = {}
+        for name, stats in self.classes.items():
+            classes[name] = {
+                'queued': stats.queued,
+                'max_queued': stats.max_queued,
+                'completed': stats.completed,
+                'coalesced': stats.coalesced,
+            }
+            for label, values in (('wait', stats.waits), ('latency', stats.latencies)):
+                for share in (0.5, 0.95):
+                    value = _percentile(values, share)
+                    classes[name][f"{label}_p{int(share * 100)}_ms"] = None if value is None else round(value * 1000, 2)
+        limits = [device.limit for device in self.devices.values()]
+        return {
+            'classes': classes,
+            'miners': len(self.devices),
+            'in_flight': sum(device.active for device in self.devices.values()),
+            'backed_off': sum(limit < self.concurrency for limit in limits),
+            'backoffs': self.backoffs,
+            'mean_limit': round(sum(limits) / len(limits), 2) if limits else None,
+        }
+
+    async def serve_stats(self, host='127.0.0.1', port=9464):
+        """Answer GET /stats with stats() as JSON; the asyncio server"""
+        async def handle(reader, writer):
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+                found = head.startswith(b'GET /stats ')
+                body = json.dumps(self.stats() if found else {'error': 'not found'}).encode()
+                writer.write(f"HTTP/1.1 {'200 OK' if found else '404 Not Found'}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+                await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        return await asyncio.start_server(handle, host, port)
+
+
+class _Slot:
+    __slots__ = ('scheduler', 'device', 'kind', 'started')
+
+    def __init__(self, scheduler, device, kind):
+        self.scheduler = scheduler
+        self.device = device
+        self.kind = kind
+        self.started = None
+
+    async def __aenter__(self):
+        self.started = await self.scheduler._acquire(self.device, self.kind)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.scheduler._release(self.device, self.kind, time.monotonic() - self.started)
+
+
+# -- benchmark -------------------------------------------------------------
+
+SERVICE_TIMES = {'control': 0.005, 'config': 0.01, 'telemetry': 0.02, 'logs': 0.08}
+OVERLOAD = 0.15              # extra service time per request already waiting on the device
+
+
+def _serve_devices(port, miners, ready):
+    """One listener standing in for many small miners at /m/<n>/
+
+    Each miner serves one request at a time in arrival order, taking
+    SERVICE_TIMES by class, and slows down by OVERLOAD for every request
+    waiting behind it. GET /__stats__ reports requests served and the
+    deepest queue seen.
+    """
+    locks = [asyncio.Lock() for _ in range(miners)]
+    waiting = [0] * miners
+    stats = {'served': 0, 'max_waiting': 0}
+    request_line = re.compile(rb'^(\w+) (?:/m/(\d+))?(/\S*) ')
+
+    async def respond(method, miner, path):
+        if path == '/__stats__':
+            return stats
+        waiting[miner] += 1
+        stats['max_waiting'] = max(stats['max_waiting'], waiting[miner])
+        async with locks[miner]:
+            waiting[miner] -= 1
+            await asyncio.sleep(SERVICE_TIMES[classify(method, path)] * (1 + OVERLOAD * waiting[miner]))
+        stats['served'] += 1
+        return {'message': 'ok'}
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                match = request_line.match(head)
+                length = re.search(rb'(?i)\r\ncontent-length: *(\d+)', head)
+                if length:
+                    await reader.readexactly(int(length.group(1)))
+                result = await respond(match.group(1).decode(), int(match.group(2) or 0), match.group(3).decode())
+                body = json.dumps(result, separators=(',', ':')).encode()
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: '
+                             + str(len(body)).encode() + b'\r\n\r\n' + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, AttributeError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, '127.0.0.1', port, backlog=1024)
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+# What several tools ask of one miner at once: two pollers with overlapping reads, a log follower
+BURST = ([('GET', '/api/v1/telemetry')] * 3 + [('GET', '/api/v1/mining')] * 2
+         + [('GET', f"/api/v1/hashboards/HB{n}") for n in range(4)] + [('GET', '/api/v1/hashrate')] * 2
+         + [('GET', LOG_PATHS[0])] * 4 + [('GET', '/api/v1/errors'), ('PUT', '/api/v1/cooling')])
+
+
+async def _rounds(port, miners, rounds, scheduler):
+    transports = [AsyncTransport(f"http://127.0.0.1:{port}/m/{n}", timeout=None, max_connections=8,
+                                 scheduler=scheduler) for n in range(miners)]
+    control, bursts = [], []
+
+    async def timed(transport, method, path, into=None):
+        started = time.monotonic()
+        await transport.request(method, path, body={} if method != 'GET' else None)
+        if into is not None:
+            into.append(time.monotonic() - started)
+
+    try:
+        for _ in range(rounds):
+            started = time.monotonic()
+            work = [timed(transport, method, path) for transport in transports for method, path in BURST]
+            reads = asyncio.gather(*work)
+            # The operator stops mining just after the burst went out
+            await asyncio.sleep(0.01)
+            await asyncio.gather(*(timed(transport, 'POST', '/api/v1/mining/stop', control)
+                                   for transport in transports))
+            await reads
+            bursts.append(time.monotonic() - started)
+    finally:
+        for transport in transports:
+            await transport.close()
+    return control, bursts
+
+
+def benchmark(miners=20, rounds=5, port=18820):
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for offset, scheduled in enumerate((False, True)):
+        ready = context.Event()
+        server = context.Process(target=_serve_devices, args=(port + offset, miners, ready), daemon=True)
+        server.start()
+        try:
+            if not ready.wait(30):
+                raise RuntimeError('simulated miners did not start')
+            scheduler = RequestScheduler() if scheduled else None
+            control, bursts = asyncio.run(_rounds(port + offset, miners, rounds, scheduler))
+
+            async def stats():
+                transport = AsyncTransport(f"http://127.0.0.1:{port + offset}", timeout=None)
+                try:
+                    return await transport.request('GET', '/__stats__')
+                finally:
+                    await transport.close()
+
+            results['scheduled' if scheduled else 'direct'] = {
+                'control_p50': _percentile(control, 0.5), 'control_p95': _percentile(control, 0.95),
+                'burst_p50': _percentile(bursts, 0.5), 'device': asyncio.run(stats()),
+                'scheduler': scheduler.stats() if scheduler else None}
+        finally:
+            server.terminate()
+            server.join()
+    return {'miners': miners, 'rounds': rounds, 'requests': len(BURST) + 1, **results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('operations', nargs='*', metavar='"METHOD /path"', help='print the class of these operations')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare control latency and device load with unscheduled bursts')
+    parser.add_argument('--miners', type=int, default=20, help='simulated miners for --benchmark')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.miners)
+        print(f"📊 {result['miners']} simulated miners, {result['rounds']} rounds of {result['requests']} requests "
+              f"each from overlapping tools, with POST /api/v1/mining/stop sent 10 ms into every burst")
+        for label, key in (('Direct', 'direct'), ('Scheduled', 'scheduled')):
+            run = result[key]
+            print(f"   - {label + ':':<11} stop p50 {run['control_p50'] * 1000:7.1f} ms, p95 "
+                  f"{run['control_p95'] * 1000:7.1f} ms | burst p50 {run['burst_p50'] * 1000:6.0f} ms | "
+                  f"{run['device']['served']:5d} requests served, deepest device queue {run['device']['max_waiting']}")
+        classes = result['scheduled']['scheduler']['classes']
+        for name, stats in classes.items():
+            print(f"   - {name:<9} completed {stats['completed']:5d}, coalesced {stats['coalesced']:4d}, "
+                  f"max queued {stats['max_queued']:4d}, wait p95 {stats['wait_p95_ms']} ms, "
+                  f"latency p95 {stats['latency_p95_ms']} ms")
+        scheduler = result['scheduled']['scheduler']
+        print(f"   - concurrency limit backed off {scheduler['backoffs']} times; {scheduler['backed_off']} of "
+              f"{scheduler['miners']} miners below the default at the end (mean limit {scheduler['mean_limit']})")
+        print(f"✅ {result['direct']['control_p95'] / result['scheduled']['control_p95']:.0f}x faster stop at p95, "
+              f"{result['direct']['device']['served'] / result['scheduled']['device']['served']:.1f}x fewer "
+              f"requests served by the miners")
+        return True
+
+    if not args.operations:
+        parser.error('operations to classify or --benchmark are required')
+    for operation in args.operations:
+        method, _, path = operation.partition(' ')
+        print(f"{operation}: {classify(method.upper(), path)}")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,607 @@
+#!/usr/bin/env python3
+"""
+Shared JWT sessions for every tool that talks to miners
+- One login per miner for all threads, asyncio tasks and worker
+  processes: AuthTokens live in a JSON file that every SessionCache on the
+  same path reads, rewritten atomically under a file lock
+- Access tokens are refreshed ahead of expiry (their exp claim) with
+  POST /api/v1/auth/refresh, falling back to POST /api/v1/auth/login;
+  single-flight per miner across threads, tasks and processes
+- A request answered 401 gets a renewed token and is sent once more
+- Plugs into any client or poller as auth=SessionCache(password)
+- stats() counts logins, refreshes and logins avoided; --benchmark
+  compares with per-worker logins against a simulated fleet
+"""
+
+import argparse
+import asyncio
+import base64
+import contextlib
+import fcntl
+import json
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from proto_client import AuthTokens, PasswordRequest, RefreshRequest, RefreshResponse
+from proto_http import DEFAULT_TIMEOUT, ApiError, AsyncTransport, Transport
+
+LOGIN_PATH = '/api/v1/auth/login'
+REFRESH_PATH = '/api/v1/auth/refresh'
+DEFAULT_PATH = Path('.sessions.json')
+REFRESH_AHEAD = 60.0     # seconds before expiry a token is replaced
+DEFAULT_LIFETIME = 900.0  # assumed when an access token carries no exp claim
+LOCK_SLOTS = 1 << 16     # byte-range locks in the lock file; miners hash onto them
+LOCK_POLL = 0.02         # seconds between attempts when an asyncio task waits for a lock
+COUNTERS = ('logins', 'refreshes', 'shared', 'joined', 'renewed')
+
+
+def token_expiry(token, fallback):
+    """The exp claim of a JWT as a Unix time, or fallback when there is none"""
+    try:
+        payload = token.split('.')[1]
+        return float(json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))['exp'])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return fallback
+
+
+class Session:
+    __slots__ = ('access_token', 'refresh_token', 'expires_at')
+
+    def __init__(self, access_token, refresh_token=None, expires_at=0.0):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.expires_at = expires_at
+
+    def to_state(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class SessionAuth:
+    """One miner's view of a SessionCache; what transports get from SessionCache.bind"""
+
+    __slots__ = ('cache', 'miner')
+
+    def __init__(self, cache, miner):
+        self.cache = cache
+        self.miner = miner
+
+    @property
+    def token(self):
+        session = self.cache.sessions.get(self.miner)
+        return None if session is None else session.access_token
+
+    def apply(self, headers):
+        token = self.token
+        if token is not None:
+            headers['Authorization'] = f"Bearer {token}"
+
+    def prepare(self):
+        self.cache.session(self.miner)
+
+    async def aprepare(self):
+        await self.cache.asession(self.miner)
+
+    def renew(self, token):
+        return self.cache.session(self.miner, rejected=token).access_token != token
+
+    async def arenew(self, token):
+        return (await self.cache.asession(self.miner, rejected=token)).access_token != token
+
+
+class SessionCache:
+    """JWT sessions per miner, shared through a file by every worker using the same path
+
+    password is one password for every miner, a callable taking the miner
+    URL, or None to use only sessions other workers obtained. Use one
+    SessionCache per path in a process: closing a second handle on the lock
+    file would drop this one's locks.
+    """
+
+    def __init__(self, password=None, path=DEFAULT_PATH, refresh_ahead=REFRESH_AHEAD, lifetime=DEFAULT_LIFETIME,
+                 timeout=DEFAULT_TIMEOUT):
+        self.password = password
+        self.path = Path(path)
+        self.refresh_ahead = refresh_ahead
+        self.lifetime = lifetime
+        self.timeout = timeout
+        self.sessions = {}
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self._mtime = None
+        self._guard = threading.Lock()
+        self._flights = {}
+        self._async_flights = {}
+        self._bound = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_fd = os.open(self.path.with_name(self.path.name + '.lock'), os.O_RDWR | os.O_CREAT, 0o600)
+
+    def bind(self, base_url):
+        # One auth per miner, so transports sharing this cache also share coalesced requests
+        miner = base_url.rstrip('/')
+        with self._guard:
+            auth = self._bound.get(miner)
+            if auth is None:
+                auth = self._bound[miner] = SessionAuth(self, miner)
+        return auth
+
+    def close(self):
+        os.close(self._lock_fd)
+
+    def stats(self):
+        """Counters for this process; shared and joined are tokens another worker or task obtained"""
+        stats = dict(self.counters)
+        stats['logins_avoided'] = stats['refreshes'] + stats['shared'] + stats['joined']
+        return stats
+
+    def _count(self, name):
+        with self._guard:
+            self.counters[name] += 1
+
+    def _usable(self, session, rejected):
+        return (session is not None and session.access_token != rejected
+                and session.expires_at - self.refresh_ahead > time.time())
+
+    def _load(self):
+        """Pick up sessions other workers wrote since the last read"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._mtime:
+                return
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return
+        with self._guard:
+            for miner, state in data.items():
+                session = Session(**state)
+                current = self.sessions.get(miner)
+                if current is None or session.expires_at > current.expires_at:
+                    self.sessions[miner] = session
+            self._mtime = mtime
+
+    def _pick(self, miner, rejected):
+        """A usable session someone else obtained while this caller waited, or None"""
+        if self._usable(self.sessions.get(miner), rejected):
+            self._count('joined')
+            return self.sessions[miner]
+        self._load()
+        if self._usable(self.sessions.get(miner), rejected):
+            self._count('shared')
+            return self.sessions[miner]
+        return None
+
+    def _store(self, miner, session):
+        with self._guard, self._locked(0):
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+            except (FileNotFoundError, ValueError):
+                data = {}
+            data[miner] = session.to_state()
+            temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temporary, self.path)
+            self.sessions[miner] = session
+
+    @contextlib.contextmanager
+    def _locked(self, offset):
+        fcntl.lockf(self._lock_fd, fcntl.LOCK_EX, 1, offset)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._lock_fd, fcntl.LOCK_UN, 1, offset)
+
+    def _slot(self, miner):
+        # Byte 0 guards the sessions file itself
+        return 1 + zlib.crc32(miner.encode()) % LOCK_SLOTS
+
+    def _secret(self, miner):
+        password = self.password(miner) if callable(self.password) else self.password
+        if password is None:
+            raise RuntimeError(f"No session for {miner} and no password to log in")
+        return password
+
+    def _session_from(self, data, refresh_token=None):
+        if refresh_token is None:
+            tokens = AuthTokens.from_dict(data)
+            access_token, refresh_token = tokens.access_token, tokens.refresh_token
+        else:
+            access_token = RefreshResponse.from_dict(data).access_token
+        return Session(access_token, refresh_token, token_expiry(access_token, time.time() + self.lifetime))
+
+    def _fetch(self, miner):
+        """Refresh the last known session, or log in; called holding the miner's locks"""
+        stale = self.sessions.get(miner)
+        transport = Transport(miner, timeout=self.timeout)
+        try:
+            if stale is not None and stale.refresh_token:
+                try:
+                    data = transport.request('POST', REFRESH_PATH,
+                                             body=RefreshRequest.from_dict({'refresh_token': stale.refresh_token}))
+                    self._count('refreshes')
+                    return self._session_from(data, stale.refresh_token)
+                except ApiError as e:
+                    if e.status not in (400, 401, 403):
+                        raise
+            data = transport.request('POST', LOGIN_PATH, body=PasswordRequest.from_dict({'password': self._secret(miner)}))
+            self._count('logins')
+            return self._session_from(data)
+        finally:
+            transport.close()
+
+    async def _afetch(self, miner):
+        stale = self.sessions.get(miner)
+        transport = AsyncTransport(miner, timeout=self.timeout, max_connections=1)
+        # Callers wait for this inside a slot the installed scheduler already granted
+        # them; queueing the login behind those slots would never be admitted
+        transport.scheduler = None
+        try:
+            if stale is not None and stale.refresh_token:
+                try:
+                    data = await transport.request('POST', REFRESH_PATH, body=RefreshRequest.from_dict(
+                        {'refresh_token': stale.refresh_token}))
+                    self._count('refreshes')
+                    return self._session_from(data, stale.refresh_token)
+                except ApiError as e:
+                    if e.status not in (400, 401, 403):
+                        raise
+            data = await transport.request('POST', LOGIN_PATH,
+                                           body=PasswordRequest.from_dict({'password': self._secret(miner)}))
+            self._count('logins')
+            return self._session_from(data)
+        finally:
+            await transport.close()
+
+    def _flight(self, miner):
+        with self._guard:
+            return self._flights.setdefault(miner, threading.Lock())
+
+    def session(self, miner, rejected=None):
+        """A usable Session for miner, refreshed or logged in at most once across workers
+
+        rejected is an access token a miner answered 401 to; it counts as unusable.
+        """
+        session = self.sessions.get(miner)
+        if self._usable(session, rejected):
+            return session
+        if rejected is not None:
+            self._count('renewed')
+        with self._flight(miner):
+            session = self._pick(miner, rejected)
+            if session is None:
+                with self._locked(self._slot(miner)):
+                    session = self._pick(miner, rejected)
+                    if session is None:
+                        session = self._fetch(miner)
+                        self._store(miner, session)
+        return session
+
+    async def asession(self, miner, rejected=None):
+        """session() for asyncio: waiting tasks and workers do not block the event loop
+
+        Locks are polled without blocking, and reads and writes of the
+        sessions file (with its byte-0 lock) run in a worker thread.
+        """
+        session = self.sessions.get(miner)
+        if self._usable(session, rejected):
+            return session
+        if rejected is not None:
+            self._count('renewed')
+        loop = asyncio.get_running_loop()
+        with self._guard:
+            flight = self._async_flights.setdefault((miner, loop), asyncio.Lock())
+        async with flight:
+            session = await asyncio.to_thread(self._pick, miner, rejected)
+            if session is not None:
+                return session
+            # Threads of this process, then other processes
+            thread_flight = self._flight(miner)
+            while not thread_flight.acquire(blocking=False):
+                await asyncio.sleep(LOCK_POLL)
+            try:
+                slot = self._slot(miner)
+                while True:
+                    try:
+                        fcntl.lockf(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, slot)
+                        break
+                    except OSError:
+                        await asyncio.sleep(LOCK_POLL)
+                try:
+                    session = await asyncio.to_thread(self._pick, miner, rejected)
+                    if session is None:
+                        session = await self._afetch(miner)
+                        await asyncio.to_thread(self._store, miner, session)
+                finally:
+                    fcntl.lockf(self._lock_fd, fcntl.LOCK_UN, 1, slot)
+            finally:
+                thread_flight.release()
+        return session
+
+
+# -- benchmark -------------------------------------------------------------
+
+def _simulated_token(miner, serial, lifetime):
+    def part(value):
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).rstrip(b'=').decode()
+    return '.'.join((part({'alg': 'HS256', 'typ': 'JWT'}),
+                     part({'sub': miner, 'jti': serial, 'exp': time.time() + lifetime}), 'sig'))
+
+
+def _serve_auth(port, miners, login_latency, lifetime, revoke_at, ready):
+    """One listener standing in for many miners' auth endpoints at /m/<n>/
+
+    Logins take login_latency and a miner handles one at a time; refreshes
+    are quick. Other requests need a live access token, and every token is
+    revoked once, revoke_at seconds after the first request, as when the
+    fleet restarts its web servers. GET /__stats__ counts logins, refreshes and 401s.
+    """
+    started = None
+    tokens, refresh_tokens = {}, {}
+    busy = {}
+    stats = {'logins': 0, 'refreshes': 0, 'unauthorized': 0, 'requests': 0}
+    revoked = False
+    request_line = re.compile(rb'^(\w+) (?:/m/(\d+))?(/\S*) ')
+    bearer = re.compile(rb'(?i)\r\nauthorization: *Bearer (\S+)')
+
+    async def respond(method, miner, path, body, token):
+        nonlocal started, revoked
+        if path == '/__stats__':
+            return 200, stats
+        started = started or time.monotonic()
+        if not revoked and time.monotonic() - started >= revoke_at:
+            revoked = True
+            tokens.clear()
+        if path == LOGIN_PATH:
+            async with busy.setdefault(miner, asyncio.Lock()):
+                await asyncio.sleep(login_latency)
+            stats['logins'] += 1
+            access = _simulated_token(miner, stats['logins'], lifetime)
+            refresh = f"refresh-{miner}-{stats['logins']}"
+            tokens[access], refresh_tokens[refresh] = miner, miner
+            return 200, {'access_token': access, 'refresh_token': refresh}
+        if path == REFRESH_PATH:
+            if refresh_tokens.get(body.get('refresh_token')) != miner:
+                stats['unauthorized'] += 1
+                return 401, {'error': {'code': 'UNAUTHORIZED', 'message': 'Invalid refresh token'}}
+            stats['refreshes'] += 1
+            access = _simulated_token(miner, -stats['refreshes'], lifetime)
+            tokens[access] = miner
+            return 200, {'access_token': access}
+        stats['requests'] += 1
+        if tokens.get(token) != miner or token_expiry(token, 0) <= time.time():
+            stats['unauthorized'] += 1
+            return 401, {'error': {'code': 'UNAUTHORIZED', 'message': 'Invalid or expired token'}}
+        return 200, {'mining-status': {'status': 'Mining'}}
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                match = request_line.match(head)
+                length = re.search(rb'(?i)\r\ncontent-length: *(\d+)', head)
+                token = bearer.search(head)
+                data = await reader.readexactly(int(length.group(1))) if length else b''
+                status, result = await respond(match.group(1).decode(), int(match.group(2) or 0),
+                                               match.group(3).decode(), json.loads(data) if data else None,
+                                               token.group(1).decode() if token else None)
+                body = json.dumps(result, separators=(',', ':')).encode()
+                writer.write(f"HTTP/1.1 {status} {'OK' if status == 200 else 'Unauthorized'}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, AttributeError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, '127.0.0.1', port, backlog=1024)
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class _LoginAuth:
+    """Today's approach: each worker logs in to each miner itself, and again after a 401"""
+
+    __slots__ = ('miner', 'token')
+
+    def __init__(self, miner):
+        self.miner = miner
+        self.token = None
+
+    def _login(self, transport):
+        self.token = transport.request('POST', LOGIN_PATH, body={'password': 'benchmark'})['access_token']
+
+    def apply(self, headers):
+        if self.token is not None:
+            headers['Authorization'] = f"Bearer {self.token}"
+
+    def prepare(self):
+        if self.token is None:
+            self.renew(None)
+
+    async def aprepare(self):
+        if self.token is None:
+            await self.arenew(None)
+
+    def renew(self, token):
+        transport = Transport(self.miner)
+        try:
+            self._login(transport)
+        finally:
+            transport.close()
+        return True
+
+    async def arenew(self, token):
+        transport = AsyncTransport(self.miner, max_connections=1)
+        try:
+            self.token = (await transport.request('POST', LOGIN_PATH, body={'password': 'benchmark'}))['access_token']
+        finally:
+            await transport.close()
+        return True
+
+
+class _Logins:
+    def bind(self, base_url):
+        return _LoginAuth(base_url)
+
+
+def _worker(port, miners, rounds, interval, shared, path, results):
+    """One worker process: asyncio tasks for every miner plus a thread of blocking requests"""
+    auth = SessionCache('benchmark', path, refresh_ahead=1.0) if shared else _Logins()
+    inventory = [f"http://127.0.0.1:{port}/m/{n}" for n in range(miners)]
+    failures = []
+
+    def blocking():
+        clients = [Transport(url, auth) for url in inventory[:max(1, miners // 5)]]
+        for _ in range(rounds):
+            for transport in clients:
+                try:
+                    transport.request('GET', '/api/v1/mining')
+                except (OSError, ApiError) as e:
+                    failures.append(str(e))
+            time.sleep(interval)
+        for transport in clients:
+            transport.close()
+
+    async def run():
+        clients = [AsyncTransport(url, auth, max_connections=1) for url in inventory]
+
+        async def miner(transport):
+            for _ in range(rounds):
+                try:
+                    await transport.request('GET', '/api/v1/mining')
+                except (OSError, ApiError) as e:
+                    failures.append(str(e))
+                await asyncio.sleep(interval)
+
+        await asyncio.gather(*(miner(transport) for transport in clients))
+        for transport in clients:
+            await transport.close()
+
+    thread = threading.Thread(target=blocking)
+    thread.start()
+    asyncio.run(run())
+    thread.join()
+    results.put((auth.stats() if shared else {}, failures))
+
+
+def benchmark(miners=50, workers=4, rounds=8, interval=0.5, login_latency=0.1, lifetime=2.5, port=18800,
+              path='/tmp/session-cache-benchmark/sessions.json'):
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for offset, shared in enumerate((False, True)):
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        ready = context.Event()
+        server = context.Process(target=_serve_auth, daemon=True,
+                                 args=(port + offset, miners, login_latency, lifetime, rounds * interval / 2, ready))
+        server.start()
+        try:
+            if not ready.wait(30):
+                raise RuntimeError('simulated auth server did not start')
+            queue = context.Queue()
+            started = time.monotonic()
+            processes = [context.Process(target=_worker, args=(port + offset, miners, rounds, interval, shared,
+                                                               path, queue)) for _ in range(workers)]
+            for process in processes:
+                process.start()
+            reports = [queue.get() for _ in processes]
+            for process in processes:
+                process.join()
+            elapsed = time.monotonic() - started
+            transport = Transport(f"http://127.0.0.1:{port + offset}")
+            try:
+                server_stats = transport.request('GET', '/__stats__')
+            finally:
+                transport.close()
+        finally:
+            server.terminate()
+            server.join()
+        counters = {}
+        for stats, _ in reports:
+            for name, value in stats.items():
+                counters[name] = counters.get(name, 0) + value
+        results['shared' if shared else 'naive'] = {
+            'seconds': elapsed, 'server': server_stats, 'counters': counters,
+            'failures': sum(len(failures) for _, failures in reports)}
+    return {'miners': miners, 'workers': workers, 'rounds': rounds, 'lifetime': lifetime, **results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('inventory', nargs='?', help='log in to every miner in this file ahead of time')
+    parser.add_argument('--path', default=str(DEFAULT_PATH), help='shared sessions file')
+    parser.add_argument('--password', default=os.environ.get('PROTO_PASSWORD'),
+                        help='miner password (default: $PROTO_PASSWORD)')
+    parser.add_argument('--list', action='store_true', help='show the cached sessions and when they expire')
+    parser.add_argument('--clear', action='store_true', help='forget every cached session')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare with per-worker logins against a simulated fleet')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark()
+        print(f"📊 {result['workers']} worker processes (asyncio tasks plus a thread each) x {result['miners']} "
+              f"miners, {result['rounds']} rounds, {result['lifetime']:g} s tokens, all revoked once midway")
+        for label, key in (('Per-worker logins', 'naive'), ('Shared sessions', 'shared')):
+            run = result[key]
+            print(f"   - {label + ':':<19} {run['server']['logins']:4d} logins, {run['server']['refreshes']:4d} "
+                  f"refreshes, {run['server']['unauthorized']:4d} 401s, {run['failures']} failed requests, "
+                  f"{run['seconds']:.2f} s")
+        counters = result['shared']['counters']
+        print(f"   - logins avoided: {counters['logins_avoided']} ({counters['shared']} shared between workers, "
+              f"{counters['joined']} joined in flight, {counters['refreshes']} refreshes), "
+              f"{counters['renewed']} tokens renewed after a 401")
+        print(f"✅ {result['naive']['server']['logins'] / max(result['shared']['server']['logins'], 1):.1f}x "
+              f"fewer logins")
+        return True
+
+    path = Path(args.path)
+    if args.clear:
+        for stale in (path, path.with_name(path.name + '.lock')):
+            with contextlib.suppress(FileNotFoundError):
+                stale.unlink()
+        print(f"✅ Cleared {path}")
+        return True
+    cache = SessionCache(args.password, path)
+    try:
+        if args.inventory:
+            from telemetry_poller import load_inventory
+
+            async def warm():
+                miners = [url.rstrip('/') for url, _ in load_inventory(args.inventory)]
+                results = await asyncio.gather(*(cache.asession(miner) for miner in miners), return_exceptions=True)
+                for miner, result in zip(miners, results):
+                    if isinstance(result, Exception):
+                        print(f"   ⚠️  {miner}: {result}")
+                return sum(not isinstance(result, Exception) for result in results)
+
+            ready = asyncio.run(warm())
+            stats = cache.stats()
+            print(f"✅ {ready} sessions ready: {stats['logins']} logins, {stats['logins_avoided']} avoided")
+        if args.list or not args.inventory:
+            cache._load()
+            now = time.time()
+            for miner, session in sorted(cache.sessions.items()):
+                left = session.expires_at - now
+                print(f"{miner}: " + (f"expires in {left:.0f} s" if left > 0 else 'expired')
+                      + (', refreshable' if session.refresh_token else ''))
+    finally:
+        cache.close()
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Content-addressed backup store for spec.json
+- Splits each saved version into hashed subtrees (one per path, one per
+  component entry) so unchanged nodes are stored only once
+- Restores any saved version by backup timestamp or info.version
+- Replaces the full spec.json.backup.* copies
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from spec_pipeline import dump_spec, load_spec, write_spec_atomic
+
+REPO_ROOT = Path(__file__).parent
+STORE_PATH = REPO_ROOT / 'spec-history'
+TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+LEGACY_BACKUP_RE = re.compile(r'^spec\.json\.backup\.(\d{8}_\d{6})$')
+
+
+def _is_split(key_path):
+    """Containers whose children are stored as separate objects
+
+    The document root, ``paths`` and every ``components`` section are split,
+    so each path item and each schema/parameter/response is its own object.
+    Anything else is stored whole.
+    """
+    return (key_path in ((), ('paths',), ('components',))
+            or (len(key_path) == 2 and key_path[0] == 'components'))
+
+
+def _encode(node):
+    return json.dumps(node, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+class BackupStore:
+    """A directory of content-addressed objects plus a version index
+
+    Objects are compact JSON documents named by the SHA-256 of their bytes:
+    ``{"blob": <subtree>}`` for leaves and ``{"tree": {key: hash}}`` for
+    split containers (key order is preserved). ``index.json`` lists every
+    saved version with its root tree hash.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = Path(path)
+        self.objects = self.path / 'objects'
+        self.index_path = self.path / 'index.json'
+        self._cache = {}
+        self.bytes_written = 0
+
+    # -- objects -----------------------------------------------------------
+
+    def _object_path(self, digest):
+        return self.objects / digest[:2] / f"{digest[2:]}.json"
+
+    def _put(self, obj):
+        data = _encode(obj)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_spec_atomic(data.decode('utf-8'), path)
+            self.bytes_written += len(data)
+        self._cache[digest] = data
+        return digest
+
+    def _get(self, digest):
+        # Cache encoded bytes rather than parsed nodes so callers can mutate
+        # what they get back without corrupting later restores
+        data = self._cache.get(digest)
+        if data is None:
+            data = self._object_path(digest).read_bytes()
+            self._cache[digest] = data
+        return json.loads(data)
+
+    def _put_node(self, node, key_path=()):
+        if _is_split(key_path) and isinstance(node, dict):
+            tree = {key: self._put_node(value, key_path + (key,)) for key, value in node.items()}
+            return self._put({'tree': tree})
+        return self._put({'blob': node})
+
+    def _get_node(self, digest):
+        obj = self._get(digest)
+        if 'tree' in obj:
+            return {key: self._get_node(child) for key, child in obj['tree'].items()}
+        return obj['blob']
+
+    # -- index -------------------------------------------------------------
+
+    def versions(self):
+        if not self.index_path.exists():
+            return []
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)['versions']
+
+    def _write_index(self, versions):
+        self.path.mkdir(parents=True, exist_ok=True)
+        versions.sort(key=lambda entry: entry['id'])
+        write_spec_atomic(json.dumps({'versions': versions}, indent=2) + '\n', self.index_path)
+
+    def save(self, spec, backup_id=None, source=None):
+        """Store spec as a new version and return its index entry
+
+        When the newest saved version already has the same root hash, no
+        new entry is added and that entry is returned instead.
+        """
+        self.bytes_written = 0
+        root = self._put_node(spec)
+        versions = self.versions()
+        if versions and versions[-1]['root'] == root and backup_id is None:
+            return versions[-1]
+
+        if backup_id is None:
+            backup_id = time.strftime(TIMESTAMP_FORMAT)
+            taken = {v['id'] for v in versions}
+            suffix = 1
+            while backup_id in taken:
+                suffix += 1
+                backup_id = f"{time.strftime(TIMESTAMP_FORMAT)}-{suffix}"
+
+        entry = {
+            'id': backup_id,
+            'version': spec.get('info', {}).get('version'),
+            'root': root,
+            'source': source,
+            'bytes_added': self.bytes_written,
+        }
+        versions = [v for v in versions if v['id'] != entry['id']] + [entry]
+        self._write_index(versions)
+        return entry
+
+    def find(self, ref):
+        """Look up a version by backup id (or id prefix) or by info.version
+
+        A version string matches the most recently saved entry with that
+        info.version.
+        """
+        versions = self.versions()
+        for entry in versions:
+            if entry['id'] == ref:
+                return entry
+        by_version = [entry for entry in versions if entry['version'] == ref]
+        if by_version:
+            return by_version[-1]
+        by_prefix = [entry for entry in versions if entry['id'].startswith(ref)]
+        if by_prefix:
+            return by_prefix[-1]
+        raise KeyError(f"No saved version matches '{ref}'")
+
+    def restore(self, ref):
+        """Rebuild the spec document for a saved version"""
+        return self._get_node(self.find(ref)['root'])
+
+    def size(self):
+        return sum(p.stat().st_size for p in self.path.rglob('*') if p.is_file())
+
+
+def legacy_backups(root=REPO_ROOT):
+    """Timestamped spec.json.backup.* files in root, oldest first"""
+    found = []
+    for path in root.iterdir():
+        match = LEGACY_BACKUP_RE.match(path.name)
+        if match:
+            found.append((match.group(1), path))
+    return sorted(found)
+
+
+def import_legacy(store, root=REPO_ROOT):
+    """Save every timestamped full backup into the store"""
+    entries = []
+    for backup_id, path in legacy_backups(root):
+        spec, _ = load_spec(path)
+        entries.append(store.save(spec, backup_id=backup_id, source=path.name))
+    return entries
+
+
+def benchmark(store, repeat=5):
+    """Time cold restores of every saved version against full-copy loads"""
+    versions = store.versions()
+    if not versions:
+        raise RuntimeError("Store is empty; run import-legacy or save first")
+
+    full_bytes = 0
+    restore_times = []
+    full_read_times = []
+    for entry in versions:
+        full_text = None
+        for _ in range(repeat):
+            cold = BackupStore(store.path)
+            start = time.perf_counter()
+            restored = cold.restore(entry['id'])
+            restore_times.append(time.perf_counter() - start)
+
+            if full_text is None:
+                full_text = dump_spec(restored)
+                full_bytes += len(full_text.encode('utf-8'))
+            start = time.perf_counter()
+            json.loads(full_text)
+            full_read_times.append(time.perf_counter() - start)
+
+    return {
+        'versions': len(versions),
+        'full_bytes': full_bytes,
+        'store_bytes': store.size(),
+        'restore_ms': statistics.median(restore_times) * 1000,
+        'full_read_ms': statistics.median(full_read_times) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--store', default=str(STORE_PATH), help='store directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    save = commands.add_parser('save', help='save a spec file as a new version')
+    save.add_argument('spec', nargs='?', default=str(REPO_ROOT / 'spec.json'))
+    save.add_argument('--id', help=f'backup id (default: current time as {TIMESTAMP_FORMAT})')
+
+    restore = commands.add_parser('restore', help='rebuild a saved version')
+    restore.add_argument('ref', help='backup id, id prefix, or info.version')
+    restore.add_argument('-o', '--output', help='write here instead of stdout')
+
+    commands.add_parser('list', help='list saved versions')
+    commands.add_parser('import-legacy', help='import spec.json.backup.* files')
+    commands.add_parser('benchmark', help='measure storage and restore time over the saved history')
+    args = parser.parse_args()
+
+    store = BackupStore(args.store)
+
+    if args.command == 'save':
+        spec, _ = load_spec(args.spec)
+        entry = store.save(spec, backup_id=args.id, source=os.path.basename(args.spec))
+        print(f"✅ Saved {entry['id']} (v{entry['version']}, +{entry['bytes_added']} bytes)")
+    elif args.command == 'restore':
+        text = dump_spec(store.restore(args.ref))
+        if args.output:
+            write_spec_atomic(text, args.output)
+            print(f"✅ Restored {args.ref} to {args.output}")
+        else:
+            sys.stdout.write(text)
+    elif args.command == 'list':
+        for entry in store.versions():
+            print(f"{entry['id']}  v{str(entry['version'] or '-'):<8} +{entry['bytes_added']:>7} bytes  {entry['source'] or ''}")
+    elif args.command == 'import-legacy':
+        for entry in import_legacy(store):
+            print(f"   - {entry['source']}: v{entry['version']}, +{entry['bytes_added']} bytes")
+        print(f"\n✅ Store size: {store.size()} bytes")
+    elif args.command == 'benchmark':
+        result = benchmark(store)
+        print(f"📊 {result['versions']} saved versions")
+        print(f"   - As full copies:     {result['full_bytes']:>9} bytes")
+        print(f"   - Delta store:        {result['store_bytes']:>9} bytes")
+        print(f"   - Restore (median):   {result['restore_ms']:.2f} ms")
+        print(f"   - Full file load:     {result['full_read_ms']:.2f} ms")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Structural diff for OpenAPI specs
+- Walks the current and upstream specs once, side by side
+- Classifies added/removed/changed operations, parameters, schemas,
+  properties, enum values, $ref targets, tags and text
+- Emits a JSON report the monitor workflow, CHANGELOG and Slack steps share
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from spec_pipeline import load_spec
+from spec_refs import RefGraph
+
+HTTP_METHODS = {'get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace'}
+TEXT_KEYS = {'description', 'summary', 'title'}
+ADDED, REMOVED, CHANGED = 'added', 'removed', 'changed'
+
+
+def _pointer(parts):
+    return '/' + '/'.join(str(p).replace('~', '~0').replace('/', '~1') for p in parts)
+
+
+def _parameter_key(param):
+    if '$ref' in param:
+        return ('$ref', param['$ref'])
+    return (param.get('in'), param.get('name'))
+
+
+class SpecDiff:
+    """One side-by-side walk over two specs, collecting change records
+
+    Each record is a dict with ``kind``, ``change`` (added/removed/changed)
+    and ``path`` (a JSON pointer into the spec), plus ``operation`` and
+    ``schema`` when the change sits inside one, and ``old``/``new`` values
+    for leaf changes.
+    """
+
+    def __init__(self, old, new):
+        self.old = old
+        self.new = new
+        self.changes = []
+
+    def run(self):
+        self._walk(self.old, self.new, ())
+        return self
+
+    # -- recording ---------------------------------------------------------
+
+    def _record(self, kind, change, parts, **extra):
+        record = {'kind': kind, 'change': change, 'path': _pointer(parts)}
+        operation = self._operation_name(parts)
+        if operation:
+            record['operation'] = operation
+        if len(parts) >= 3 and parts[0] == 'components' and parts[1] == 'schemas':
+            record['schema'] = parts[2]
+        record.update(extra)
+        self.changes.append(record)
+
+    @staticmethod
+    def _operation_name(parts):
+        if len(parts) >= 3 and parts[0] == 'paths' and parts[2] in HTTP_METHODS:
+            return f"{parts[2].upper()} {parts[1]}"
+        return None
+
+    def _presence(self, node, change, parts):
+        """Record a whole subtree appearing or disappearing"""
+        if len(parts) == 2 and parts[0] == 'paths':
+            self._record('path', change, parts)
+            for method in node:
+                if method in HTTP_METHODS:
+                    self._record('operation', change, parts + (method,))
+        elif len(parts) == 3 and parts[0] == 'paths' and parts[2] in HTTP_METHODS:
+            self._record('operation', change, parts)
+        elif len(parts) == 3 and parts[0] == 'components':
+            kind = {'schemas': 'schema', 'parameters': 'parameter',
+                    'responses': 'response'}.get(parts[1], 'component')
+            self._record(kind, change, parts, name=parts[2])
+        elif len(parts) >= 2 and parts[-2] == 'properties':
+            self._record('property', change, parts, name=parts[-1])
+        elif parts and parts[-1] == 'requestBody':
+            self._record('request_body', change, parts)
+        elif len(parts) >= 2 and parts[-2] == 'responses':
+            self._record('response', change, parts, status=parts[-1])
+        else:
+            self._record('value', change, parts,
+                         **({'old': node} if change == REMOVED else {'new': node}))
+
+    # -- walking -----------------------------------------------------------
+
+    def _walk(self, old, new, parts):
+        """Compare two nodes, returning True when anything differs"""
+        if isinstance(old, dict) and isinstance(new, dict):
+            differs = self._walk_dict(old, new, parts)
+        elif isinstance(old, list) and isinstance(new, list):
+            differs = self._walk_list(old, new, parts)
+        elif old == new and type(old) is type(new):
+            return False
+        else:
+            self._leaf(old, new, parts)
+            return True
+
+        if differs:
+            if len(parts) == 3 and parts[0] == 'paths' and parts[2] in HTTP_METHODS:
+                self._record('operation', CHANGED, parts)
+            elif len(parts) == 3 and parts[:2] == ('components', 'schemas'):
+                self._record('schema', CHANGED, parts, name=parts[2])
+        return differs
+
+    def _walk_dict(self, old, new, parts):
+        differs = False
+        for key, old_value in old.items():
+            if key in new:
+                differs |= self._walk(old_value, new[key], parts + (key,))
+            else:
+                self._presence(old_value, REMOVED, parts + (key,))
+                differs = True
+        for key, new_value in new.items():
+            if key not in old:
+                self._presence(new_value, ADDED, parts + (key,))
+                differs = True
+        return differs
+
+    def _walk_list(self, old, new, parts):
+        key = parts[-1] if parts else None
+        if key in ('enum', 'required') or (key == 'tags' and len(parts) == 4):
+            return self._walk_set(old, new, parts, key)
+        if key == 'parameters' and all(isinstance(p, dict) for p in old + new):
+            return self._walk_keyed(old, new, parts, _parameter_key, 'parameter')
+        if parts == ('tags',) and all(isinstance(t, dict) for t in old + new):
+            return self._walk_keyed(old, new, parts, lambda t: t.get('name'), 'tag')
+
+        differs = False
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            differs |= self._walk(old_item, new_item, parts + (index,))
+        for index in range(len(new), len(old)):
+            self._record('value', REMOVED, parts + (index,), old=old[index])
+            differs = True
+        for index in range(len(old), len(new)):
+            self._record('value', ADDED, parts + (index,), new=new[index])
+            differs = True
+        return differs
+
+    def _walk_set(self, old, new, parts, key):
+        kind = {'enum': 'enum_value', 'required': 'required', 'tags': 'operation_tag'}[key]
+        old_set = {json.dumps(v, sort_keys=True) for v in old}
+        new_set = {json.dumps(v, sort_keys=True) for v in new}
+        for value in old:
+            if json.dumps(value, sort_keys=True) not in new_set:
+                self._record(kind, REMOVED, parts, value=value)
+        for value in new:
+            if json.dumps(value, sort_keys=True) not in old_set:
+                self._record(kind, ADDED, parts, value=value)
+        return old_set != new_set or old != new
+
+    def _walk_keyed(self, old, new, parts, key_of, kind):
+        old_items = {key_of(item): (index, item) for index, item in enumerate(old)}
+        new_items = {key_of(item): (index, item) for index, item in enumerate(new)}
+        differs = [key_of(item) for item in old] != [key_of(item) for item in new]
+        for item_key, (index, item) in old_items.items():
+            label = item_key[1] if isinstance(item_key, tuple) else item_key
+            if item_key not in new_items:
+                self._record(kind, REMOVED, parts + (index,), name=label)
+                differs = True
+                continue
+            new_index, new_item = new_items[item_key]
+            if self._walk(item, new_item, parts + (new_index,)):
+                self._record(kind, CHANGED, parts + (new_index,), name=label)
+                differs = True
+        for item_key, (index, _) in new_items.items():
+            if item_key not in old_items:
+                label = item_key[1] if isinstance(item_key, tuple) else item_key
+                self._record(kind, ADDED, parts + (index,), name=label)
+                differs = True
+        return differs
+
+    def _leaf(self, old, new, parts):
+        key = parts[-1] if parts else None
+        if key == '$ref':
+            self._record('ref', CHANGED, parts, old=old, new=new)
+        elif key in TEXT_KEYS and isinstance(old, str) and isinstance(new, str):
+            self._record('text', CHANGED, parts, old=old, new=new)
+        else:
+            self._record('value', CHANGED, parts, old=old, new=new)
+
+    # -- reporting ---------------------------------------------------------
+
+    def _annotate_users(self):
+        """Attach the operations that transitively use each changed component"""
+        graphs = {}
+        for record in self.changes:
+            parts = record['path'].split('/')
+            if len(parts) != 4 or parts[1] != 'components' or record['kind'] == 'component':
+                continue
+            side = self.old if record['change'] == REMOVED else self.new
+            graph = graphs.get(id(side))
+            if graph is None:
+                graph = graphs[id(side)] = RefGraph(side)
+            record['used_by'] = sorted(graph.used_by('#' + record['path']))
+
+    def report(self):
+        self._annotate_users()
+        summary = {}
+        for record in self.changes:
+            counts = summary.setdefault(record['kind'], {ADDED: 0, REMOVED: 0, CHANGED: 0})
+            counts[record['change']] += 1
+        return {
+            'old_version': self.old.get('info', {}).get('version'),
+            'new_version': self.new.get('info', {}).get('version'),
+            'summary': summary,
+            'changes': self.changes,
+        }
+
+
+def diff_specs(old, new):
+    """Return the JSON-serializable change report for two parsed specs"""
+    return SpecDiff(old, new).run().report()
+
+
+def summary_lines(report):
+    """Human-readable bullet lines for the CHANGELOG and Slack messages"""
+    summary = report['summary']
+    lines = []
+
+    def count(kind, change):
+        return summary.get(kind, {}).get(change, 0)
+
+    def plural(n, word):
+        if n == 1:
+            return f"{n} {word}"
+        return f"{n} {word[:-1]}ies" if word.endswith('y') else f"{n} {word}s"
+
+    for kind, word in (('operation', 'endpoint'), ('schema', 'schema'),
+                       ('parameter', 'parameter'), ('property', 'schema property'),
+                       ('enum_value', 'enum value'), ('tag', 'tag')):
+        if count(kind, ADDED):
+            lines.append(f"Added {plural(count(kind, ADDED), word)}")
+        if count(kind, REMOVED):
+            lines.append(f"Removed {plural(count(kind, REMOVED), word)}")
+    if count('operation', CHANGED):
+        lines.append(f"Changed {plural(count('operation', CHANGED), 'endpoint')}")
+    if count('schema', CHANGED):
+        lines.append(f"Changed {plural(count('schema', CHANGED), 'schema')}")
+    if count('ref', CHANGED):
+        lines.append(f"Retargeted {plural(count('ref', CHANGED), '$ref')}")
+    if count('text', CHANGED):
+        lines.append(f"Updated {plural(count('text', CHANGED), 'description')}")
+    affected = {op for record in report['changes']
+                if record['kind'] == 'schema' and record['change'] == CHANGED
+                for op in record.get('used_by', ())}
+    if affected:
+        lines.append(f"Schema changes reach {plural(len(affected), 'endpoint')}")
+
+    for record in report['changes']:
+        if record['kind'] == 'operation' and record['change'] in (ADDED, REMOVED):
+            lines.append(f"{record['change'].capitalize()} `{record['operation']}`")
+        elif record['kind'] == 'schema' and record['change'] in (ADDED, REMOVED):
+            lines.append(f"{record['change'].capitalize()} schema `{record['name']}`")
+    return lines
+
+
+def _legacy_analysis(old_path, new_path):
+    """The jq/diff/grep commands the monitor workflow used to run"""
+    script = r'''
+    diff -u <(jq -r '.. | select(type == "string") | select(contains("hash rate"))' "$1") \
+            <(jq -r '.. | select(type == "string") | select(contains("hash rate"))' "$2") | grep -c "^-" || true
+    diff -u <(jq -r '.. | select(type == "string") | select(contains("hash board"))' "$1") \
+            <(jq -r '.. | select(type == "string") | select(contains("hash board"))' "$2") | grep -c "^-" || true
+    jq -r '.paths | keys | length' "$1"; jq -r '.paths | keys | length' "$2"
+    jq -r '.tags | length' "$1"; jq -r '.tags | length' "$2"
+    '''
+    subprocess.run(['bash', '-c', script, 'legacy', str(old_path), str(new_path)],
+                   check=True, capture_output=True)
+
+
+def benchmark(repeat=5):
+    """Diff every pair of adjacent versions in the backup store"""
+    from spec_backup_store import BackupStore
+
+    store = BackupStore()
+    versions = [store.restore(entry['id']) for entry in store.versions()]
+    versions.append(load_spec()[0])
+    pairs = list(zip(versions, versions[1:]))
+
+    engine_times = []
+    changes = 0
+    for old, new in pairs:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            report = diff_specs(old, new)
+            samples.append(time.perf_counter() - start)
+        engine_times.append(statistics.median(samples))
+        changes += len(report['changes'])
+
+    legacy_times = []
+    if shutil.which('jq'):
+        with tempfile.TemporaryDirectory() as tmp:
+            files = []
+            for index, spec in enumerate(versions):
+                path = Path(tmp) / f"{index}.json"
+                path.write_text(json.dumps(spec, indent=2))
+                files.append(path)
+            for old_path, new_path in zip(files, files[1:]):
+                start = time.perf_counter()
+                _legacy_analysis(old_path, new_path)
+                legacy_times.append(time.perf_counter() - start)
+
+    return {
+        'pairs': len(pairs),
+        'changes': changes,
+        'engine_ms': sum(engine_times) * 1000,
+        'engine_max_ms': max(engine_times) * 1000,
+        'legacy_ms': sum(legacy_times) * 1000 if legacy_times else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('old', nargs='?', default='spec.json', help='current spec')
+    parser.add_argument('new', nargs='?', help='upstream spec')
+    parser.add_argument('-o', '--output', help='write the JSON report here')
+    parser.add_argument('--summary', action='store_true', help='print bullet summary lines')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='diff every adjacent pair of saved versions')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark()
+        print(f"📊 {result['pairs']} adjacent version pairs, {result['changes']} changes found")
+        print(f"   - Diff engine total:  {result['engine_ms']:.1f} ms (worst pair {result['engine_max_ms']:.1f} ms)")
+        if result['legacy_ms'] is not None:
+            print(f"   - jq/diff/grep total: {result['legacy_ms']:.1f} ms")
+        return True
+
+    if not args.new:
+        parser.error('the upstream spec is required')
+    old, _ = load_spec(args.old)
+    new, _ = load_spec(args.new)
+    report = diff_specs(old, new)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    if args.summary:
+        for line in summary_lines(report):
+            print(f"• {line}")
+    elif not args.output:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
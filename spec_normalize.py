@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Text normalizer for upstream API specs
+- One compiled rule table (PSU/API capitalization) applied in a single
+  pass over the parsed spec
+- Only touches string values of text fields (description, summary, title),
+  never keys, $refs, enum values or examples
+- Counts every fix per rule as it goes; running it twice changes nothing
+"""
+
+import argparse
+import json
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from spec_pipeline import dump_spec, load_spec, write_spec_atomic
+
+TEXT_FIELDS = frozenset({'description', 'summary', 'title'})
+
+# (rule name, report group, pattern, replacement), applied in order. These
+# are the monitor workflow's former sed expressions, anchored to the string
+# value instead of the raw JSON line.
+RULES = [
+    ('Ps Us -> PSUs', 'PSU', r'Ps Us', 'PSUs'),
+    ('PsUs -> PSUs', 'PSU', r'PsUs', 'PSUs'),
+    ('Psus -> PSUs', 'PSU', r'Psus', 'PSUs'),
+    ('Api -> API', 'API', r'(?<![A-Z])Api(?![a-z])', 'API'),
+    ('api -> API', 'API', r'(?<![^ ])api(?![^ ])', 'API'),
+    ('Psu -> PSU', 'PSU', r'Psu(?![a-z])', 'PSU'),
+    ('psu -> PSU', 'PSU', r'(?<![a-zA-Z])psu(?![a-zA-Z])', 'PSU'),
+    ('psus -> PSUs', 'PSU', r'(?<![a-zA-Z])psus(?![a-zA-Z])', 'PSUs'),
+]
+
+GROUP_LABELS = {
+    'PSU': 'Fixed PSU capitalization',
+    'API': 'Fixed API capitalization',
+}
+
+# The sed chain this module replaces, kept for the benchmark
+LEGACY_SED_CHAIN = r'''
+cat "$1" | \
+  sed 's/Ps Us/PSUs/g' | \
+  sed 's/PsUs/PSUs/g' | \
+  sed 's/Psus/PSUs/g' | \
+  sed 's/\([^A-Z]\)Api\([^a-z]\)/\1API\2/g' | \
+  sed 's/\([^A-Z]\)Api$/\1API/g' | \
+  sed 's/^Api\([^a-z]\)/API\1/g' | \
+  sed 's/ api / API /g' | \
+  sed 's/^api /API /g' | \
+  sed 's/ api$/ API/g' | \
+  sed 's/Psu\([^a-z]\)/PSU\1/g' | \
+  sed 's/Psu$/PSU/g' | \
+  sed -E 's/(^|[^a-zA-Z])psu([^a-zA-Z]|$)/\1PSU\2/g' | \
+  sed -E 's/(^|[^a-zA-Z])psus([^a-zA-Z]|$)/\1PSUs\2/g' > "$2"
+'''
+
+
+class Normalizer:
+    """A compiled rule table applied to the text fields of a spec"""
+
+    def __init__(self, rules=RULES, fields=TEXT_FIELDS):
+        self.rules = [(name, group, re.compile(pattern), replacement)
+                      for name, group, pattern, replacement in rules]
+        self.fields = frozenset(fields)
+        # Cheap pre-check so strings no rule can touch are skipped
+        self.candidate = re.compile('|'.join(f'(?:{pattern})' for _, _, pattern, _ in rules))
+
+    def normalize_text(self, text, counts):
+        if not self.candidate.search(text):
+            return text
+        for name, _, regex, replacement in self.rules:
+            text, n = regex.subn(replacement, text)
+            if n:
+                counts[name] = counts.get(name, 0) + n
+        return text
+
+    def normalize(self, spec):
+        """Normalize spec in place and return {rule name: fix count}"""
+        counts = {}
+        stack = [spec]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if isinstance(value, str):
+                        if key in self.fields:
+                            node[key] = self.normalize_text(value, counts)
+                    elif isinstance(value, (dict, list)) and key not in ('example', 'examples'):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
+        return counts
+
+    def report_lines(self, counts):
+        """Bullet lines grouped the way the workflow has always reported them"""
+        groups = {}
+        for name, group, _, _ in self.rules:
+            if counts.get(name):
+                groups[group] = groups.get(group, 0) + counts[name]
+        return [f"• {GROUP_LABELS.get(group, group)} ({n} changes)" for group, n in groups.items()]
+
+
+def normalize_spec(spec):
+    """Normalize a parsed spec in place with the default rules"""
+    return Normalizer().normalize(spec)
+
+
+def benchmark(repeat=10):
+    """Time the sed chain and the normalizer on the largest saved spec"""
+    from spec_backup_store import BackupStore
+
+    store = BackupStore()
+    candidates = [store.restore(entry['id']) for entry in store.versions()]
+    candidates.append(load_spec()[0])
+    largest = max(candidates, key=lambda spec: len(dump_spec(spec)))
+    text = dump_spec(largest)
+    normalizer = Normalizer()
+
+    python_times = []
+    pass_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        spec = json.loads(text)
+        parsed = time.perf_counter()
+        counts = normalizer.normalize(spec)
+        pass_times.append(time.perf_counter() - parsed)
+        dump_spec(spec)
+        python_times.append(time.perf_counter() - start)
+
+    sed_times = []
+    if shutil.which('sed'):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / 'in.json'
+            target = Path(tmp) / 'out.json'
+            source.write_text(text, encoding='utf-8')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                subprocess.run(['bash', '-c', LEGACY_SED_CHAIN, 'sed', str(source), str(target)],
+                               check=True)
+                sed_times.append(time.perf_counter() - start)
+
+    return {
+        'version': largest['info'].get('version'),
+        'bytes': len(text.encode('utf-8')),
+        'fixes': sum(counts.values()),
+        'python_ms': statistics.median(python_times) * 1000,
+        'pass_ms': statistics.median(pass_times) * 1000,
+        'sed_ms': statistics.median(sed_times) * 1000 if sed_times else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('spec', nargs='?', help='spec file to normalize')
+    parser.add_argument('-o', '--output', help='write here instead of in place')
+    parser.add_argument('--report', help='write per-rule fix counts as JSON here')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare against the sed chain on the largest saved spec')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark()
+        print(f"📊 Largest saved spec: v{result['version']} ({result['bytes']} bytes, {result['fixes']} fixes)")
+        print(f"   - Parse + normalize + dump: {result['python_ms']:.1f} ms")
+        print(f"   - Normalize pass only:      {result['pass_ms']:.1f} ms")
+        if result['sed_ms'] is not None:
+            print(f"   - 13-stage sed chain:       {result['sed_ms']:.1f} ms")
+        return True
+
+    if not args.spec:
+        parser.error('a spec file is required')
+    normalizer = Normalizer()
+    spec, _ = load_spec(args.spec)
+    counts = normalizer.normalize(spec)
+    if counts or args.output:
+        write_spec_atomic(dump_spec(spec), args.output or args.spec)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'total': sum(counts.values()), 'rules': counts,
+                       'summary': normalizer.report_lines(counts)}, f, indent=2, ensure_ascii=False)
+
+    for line in normalizer.report_lines(counts):
+        print(line)
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Single-pass transform pipeline for spec.json
+- Parses spec.json once and applies a chain of transform stages in memory
+- Writes the result once, atomically (temp file + rename)
+- Replaces the per-script load/dump cycle of the old updater scripts
+"""
+
+import argparse
+import copy
+import json
+import os
+import stat
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SPEC_PATH = Path(__file__).parent / 'spec.json'
+
+
+def load_spec(path=SPEC_PATH):
+    """Read and parse a spec file, returning (spec, raw_text)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return json.loads(text), text
+
+
+def dump_spec(spec):
+    """Serialize a spec in the layout the workflow's jq step produces
+
+    Non-ASCII characters stay as UTF-8, as jq writes them; the old updater
+    scripts' json.dump escaped them (\\uXXXX), so their first run through
+    the pipeline rewrites such characters back to their literal form.
+    """
+    return json.dumps(spec, indent=2, ensure_ascii=False) + '\n'
+
+
+def write_spec_atomic(text, path=SPEC_PATH):
+    """Write text next to path and rename it into place, keeping path's permissions"""
+    path = Path(path)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file owner-only
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class Stage:
+    """A named in-place transform of a parsed spec
+
+    ``apply`` mutates the spec and returns a short human-readable summary
+    of what it changed (or None when it was a no-op).
+    """
+
+    def __init__(self, name, apply):
+        self.name = name
+        self.apply = apply
+
+    def __repr__(self):
+        return f"Stage({self.name})"
+
+
+def set_version(version):
+    """Stage: set info.version"""
+    def apply(spec):
+        old = spec['info'].get('version')
+        if old == version:
+            return None
+        spec['info']['version'] = version
+        return f"Version: {old} -> {version}"
+    return Stage(f"set_version {version}", apply)
+
+
+def set_openapi(version):
+    """Stage: set the top-level openapi version"""
+    def apply(spec):
+        old = spec.get('openapi')
+        if old == version:
+            return None
+        spec['openapi'] = version
+        return f"OpenAPI: {old} -> {version}"
+    return Stage(f"set_openapi {version}", apply)
+
+
+def set_title(title):
+    """Stage: set info.title"""
+    def apply(spec):
+        old = spec['info'].get('title')
+        if old == title:
+            return None
+        spec['info']['title'] = title
+        return f"Title: {old!r} -> {title!r}"
+    return Stage(f"set_title {title}", apply)
+
+
+def replace_tags(tags):
+    """Stage: replace the top-level tags section"""
+    def apply(spec):
+        new_tags = copy.deepcopy(tags)
+        if spec.get('tags') == new_tags:
+            return None
+        spec['tags'] = new_tags
+        return f"Tags: {len(new_tags)} tags updated"
+    return Stage("replace_tags", apply)
+
+
+def merge_tags(tags):
+    """Stage: append tag definitions whose names are not yet present"""
+    def apply(spec):
+        existing = {tag['name'] for tag in spec.setdefault('tags', [])}
+        added = [tag['name'] for tag in tags if tag['name'] not in existing]
+        for tag in tags:
+            if tag['name'] in added:
+                spec['tags'].append(copy.deepcopy(tag))
+        return f"Added tags: {', '.join(added)}" if added else None
+    return Stage("merge_tags", apply)
+
+
+def add_operation_tag(path, method, tag):
+    """Stage: add a tag to a single operation, keeping existing tags"""
+    method = method.lower()
+
+    def apply(spec):
+        operation = spec.get('paths', {}).get(path, {}).get(method)
+        if operation is None:
+            raise KeyError(f"{method.upper()} {path} endpoint not found")
+        current_tags = operation.get('tags', [])
+        if tag in current_tags:
+            return None
+        operation['tags'] = current_tags + [tag]
+        return f"Added '{tag}' tag to {method.upper()} {path}"
+    return Stage(f"add_operation_tag {method.upper()} {path} {tag}", apply)
+
+
+def swap_servers(servers):
+    """Stage: replace the servers section"""
+    def apply(spec):
+        new_servers = copy.deepcopy(servers)
+        if spec.get('servers') == new_servers:
+            return None
+        spec['servers'] = new_servers
+        return f"Servers: {', '.join(s['url'] for s in new_servers)}"
+    return Stage("swap_servers", apply)
+
+
+class SpecPipeline:
+    """A chain of stages applied to one in-memory document"""
+
+    def __init__(self, stages=()):
+        self.stages = list(stages)
+
+    def then(self, stage):
+        self.stages.append(stage)
+        return self
+
+    def apply(self, spec):
+        """Run every stage against spec in order, returning change summaries"""
+        changes = []
+        for stage in self.stages:
+            summary = stage.apply(spec)
+            if summary:
+                changes.append(summary)
+        return changes
+
+    def run(self, path=SPEC_PATH, output=None, dry_run=False, backup=None, store=None):
+        """Parse path once, apply all stages, and write the result once
+
+        Returns a dict with the change summaries and whether a write happened.
+        Nothing is written when no stage reported a change. When ``backup``
+        is given, the original text is copied there verbatim before the write.
+        When ``store`` (a spec_backup_store.BackupStore) is given and a
+        stage changed something, the original document is saved to it
+        first; unchanged subtrees cost nothing there.
+        """
+        output = Path(output or path)
+        spec, original_text = load_spec(path)
+        changes = self.apply(spec)
+        if store is not None and changes and not dry_run:
+            # The stages edited spec in place; the snapshot is of the original
+            store.save(json.loads(original_text), source=Path(path).name)
+
+        written = False
+        if not dry_run and (changes or output != Path(path)):
+            text = dump_spec(spec)
+            if backup:
+                write_spec_atomic(original_text, backup)
+            write_spec_atomic(text, output)
+            written = True
+
+        return {'changes': changes, 'written': written, 'output': output}
+
+
+def _legacy_run(path, stage):
+    """Emulate one old updater script: load, backup, mutate, dump"""
+    with open(path, 'r') as f:
+        spec = json.load(f)
+    with open(f"{path}.backup.bench", 'w') as f:
+        json.dump(spec, f, indent=2)
+    stage.apply(spec)
+    with open(path, 'w') as f:
+        json.dump(spec, f, indent=2)
+
+
+def benchmark(stages, source=SPEC_PATH, repeat=20):
+    """Compare a sequence of per-script runs against one pipeline run"""
+    with open(source, 'r') as f:
+        source_text = f.read()
+
+    legacy_times = []
+    pipeline_times = []
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp) / 'spec.json'
+        for _ in range(repeat):
+            work.write_text(source_text)
+            start = time.perf_counter()
+            for stage in stages:
+                _legacy_run(work, stage)
+            legacy_times.append(time.perf_counter() - start)
+            legacy_result = json.loads(work.read_text())
+
+            work.write_text(source_text)
+            start = time.perf_counter()
+            SpecPipeline(stages).run(work)
+            pipeline_times.append(time.perf_counter() - start)
+            pipeline_result = json.loads(work.read_text())
+
+    legacy = statistics.median(legacy_times)
+    pipeline = statistics.median(pipeline_times)
+    return {
+        'stages': len(stages),
+        'legacy_ms': legacy * 1000,
+        'pipeline_ms': pipeline * 1000,
+        'speedup': legacy / pipeline if pipeline else float('inf'),
+        'same_document': legacy_result == pipeline_result,
+    }
+
+
+def _release_stages(args):
+    stages = []
+    if args.version:
+        stages.append(set_version(args.version))
+    if args.title:
+        stages.append(set_title(args.title))
+    if args.tags:
+        from update_tags import TAGS
+        stages.append(replace_tags(TAGS))
+    for path, method, tag in args.add_tag or []:
+        stages.append(add_operation_tag(path, method, tag))
+    if args.server:
+        stages.append(swap_servers([
+            {'url': url, 'description': args.server_description}
+            for url in args.server
+        ]))
+    return stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--spec', default=str(SPEC_PATH), help='spec file to transform')
+    parser.add_argument('--output', help='write the result here instead of in place')
+    parser.add_argument('--version', help='set info.version')
+    parser.add_argument('--title', help='set info.title')
+    parser.add_argument('--tags', action='store_true', help='replace tags with the list in update_tags.py')
+    parser.add_argument('--add-tag', nargs=3, action='append', metavar=('PATH', 'METHOD', 'TAG'),
+                        help='add TAG to the METHOD PATH operation (repeatable)')
+    parser.add_argument('--server', action='append', help='replace servers with this URL (repeatable)')
+    parser.add_argument('--server-description', default='', help='description for --server entries')
+    parser.add_argument('--dry-run', action='store_true', help='apply stages without writing')
+    parser.add_argument('--benchmark', type=int, metavar='N', nargs='?', const=20,
+                        help='time the selected stages as separate scripts vs. one pipeline')
+    args = parser.parse_args()
+
+    stages = _release_stages(args)
+    if not stages:
+        parser.error('no stages selected')
+
+    if args.benchmark:
+        result = benchmark(stages, args.spec, args.benchmark)
+        print(f"📊 {result['stages']} stages, median of {args.benchmark} runs")
+        print(f"   - Per-script load/dump: {result['legacy_ms']:.1f} ms")
+        print(f"   - Single pipeline:      {result['pipeline_ms']:.1f} ms")
+        print(f"   - Speedup:              {result['speedup']:.1f}x")
+        print(f"   - Same document:        {result['same_document']}")
+        return result['same_document']
+
+    print(f"Reading spec from: {args.spec}")
+    result = SpecPipeline(stages).run(args.spec, args.output, args.dry_run)
+    for change in result['changes']:
+        print(f"   - {change}")
+    if result['written']:
+        print(f"\n✅ Wrote {result['output']} ({len(stages)} stages, one parse, one write)")
+    else:
+        print("\nℹ️  Nothing written")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
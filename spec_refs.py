@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+$ref resolution graph for spec.json
+- Builds the reference graph between operations and components once
+- Memoizes resolved and fully inlined subtrees, cutting reference cycles
+- Answers "which operations transitively use X" from a precomputed index
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from spec_pipeline import SPEC_PATH, load_spec
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+
+def _unescape(part):
+    return part.replace('~1', '/').replace('~0', '~')
+
+
+def collect_refs(node):
+    """Local $ref targets anywhere under node, in document order"""
+    refs = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get('$ref')
+            if isinstance(ref, str) and ref.startswith('#/'):
+                refs.append(ref)
+            stack.extend(v for v in current.values() if isinstance(v, (dict, list)))
+        elif isinstance(current, list):
+            stack.extend(v for v in current if isinstance(v, (dict, list)))
+    return refs
+
+
+def operations(spec):
+    """Yield (operation id, method, path, operation, path-level parameters)"""
+    for path, item in spec.get('paths', {}).items():
+        for method, operation in item.items():
+            if method in HTTP_METHODS:
+                yield f"{method.upper()} {path}", method, path, operation, item.get('parameters', [])
+
+
+class RefGraph:
+    """Reference graph over one parsed spec
+
+    Nodes are operations (``"GET /api/v1/telemetry"``) and components
+    (``"#/components/schemas/MetricUnit"``). Component names may be given
+    bare (``"MetricUnit"``) wherever a component is expected, as long as the
+    name is unique across component sections.
+
+    The spec must not be mutated after the graph is built; resolved and
+    inlined subtrees are shared between callers and are read-only.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.edges = {}
+        self.operations = {}
+        self._names = {}
+        self._resolved = {}
+        self._inlined = {}
+        self._build()
+        self._close()
+
+    # -- construction ------------------------------------------------------
+
+    def _build(self):
+        for section, entries in self.spec.get('components', {}).items():
+            if not isinstance(entries, dict):
+                continue
+            for name, node in entries.items():
+                pointer = f"#/components/{section}/{name}"
+                self.edges[pointer] = frozenset(collect_refs(node))
+                self._names.setdefault(name, []).append(pointer)
+
+        for op_id, _, _, operation, shared_params in operations(self.spec):
+            self.operations[op_id] = operation
+            self.edges[op_id] = frozenset(collect_refs(operation) + collect_refs(shared_params))
+
+    def _close(self):
+        """Transitive closure via Tarjan's SCCs, plus the reverse index"""
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        counter = [0]
+        self.cycles = []
+        self._cyclic = {}
+        closure = {}
+
+        def visit(node):
+            index[node] = low[node] = counter[0]
+            counter[0] += 1
+            stack.append(node)
+            on_stack.add(node)
+            for target in self.edges.get(node, ()):
+                if target not in index:
+                    visit(target)
+                    low[node] = min(low[node], low[target])
+                elif target in on_stack:
+                    low[node] = min(low[node], index[target])
+
+            if low[node] == index[node]:
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    members.append(member)
+                    if member == node:
+                        break
+                # SCCs come out sinks first, so every target outside this
+                # one is already closed
+                reach = set()
+                for member in members:
+                    for target in self.edges.get(member, ()):
+                        reach.add(target)
+                        if target not in members:
+                            reach |= closure[target]
+                cyclic = len(members) > 1 or node in self.edges.get(node, ())
+                if cyclic:
+                    self.cycles.append(sorted(members))
+                frozen = frozenset(reach)
+                for member in members:
+                    closure[member] = frozen
+                    self._cyclic[member] = cyclic
+
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, 10 * len(self.edges) + 100))
+        try:
+            for node in self.edges:
+                if node not in index:
+                    visit(node)
+        finally:
+            sys.setrecursionlimit(limit)
+
+        self.closure = closure
+        used_by = {}
+        used_by_components = {}
+        for node, reach in closure.items():
+            target_index = used_by if node in self.operations else used_by_components
+            for target in reach:
+                target_index.setdefault(target, set()).add(node)
+        self._used_by = {k: frozenset(v) for k, v in used_by.items()}
+        self._used_by_components = {k: frozenset(v) for k, v in used_by_components.items()}
+
+    # -- lookups -----------------------------------------------------------
+
+    def pointer(self, name):
+        """Normalize a bare component name to its JSON pointer"""
+        if name.startswith('#/') or name in self.operations:
+            return name
+        matches = self._names.get(name, [])
+        if len(matches) != 1:
+            raise KeyError(f"Component '{name}' is {'ambiguous' if matches else 'not defined'}")
+        return matches[0]
+
+    def resolve(self, ref):
+        """The node a $ref points at (not inlined), memoized"""
+        ref = self.pointer(ref)
+        node = self._resolved.get(ref)
+        if node is None:
+            node = self.spec
+            for part in ref[2:].split('/'):
+                node = node[_unescape(part)]
+            self._resolved[ref] = node
+        return node
+
+    def inline(self, ref):
+        """The target of ref with every nested $ref replaced by its target
+
+        References that would re-enter a cycle are left as ``{"$ref": ...}``.
+        Results outside cycles are memoized.
+        """
+        return self._inline(self.pointer(ref), ())
+
+    def _inline(self, ref, active):
+        cached = self._inlined.get(ref)
+        if cached is not None:
+            return cached
+        result = self._inline_node(self.resolve(ref), active + (ref,))
+        if not self._cyclic.get(ref):
+            self._inlined[ref] = result
+        return result
+
+    def _inline_node(self, node, active):
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str) and ref.startswith('#/'):
+                if ref in active:
+                    return node
+                return self._inline(ref, active)
+            return {k: self._inline_node(v, active) for k, v in node.items()}
+        if isinstance(node, list):
+            return [self._inline_node(v, active) for v in node]
+        return node
+
+    def dependencies(self, node):
+        """Every component node transitively references"""
+        return self.closure.get(self.pointer(node), frozenset())
+
+    def used_by(self, component):
+        """Operations that transitively reference component"""
+        return self._used_by.get(self.pointer(component), frozenset())
+
+    def used_by_components(self, component):
+        """Components that transitively reference component"""
+        return self._used_by_components.get(self.pointer(component), frozenset())
+
+    def unused(self):
+        """Components no operation reaches"""
+        return sorted(p for p in self.edges if p.startswith('#/') and p not in self._used_by)
+
+
+def _naive_used_by(spec, pointer):
+    """Re-walk every operation and follow refs by hand, as tools did before"""
+    users = set()
+    for op_id, _, _, operation, shared_params in operations(spec):
+        seen = set()
+        pending = collect_refs(operation) + collect_refs(shared_params)
+        while pending:
+            ref = pending.pop()
+            if ref in seen:
+                continue
+            seen.add(ref)
+            node = spec
+            for part in ref[2:].split('/'):
+                node = node[_unescape(part)]
+            pending.extend(collect_refs(node))
+        if pointer in seen:
+            users.add(op_id)
+    return users
+
+
+def benchmark(spec, repeat=5):
+    """Graph build plus one used_by query per component vs. naive re-walks"""
+    components = [p for p in RefGraph(spec).edges if p.startswith('#/')]
+
+    build_times = []
+    query_times = []
+    naive_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        graph = RefGraph(spec)
+        build_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for pointer in components:
+            graph.used_by(pointer)
+        query_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for pointer in components:
+            naive = _naive_used_by(spec, pointer)
+        naive_times.append(time.perf_counter() - start)
+        if naive != set(graph.used_by(components[-1])):
+            raise AssertionError(f"Graph disagrees with naive walk for {components[-1]}")
+
+    return {
+        'components': len(components),
+        'operations': len(graph.operations),
+        'build_ms': statistics.median(build_times) * 1000,
+        'query_us': statistics.median(query_times) / len(components) * 1e6,
+        'naive_us': statistics.median(naive_times) / len(components) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--spec', default=str(SPEC_PATH), help='spec file to load')
+    commands = parser.add_subparsers(dest='command', required=True)
+    users = commands.add_parser('users', help='operations that transitively use a component')
+    users.add_argument('component')
+    deps = commands.add_parser('deps', help='components an operation or component depends on')
+    deps.add_argument('node', help='e.g. "GET /api/v1/telemetry" or TelemetryData')
+    commands.add_parser('cycles', help='list reference cycles')
+    commands.add_parser('unused', help='list components no operation reaches')
+    commands.add_parser('benchmark', help='compare graph queries against naive re-walks')
+    args = parser.parse_args()
+
+    spec, _ = load_spec(args.spec)
+
+    if args.command == 'benchmark':
+        result = benchmark(spec)
+        print(f"📊 {result['operations']} operations, {result['components']} components")
+        print(f"   - Graph build:          {result['build_ms']:.1f} ms")
+        print(f"   - used_by query:        {result['query_us']:.2f} µs")
+        print(f"   - Naive re-walk query:  {result['naive_us']:.0f} µs")
+        return True
+
+    graph = RefGraph(spec)
+    if args.command == 'users':
+        for op_id in sorted(graph.used_by(args.component)):
+            print(op_id)
+    elif args.command == 'deps':
+        for pointer in sorted(graph.dependencies(args.node)):
+            print(pointer)
+    elif args.command == 'cycles':
+        for members in graph.cycles:
+            print(' -> '.join(members))
+        if not graph.cycles:
+            print("✅ No reference cycles")
+    elif args.command == 'unused':
+        for pointer in graph.unused():
+            print(pointer)
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,648 @@
+#!/usr/bin/env python3
+"""
+Compile components.schemas (and operation request/response schemas) into
+specialized Python validators
+- Each schema becomes one generated function: $refs inlined, enums as
+  frozensets, required keys and property checks unrolled, arrays of plain
+  numbers or strings checked with one set(map(type, ...)) pass
+- oneOf branches that share a single-value enum property (like the 'type'
+  of TimeSeriesLevelConfig) dispatch on it instead of trying every branch
+- The generated module is cached in .validator-cache/ under the spec hash,
+  so later runs import it (and its bytecode) without compiling again
+- Formats are not asserted, as in most JSON Schema validators
+- --benchmark: payloads/s against a generic schema-walking validator (and
+  jsonschema when installed) on telemetry payloads
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import itertools
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from spec_pipeline import SPEC_PATH, load_spec, write_spec_atomic
+from spec_refs import RefGraph, operations
+
+try:
+    import jsonschema
+except ImportError:  # optional: pip install jsonschema
+    jsonschema = None
+
+ROOT = Path(__file__).parent
+CACHE_PATH = ROOT / '.validator-cache'
+# Bump when the generated code changes, so cached modules are rebuilt
+COMPILER_VERSION = 1
+# Deeper schemas continue in a separate function, well inside CPython's
+# limits on indentation and nested blocks
+MAX_INDENT = 24
+
+TYPES = {
+    'object': ('dict',),
+    'array': ('list',),
+    'string': ('str',),
+    'integer': ('int',),
+    'number': ('int', 'float'),
+    'boolean': ('bool',),
+    'null': ('NoneType',),
+}
+NAMES = {'dict': 'object', 'list': 'array', 'str': 'string', 'int': 'integer', 'float': 'number',
+         'bool': 'boolean', 'NoneType': 'null'}
+OBJECT_KEYWORDS = ('required', 'properties', 'additionalProperties', 'minProperties', 'maxProperties')
+ARRAY_KEYWORDS = ('items', 'minItems', 'maxItems')
+STRING_KEYWORDS = ('minLength', 'maxLength', 'pattern')
+NUMBER_KEYWORDS = ('minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum')
+# Keywords that never constrain a value
+ANNOTATIONS = {'description', 'example', 'examples', 'default', 'title', 'format', 'readOnly', 'writeOnly',
+               'deprecated', 'externalDocs', 'xml', 'discriminator'}
+
+
+class ValidationError(ValueError):
+    """A value that does not match its schema; path is a JSONPath-like location"""
+
+    def __init__(self, path, message):
+        self.path = path
+        self.message = message
+        super().__init__(f"{path}: {message}")
+
+
+MISSING = object()
+
+
+def _first_invalid(values, types):
+    """Index of the first value whose type is not in types"""
+    return next(index for index, value in enumerate(values) if type(value) not in types)
+
+
+def _expected(names):
+    """'expected ...' message for Python type names ('int' is implied by 'float', as for JSON numbers)"""
+    kinds = {NAMES[name] for name in names if not (name == 'int' and 'float' in names)}
+    return f"expected {' or '.join(sorted(kinds))}"
+
+
+def _literal(text):
+    """text escaped for use inside a double-quoted f-string"""
+    return text.replace('\\', '\\\\').replace('"', '\\"').replace('{', '{{').replace('}', '}}')
+
+
+def _types(schema):
+    """(Python type names, nullable) for a schema's type keyword"""
+    kinds = schema.get('type')
+    if kinds is None:
+        return None, bool(schema.get('nullable'))
+    kinds = [kinds] if isinstance(kinds, str) else list(kinds)
+    nullable = bool(schema.get('nullable')) or 'null' in kinds
+    return [name for kind in kinds if kind != 'null' for name in TYPES.get(kind, ())], nullable
+
+
+class _Compiler:
+    """Generates the source of one validator module"""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.constants = {}
+        self.dispatch = {}
+        self.functions = []
+        self.names = {}
+        self.counter = itertools.count()
+
+    def constant(self, prefix, expression):
+        name = self.constants.get(expression)
+        if name is None:
+            name = self.constants[expression] = f"{prefix}{len(self.constants)}"
+        return name
+
+    def function(self, key, schema, active=()):
+        """Name of the generated function for schema, generating it on first use"""
+        name = self.names.get(key)
+        if name is None:
+            name = self.names[key] = f"_v{len(self.names)}"
+            body = self.emit(schema, 'v', '{p}', 1, active)
+            self.functions.append('\n'.join([f"def {name}(v, p='$'):", *(body or ['    pass'])]))
+        return name
+
+    def emit(self, schema, var, path, depth, active):
+        """Lines checking the value in var against schema, indented to depth"""
+        ref = schema.get('$ref')
+        if ref is not None:
+            if ref in active or depth > MAX_INDENT:
+                name = self.function(ref, self.graph.resolve(ref), (ref,))
+                return [f"{'    ' * depth}{name}({var}, f\"{path}\")"]
+            return self.emit(self.graph.resolve(ref), var, path, depth, active + (ref,))
+        if depth > MAX_INDENT:
+            name = self.function(('inline', id(schema)), schema, active)
+            return [f"{'    ' * depth}{name}({var}, f\"{path}\")"]
+
+        types, nullable = _types(schema)
+        inner = depth + 1 if nullable else depth
+        pad = '    ' * inner
+        lines = []
+
+        def fail(message, at=inner, where=path):
+            return f"{'    ' * at}raise ValidationError(f\"{where}\", {message!r})"
+
+        if types:
+            if len(types) == 1:
+                lines.append(f"{pad}if type({var}) is not {types[0]}:")
+            else:
+                lines.append(f"{pad}if type({var}) not in ({', '.join(types)}):")
+            lines.append(fail(_expected(types), inner + 1))
+
+        if 'enum' in schema:
+            values = schema['enum']
+            scalar = types and set(types) <= {'str', 'int', 'float', 'bool'}
+            if scalar and len(values) > 3:
+                name = self.constant('E', f"frozenset({tuple(values)!r})")
+            else:
+                name = self.constant('E', repr(tuple(values)))
+            lines.append(f"{pad}if {var} not in {name}:")
+            lines.append(fail(f"not one of {', '.join(map(str, values))}", inner + 1))
+        if 'const' in schema:
+            lines.append(f"{pad}if {var} != {schema['const']!r}:")
+            lines.append(fail(f"must be {schema['const']!r}", inner + 1))
+
+        for keywords, kind, emit in ((OBJECT_KEYWORDS, 'dict', self._object), (ARRAY_KEYWORDS, 'list', self._array),
+                                     (STRING_KEYWORDS, 'str', self._string), (NUMBER_KEYWORDS, None, self._number)):
+            if not any(keyword in schema for keyword in keywords):
+                continue
+            if types is None or (kind is not None and kind not in types) or (kind is None and len(types) > 2):
+                # Keywords apply only to values of their kind
+                guard = f"type({var}) is {kind}" if kind else f"type({var}) in (int, float)"
+                checks = emit(schema, var, path, inner + 1, active)
+                if checks:
+                    lines += [f"{pad}if {guard}:", *checks]
+            else:
+                lines += emit(schema, var, path, inner, active)
+
+        for part in schema.get('allOf', ()):
+            lines += self.emit(part, var, path, inner, active)
+        if schema.get('anyOf'):
+            branches = [self.function(('branch', id(part)), part, active) for part in schema['anyOf']]
+            lines += [f"{pad}for f in ({', '.join(branches)},):",
+                      f"{pad}    try:",
+                      f"{pad}        f({var}, f\"{path}\")",
+                      f"{pad}    except ValidationError:",
+                      f"{pad}        continue",
+                      f"{pad}    break",
+                      f"{pad}else:",
+                      fail('matches none of the anyOf schemas', inner + 1)]
+        if schema.get('oneOf'):
+            lines += self._one_of(schema['oneOf'], var, path, inner, active)
+
+        if nullable and lines:
+            lines.insert(0, f"{'    ' * depth}if {var} is not None:")
+        return lines
+
+    def _object(self, schema, var, path, depth, active):
+        pad = '    ' * depth
+        lines = []
+        for key in schema.get('required', ()):
+            lines += [f"{pad}if {key!r} not in {var}:",
+                      f"{pad}    raise ValidationError(f\"{path}\", {f'missing required property {key!r}'!r})"]
+        if 'minProperties' in schema:
+            lines += [f"{pad}if len({var}) < {schema['minProperties']}:",
+                      f"{pad}    raise ValidationError(f\"{path}\", 'too few properties')"]
+        if 'maxProperties' in schema:
+            lines += [f"{pad}if len({var}) > {schema['maxProperties']}:",
+                      f"{pad}    raise ValidationError(f\"{path}\", 'too many properties')"]
+        properties = schema.get('properties', {})
+        for key, sub in properties.items():
+            item = f"x{next(self.counter)}"
+            checks = self.emit(sub, item, f"{path}.{_literal(key)}", depth + 1, active)
+            if checks:
+                lines += [f"{pad}{item} = {var}.get({key!r}, MISSING)",
+                          f"{pad}if {item} is not MISSING:", *checks]
+        extra = schema.get('additionalProperties', True)
+        known = self.constant('K', f"frozenset({tuple(properties)!r})") if properties else None
+        if extra is False:
+            check = f"{known}.issuperset({var})" if known else f"not {var}"
+            lines += [f"{pad}if not {check}:",
+                      f"{pad}    raise ValidationError(f\"{path}\", 'unexpected properties ' + "
+                      f"', '.join(sorted(set({var}) - {known or 'set()'})))"]
+        elif isinstance(extra, dict):
+            key, item = f"k{next(self.counter)}", f"x{next(self.counter)}"
+            checks = self.emit(extra, item, f"{path}.{{{key}}}", depth + 2 if known else depth + 1, active)
+            if checks:
+                lines.append(f"{pad}for {key}, {item} in {var}.items():")
+                if known:
+                    lines.append(f"{pad}    if {key} not in {known}:")
+                lines += checks
+        return lines
+
+    def _array(self, schema, var, path, depth, active):
+        pad = '    ' * depth
+        lines = []
+        if 'minItems' in schema:
+            lines += [f"{pad}if len({var}) < {schema['minItems']}:",
+                      f"{pad}    raise ValidationError(f\"{path}\", 'fewer than {schema['minItems']} items')"]
+        if 'maxItems' in schema:
+            lines += [f"{pad}if len({var}) > {schema['maxItems']}:",
+                      f"{pad}    raise ValidationError(f\"{path}\", 'more than {schema['maxItems']} items')"]
+        items = schema.get('items')
+        if not items:
+            return lines
+        resolved = items
+        while '$ref' in resolved:
+            resolved = self.graph.resolve(resolved['$ref'])
+        types, nullable = _types(resolved)
+        if types and set(resolved) <= ANNOTATIONS | {'type', 'nullable'} and set(types) <= {'str', 'int', 'float', 'bool'}:
+            # Plain scalars: one C-level pass over the item types
+            names = types + (['NoneType'] if nullable else [])
+            allowed = self.constant('T', f"frozenset(({', '.join(names)},))")
+            return lines + [f"{pad}if not {allowed}.issuperset(map(type, {var})):",
+                            f"{pad}    raise ValidationError(f\"{path}[{{_first_invalid({var}, {allowed})}}]\", "
+                            f"{_expected(names)!r})"]
+        item = f"x{next(self.counter)}"
+        checks = self.emit(items, item, f"{path}[{{{var}.index({item})}}]", depth + 1, active)
+        if checks:
+            lines += [f"{pad}for {item} in {var}:", *checks]
+        return lines
+
+    def _string(self, schema, var, path, depth, active):
+        pad = '    ' * depth
+        lines = []
+        if 'minLength' in schema:
+            lines += [f"{pad}if len({var}) < {schema['minLength']}:",
+                      f"{pad}    raise ValidationError(f\"{path}\", 'shorter than {schema['minLength']}')"]
+        if 'maxLength' in schema:
+            lines += [f"{pad}if len({var}) > {schema['maxLength']}:",
+                      f"{pad}    raise ValidationError(f\"{path}\", 'longer than {schema['maxLength']}')"]
+        if 'pattern' in schema:
+            name = self.constant('P', f"re.compile({schema['pattern']!r})")
+            lines += [f"{pad}if {name}.search({var}) is None:",
+                      f"{pad}    raise ValidationError(f\"{path}\", {'does not match ' + schema['pattern']!r})"]
+        return lines
+
+    def _number(self, schema, var, path, depth, active):
+        pad = '    ' * depth
+        lines = []
+        for keyword, exclusive, bad in (('minimum', 'exclusiveMinimum', '<'), ('maximum', 'exclusiveMaximum', '>')):
+            limit, strict = schema.get(keyword), schema.get(exclusive)
+            if isinstance(strict, (int, float)) and not isinstance(strict, bool):
+                # JSON Schema 2019+ / OpenAPI 3.1: the exclusive bound is the number itself
+                limit, strict = strict, True
+            if limit is None:
+                continue
+            op = bad + ('=' if strict else '')
+            lines += [f"{pad}if {var} {op} {limit!r}:",
+                      f"{pad}    raise ValidationError(f\"{path}\", {f'{keyword} {limit}' + (' (exclusive)' if strict else '')!r})"]
+        return lines
+
+    def _one_of(self, branches, var, path, depth, active):
+        pad = '    ' * depth
+        resolved = []
+        for branch in branches:
+            while '$ref' in branch:
+                branch = self.graph.resolve(branch['$ref'])
+            resolved.append(branch)
+        if all(set(branch) <= ANNOTATIONS | {'type'} and isinstance(branch.get('type'), str) for branch in resolved):
+            kinds = [_types(branch)[0] for branch in resolved]
+            if sum(map(len, kinds)) == len({name for names in kinds for name in names}):
+                # Branches that differ only in (disjoint) type: a single type check
+                return self.emit({'type': [branch['type'] for branch in resolved]}, var, path, depth, active)
+        functions = [self.function(('branch', id(branch)), branch, active) for branch in branches]
+        key = self._discriminator(resolved)
+        if key is not None:
+            table = {resolved_branch['properties'][key]['enum'][0]: name
+                     for resolved_branch, name in zip(resolved, functions)}
+            entries = f"{{{', '.join(f'{value!r}: {fn}' for value, fn in table.items())}}}"
+            name = self.dispatch.setdefault(entries, f"D{len(self.dispatch)}")
+            tag = f"t{next(self.counter)}"
+            return [f"{pad}{tag} = {var}.get({key!r}) if type({var}) is dict else None",
+                    f"{pad}f = {name}.get({tag}) if type({tag}) is str else None",
+                    f"{pad}if f is None:",
+                    f"{pad}    raise ValidationError(f\"{path}.{_literal(key)}\", "
+                    f"{'not one of ' + ', '.join(map(str, table))!r})",
+                    f"{pad}f({var}, f\"{path}\")"]
+        return [f"{pad}n = 0",
+                f"{pad}for f in ({', '.join(functions)},):",
+                f"{pad}    try:",
+                f"{pad}        f({var}, f\"{path}\")",
+                f"{pad}    except ValidationError:",
+                f"{pad}        continue",
+                f"{pad}    n += 1",
+                f"{pad}if n != 1:",
+                f"{pad}    raise ValidationError(f\"{path}\", f\"matches {{n}} of {len(functions)} oneOf schemas\")"]
+
+    @staticmethod
+    def _discriminator(branches):
+        """A required property with a distinct single string value in every branch"""
+        if len(branches) < 2:
+            return None
+        candidates = set.intersection(*(set(branch.get('required', ())) for branch in branches))
+        for key in sorted(candidates):
+            values = []
+            for branch in branches:
+                prop = branch.get('properties', {}).get(key, {})
+                enum = prop.get('enum')
+                if not enum or len(enum) != 1 or not isinstance(enum[0], str):
+                    break
+                values.append(enum[0])
+            else:
+                if len(set(values)) == len(values):
+                    return key
+        return None
+
+
+def _media_schema(graph, node):
+    """The JSON schema of a request body or response, None without one"""
+    if '$ref' in node:
+        node = graph.resolve(node['$ref'])
+    content = node.get('content') or {}
+    media = content.get('application/json')
+    return media.get('schema') if media else None
+
+
+def compile_validators(spec, digest=''):
+    """Source of a module defining SCHEMAS, REQUESTS and RESPONSES validator tables"""
+    graph = RefGraph(spec)
+    compiler = _Compiler(graph)
+    schemas = {name: compiler.function(f"#/components/schemas/{name}", schema, (f"#/components/schemas/{name}",))
+               for name, schema in spec.get('components', {}).get('schemas', {}).items()}
+    requests, responses = {}, {}
+    for operation_id, _, _, operation, _ in operations(spec):
+        schema = _media_schema(graph, operation.get('requestBody') or {})
+        if schema is not None:
+            requests[operation_id] = compiler.function(('request', operation_id), schema)
+        for status, response in operation.get('responses', {}).items():
+            schema = _media_schema(graph, response)
+            if schema is not None:
+                responses.setdefault(operation_id, {})[status] = compiler.function(
+                    ('response', operation_id, status), schema)
+
+    def table(mapping):
+        return '{\n' + ''.join(f"    {key!r}: {value if isinstance(value, str) else table(value)},\n"
+                               for key, value in mapping.items()) + '}'
+
+    return '\n'.join([
+        f'"""Validators generated by spec_validators.py (compiler {COMPILER_VERSION}, spec {digest}); do not edit"""',
+        '',
+        'import re',
+        '',
+        '# ValidationError, MISSING, NoneType and _first_invalid are provided by spec_validators on import',
+        '',
+        *(f"{name} = {expression}" for expression, name in compiler.constants.items()),
+        '', '',
+        '\n\n\n'.join(compiler.functions),
+        '', '',
+        *(f"{name} = {entries}" for entries, name in compiler.dispatch.items()),
+        '',
+        f"SCHEMAS = {table(schemas)}",
+        f"REQUESTS = {table(requests)}",
+        f"RESPONSES = {table(responses)}",
+        '',
+    ])
+
+
+def spec_digest(text):
+    return hashlib.sha256(f"{COMPILER_VERSION}\n{text}".encode('utf-8')).hexdigest()[:16]
+
+
+class Validators:
+    """Compiled validators for one spec
+
+    Each validator takes (value, path='$') and raises ValidationError on the
+    first mismatch; valid values return None.
+    """
+
+    def __init__(self, module, digest):
+        self.module = module
+        self.digest = digest
+        self.schemas = module.SCHEMAS
+        self.requests = module.REQUESTS
+        self.responses = module.RESPONSES
+
+    @classmethod
+    def load(cls, spec, text, cache_dir=CACHE_PATH):
+        """Import the cached module for this spec, compiling it first if needed"""
+        digest = spec_digest(text)
+        cache_dir = Path(cache_dir)
+        path = cache_dir / f"validators_{digest}.py"
+        if not path.exists():
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in cache_dir.glob('validators_*.py'):  # older specs
+                stale.unlink()
+            write_spec_atomic(compile_validators(spec, digest), path)
+        module_spec = importlib.util.spec_from_file_location(f"validators_{digest}", path)
+        module = importlib.util.module_from_spec(module_spec)
+        module.ValidationError = ValidationError
+        module.MISSING = MISSING
+        module._first_invalid = _first_invalid
+        module.NoneType = type(None)
+        module_spec.loader.exec_module(module)
+        return cls(module, digest)
+
+    def schema(self, name):
+        return self.schemas[name]
+
+    def request(self, operation_id):
+        """Validator for an operation's JSON request body"""
+        return self.requests[operation_id]
+
+    def response(self, operation_id, status=200):
+        """Validator for an operation's JSON response with this status"""
+        return self.responses[operation_id][str(status)]
+
+    def validate(self, name, value):
+        self.schemas[name](value)
+
+    def is_valid(self, name, value):
+        try:
+            self.schemas[name](value)
+        except ValidationError:
+            return False
+        return True
+
+
+def load_validators(spec_path=SPEC_PATH, cache_dir=CACHE_PATH):
+    spec, text = load_spec(spec_path)
+    return Validators.load(spec, text, cache_dir)
+
+
+def validate_generic(graph, schema, value, path='$'):
+    """The same checks by walking the schema on every call (the baseline)"""
+    while '$ref' in schema:
+        schema = graph.resolve(schema['$ref'])
+    types, nullable = _types(schema)
+    if value is None and nullable:
+        return
+    kind = type(value).__name__
+    if types and kind not in types:
+        raise ValidationError(path, f"expected {schema['type']}")
+    if 'enum' in schema and value not in schema['enum']:
+        raise ValidationError(path, 'not in enum')
+    if 'const' in schema and value != schema['const']:
+        raise ValidationError(path, 'const mismatch')
+    if kind == 'dict':
+        for key in schema.get('required', ()):
+            if key not in value:
+                raise ValidationError(path, f"missing required property {key!r}")
+        properties = schema.get('properties', {})
+        extra = schema.get('additionalProperties', True)
+        for key, item in value.items():
+            if key in properties:
+                validate_generic(graph, properties[key], item, f"{path}.{key}")
+            elif extra is False:
+                raise ValidationError(path, f"unexpected property {key!r}")
+            elif isinstance(extra, dict):
+                validate_generic(graph, extra, item, f"{path}.{key}")
+    elif kind == 'list':
+        if len(value) < schema.get('minItems', 0) or len(value) > schema.get('maxItems', len(value)):
+            raise ValidationError(path, 'wrong number of items')
+        if 'items' in schema:
+            for index, item in enumerate(value):
+                validate_generic(graph, schema['items'], item, f"{path}[{index}]")
+    elif kind == 'str':
+        if len(value) < schema.get('minLength', 0) or len(value) > schema.get('maxLength', len(value)):
+            raise ValidationError(path, 'wrong length')
+        if 'pattern' in schema and not re.search(schema['pattern'], value):
+            raise ValidationError(path, 'pattern mismatch')
+    elif kind in ('int', 'float'):
+        if 'minimum' in schema and value < schema['minimum']:
+            raise ValidationError(path, 'below minimum')
+        if 'maximum' in schema and value > schema['maximum']:
+            raise ValidationError(path, 'above maximum')
+    for part in schema.get('allOf', ()):
+        validate_generic(graph, part, value, path)
+    for keyword, needed in (('anyOf', None), ('oneOf', 1)):
+        if keyword in schema:
+            matches = 0
+            for branch in schema[keyword]:
+                try:
+                    validate_generic(graph, branch, value, path)
+                    matches += 1
+                except ValidationError:
+                    pass
+            if (needed is None and not matches) or (needed is not None and matches != needed):
+                raise ValidationError(path, f"matches {matches} {keyword} branches")
+
+
+# -- benchmark -------------------------------------------------------------
+
+def _json_schema(graph, name):
+    """An inlined component schema as draft 4 JSON Schema, for jsonschema"""
+    def convert(node):
+        if isinstance(node, dict):
+            node = {key: convert(value) for key, value in node.items() if key not in ('example', 'examples')}
+            if node.pop('nullable', False) and isinstance(node.get('type'), str):
+                node['type'] = [node['type'], 'null']
+            return node
+        if isinstance(node, list):
+            return [convert(value) for value in node]
+        return node
+    return convert(graph.inline(name))
+
+
+def recorded_payloads(spec, paths=()):
+    """(label, TelemetryData body) pairs: the spec examples, a synthetic full
+    snapshot and any recorded bodies or telemetry_poller JSON lines"""
+    from timeseries_stream import synthetic_telemetry
+
+    content = spec['paths']['/api/v1/telemetry']['get']['responses']['200']['content']['application/json']
+    payloads = [(f"spec example {name}", entry['value']) for name, entry in content.get('examples', {}).items()]
+    payloads.append(('synthetic 3x126 ASICs', json.loads(synthetic_telemetry(hashboards=3, asics=126))))
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        try:
+            payloads.append((Path(path).name, json.loads(text)))
+        except ValueError:
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+            payloads += [(f"{Path(path).name}:{index}", record['telemetry'])
+                         for index, record in enumerate(records) if record.get('telemetry')]
+    return payloads
+
+
+def _rate(function, payloads, seconds=0.5):
+    """Payloads validated per second"""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for payload in payloads:
+            function(payload)
+        count += len(payloads)
+    return count / (time.perf_counter() - start)
+
+
+def benchmark(spec_path=SPEC_PATH, payload_paths=(), cache_dir=CACHE_PATH):
+    spec, text = load_spec(spec_path)
+    graph = RefGraph(spec)
+    start = time.perf_counter()
+    source = compile_validators(spec, spec_digest(text))
+    compile_s = time.perf_counter() - start
+    start = time.perf_counter()
+    validators = Validators.load(spec, text, cache_dir)
+    load_s = time.perf_counter() - start
+
+    validate = validators.schema('TelemetryData')
+    schema = {'$ref': '#/components/schemas/TelemetryData'}
+    checker = jsonschema.Draft4Validator(_json_schema(graph, 'TelemetryData')) if jsonschema else None
+    results = {'schemas': len(validators.schemas), 'source_lines': source.count('\n'), 'compile_s': compile_s,
+               'load_s': load_s, 'payloads': []}
+    for label, payload in recorded_payloads(spec, payload_paths):
+        validate(payload)
+        validate_generic(graph, schema, payload)
+        row = {'payload': label, 'bytes': len(json.dumps(payload)),
+               'compiled': _rate(validate, [payload]),
+               'generic': _rate(lambda value: validate_generic(graph, schema, value), [payload])}
+        if checker is not None:
+            row['jsonschema'] = _rate(checker.validate, [payload], 0.3)
+        results['payloads'].append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--spec', default=str(SPEC_PATH), help='spec file to compile')
+    parser.add_argument('--schema', help='component schema to validate the files against')
+    parser.add_argument('files', nargs='*', help='JSON files to validate (with --schema), or payloads to benchmark')
+    parser.add_argument('--source', action='store_true', help='print the generated module and exit')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare with a generic validator on telemetry payloads')
+    args = parser.parse_args()
+
+    if args.source:
+        spec, text = load_spec(args.spec)
+        print(compile_validators(spec, spec_digest(text)))
+        return True
+
+    if args.benchmark:
+        result = benchmark(args.spec, args.files)
+        print(f"📊 {result['schemas']} schemas -> {result['source_lines']} lines, compiled in "
+              f"{result['compile_s'] * 1000:.0f} ms; cached import {result['load_s'] * 1000:.1f} ms")
+        print(f"   {'payload':<40} {'bytes':>7} {'compiled/s':>11} {'generic/s':>10} {'jsonschema/s':>13}")
+        for row in result['payloads']:
+            other = f"{row['jsonschema']:>13,.0f}" if 'jsonschema' in row else f"{'-':>13}"
+            print(f"   {row['payload']:<40} {row['bytes']:>7} {row['compiled']:>11,.0f} {row['generic']:>10,.0f} "
+                  f"{other}   ({row['compiled'] / row['generic']:.1f}x generic)")
+        if jsonschema is None:
+            print("   ⚠️  jsonschema not installed, skipped that column (pip install jsonschema)")
+        return True
+
+    validators = load_validators(args.spec)
+    if not args.schema:
+        print(f"✅ {len(validators.schemas)} schema validators ready (cache {validators.digest})")
+        return True
+    failures = 0
+    for path in args.files:
+        with open(path, encoding='utf-8') as f:
+            value = json.load(f)
+        try:
+            validators.validate(args.schema, value)
+            print(f"✅ {path}")
+        except ValidationError as e:
+            failures += 1
+            print(f"❌ {path}: {e}")
+    return failures == 0
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
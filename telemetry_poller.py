@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Fleet-wide telemetry poller on GET /api/v1/telemetry
+- Fans the full snapshot call (level=miner,hashboard,PSU,asic) out to a
+  miner inventory with asyncio, one kept-alive connection per miner
+- Bounded concurrency per subnet and a deadline on every request; a miner
+  that is still busy or timed out sits the next tick out instead of
+  queueing up
+- Streams parsed TelemetryData records and reports fleet latency per tick
+- --simulate runs against a local simulated fleet
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import multiprocessing
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from proto_client import AsyncClient, BearerAuth
+from proto_http import ApiError
+
+LEVELS = ['miner', 'hashboard', 'PSU', 'asic']
+DEFAULT_INTERVAL = 30.0
+DEFAULT_DEADLINE = 10.0
+DEFAULT_PER_SUBNET = 32
+SUBNET_PREFIX = 24
+
+
+def subnet_of(url, prefix=SUBNET_PREFIX):
+    """The /prefix network of a miner URL, or its host name when not an IP"""
+    host = urlsplit(url if '://' in url else f"http://{url}").hostname
+    try:
+        return str(ipaddress.ip_network(f"{host}/{prefix}", strict=False))
+    except ValueError:
+        return host
+
+
+def load_inventory(path, prefix=SUBNET_PREFIX):
+    """[(url, subnet)] from a file with one miner per line
+
+    Lines are ``host``, ``host:port`` or a URL, optionally followed by an
+    explicit subnet/group name. Blank lines and ``#`` comments are ignored.
+    """
+    inventory = []
+    for line in Path(path).read_text(encoding='utf-8').splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        url, *group = line.split()
+        if '://' not in url:
+            url = f"http://{url}"
+        inventory.append((url, group[0] if group else subnet_of(url, prefix)))
+    return inventory
+
+
+class TelemetryResult:
+    """One miner's outcome for one tick; telemetry is None unless status is 'ok'"""
+
+    __slots__ = ('miner', 'tick', 'status', 'latency', 'telemetry', 'error')
+
+    def __init__(self, miner, tick, status, latency, telemetry=None, error=None):
+        self.miner = miner
+        self.tick = tick
+        self.status = status
+        self.latency = latency
+        self.telemetry = telemetry
+        self.error = error
+
+    def to_dict(self):
+        return {
+            'miner': self.miner,
+            'tick': self.tick,
+            'status': self.status,
+            'latency_ms': round(self.latency * 1000, 2),
+            'telemetry': self.telemetry.to_dict() if self.telemetry is not None else None,
+            'error': self.error,
+        }
+
+
+class TickReport:
+    """Fleet latency and outcome counts for one tick"""
+
+    __slots__ = ('tick', 'miners', 'ok', 'errors', 'timeouts', 'skipped',
+                 'p50', 'p95', 'p99', 'max', 'wall', 'cpu')
+
+    def __init__(self, tick, miners, counts, latencies, wall, cpu):
+        self.tick = tick
+        self.miners = miners
+        self.ok = counts.get('ok', 0)
+        self.errors = counts.get('error', 0)
+        self.timeouts = counts.get('timeout', 0)
+        self.skipped = counts.get('skipped', 0)
+        latencies.sort()
+
+        def quantile(q):
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))] if latencies else 0.0
+
+        self.p50, self.p95, self.p99 = quantile(0.50), quantile(0.95), quantile(0.99)
+        self.max = latencies[-1] if latencies else 0.0
+        self.wall = wall
+        self.cpu = cpu
+
+    def line(self):
+        return (f"tick {self.tick}: {self.ok}/{self.miners} ok, {self.errors} errors, "
+                f"{self.timeouts} timeouts, {self.skipped} skipped | latency p50 {self.p50 * 1000:.0f} "
+                f"p95 {self.p95 * 1000:.0f} p99 {self.p99 * 1000:.0f} max {self.max * 1000:.0f} ms | "
+                f"tick {self.wall:.2f} s, CPU {self.cpu:.2f} s")
+
+
+class _Miner:
+    __slots__ = ('url', 'subnet', 'client', 'busy', 'rest')
+
+    def __init__(self, url, subnet, client):
+        self.url = url
+        self.subnet = subnet
+        self.client = client
+        self.busy = False
+        self.rest = False
+
+
+class FleetPoller:
+    """Polls every miner in an inventory once per interval
+
+    Iterate ``stream()`` for TelemetryResult records as they arrive; a
+    TickReport per finished tick is appended to ``reports`` and passed to
+    ``on_tick`` if given.
+    """
+
+    def __init__(self, inventory, interval=DEFAULT_INTERVAL, deadline=DEFAULT_DEADLINE,
+                 per_subnet=DEFAULT_PER_SUBNET, level=LEVELS, auth=None, on_tick=None):
+        if deadline > interval:
+            raise ValueError('deadline must not exceed the polling interval')
+        self.interval = interval
+        self.deadline = deadline
+        self.per_subnet = per_subnet
+        self.level = list(level)
+        self.on_tick = on_tick
+        self.reports = []
+        # The poller enforces the deadline; transports run without their own
+        self.miners = [_Miner(url, subnet, AsyncClient(url, auth=auth, timeout=None, max_connections=1))
+                       for url, subnet in inventory]
+        self._limits = {}
+
+    async def _poll(self, miner, tick, deadline_at, queue):
+        loop = asyncio.get_running_loop()
+        miner.busy = True
+        started = loop.time()
+        telemetry = error = None
+        queued = True
+        try:
+            async with asyncio.timeout_at(deadline_at):
+                async with self._limits[miner.subnet]:
+                    queued = False
+                    started = loop.time()
+                    telemetry = await miner.client.get_current_telemetry(level=self.level)
+            status = 'ok'
+        except TimeoutError:
+            if queued:
+                # The subnet stayed full all tick; the miner itself was never asked
+                status, error = 'skipped', f"no subnet slot within {self.deadline:g} s"
+            else:
+                status, error = 'timeout', f"no response within {self.deadline:g} s"
+                miner.rest = True
+        except (OSError, ApiError, ValueError, asyncio.IncompleteReadError) as e:
+            status, error = 'error', str(e) or type(e).__name__
+        except (AttributeError, KeyError, TypeError) as e:
+            # A 200 whose body is not TelemetryData; one miner's bad answer must not end the tick
+            status, error = 'error', f"malformed telemetry: {type(e).__name__}: {e}"
+        finally:
+            miner.busy = False
+        latency = loop.time() - started
+        queue.put_nowait(TelemetryResult(miner.url, tick, status, latency, telemetry, error))
+        return status, latency
+
+    async def _tick(self, tick, queue):
+        loop = asyncio.get_running_loop()
+        started, cpu = loop.time(), time.process_time()
+        deadline_at = started + self.deadline
+        polls = []
+        counts = {}
+        for miner in self.miners:
+            if miner.busy or miner.rest:
+                miner.rest = False
+                counts['skipped'] = counts.get('skipped', 0) + 1
+                queue.put_nowait(TelemetryResult(miner.url, tick, 'skipped', 0.0))
+                continue
+            polls.append(self._poll(miner, tick, deadline_at, queue))
+
+        latencies = []
+        for status, latency in await asyncio.gather(*polls):
+            counts[status] = counts.get(status, 0) + 1
+            if status == 'ok':
+                latencies.append(latency)
+        report = TickReport(tick, len(self.miners), counts, latencies,
+                            loop.time() - started, time.process_time() - cpu)
+        self.reports.append(report)
+        if self.on_tick is not None:
+            self.on_tick(report)
+
+    async def _schedule(self, queue, ticks):
+        loop = asyncio.get_running_loop()
+        for subnet in {miner.subnet for miner in self.miners}:
+            self._limits.setdefault(subnet, asyncio.Semaphore(self.per_subnet))
+        running = set()
+        tick = 0
+        next_at = loop.time()
+        try:
+            while ticks is None or tick < ticks:
+                task = asyncio.create_task(self._tick(tick, queue))
+                running.add(task)
+                task.add_done_callback(running.discard)
+                tick += 1
+                if ticks is not None and tick >= ticks:
+                    break
+                next_at += self.interval
+                # A late tick start is not made up for; the schedule moves on
+                while next_at < loop.time():
+                    next_at += self.interval
+                await asyncio.sleep(next_at - loop.time())
+            await asyncio.gather(*running)
+        finally:
+            queue.put_nowait(None)
+
+    async def stream(self, ticks=None):
+        """Yield TelemetryResult records, forever or for the given ticks"""
+        queue = asyncio.Queue()
+        scheduler = asyncio.create_task(self._schedule(queue, ticks))
+        try:
+            while True:
+                result = await queue.get()
+                if result is None:
+                    break
+                yield result
+            await scheduler
+        finally:
+            scheduler.cancel()
+            for miner in self.miners:
+                await miner.client.close()
+
+
+# -- simulated fleet -------------------------------------------------------
+
+def _simulated_body():
+    from spec_pipeline import load_spec
+
+    spec, _ = load_spec()
+    content = spec['paths']['/api/v1/telemetry']['get']['responses']['200']['content']['application/json']
+    examples = [entry['value'] for entry in content.get('examples', {}).values()]
+    return json.dumps(max(examples, key=lambda value: len(json.dumps(value))),
+                      separators=(',', ':')).encode('utf-8')
+
+
+def _serve_fleet(port, miners, slow, failing, ready, seed=7):
+    """One listener standing in for many miners at /m/<n>/api/v1/...
+
+    Each miner answers in 2-40 ms; the slow ones take 2-5x the deadline
+    and the failing ones return 500.
+    """
+    rng = random.Random(seed)
+    delays = [rng.uniform(0.002, 0.040) for _ in range(miners)]
+    for index in rng.sample(range(miners), slow):
+        delays[index] = None
+    broken = set(rng.sample(range(miners), failing))
+    body = _simulated_body()
+    ok = (b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: '
+          + str(len(body)).encode() + b'\r\n\r\n' + body)
+    error = b'{"error":{"code":"INTERNAL","message":"simulated failure"}}'
+    failed = (b'HTTP/1.1 500 Internal Server Error\r\nContent-Type: application/json\r\n'
+              b'Content-Length: ' + str(len(error)).encode() + b'\r\n\r\n' + error)
+    miner_path = re.compile(rb'^[A-Z]+ /m/(\d+)/')
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                index = int(miner_path.match(head).group(1))
+                delay = delays[index]
+                await asyncio.sleep(delay if delay is not None else rng.uniform(20, 50))
+                writer.write(failed if index in broken else ok)
+        except (asyncio.IncompleteReadError, ConnectionError, AttributeError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, '127.0.0.1', port, backlog=4096)
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def simulated_inventory(port, miners, group=250):
+    """Miners behind the simulated listener, grouped like /24 subnets"""
+    return [(f"http://127.0.0.1:{port}/m/{n}", f"sim-{n // group}") for n in range(miners)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('inventory', nargs='?', help='file with one miner (host, host:port or URL) per line')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help='seconds between ticks')
+    parser.add_argument('--deadline', type=float, default=DEFAULT_DEADLINE, help='per-request deadline in seconds')
+    parser.add_argument('--per-subnet', type=int, default=DEFAULT_PER_SUBNET,
+                        help='concurrent requests per subnet')
+    parser.add_argument('--prefix', type=int, default=SUBNET_PREFIX, help='subnet prefix length for grouping')
+    parser.add_argument('--ticks', type=int, help='stop after this many ticks (default: run forever)')
+    parser.add_argument('--token', help='JWT bearer token')
+    parser.add_argument('-o', '--output', help='append records as JSON lines here')
+    parser.add_argument('--simulate', type=int, metavar='MINERS',
+                        help='poll a local simulated fleet of this many miners')
+    parser.add_argument('--slow', type=float, default=0.01, help='share of simulated miners that never answer in time')
+    parser.add_argument('--failing', type=float, default=0.005, help='share of simulated miners returning 500')
+    args = parser.parse_args()
+
+    server = None
+    if args.simulate:
+        port = 18600
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(
+            target=_serve_fleet, daemon=True,
+            args=(port, args.simulate, int(args.simulate * args.slow), int(args.simulate * args.failing), ready))
+        server.start()
+        if not ready.wait(30):
+            raise RuntimeError('simulated fleet did not start')
+        inventory = simulated_inventory(port, args.simulate)
+        print(f"🛰️  Simulated fleet: {args.simulate} miners, {len({g for _, g in inventory})} subnets")
+    elif args.inventory:
+        inventory = load_inventory(args.inventory, args.prefix)
+    else:
+        parser.error('an inventory file or --simulate is required')
+
+    auth = BearerAuth(args.token) if args.token else None
+    poller = FleetPoller(inventory, args.interval, args.deadline, args.per_subnet, auth=auth,
+                         on_tick=lambda report: print(f"📊 {report.line()}", flush=True))
+    output = open(args.output, 'a', encoding='utf-8') if args.output else None
+
+    async def run():
+        async for result in poller.stream(args.ticks):
+            if output is not None:
+                output.write(json.dumps(result.to_dict(), separators=(',', ':'), ensure_ascii=False) + '\n')
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if output is not None:
+            output.close()
+        if server is not None:
+            server.terminate()
+            server.join()
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,660 @@
+#!/usr/bin/env python3
+"""
+Local append-only store for polled TelemetryData snapshots
+- One directory per miner, level (miner, hashboard, PSU, asic) and field,
+  named as in TimeSeriesRequest; each holds fixed-width float64 segments
+  with one row per snapshot: the timestamp, then one value per entity (NaN
+  when missing), with the entity list in the segment header
+- A new segment starts every UTC day and whenever the entities change
+- Reads memory-map the segments, so queries slice rows straight out of the
+  page cache without copying or parsing
+- Rollups to 5-minute and 1-hour buckets keep count, sum, min, max and last
+  per entity, enough for every TimeSeriesRequest aggregation (mean, min,
+  max, last, sum, count); run rollup() or start_rollups() for a background
+  thread
+- query() answers a TimeSeriesRequest with a TimeSeriesResponse, from the
+  coarsest rollup that fits the interval plus raw rows for the rest
+- Queries and rollups need NumPy (pip install numpy); ingest does not
+"""
+
+import argparse
+import json
+import math
+import mmap
+import os
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install numpy
+    np = None
+
+from timeseries_columnar import LEVELS, parse_duration
+from timeseries_planner import choose_interval, epoch, format_duration, isoformat, time_range
+
+STORE_PATH = Path('telemetry-store')
+MAGIC = b'PTS1'
+PREFIX = struct.Struct('<4sI')
+SEGMENT_SECONDS = 86400
+ROLLUP_TIERS = (300, 3600)
+# Open segment files kept for appending; older ones are closed first
+MAX_OPEN = 512
+NAN = float('nan')
+
+# TimeSeriesRequest field -> (TelemetryData property, key inside it), per level
+FIELDS = {
+    'miner': {'hashrate': ('hashrate', 'value'), 'temperature': ('temperature', 'value'),
+              'power': ('power', 'value'), 'efficiency': ('efficiency', 'value')},
+    'hashboard': {'hashrate': ('hashrate', 'value'), 'temperature': ('temperature', 'average'),
+                  'inletTemp': ('temperature', 'inlet'), 'outletTemp': ('temperature', 'outlet'),
+                  'power': ('power', 'value'), 'efficiency': ('efficiency', 'value')},
+    'asic': {'hashrate': ('hashrate', 'values'), 'temperature': ('temperature', 'values')},
+    'PSU': {'outputVoltage': ('voltage', 'output'), 'outputCurrent': ('current', 'output'),
+            'outputPower': ('power', 'output'), 'inputVoltage': ('voltage', 'input'),
+            'inputCurrent': ('current', 'input'), 'inputPower': ('power', 'input'),
+            'hotspotTemp': ('temperature', 'hotspot'), 'ambientTemp': ('temperature', 'ambient'),
+            'averageTemp': ('temperature', 'average')},
+}
+LEVEL_KEYS = {level: response_key for response_key, (level, _) in LEVELS.items()}
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError('telemetry_store queries and rollups need NumPy: pip install numpy')
+
+
+def _number(value):
+    return value if type(value) in (float, int) else NAN
+
+
+def extract(snapshot):
+    """(level, field, unit, entity keys, labels, values) for every series in a TelemetryData snapshot"""
+    miner = snapshot.get('miner')
+    if isinstance(miner, dict):
+        for field, (name, key) in FIELDS['miner'].items():
+            metric = miner.get(name)
+            if isinstance(metric, dict):
+                yield 'miner', field, metric.get('unit'), ((),), None, [_number(metric.get(key))]
+    for level, response_key in (('hashboard', 'hashboards'), ('PSU', 'PSUs')):
+        records = [record for record in snapshot.get(response_key) or () if isinstance(record, dict)]
+        if not records:
+            continue
+        keys = tuple((record.get('index'),) for record in records)
+        labels = [record.get('serial_number') for record in records]
+        for field, (name, key) in FIELDS[level].items():
+            metrics = [record.get(name) if isinstance(record.get(name), dict) else {} for record in records]
+            if any(metrics):
+                unit = next((metric['unit'] for metric in metrics if metric.get('unit')), None)
+                yield level, field, unit, keys, labels, [_number(metric.get(key)) for metric in metrics]
+    boards = [board for board in snapshot.get('hashboards') or () if isinstance(board, dict)]
+    for field, (name, _) in FIELDS['asic'].items():
+        keys, values, unit = [], [], None
+        for board in boards:
+            metric = (board.get('asics') or {}).get(name)
+            if not isinstance(metric, dict) or not isinstance(metric.get('values'), list):
+                continue
+            unit = unit or metric.get('unit')
+            keys += [(board.get('index'), asic) for asic in range(len(metric['values']))]
+            values += map(_number, metric['values'])
+        if keys:
+            yield 'asic', field, unit, tuple(keys), None, values
+
+
+class Segment:
+    """One fixed-width float64 file: a JSON header, then rows of width values"""
+
+    __slots__ = ('path', 'meta', 'width', 'offset')
+
+    def __init__(self, path, meta, offset):
+        self.path = Path(path)
+        self.meta = meta
+        self.offset = offset
+        entities = len(meta['entities'])
+        self.width = 1 + entities * (5 if meta.get('tier') else 1)
+
+    @classmethod
+    def create(cls, path, meta):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = json.dumps(meta, separators=(',', ':')).encode('utf-8')
+        header += b' ' * (-(PREFIX.size + len(header)) % 8)
+        with open(path, 'xb') as f:
+            f.write(PREFIX.pack(MAGIC, len(header)) + header)
+        return cls(path, meta, PREFIX.size + len(header))
+
+    @classmethod
+    def open(cls, path):
+        with open(path, 'rb') as f:
+            magic, length = PREFIX.unpack(f.read(PREFIX.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a telemetry segment")
+            meta = json.loads(f.read(length))
+        return cls(path, meta, PREFIX.size + length)
+
+    @property
+    def start(self):
+        return self.meta['start']
+
+    def rows(self):
+        """Complete rows on disk (a row still being written is not counted)"""
+        return max(0, os.path.getsize(self.path) - self.offset) // (8 * self.width)
+
+    def array(self):
+        """(rows, width) float64 view of the memory-mapped file"""
+        rows = self.rows()
+        if not rows:
+            return np.empty((0, self.width))
+        with open(self.path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return np.frombuffer(mapped, dtype='<f8', count=rows * self.width, offset=self.offset).reshape(rows,
+                                                                                                     self.width)
+
+    def last_time(self):
+        rows = self.rows()
+        if not rows:
+            return None
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset + (rows - 1) * self.width * 8)
+            return struct.unpack('<d', f.read(8))[0]
+
+
+class _Stream:
+    """Append state of one miner/level/field directory"""
+
+    __slots__ = ('directory', 'segment', 'file', 'entities', 'last', 'ends')
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.segment = None
+        self.file = None
+        self.entities = None
+        self.last = None
+        self.ends = None
+
+
+def _slug(miner):
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', miner).strip('_') or '_'
+
+
+def _raw_stats(values):
+    """count, sum, min, max, last arrays for raw rows (NaN = missing)"""
+    present = ~np.isnan(values)
+    return (present.astype(np.float64), np.where(present, values, 0.0), np.where(present, values, np.inf),
+            np.where(present, values, -np.inf), values)
+
+
+def _rollup_stats(rows, entities):
+    return tuple(rows[:, 1 + entities * index:1 + entities * (index + 1)] for index in range(5))
+
+
+def reduce_buckets(times, stats, step):
+    """(bucket start times, count, sum, min, max, last) over step-second buckets of time-ordered rows"""
+    buckets = np.floor(times / step)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    count, total, low, high, last = stats
+    reduced = (np.add.reduceat(count, starts, axis=0), np.add.reduceat(total, starts, axis=0),
+               np.minimum.reduceat(low, starts, axis=0), np.maximum.reduceat(high, starts, axis=0))
+    # last: the latest row with data inside each bucket
+    rows = np.where(count > 0, np.arange(len(times))[:, None], -1)
+    latest = np.maximum.accumulate(rows, axis=0)[np.r_[starts[1:], len(times)] - 1]
+    picked = last[np.clip(latest, 0, None), np.arange(last.shape[1])]
+    return (buckets[starts] * step, *reduced, np.where(latest >= starts[:, None], picked, np.nan))
+
+
+class TelemetryStore:
+    """Append-only TelemetryData history for many miners under one directory"""
+
+    def __init__(self, path=STORE_PATH, tiers=ROLLUP_TIERS, segment_seconds=SEGMENT_SECONDS):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.tiers = tuple(sorted(tiers))
+        self.segment_seconds = segment_seconds
+        self.snapshots = 0
+        self.rows = 0
+        self.dropped = 0
+        self._streams = OrderedDict()
+        self._headers = {}
+        self._miners = {}
+        self._lock = threading.RLock()
+        self._stop = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -- ingest ------------------------------------------------------------
+
+    def _miner_directory(self, miner):
+        directory = self._miners.get(miner)
+        if directory is None:
+            directory = self.path / _slug(miner)
+            marker = directory / 'miner.json'
+            if marker.exists():
+                known = json.loads(marker.read_text(encoding='utf-8'))['miner']
+                if known != miner:
+                    raise ValueError(f"Miners '{known}' and '{miner}' map to the same directory")
+            else:
+                directory.mkdir(parents=True, exist_ok=True)
+                marker.write_text(json.dumps({'miner': miner}), encoding='utf-8')
+            self._miners[miner] = directory
+        return directory
+
+    def _stream(self, miner, level, field):
+        key = (miner, level, field)
+        stream = self._streams.get(key)
+        if stream is not None:
+            self._streams.move_to_end(key)
+            return stream
+        stream = self._streams[key] = _Stream(self._miner_directory(miner) / level / field)
+        segments = self._segments(stream.directory)
+        if segments:
+            # Resume the newest segment, dropping a row cut short by a crash
+            segment = segments[-1]
+            os.truncate(segment.path, segment.offset + segment.rows() * segment.width * 8)
+            stream.segment = segment
+            stream.entities = tuple(map(tuple, segment.meta['entities']))
+            stream.last = segment.last_time()
+            stream.ends = (segment.start // self.segment_seconds + 1) * self.segment_seconds
+            stream.file = open(segment.path, 'ab')
+        while len(self._streams) > MAX_OPEN:
+            _, old = self._streams.popitem(last=False)
+            if old.file is not None:
+                old.file.close()
+        return stream
+
+    def _roll(self, stream, moment, level, field, unit, entities, labels):
+        if stream.file is not None:
+            stream.file.close()
+        meta = {'level': level, 'field': field, 'unit': unit, 'entities': entities, 'labels': labels,
+                'start': moment, 'tier': 0}
+        stream.segment = Segment.create(stream.directory / f"{moment:.3f}.seg", meta)
+        stream.entities = entities
+        stream.ends = (moment // self.segment_seconds + 1) * self.segment_seconds
+        stream.file = open(stream.segment.path, 'ab')
+
+    def append(self, miner, snapshot, timestamp=None):
+        """Store one TelemetryData snapshot; returns the rows written
+
+        Snapshots must arrive in time order per miner; older or repeated
+        timestamps are counted in dropped and skipped.
+        """
+        if timestamp is None:
+            timestamp = epoch(snapshot['timestamp']) if snapshot.get('timestamp') else time.time()
+        written = 0
+        stale = False
+        with self._lock:
+            for level, field, unit, entities, labels, values in extract(snapshot):
+                stream = self._stream(miner, level, field)
+                if stream.last is not None and timestamp <= stream.last:
+                    stale = True
+                    continue
+                if stream.segment is None or entities != stream.entities or timestamp >= stream.ends:
+                    self._roll(stream, timestamp, level, field, unit, entities, labels)
+                stream.file.write(array('d', [timestamp, *values]).tobytes())
+                stream.last = timestamp
+                written += 1
+            self.snapshots += 1
+            self.dropped += stale
+            self.rows += written
+        return written
+
+    def flush(self):
+        with self._lock:
+            for stream in self._streams.values():
+                if stream.file is not None:
+                    stream.file.flush()
+
+    def close(self):
+        self.stop_rollups()
+        with self._lock:
+            for stream in self._streams.values():
+                if stream.file is not None:
+                    stream.file.close()
+            self._streams.clear()
+
+    # -- reading -----------------------------------------------------------
+
+    def _open(self, path):
+        """Segment for path; headers never change, so each is parsed once"""
+        segment = self._headers.get(path)
+        if segment is None:
+            segment = self._headers[path] = Segment.open(path)
+        return segment
+
+    def _segments(self, directory):
+        if not directory.is_dir():
+            return []
+        paths = sorted(directory.glob('*.seg'), key=lambda path: float(path.stem))
+        return [self._open(path) for path in paths]
+
+    def miners(self):
+        return sorted(json.loads(marker.read_text(encoding='utf-8'))['miner']
+                      for marker in self.path.glob('*/miner.json'))
+
+    def segments(self, miner, level, field):
+        return self._segments(self.path / _slug(miner) / level / field)
+
+    def _gather(self, miner, level, field, start, end, tier):
+        """(entity keys, labels, unit, times, stats) of rows in [start, end), rollup rows first where usable"""
+        segments = self.segments(miner, level, field)
+        chosen = [segment for index, segment in enumerate(segments)
+                  if segment.start < end and (index + 1 == len(segments) or segments[index + 1].start > start)]
+        keys, labels, unit = {}, {}, None
+        for segment in chosen:
+            unit = unit or segment.meta.get('unit')
+            for position, key in enumerate(map(tuple, segment.meta['entities'])):
+                keys.setdefault(key, len(keys))
+                if segment.meta.get('labels'):
+                    labels[key] = segment.meta['labels'][position]
+        width = len(keys)
+        times, parts = [], []
+
+        def add(part_times, stats, entities):
+            if not len(part_times):
+                return
+            columns = [keys[tuple(key)] for key in entities]
+            if columns != list(range(width)):
+                neutral = (0.0, 0.0, np.inf, -np.inf, np.nan)
+                expanded = []
+                for values, fill in zip(stats, neutral):
+                    full = np.full((len(part_times), width), fill)
+                    full[:, columns] = values
+                    expanded.append(full)
+                stats = tuple(expanded)
+            times.append(part_times)
+            parts.append(stats)
+
+        for segment in chosen:
+            raw = segment.array()
+            entities = segment.meta['entities']
+            rolled_until = start
+            if tier:
+                target = segment.path.parent / f"rollup-{tier}" / segment.path.name
+                if target.exists():
+                    rollup = self._open(target).array()
+                    if len(rollup):
+                        rolled_until = min(rollup[-1, 0] + tier, end // tier * tier)
+                        rows = rollup[(rollup[:, 0] >= start) & (rollup[:, 0] < rolled_until)]
+                        add(rows[:, 0], _rollup_stats(rows, len(entities)), entities)
+            rows = raw[(raw[:, 0] >= max(start, rolled_until)) & (raw[:, 0] < end)]
+            add(rows[:, 0], _raw_stats(rows[:, 1:]), entities)
+        if not times:
+            return list(keys), labels, unit, np.empty(0), tuple(np.empty((0, width)) for _ in range(5))
+        return (list(keys), labels, unit, np.concatenate(times),
+                tuple(np.concatenate([part[index] for part in parts]) for index in range(5)))
+
+    def query(self, miner, request, now=None):
+        """A TimeSeriesResponse for a TimeSeriesRequest, from the store alone
+
+        start_time is rounded down to the interval, as bucket boundaries are
+        multiples of the interval from the Unix epoch.
+        """
+        _require_numpy()
+        self.flush()
+        start, end = time_range(request, now)
+        interval = parse_duration(request['interval']) if request.get('interval') else choose_interval(end - start)
+        aggregation = request.get('aggregation') or 'mean'
+        first = math.floor(start / interval)
+        length = math.ceil(end / interval) - first
+        # The coarsest rollup whose buckets nest inside the interval's
+        tier = max((tier for tier in self.tiers if interval % tier == 0), default=0)
+
+        data = {}
+        for level in request['levels']:
+            kind, indexes = level['type'], level.get('indexes')
+            entities = {}
+            for field in level['fields']:
+                if field not in FIELDS[kind]:
+                    raise ValueError(f"Unknown {kind} field '{field}'")
+                keys, labels, unit, times, stats = self._gather(miner, kind, field, first * interval, end, tier)
+                if indexes is not None:
+                    wanted = set(indexes)
+                    columns = [column for column, key in enumerate(keys) if key[-1] in wanted]
+                    keys = [keys[column] for column in columns]
+                    stats = tuple(values[:, columns] for values in stats)
+                grid = [np.zeros((length, len(keys))), np.zeros((length, len(keys))),
+                        np.full((length, len(keys)), np.inf), np.full((length, len(keys)), -np.inf),
+                        np.full((length, len(keys)), np.nan)]
+                if len(times):
+                    bucket_times, *reduced = reduce_buckets(times, stats, interval)
+                    slots = (bucket_times / interval).astype(np.int64) - first
+                    for target, values in zip(grid, reduced):
+                        target[slots] = values
+                count, total, low, high, last = grid
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    values = {'mean': total / count, 'avg': total / count, 'min': low, 'max': high, 'last': last,
+                              'sum': np.where(count > 0, total, np.nan), 'count': count}[aggregation]
+                    values = np.where(np.isinf(values), np.nan, values)
+                    totals = count.sum(axis=0)
+                    means = total.sum(axis=0) / totals
+                lows, highs = low.min(axis=0, initial=np.inf), high.max(axis=0, initial=-np.inf)
+                columns = values.T.tolist()
+                for column, key in enumerate(keys):
+                    record = entities.get(key)
+                    if record is None:
+                        record = entities[key] = self._record(kind, key, labels.get(key))
+                    metric = {'unit': unit, 'values': [None if value != value else value
+                                                       for value in columns[column]]}
+                    if totals[column]:
+                        metric['aggregates'] = {'min': float(lows[column]), 'avg': float(means[column]),
+                                                'max': float(highs[column])}
+                    record[field] = metric
+            response_key = LEVEL_KEYS[kind]
+            records = [entities[key] for key in sorted(entities, key=lambda key: tuple(map(str, key))
+                                                       if None in key else key)]
+            data[response_key] = (records[0] if records else {}) if kind == 'miner' else records
+        meta = {'start_time': isoformat(first * interval), 'end_time': isoformat(end),
+                'interval': format_duration(interval), 'levels': request['levels'], 'aggregation': aggregation}
+        return {'meta': meta, 'data': data}
+
+    @staticmethod
+    def _record(kind, key, label):
+        if kind == 'miner':
+            return {}
+        if kind == 'asic':
+            return {'index': key[1], 'hashboard_index': key[0]}
+        record = {'index': key[0]}
+        if label is not None:
+            record['serial_number'] = label
+        return record
+
+    # -- rollups -----------------------------------------------------------
+
+    def _rollup_segment(self, segment, tier, sealed):
+        target = segment.path.parent / f"rollup-{tier}" / segment.path.name
+        rolled = self._open(target) if target.exists() else Segment.create(target, {**segment.meta, 'tier': tier})
+        raw = segment.array()
+        if not len(raw):
+            return 0
+        times = raw[:, 0]
+        done = rolled.last_time()
+        since = -np.inf if done is None else done + tier
+        # A bucket is closed once a later row exists, or the segment is sealed
+        until = np.inf if sealed else times[-1] // tier * tier
+        lo, hi = np.searchsorted(times, since), np.searchsorted(times, until)
+        if hi <= lo:
+            return 0
+        bucket_times, *stats = reduce_buckets(times[lo:hi], _raw_stats(raw[lo:hi, 1:]), tier)
+        rows = np.column_stack([bucket_times, *stats])
+        with open(target, 'ab') as f:
+            f.write(rows.astype('<f8').tobytes())
+        return len(rows)
+
+    def rollup(self):
+        """Roll every closed bucket not rolled up yet; returns the rollup rows written"""
+        _require_numpy()
+        self.flush()
+        written = 0
+        for directory in sorted({path.parent for path in self.path.glob('*/*/*/*.seg')}):
+            segments = self._segments(directory)
+            for index, segment in enumerate(segments):
+                for tier in self.tiers:
+                    written += self._rollup_segment(segment, tier, sealed=index + 1 < len(segments))
+        return written
+
+    def start_rollups(self, every=60.0):
+        """Run rollup() every `every` seconds in a daemon thread until stop_rollups()"""
+        if self._stop is not None:
+            return
+        self._stop = threading.Event()
+
+        def loop(stop):
+            while not stop.wait(every):
+                self.rollup()
+
+        threading.Thread(target=loop, args=(self._stop,), name='telemetry-rollups', daemon=True).start()
+
+    def stop_rollups(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def size(self):
+        return sum(path.stat().st_size for path in self.path.rglob('*.seg'))
+
+
+# -- benchmark -------------------------------------------------------------
+
+def benchmark(days=7, poll=60, miners=1, repeat=20):
+    """Ingest throughput, rollup time and query throughput on synthetic snapshots"""
+    from timeseries_stream import synthetic_telemetry
+
+    _require_numpy()
+    variants = [json.loads(synthetic_telemetry(seed=seed)) for seed in range(8)]
+    ticks = int(days * 86400 // poll)
+    origin = epoch('2024-01-01T00:00:00Z')
+    directory = tempfile.mkdtemp(prefix='telemetry-store-')
+    results = {'snapshots': ticks * miners, 'days': days, 'poll': poll}
+    try:
+        with TelemetryStore(directory) as store:
+            start = time.perf_counter()
+            for tick in range(ticks):
+                for miner in range(miners):
+                    store.append(f"miner-{miner}", variants[(tick + miner) % len(variants)], origin + tick * poll)
+            store.flush()
+            elapsed = time.perf_counter() - start
+            results['ingest_per_s'] = ticks * miners / elapsed
+            results['rows_per_s'] = store.rows / elapsed
+            results['disk_bytes'] = store.size()
+
+            start = time.perf_counter()
+            results['rollup_rows'] = store.rollup()
+            results['rollup_s'] = time.perf_counter() - start
+
+            end = origin + ticks * poll
+            queries = {
+                'miner+hashboard PT6H @PT5M': {'start_time': isoformat(end - 6 * 3600), 'end_time': isoformat(end),
+                                               'interval': 'PT5M',
+                                               'levels': [{'type': 'miner', 'fields': ['hashrate', 'power']},
+                                                          {'type': 'hashboard', 'fields': ['hashrate']}]},
+                'ASIC PT24H @PT5M': {'start_time': isoformat(end - 86400), 'end_time': isoformat(end),
+                                     'interval': 'PT5M',
+                                     'levels': [{'type': 'asic', 'fields': ['hashrate', 'temperature']}]},
+                f'ASIC {days:g} days @PT1H': {'start_time': isoformat(origin), 'end_time': isoformat(end),
+                                              'interval': 'PT1H',
+                                              'levels': [{'type': 'asic', 'fields': ['hashrate']}]},
+            }
+            raw = TelemetryStore(directory, tiers=())
+            results['queries'] = []
+            for label, request in queries.items():
+                for aggregation in ('mean', 'min', 'max', 'last', 'sum', 'count'):
+                    rolled_up = store.query('miner-0', {**request, 'aggregation': aggregation})
+                    if not _close(rolled_up['data'], raw.query('miner-0', {**request, 'aggregation': aggregation})['data']):
+                        raise AssertionError(f"{label} {aggregation}: rollups and raw rows disagree")
+                row = {'query': label}
+                for mode, source in (('rollup', store), ('raw', raw)):
+                    start = time.perf_counter()
+                    for _ in range(repeat):
+                        source.query('miner-0', request)
+                    row[mode] = repeat / (time.perf_counter() - start)
+                results['queries'].append(row)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+
+def _close(a, b):
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_close(a[key], b[key]) for key in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_close(x, y) for x, y in zip(a, b))
+    if isinstance(a, float) and isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+    return a == b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--store', default=str(STORE_PATH), help='store directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help='append telemetry_poller JSON lines')
+    ingest.add_argument('records', nargs='+', help='telemetry_poller -o output files')
+    commands.add_parser('rollup', help='roll up closed buckets')
+    query = commands.add_parser('query', help='answer a TimeSeriesRequest from the store')
+    query.add_argument('miner', help='miner URL as recorded by the poller')
+    query.add_argument('request', help='TimeSeriesRequest as a JSON file or inline JSON')
+    query.add_argument('-o', '--output', help='write the TimeSeriesResponse here')
+    commands.add_parser('miners', help='list stored miners')
+    bench = commands.add_parser('benchmark', help='ingest and query throughput on synthetic snapshots')
+    bench.add_argument('--days', type=float, default=7, help='days of history to ingest')
+    bench.add_argument('--poll', type=float, default=60, help='seconds between snapshots')
+    args = parser.parse_args()
+
+    if args.command == 'benchmark':
+        result = benchmark(args.days, args.poll)
+        print(f"📊 {result['snapshots']:,} snapshots ({result['days']:g} days every {result['poll']:g} s, "
+              f"3 hashboards x 126 ASICs)")
+        print(f"   - ingest   {result['ingest_per_s']:10,.0f} snapshots/s ({result['rows_per_s']:,.0f} rows/s), "
+              f"{result['disk_bytes'] / 1e6:.1f} MB on disk")
+        print(f"   - rollup   {result['rollup_rows']:10,} rows in {result['rollup_s']:.2f} s")
+        for row in result['queries']:
+            print(f"   - {row['query']:<28} {row['rollup']:8,.1f} queries/s from rollups, {row['raw']:8,.1f} from raw rows")
+        print("✅ Rollup and raw answers agree for every aggregation")
+        return True
+
+    with TelemetryStore(args.store) as store:
+        if args.command == 'ingest':
+            for path in args.records:
+                with open(path, encoding='utf-8') as f:
+                    for line in f:
+                        record = json.loads(line) if line.strip() else None
+                        if record and record.get('telemetry'):
+                            store.append(record['miner'], record['telemetry'])
+            print(f"✅ {store.snapshots:,} snapshots, {store.rows:,} rows ({store.dropped} out of order)")
+        elif args.command == 'rollup':
+            print(f"✅ {store.rollup():,} rollup rows written")
+        elif args.command == 'miners':
+            for miner in store.miners():
+                print(miner)
+        elif args.command == 'query':
+            request = json.loads(args.request) if args.request.lstrip().startswith('{') else \
+                json.loads(Path(args.request).read_text(encoding='utf-8'))
+            response = store.query(args.miner, request)
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    json.dump(response, f, separators=(',', ':'))
+                print(f"✅ Wrote {args.output}")
+            else:
+                print(json.dumps(response))
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
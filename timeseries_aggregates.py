@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Vectorized aggregates over decoded POST /api/v1/timeseries responses
+- Every aggregation in TimeSeriesRequest.aggregation (mean, avg, min, max,
+  last, sum, count) for every entity and metric of a level in one pass,
+  either over the whole series (as TimeSeriesAggregates) or per interval
+- Nulls are skipped: a bucket with no values is null for every aggregation
+  except count, which is 0
+- Interval buckets start on multiples of the interval, as the API's do
+- Takes the LevelFrame arrays from timeseries_columnar; cross-checks the
+  min/avg/max a miner reported against the values it sent
+- Requires NumPy (pip install numpy)
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install numpy
+    np = None
+
+from timeseries_columnar import LevelFrame, decode_timeseries, parse_duration
+
+AGGREGATIONS = ('mean', 'avg', 'min', 'max', 'last', 'sum', 'count')
+STATS = ('count', 'sum', 'min', 'max', 'last')
+REPORTED = ('min', 'avg', 'max')  # LevelFrame.aggregates columns
+
+# Series reduced per batch: bounds the padded copy and masks to a few MB
+CHUNK = 4096
+
+# (name, values, width, offset, expected) with the API's null handling;
+# width None is the whole series
+CASES = (
+    ('nulls skipped', [1.0, None, 3.0], None, 0,
+     {'mean': [2.0], 'min': [1.0], 'max': [3.0], 'last': [3.0], 'sum': [4.0], 'count': [2]}),
+    ('trailing null', [1.0, 2.0, None], None, 0,
+     {'mean': [1.5], 'min': [1.0], 'max': [2.0], 'last': [2.0], 'sum': [3.0], 'count': [2]}),
+    ('all null', [None, None, None], None, 0,
+     {'mean': [None], 'min': [None], 'max': [None], 'last': [None], 'sum': [None], 'count': [0]}),
+    ('single value', [42.5], None, 0,
+     {'mean': [42.5], 'min': [42.5], 'max': [42.5], 'last': [42.5], 'sum': [42.5], 'count': [1]}),
+    ('negatives and zero', [-1.0, -5.0, None, 0.0], None, 0,
+     {'mean': [-2.0], 'min': [-5.0], 'max': [0.0], 'last': [0.0], 'sum': [-6.0], 'count': [3]}),
+    ('per interval', [1.0, 2.0, None, 4.0, None, None], 2, 0,
+     {'mean': [1.5, 4.0, None], 'min': [1.0, 4.0, None], 'max': [2.0, 4.0, None],
+      'last': [2.0, 4.0, None], 'sum': [3.0, 4.0, None], 'count': [2, 1, 0]}),
+    ('partial first and last bucket', [5.0, 6.0, 7.0, 8.0], 3, 1,
+     {'mean': [5.5, 7.5], 'min': [5.0, 7.0], 'max': [6.0, 8.0], 'last': [6.0, 8.0], 'sum': [11.0, 15.0],
+      'count': [2, 2]}),
+)
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError('timeseries_aggregates needs NumPy: pip install numpy')
+
+
+def reduce_series(values, width=None, offset=0, chunk=CHUNK):
+    """count, sum, min, max and last over buckets of width points along the last axis
+
+    values  float64 (..., time), NaN where null
+    width   points per bucket; None for one bucket over the whole series
+    offset  points of bucket 0 that lie before values[..., 0]
+    Returns a float64 (5, ..., buckets) array in STATS order.
+    """
+    _require_numpy()
+    values = np.asarray(values, dtype=np.float64)
+    length = values.shape[-1]
+    width = width or max(length, 1)
+    buckets = max(-(-(offset + length) // width), 1)
+    rows = values.reshape(-1, length)
+    out = np.empty((len(STATS), len(rows), buckets))
+    padded = buckets * width != length
+    for begin in range(0, len(rows), chunk):
+        block = rows[begin:begin + chunk]
+        if padded:
+            grid = np.full((len(block), buckets * width), np.nan)
+            grid[:, offset:offset + length] = block
+            block = grid
+        cube = block.reshape(len(block), buckets, width)
+        present = ~np.isnan(cube)
+        count = present.sum(axis=-1)
+        target = out[:, begin:begin + len(block)]
+        target[0] = count
+        target[1] = np.where(count > 0, np.where(present, cube, 0.0).sum(axis=-1), np.nan)
+        # fmin/fmax skip NaN and give NaN only when every value is NaN
+        target[2] = np.fmin.reduce(cube, axis=-1)
+        target[3] = np.fmax.reduce(cube, axis=-1)
+        # last: the latest present point; an empty bucket picks a NaN anyway
+        latest = width - 1 - present[..., ::-1].argmax(axis=-1)
+        target[4] = np.take_along_axis(cube, latest[..., None], axis=-1)[..., 0]
+    return out.reshape((len(STATS),) + values.shape[:-1] + (buckets,))
+
+
+def finish(stats, aggregation):
+    """One aggregation from reduce_series output (NaN where the bucket is empty)"""
+    count, total, low, high, last = stats
+    if aggregation in ('mean', 'avg'):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return total / count
+    try:
+        return {'min': low, 'max': high, 'last': last, 'sum': total, 'count': count}[aggregation]
+    except KeyError:
+        raise ValueError(f"Unknown aggregation '{aggregation}'") from None
+
+
+class Aggregates:
+    """Every aggregation of one level, as (entity, metric, bucket) arrays"""
+
+    __slots__ = ('frame', 'timestamps', 'interval', 'stats')
+
+    def __init__(self, frame, timestamps, interval, stats):
+        self.frame = frame
+        self.timestamps = timestamps
+        self.interval = interval
+        self.stats = stats
+
+    def __getitem__(self, aggregation):
+        return finish(self.stats, aggregation)
+
+    def series(self, aggregation, metric, key=()):
+        """(bucket,) array of one aggregation for one entity and metric"""
+        return self[aggregation][self.frame.row(key), self.frame.metrics.index(metric)]
+
+    def to_dict(self, aggregation):
+        """{key: {metric: [value or None, ...]}} for one aggregation"""
+        values = self[aggregation]
+        result = {}
+        for row, key in enumerate(self.frame.keys):
+            result[key] = {metric: [None if math.isnan(v) else v for v in values[row, column].tolist()]
+                           for column, metric in enumerate(self.frame.metrics)}
+        return result
+
+
+def _step(timestamps):
+    if timestamps is None or len(timestamps) < 2:
+        raise ValueError('Per-interval aggregates need the response timestamps (meta.start_time and interval)')
+    return int((timestamps[1] - timestamps[0]) / np.timedelta64(1, 's'))
+
+
+def aggregate_frame(frame, timestamps=None, interval=None):
+    """Aggregates for a LevelFrame over the whole series, or per interval (seconds or ISO 8601)"""
+    _require_numpy()
+    if interval is None:
+        return Aggregates(frame, None, None, reduce_series(frame.values))
+    seconds = int(parse_duration(interval) if isinstance(interval, str) else interval)
+    step = _step(timestamps)
+    if seconds <= 0 or seconds % step:
+        raise ValueError(f"Interval of {seconds}s is not a multiple of the {step}s response interval")
+    start = int(timestamps[0].astype('datetime64[s]').astype(np.int64))
+    offset = (start % seconds) // step
+    stats = reduce_series(frame.values, seconds // step, offset)
+    first = np.datetime64(start - start % seconds, 's')
+    starts = first + np.arange(stats.shape[-1]) * np.timedelta64(seconds, 's')
+    return Aggregates(frame, starts, seconds, stats)
+
+
+def aggregate(series, interval=None):
+    """{level: Aggregates} for every level of a ColumnarTimeSeries"""
+    return {level: aggregate_frame(frame, series.timestamps, interval) for level, frame in series.levels.items()}
+
+
+def check_aggregates(frame, tolerance=1e-3):
+    """(key, metric, field, reported, computed) wherever reported min/avg/max disagree with the values"""
+    _require_numpy()
+    count, total, low, high, _ = reduce_series(frame.values)[..., 0]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        computed = np.stack((low, total / count, high), axis=-1)
+    reported = frame.aggregates
+    close = np.isclose(reported, computed, rtol=1e-9, atol=tolerance)
+    wrong = ~np.isnan(reported) & ~close
+    return [(frame.keys[e], frame.metrics[m], REPORTED[a], float(reported[e, m, a]), float(computed[e, m, a]))
+            for e, m, a in zip(*np.nonzero(wrong))]
+
+
+def reference(values, width=None, offset=0):
+    """{aggregation: [value or None per bucket]} for one list of floats and None, in plain Python"""
+    width = width or max(len(values), 1)
+    padded = [None] * offset + list(values)
+    result = {name: [] for name in AGGREGATIONS}
+    for begin in range(0, max(len(padded), 1), width):
+        present = [v for v in padded[begin:begin + width] if v is not None]
+        total = sum(present) if present else None
+        mean = total / len(present) if present else None
+        for name, value in (('mean', mean), ('avg', mean), ('min', min(present, default=None)),
+                            ('max', max(present, default=None)), ('last', present[-1] if present else None),
+                            ('sum', total), ('count', len(present))):
+            result[name].append(value)
+    return result
+
+
+def _same(expected, actual):
+    if len(expected) != len(actual):
+        return False
+    for want, got in zip(expected, actual):
+        if want is None or (isinstance(want, float) and math.isnan(want)):
+            if not math.isnan(got):
+                return False
+        elif not math.isclose(want, got, rel_tol=1e-12, abs_tol=1e-12):
+            return False
+    return True
+
+
+def _spec_examples(node, found):
+    if isinstance(node, dict):
+        schema = node.get('properties', {}).get('values', {})
+        if 'aggregates' in node.get('properties', {}) and isinstance(schema.get('example'), list):
+            found.append(schema['example'])
+        for value in node.values():
+            _spec_examples(value, found)
+    elif isinstance(node, list):
+        for value in node:
+            _spec_examples(value, found)
+    return found
+
+
+def conformance(spec_path='spec.json'):
+    """Check the vectorized aggregates against CASES and the spec's values examples; returns checks run"""
+    _require_numpy()
+    cases = list(CASES)
+    path = Path(spec_path)
+    if path.exists():
+        for values in _spec_examples(json.loads(path.read_text(encoding='utf-8')), []):
+            cases.append((f"spec example {values}", values, None, 0, reference(values)))
+    checks = 0
+    for name, values, width, offset, expected in cases:
+        stats = reduce_series(np.array([math.nan if v is None else v for v in values]), width, offset)
+        for aggregation in AGGREGATIONS:
+            want = expected.get('mean' if aggregation == 'avg' else aggregation)
+            for label, result in (('vectorized', finish(stats, aggregation).tolist()),
+                                  ('reference', reference(values, width, offset)[aggregation])):
+                result = [math.nan if v is None else v for v in result]
+                if not _same(want, result):
+                    raise AssertionError(f"{name}: {label} {aggregation} gave {result}, expected {want}")
+                checks += 1
+    return checks
+
+
+def synthetic_frame(series=100_000, points=288, metrics=('hashrate', 'temperature'), null_rate=0.02,
+                    asics=126, seed=11):
+    """An ASIC LevelFrame with series // len(metrics) ASICs and null_rate NaN values"""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    entities = max(series // len(metrics), 1)
+    values = rng.normal(1.0, 0.02, (entities, len(metrics), points))
+    values[rng.random(values.shape) < null_rate] = np.nan
+    keys = [(entity // asics, entity % asics) for entity in range(entities)]
+    aggregates = np.full((entities, len(metrics), len(REPORTED)), np.nan)
+    return LevelFrame('asic', tuple(metrics), {}, values, aggregates, keys, [None] * entities)
+
+
+def benchmark(series=100_000, points=288, step=300, interval=3600, sample=1000, repeat=3):
+    """Series per second whole-series and per interval, against the plain Python loops on a sample"""
+    _require_numpy()
+    frame = synthetic_frame(series, points)
+    timestamps = np.datetime64('2024-01-15T00:00:00', 's') + np.arange(points) * np.timedelta64(step, 's')
+    total = frame.values.shape[0] * frame.values.shape[1]
+    result = {'series': total, 'points': points, 'values': frame.values.size}
+
+    for label, width, span in (('whole', None, None), ('interval', interval // step, interval)):
+        times = []
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            aggregates = aggregate_frame(frame, timestamps, span)
+            every = [aggregates[name] for name in AGGREGATIONS]
+            times.append(time.perf_counter() - begin)
+        rows = frame.values.reshape(total, points)
+        picks = random.Random(3).sample(range(total), min(sample, total))
+        plain = [[None if v != v else v for v in rows[row].tolist()] for row in picks]
+        begin = time.perf_counter()
+        expected = [reference(values, width) for values in plain]
+        python = (time.perf_counter() - begin) / len(picks) * total
+        for row, want in zip(picks, expected):
+            for name, values in zip(AGGREGATIONS, every):
+                got = values.reshape(total, -1)[row].tolist()
+                if not _same([math.nan if v is None else v for v in want[name]], got):
+                    raise AssertionError(f"{label} {name} differs from the reference for series {row}")
+        result[label] = {'seconds': min(times), 'python': python, 'buckets': every[0].shape[-1]}
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('response', nargs='?', help='TimeSeriesResponse JSON file to aggregate')
+    parser.add_argument('--interval', help='ISO 8601 bucket width (default: the whole series)')
+    parser.add_argument('--aggregation', choices=AGGREGATIONS, help='print this aggregation per entity')
+    parser.add_argument('--conformance', action='store_true',
+                        help="check null handling and the spec's examples against a plain Python reference")
+    parser.add_argument('--spec', default='spec.json', help='spec for --conformance examples')
+    parser.add_argument('--benchmark', action='store_true', help='throughput on synthetic ASIC series')
+    parser.add_argument('--series', type=int, default=100_000, help='synthetic ASIC series for --benchmark')
+    parser.add_argument('--points', type=int, default=288, help='points per synthetic series (PT5M)')
+    args = parser.parse_args()
+
+    if args.conformance:
+        print(f"✅ {conformance(args.spec)} aggregate checks match the API semantics")
+        return True
+
+    if args.benchmark:
+        result = benchmark(args.series, args.points)
+        print(f"📊 {result['series']} ASIC series x {result['points']} points ({result['values']} values, "
+              f"{result['values'] * 8 / 1e6:.0f} MB)")
+        for label, key in (('Whole series', 'whole'), ('Per PT1H', 'interval')):
+            run = result[key]
+            print(f"   - {label + ':':<14} {run['buckets']:>3} buckets, all 7 aggregations in {run['seconds']:.2f} s "
+                  f"({result['series'] / run['seconds']:,.0f} series/s); Python loops ~{run['python']:.1f} s "
+                  f"({run['python'] / run['seconds']:.0f}x)")
+        return True
+
+    if not args.response:
+        parser.error('a response file, --conformance or --benchmark is required')
+    with open(args.response, 'rb') as f:
+        decoded = decode_timeseries(f.read())
+    for level, aggregates in aggregate(decoded, args.interval).items():
+        frame = aggregates.frame
+        mismatches = check_aggregates(frame)
+        print(f"{'⚠️ ' if mismatches else '✅'} {level:<10} {len(frame):>4} entities x {len(frame.metrics)} metrics, "
+              f"{aggregates.stats.shape[-1]} buckets, {len(mismatches)} reported aggregates disagree")
+        for key, metric, field, reported, computed in mismatches[:10]:
+            print(f"   - {key} {metric}.{field}: reported {reported}, values give {computed:.6g}")
+        if args.aggregation:
+            for key, metrics in aggregates.to_dict(args.aggregation).items():
+                print(f"   {key}: {json.dumps(metrics)}")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Client-side cache for time-series history, aligned to interval buckets
+- Closed buckets (ended before now - settle) are kept per miner, level,
+  entity, field, aggregation and interval in blocks of BLOCK buckets
+- A repeated or overlapping query is answered from cache up to the first
+  bucket not cached, and only that open tail is fetched
+- Works for POST /api/v1/timeseries (start_time is rounded down to the
+  interval) and for the legacy GET /api/v1/{hashrate,temperature,power,
+  efficiency}[/{hb_sn}[/{asic_id}]] endpoints, where the bucket width is
+  taken from the returned datetimes and the tail is fetched with the
+  shortest duration that covers it
+- LRU eviction to a memory budget; hit rate and bytes-saved counters
+- --benchmark: dashboard refreshes of PT6H at PT5M with and without the cache
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from collections import OrderedDict
+
+from timeseries_columnar import LEVELS, parse_duration
+from timeseries_planner import (BYTES_PER_POINT, RANGE_KEYS, choose_interval, epoch, format_duration, isoformat,
+                                merge_aggregates, time_range)
+
+BLOCK = 64
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Seconds after a bucket ends before the miner's value for it is final
+DEFAULT_SETTLE = 60.0
+LEGACY_METRICS = ('hashrate', 'temperature', 'power', 'efficiency')
+# DurationParam and GranularityParam values, in seconds
+LEGACY_DURATIONS = {'1h': 3600, '12h': 43200, '24h': 86400, '48h': 172800, '5d': 432000}
+LEGACY_GRANULARITIES = {'1m': 60, '5m': 300, '15m': 900}
+# Bytes held per cached block beyond its values: list, key tuple and LRU links
+BLOCK_OVERHEAD = 200
+VALUE_BYTES = 32
+LEVEL_KEYS = {level: response_key for response_key, (level, _) in LEVELS.items()}
+
+# A bucket not in the cache, as opposed to a cached null value
+UNSET = object()
+
+
+def miner_key(client):
+    """Scheme, host and base path of a client's miner"""
+    target = client.transport.target
+    return f"{target.scheme}://{target.host_header}{target.base_path}"
+
+
+class TimeSeriesCache:
+    """Closed buckets of many miners' time series, evicted least recently used first"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, settle=DEFAULT_SETTLE, clock=time.time):
+        self.max_bytes = max_bytes
+        self.settle = settle
+        self.clock = clock
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+
+    # -- storage -----------------------------------------------------------
+
+    def _store(self, key, value, size):
+        if key in self._entries:
+            self.bytes -= self._sizes[key]
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            old, _ = self._entries.popitem(last=False)
+            self.bytes -= self._sizes.pop(old)
+            self.evictions += 1
+
+    def _get(self, key):
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def cached_run(self, series, first, stop):
+        """Values of consecutive cached buckets of a series from first, up to stop"""
+        values = []
+        bucket = first
+        while bucket < stop:
+            block = self._get(series + (bucket // BLOCK,))
+            if block is None:
+                break
+            for value in block[bucket % BLOCK:min(BLOCK, bucket % BLOCK + stop - bucket)]:
+                if value is UNSET:
+                    return values
+                values.append(value)
+            bucket = first + len(values)
+        return values
+
+    def put(self, series, first, values):
+        """Cache values of consecutive buckets of a series starting at bucket first"""
+        position = 0
+        while position < len(values):
+            bucket = first + position
+            number, offset = divmod(bucket, BLOCK)
+            key = series + (number,)
+            block = self._get(key)
+            block = list(block) if block is not None else [UNSET] * BLOCK
+            part = values[position:position + BLOCK - offset]
+            block[offset:offset + len(part)] = part
+            stored = BLOCK - block.count(UNSET)
+            self._store(key, block, BLOCK_OVERHEAD + 8 * BLOCK + VALUE_BYTES * stored)
+            position += len(part)
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {'entries': len(self._entries), 'bytes': self.bytes, 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hit_rate, 'bytes_saved': self.hits * BYTES_PER_POINT, 'requests': self.requests,
+                'evictions': self.evictions}
+
+    # -- POST /api/v1/timeseries -------------------------------------------
+
+    def _prepare_timeseries(self, miner, query):
+        """(sub-request or None, state) for a TimeSeriesRequest"""
+        now = self.clock()
+        start, end = time_range(query, now)
+        interval = parse_duration(query['interval']) if query.get('interval') else choose_interval(end - start)
+        aggregation = query.get('aggregation') or 'mean'
+        first, last = int(start // interval), math.ceil(end / interval)
+        # Buckets that may come from the cache: closed, and wholly inside the query
+        closed = min(int((now - self.settle) // interval), int(end // interval))
+
+        layout = []
+        for level in query['levels']:
+            signature = ('entities', miner, level['type'], tuple(level.get('indexes') or ()) or None)
+            layout.append((level, signature, self._get(signature)))
+        prefixes = {}
+        cached = first
+        # Entities are known once the same levels have been fetched
+        if closed > first and all(entities is not None for _, _, entities in layout):
+            cached = closed
+            for level, _, entities in layout:
+                for entity_key, _, _ in entities:
+                    for field in level['fields']:
+                        series = (miner, level['type'], entity_key, field, aggregation, interval)
+                        values = self.cached_run(series, first, cached)
+                        prefixes[series] = values
+                        cached = min(cached, first + len(values))
+        state = {'miner': miner, 'query': query, 'interval': interval, 'aggregation': aggregation,
+                 'first': first, 'last': last, 'cached': cached, 'closed': closed, 'end': end,
+                 'layout': layout, 'prefixes': prefixes}
+        if cached >= last:
+            return None, state
+        request = {key: value for key, value in query.items() if key not in RANGE_KEYS}
+        request = {'start_time': isoformat(cached * interval), 'end_time': isoformat(end),
+                   'interval': format_duration(interval), **request}
+        return request, state
+
+    def _complete_timeseries(self, state, response):
+        """The TimeSeriesResponse for a query from cached prefixes and the fetched tail"""
+        miner, query, interval = state['miner'], state['query'], state['interval']
+        first, last, cached, closed = state['first'], state['last'], state['cached'], state['closed']
+        series_count = 0
+        data = {}
+        fetched = (response or {}).get('data') or {}
+        meta = (response or {}).get('meta') or {}
+        # Position of bucket `cached` in the fetched values
+        offset = cached - int(epoch(meta['start_time']) // interval) if meta.get('start_time') else 0
+        for level, signature, entities in state['layout']:
+            response_key = LEVEL_KEYS[level['type']]
+            key_fields = LEVELS[response_key][1]
+            if response is not None:
+                records = fetched.get(response_key)
+                records = [records] if isinstance(records, dict) else (records or [])
+                # (key, plain fields, metric units) per entity, for answers from cache alone
+                entities = [(tuple(record.get(field) for field in key_fields),
+                             {name: value for name, value in record.items()
+                              if not (isinstance(value, dict) and 'values' in value)},
+                             {name: value.get('unit') for name, value in record.items()
+                              if isinstance(value, dict) and 'values' in value}) for record in records]
+                self._store(signature, entities, BLOCK_OVERHEAD + 100 * len(entities))
+                by_key = dict(zip((entity_key for entity_key, _, _ in entities), records))
+            else:
+                by_key = {}
+            out = []
+            for entity_key, fields, units in entities:
+                record = dict(fields)
+                tail_record = by_key.get(entity_key, {})
+                for field in level['fields']:
+                    series = (miner, level['type'], entity_key, field, state['aggregation'], interval)
+                    prefix = state['prefixes'].get(series, [])[:cached - first]
+                    metric = tail_record.get(field) or {}
+                    tail = list(metric.get('values') or ())
+                    tail = tail[offset:] if offset >= 0 else [None] * -offset + tail
+                    values = (prefix + tail)[:last - first]
+                    values += [None] * (last - first - len(values))
+                    # Closed buckets fetched now go into the cache
+                    if cached < closed:
+                        self.put(series, cached, values[cached - first:closed - first])
+                    parts = []
+                    if prefix:
+                        present = [value for value in prefix if value is not None]
+                        if present:
+                            parts.append((len(present), {'min': min(present), 'avg': sum(present) / len(present),
+                                                         'max': max(present)}))
+                    if metric.get('aggregates'):
+                        parts.append((len(tail) - tail.count(None), metric['aggregates']))
+                    result = {'values': values}
+                    unit = metric.get('unit', units.get(field))
+                    if unit is not None:
+                        result['unit'] = unit
+                    aggregates = merge_aggregates(parts)
+                    if aggregates:
+                        result['aggregates'] = aggregates
+                    record[field] = result
+                    series_count += 1
+                out.append(record)
+            if response_key == 'miner':
+                data['miner'] = out[0] if out else {}
+            else:
+                data[response_key] = out
+        self.hits += series_count * (cached - first)
+        self.misses += series_count * (last - cached)
+        meta = {'start_time': isoformat(first * interval), 'end_time': isoformat(state['end']),
+                'interval': format_duration(interval), 'levels': query['levels'],
+                'aggregation': state['aggregation']}
+        return {'meta': meta, 'data': data}
+
+    def timeseries(self, client, query):
+        """POST /api/v1/timeseries through the cache with a generated Client"""
+        request, state = self._prepare_timeseries(miner_key(client), query)
+        response = None
+        if request is not None:
+            self.requests += 1
+            response = client.transport.request('POST', '/api/v1/timeseries', body=request)
+        return self._complete_timeseries(state, response)
+
+    async def timeseries_async(self, client, query):
+        """POST /api/v1/timeseries through the cache with a generated AsyncClient"""
+        request, state = self._prepare_timeseries(miner_key(client), query)
+        response = None
+        if request is not None:
+            self.requests += 1
+            response = await client.transport.request('POST', '/api/v1/timeseries', body=request)
+        return self._complete_timeseries(state, response)
+
+    # -- legacy GET /api/v1/<metric> ---------------------------------------
+
+    def _prepare_legacy(self, miner, metric, hb_sn, asic_id, duration, granularity, fresh=False):
+        if metric not in LEGACY_METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {', '.join(LEGACY_METRICS)}")
+        if asic_id is not None and hb_sn is None:
+            raise ValueError("asic_id needs hb_sn")
+        if granularity is not None and asic_id is None:
+            raise ValueError("granularity is only accepted by the per-ASIC endpoints")
+        path = '/'.join(['/api/v1', metric] + [str(part) for part in (hb_sn, asic_id) if part is not None])
+        now = self.clock()
+        query = {'duration': duration}
+        if granularity is not None:
+            query['granularity'] = granularity
+        # The device's bucket width is learned from a response; until then nothing is cached
+        signature = ('interval', miner, path, granularity)
+        interval = None if fresh else self._get(signature)
+        state = {'miner': miner, 'path': path, 'metric': metric, 'duration': duration, 'now': now,
+                 'signature': signature, 'interval': interval, 'cached': None}
+        if interval is not None:
+            first = math.ceil((now - LEGACY_DURATIONS[duration]) / interval)
+            closed = int((now - self.settle) // interval)
+            state['cached'] = cached = first + len(self.cached_run(self._legacy_series(state, interval), first, closed))
+            # The shortest duration reaching back to the first bucket not cached
+            query['duration'] = next((name for name, seconds in sorted(LEGACY_DURATIONS.items(), key=lambda item: item[1])
+                                      if now - seconds <= cached * interval), duration)
+        return path, query, state
+
+    @staticmethod
+    def _legacy_series(state, interval):
+        return (state['miner'], state['path'], None, state['metric'], 'legacy', interval)
+
+    def _complete_legacy(self, state, response):
+        """The legacy response from cached buckets and the fetched tail
+
+        None when the bucket width in the response is not the one the cache
+        was read with; the caller then fetches again with fresh=True.
+        """
+        name = f"{state['metric']}-data"
+        fetched = ((response or {}).get(name) or {})
+        returned = [point for point in fetched.get('data') or ()
+                    if isinstance(point, dict) and isinstance(point.get('datetime'), int)]
+        datetimes = sorted({point['datetime'] for point in returned})
+        steps = [later - earlier for earlier, later in zip(datetimes, datetimes[1:])]
+        interval = min(steps) if steps else state['interval']
+        if interval is None:
+            # Too few points to tell the bucket width
+            self.misses += len(returned)
+            return {name: {'duration': state['duration'], 'data': returned,
+                           'aggregates': fetched.get('aggregates') or {}}}
+        self._store(state['signature'], interval, BLOCK_OVERHEAD)
+        if state['interval'] is not None and interval != state['interval']:
+            return None
+
+        now = state['now']
+        first = math.ceil((now - LEGACY_DURATIONS[state['duration']]) / interval)
+        closed = int((now - self.settle) // interval)
+        cached = first if state['cached'] is None else state['cached']
+        series = self._legacy_series(state, interval)
+        points = {point['datetime'] // interval: point.get('value', None) for point in returned}
+        # Closed buckets fetched now go into the cache; ones the device left out stay uncached
+        run = []
+        for bucket in range(cached, max(cached, closed) + 1):
+            if bucket < closed and bucket in points:
+                run.append(points[bucket])
+            elif run:
+                self.put(series, bucket - len(run), run)
+                run = []
+        data = [{'datetime': (first + index) * interval, 'value': value}
+                for index, value in enumerate(self.cached_run(series, first, cached))]
+        data += [{'datetime': bucket * interval, 'value': points[bucket]}
+                 for bucket in sorted(points) if bucket >= max(first, cached)]
+        self.hits += cached - first
+        self.misses += len(data) - (cached - first)
+        if cached == first and fetched.get('aggregates') is not None and len(points) == len(data):
+            aggregates = fetched['aggregates']
+        else:
+            present = [point['value'] for point in data if point['value'] is not None]
+            aggregates = ({'min': min(present), 'avg': sum(present) / len(present), 'max': max(present)}
+                          if present else {})
+        return {name: {'duration': state['duration'], 'data': data, 'aggregates': aggregates}}
+
+    def legacy(self, client, metric, hb_sn=None, asic_id=None, duration='1h', granularity=None):
+        """GET /api/v1/<metric>[/<hb_sn>[/<asic_id>]]?duration= through the cache
+
+        granularity is sent to the per-ASIC endpoints only, the others take none.
+        """
+        for fresh in (False, True):
+            path, query, state = self._prepare_legacy(miner_key(client), metric, hb_sn, asic_id, duration,
+                                                      granularity, fresh)
+            self.requests += 1
+            result = self._complete_legacy(state, client.transport.request('GET', path, query))
+            if result is not None:
+                return result
+
+    async def legacy_async(self, client, metric, hb_sn=None, asic_id=None, duration='1h', granularity=None):
+        for fresh in (False, True):
+            path, query, state = self._prepare_legacy(miner_key(client), metric, hb_sn, asic_id, duration,
+                                                      granularity, fresh)
+            self.requests += 1
+            result = self._complete_legacy(state, await client.transport.request('GET', path, query))
+            if result is not None:
+                return result
+
+
+# -- benchmark -------------------------------------------------------------
+
+class _StubTarget:
+    scheme, host_header, base_path = 'http', 'stub', ''
+
+
+class _StubClient:
+    """A client whose transport answers from timeseries_planner's stub miner at a simulated time"""
+
+    def __init__(self, clock, shape):
+        self.transport = self
+        self.target = _StubTarget()
+        self.clock = clock
+        self.shape = shape
+        self.bytes = 0
+
+    def request(self, method, path, query=None, body=None, files=None, raw=False):
+        from timeseries_planner import _stub_response, _stub_value
+
+        if method == 'POST':
+            body, _ = _stub_response(body, self.shape, 1e9)
+        else:
+            interval = LEGACY_GRANULARITIES[(query or {}).get('granularity', '1m')]
+            now = self.clock()
+            buckets = range(math.ceil((now - LEGACY_DURATIONS[query['duration']]) / interval), int(now // interval))
+            points = [{'datetime': bucket * interval, 'value': _stub_value(1, 0, bucket)} for bucket in buckets]
+            present = [point['value'] for point in points if point['value'] is not None]
+            body = json.dumps({f"{path.split('/')[3]}-data": {
+                'duration': query['duration'], 'data': points,
+                'aggregates': {'min': min(present), 'avg': sum(present) / len(present), 'max': max(present)}}},
+                separators=(',', ':')).encode('utf-8')
+        self.bytes += len(body)
+        return json.loads(body)
+
+
+def benchmark(refreshes=60, every=30.0, window='PT6H', interval='PT5M', shape=None):
+    """Dashboard refreshes every `every` simulated seconds, with and without the cache"""
+    from timeseries_planner import DEFAULT_SHAPE
+
+    shape = {**DEFAULT_SHAPE, **(shape or {})}
+    span = parse_duration(window)
+    results = {}
+    for mode in ('direct', 'cached'):
+        now = [epoch('2024-01-15T12:00:00Z')]
+        client = _StubClient(lambda: now[0], shape)
+        cache = TimeSeriesCache(clock=lambda: now[0])
+        elapsed = 0.0
+        checked = 0
+        for _ in range(refreshes):
+            query = {'start_time': isoformat(now[0] - span), 'end_time': isoformat(now[0]), 'interval': interval,
+                     'levels': [{'type': 'miner', 'fields': ['hashrate', 'temperature']},
+                                {'type': 'asic', 'fields': ['hashrate', 'temperature']}]}
+            start = time.perf_counter()
+            if mode == 'cached':
+                response = cache.timeseries(client, query)
+                cache.legacy(client, 'hashrate', duration='24h')
+            else:
+                step = parse_duration(interval)
+                aligned = dict(query, start_time=isoformat((now[0] - span) // step * step))
+                response = client.request('POST', '/api/v1/timeseries', body=aligned)
+                client.request('GET', '/api/v1/hashrate', {'duration': '24h'})
+            elapsed += time.perf_counter() - start
+            if mode == 'cached' and checked < 5:
+                direct = _StubClient(lambda: now[0], shape).request(
+                    'POST', '/api/v1/timeseries', body=dict(query, start_time=response['meta']['start_time']))
+                if [a['hashrate']['values'] for a in direct['data']['asics']] != \
+                        [a['hashrate']['values'] for a in response['data']['asics']]:
+                    raise AssertionError("Cached response differs from a direct request")
+                checked += 1
+            now[0] += every
+        results[mode] = {'bytes': client.bytes, 'seconds': elapsed / refreshes}
+        if mode == 'cached':
+            results['stats'] = cache.stats()
+    results['refreshes'] = refreshes
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--benchmark', action='store_true', help='simulated dashboard refreshes')
+    parser.add_argument('--refreshes', type=int, default=60, help='benchmark refreshes')
+    parser.add_argument('--every', type=float, default=30.0, help='benchmark seconds between refreshes')
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.error('use TimeSeriesCache from Python, or --benchmark')
+    result = benchmark(args.refreshes, args.every)
+    stats = result['stats']
+    print(f"📊 {result['refreshes']} refreshes every {args.every:g} s of PT6H at PT5M (miner + 378 ASICs) "
+          f"and 24h of miner hashrate")
+    for mode, label in (('direct', 'no cache'), ('cached', 'cache')):
+        run = result[mode]
+        print(f"   - {label:<9} {run['bytes'] / 1e6:8.1f} MB fetched, {run['seconds'] * 1000:6.1f} ms per refresh")
+    print(f"   hit rate {stats['hit_rate']:.1%}, {stats['bytes_saved'] / 1e6:.1f} MB saved (estimated), "
+          f"{stats['bytes'] / 1e6:.1f} MB cached in {stats['entries']} entries, {stats['requests']} requests")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Columnar decoder for POST /api/v1/timeseries responses (TimeSeriesResponse)
+- Every TimeSeriesMetricData.values array goes straight from the response
+  bytes into one float64 buffer (null -> NaN) in a single NumPy call; only
+  the small remaining skeleton is parsed with json
+- One (entity, metric, time) array per level, indexed by index,
+  hashboard_index and serial_number
+- Timestamps derived from TimeSeriesMeta start_time and interval
+- Requires NumPy (pip install numpy)
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install numpy
+    np = None
+
+# Response key -> (level name in TimeSeriesMeta.levels, key fields)
+LEVELS = {
+    'miner': ('miner', ()),
+    'hashboards': ('hashboard', ('index',)),
+    'asics': ('asic', ('hashboard_index', 'index')),
+    'PSUs': ('PSU', ('index',)),
+}
+AGGREGATES = ('min', 'avg', 'max')
+
+# The start of a values array, and what may not appear inside one
+VALUES_OPEN = re.compile(rb'\s*:\s*\[')
+UNEXPECTED = re.compile(rb'[\[{"]')
+DURATION = re.compile(r'^P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$')
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError('timeseries_columnar needs NumPy: pip install numpy')
+
+
+def parse_duration(text):
+    """Seconds in an ISO 8601 duration such as PT15M (weeks to seconds only)"""
+    match = DURATION.match(text or '')
+    if not match or text in ('P', 'PT'):
+        raise ValueError(f"Unsupported ISO 8601 duration '{text}'")
+    weeks, days, hours, minutes, seconds = (float(part) if part else 0.0 for part in match.groups())
+    return (((weeks * 7 + days) * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+def parse_time(text):
+    """UTC numpy datetime64[s] for an ISO 8601 timestamp"""
+    moment = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(moment.replace(microsecond=0), 's')
+
+
+class LevelFrame:
+    """One level of a response as contiguous arrays
+
+    values      float64 (entity, metric, time), NaN where null or missing
+    aggregates  float64 (entity, metric, 3) for min/avg/max, NaN if absent
+    keys        one tuple per entity: () for miner, (index,) for hashboards
+                and PSUs, (hashboard_index, index) for ASICs
+    """
+
+    __slots__ = ('level', 'metrics', 'units', 'values', 'aggregates', 'keys', 'serial_numbers',
+                 '_rows', '_serials', '_columns')
+
+    def __init__(self, level, metrics, units, values, aggregates, keys, serial_numbers):
+        self.level = level
+        self.metrics = metrics
+        self.units = units
+        self.values = values
+        self.aggregates = aggregates
+        self.keys = keys
+        self.serial_numbers = serial_numbers
+        self._rows = {key: row for row, key in enumerate(keys)}
+        self._serials = {serial: row for row, serial in enumerate(serial_numbers) if serial is not None}
+        self._columns = {metric: column for column, metric in enumerate(metrics)}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def row(self, key=()):
+        """Entity row for a key tuple, a bare index or a serial number"""
+        if isinstance(key, str):
+            return self._serials[key]
+        if not isinstance(key, tuple):
+            key = (key,)
+        return self._rows[key]
+
+    def metric(self, name):
+        """(entity, time) view of one metric"""
+        return self.values[:, self._columns[name], :]
+
+    def series(self, metric, key=()):
+        """(time,) view of one metric for one entity"""
+        return self.values[self.row(key), self._columns[metric], :]
+
+
+class ColumnarTimeSeries:
+    """A decoded TimeSeriesResponse: meta, timestamps and one frame per level"""
+
+    __slots__ = ('meta', 'timestamps', 'levels')
+
+    def __init__(self, meta, timestamps, levels):
+        self.meta = meta
+        self.timestamps = timestamps
+        self.levels = levels
+
+    def __getitem__(self, level):
+        return self.levels[level]
+
+    def __contains__(self, level):
+        return level in self.levels
+
+
+def _split_values(raw):
+    """(skeleton bytes, flat float64 buffer, offsets, counts)
+
+    Each values array in raw is replaced by its ordinal, so the skeleton
+    parses into the same structure with ints where the arrays were. Returns
+    None when an array holds anything but numbers and nulls.
+    """
+    pieces = []
+    skeleton = []
+    counts = []
+    position = 0
+    while True:
+        key = raw.find(b'"values"', position)
+        if key < 0:
+            break
+        opening = VALUES_OPEN.match(raw, key + 8)
+        if opening is None:
+            # "values" as a string value or a non-array; json handles it
+            skeleton.append(raw[position:key + 8])
+            position = key + 8
+            continue
+        close = raw.find(b']', opening.end())
+        if close < 0:
+            return None
+        content = raw[opening.end():close]
+        skeleton.append(raw[position:key])
+        skeleton.append(b'"values":%d' % len(counts))
+        if content.strip():
+            pieces.append(content)
+            counts.append(content.count(b',') + 1)
+        else:
+            counts.append(0)
+        position = close + 1
+    skeleton.append(raw[position:])
+
+    total = sum(counts)
+    if pieces:
+        joined = b','.join(pieces)
+        if UNEXPECTED.search(joined):
+            return None
+        flat = np.fromstring(joined.replace(b'null', b'nan'), dtype=np.float64, sep=',')
+    else:
+        flat = np.empty(0, dtype=np.float64)
+    if len(flat) != total:
+        return None
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return b''.join(skeleton), flat, offsets, counts
+
+
+def _split_parsed(document):
+    """The same split for an already parsed response (the fallback path)"""
+    arrays = []
+
+    def visit(node):
+        if isinstance(node, dict):
+            values = node.get('values')
+            if isinstance(values, list):
+                node['values'] = len(arrays)
+                arrays.append(values)
+            for child in node.values():
+                if isinstance(child, (dict, list)):
+                    visit(child)
+        elif isinstance(node, list):
+            for child in node:
+                if isinstance(child, (dict, list)):
+                    visit(child)
+
+    visit(document.get('data') or {})
+    counts = [len(values) for values in arrays]
+    flat = np.array([v for values in arrays for v in values], dtype=np.float64)
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return document, flat, offsets, counts
+
+
+def _metric_names(entities, requested):
+    names = list(requested or [])
+    seen = set(names)
+    for entity in entities:
+        for key, value in entity.items():
+            if isinstance(value, dict) and key not in seen:
+                seen.add(key)
+                names.append(key)
+    return [name for name in names if any(isinstance(e.get(name), dict) for e in entities)]
+
+
+def _frame(response_key, entities, requested, flat, offsets, counts, length):
+    level, key_fields = LEVELS[response_key]
+    metrics = _metric_names(entities, requested)
+    n_entities, n_metrics = len(entities), len(metrics)
+
+    # Fast path: every entity lists every metric, in order, at full length,
+    # so the level is one contiguous run of the flat buffer
+    ordinals = [[(entity.get(name) or {}).get('values') for name in metrics] for entity in entities]
+    first = ordinals[0][0] if ordinals and ordinals[0] else None
+    contiguous = isinstance(first, int) and all(
+        ordinals[e][m] == first + e * n_metrics + m and counts[first + e * n_metrics + m] == length
+        for e in range(n_entities) for m in range(n_metrics))
+    if contiguous:
+        start = offsets[first]
+        values = flat[start:start + n_entities * n_metrics * length].reshape(n_entities, n_metrics, length)
+    else:
+        values = np.full((n_entities, n_metrics, length), np.nan)
+        for e, row in enumerate(ordinals):
+            for m, ordinal in enumerate(row):
+                if isinstance(ordinal, int):
+                    values[e, m, :counts[ordinal]] = flat[offsets[ordinal]:offsets[ordinal + 1]]
+                elif isinstance(ordinal, list):
+                    values[e, m, :len(ordinal)] = [math.nan if v is None else v for v in ordinal]
+
+    aggregates = np.full((n_entities, n_metrics, len(AGGREGATES)), np.nan)
+    units = {}
+    for e, entity in enumerate(entities):
+        for m, name in enumerate(metrics):
+            data = entity.get(name)
+            if not data:
+                continue
+            if name not in units and data.get('unit') is not None:
+                units[name] = data['unit']
+            stats = data.get('aggregates')
+            if stats:
+                for a, field in enumerate(AGGREGATES):
+                    if stats.get(field) is not None:
+                        aggregates[e, m, a] = stats[field]
+
+    keys = [tuple(entity.get(field) for field in key_fields) for entity in entities]
+    serials = [entity.get('serial_number') for entity in entities]
+    return LevelFrame(level, tuple(metrics), units, values, aggregates, keys, serials)
+
+
+def timestamps_for(meta, length):
+    """datetime64[s] array for length points, or None without start_time"""
+    if not meta or not meta.get('start_time') or not length:
+        return None
+    start = parse_time(meta['start_time'])
+    if meta.get('interval'):
+        step = np.timedelta64(int(round(parse_duration(meta['interval']))), 's')
+        return start + np.arange(length) * step
+    if meta.get('end_time') and length > 1:
+        span = (parse_time(meta['end_time']) - start) / (length - 1)
+        return start + np.arange(length) * span
+    return np.array([start])
+
+
+def decode_timeseries(body):
+    """Decode a TimeSeriesResponse body (bytes or str) into a ColumnarTimeSeries"""
+    _require_numpy()
+    raw = body.encode('utf-8') if isinstance(body, str) else bytes(body)
+    split = _split_values(raw)
+    if split is not None:
+        skeleton, flat, offsets, counts = split
+        document = json.loads(skeleton)
+    else:
+        document, flat, offsets, counts = _split_parsed(json.loads(raw))
+    meta = document.get('meta') or {}
+    data = document.get('data') or {}
+    length = max(counts, default=0)
+
+    requested = {}
+    for config in meta.get('levels') or []:
+        if isinstance(config, dict) and config.get('type'):
+            requested[config['type']] = config.get('fields')
+
+    levels = {}
+    for response_key, (level, _) in LEVELS.items():
+        entities = data.get(response_key)
+        if entities is None:
+            continue
+        if isinstance(entities, dict):
+            entities = [entities]
+        levels[level] = _frame(response_key, entities, requested.get(level), flat, offsets, counts, length)
+    return ColumnarTimeSeries(meta, timestamps_for(meta, length), levels)
+
+
+def fetch_timeseries(client, request):
+    """POST /api/v1/timeseries with a generated Client, decoded columnar"""
+    return decode_timeseries(client.transport.request('POST', '/api/v1/timeseries', body=request, raw=True))
+
+
+async def fetch_timeseries_async(client, request):
+    """POST /api/v1/timeseries with a generated AsyncClient, decoded columnar"""
+    body = await client.transport.request('POST', '/api/v1/timeseries', body=request, raw=True)
+    return decode_timeseries(body)
+
+
+# -- benchmark -------------------------------------------------------------
+
+def synthetic_response(hashboards=3, asics=114, psus=2, points=288, null_rate=0.02,
+                       metrics=('hashrate', 'temperature'), seed=11):
+    """A TimeSeriesResponse body with ASIC-level data, as bytes"""
+    rng = random.Random(seed)
+    units = {'hashrate': 'TH/s', 'temperature': '°C', 'power': 'W', 'efficiency': 'J/TH',
+             'voltage': 'V', 'current': 'A'}
+
+    def series(name, base):
+        values = [None if rng.random() < null_rate else round(base + rng.gauss(0, base * 0.02), 3)
+                  for _ in range(points)]
+        present = [v for v in values if v is not None]
+        return {'unit': units.get(name, ''), 'values': values,
+                'aggregates': {'min': min(present), 'avg': round(sum(present) / len(present), 3),
+                               'max': max(present)}}
+
+    def entity(record, scale):
+        for name in metrics:
+            record[name] = series(name, scale * (60 if name == 'temperature' else 100))
+        return record
+
+    data = {
+        'miner': entity({}, 3.0),
+        'hashboards': [entity({'index': board, 'serial_number': f"HB{board:06d}"}, 1.0)
+                       for board in range(hashboards)],
+        'asics': [entity({'index': asic, 'hashboard_index': board}, 0.01)
+                  for board in range(hashboards) for asic in range(asics)],
+        'PSUs': [entity({'index': psu, 'serial_number': f"PSU{psu:05d}"}, 3.0) for psu in range(psus)],
+    }
+    meta = {
+        'start_time': '2024-01-15T00:00:00Z',
+        'end_time': '2024-01-16T00:00:00Z',
+        'interval': 'PT5M',
+        'levels': [{'type': level, 'fields': list(metrics)} for level in ('miner', 'hashboard', 'asic', 'PSU')],
+        'aggregation': 'mean',
+    }
+    return json.dumps({'meta': meta, 'data': data}, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def decode_plain(body):
+    """json.loads plus dict traversal into float lists, as consumers do today"""
+    document = json.loads(body)
+    nan = math.nan
+    levels = {}
+    for response_key, (level, key_fields) in LEVELS.items():
+        entities = document['data'].get(response_key)
+        if entities is None:
+            continue
+        if isinstance(entities, dict):
+            entities = [entities]
+        rows = {}
+        for entity in entities:
+            key = tuple(entity.get(field) for field in key_fields)
+            rows[key] = {name: [nan if v is None else float(v) for v in metric['values']]
+                         for name, metric in entity.items() if isinstance(metric, dict)}
+        levels[level] = rows
+    return levels
+
+
+def decode_plain_arrays(body):
+    """json.loads, then the same (entity, metric, time) arrays via np.array"""
+    document = json.loads(body)
+    levels = {}
+    for response_key, (level, _) in LEVELS.items():
+        entities = document['data'].get(response_key)
+        if entities is None:
+            continue
+        if isinstance(entities, dict):
+            entities = [entities]
+        metrics = _metric_names(entities, None)
+        levels[level] = np.array([[entity[name]['values'] for name in metrics] for entity in entities],
+                                 dtype=np.float64)
+    return levels
+
+
+def _check(columnar, plain):
+    for level, rows in plain.items():
+        frame = columnar[level]
+        for key, metrics in rows.items():
+            for name, values in metrics.items():
+                decoded = frame.series(name, key)[:len(values)]
+                if not np.array_equal(decoded, np.array(values), equal_nan=True):
+                    raise AssertionError(f"Mismatch for {level} {key} {name}")
+
+
+def benchmark(repeat=15, **shape):
+    _require_numpy()
+    body = synthetic_response(**shape)
+
+    def measure(decode):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = decode(body)
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        result = decode(body)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, statistics.median(times) * 1000, peak, retained
+
+    columnar, columnar_ms, columnar_peak, columnar_kept = measure(decode_timeseries)
+    plain, plain_ms, plain_peak, plain_kept = measure(decode_plain)
+    _, arrays_ms, arrays_peak, arrays_kept = measure(decode_plain_arrays)
+    _check(columnar, plain)
+    asic = columnar['asic']
+    return {
+        'bytes': len(body),
+        'shape': asic.values.shape,
+        'numbers': sum(frame.values.size for frame in columnar.levels.values()),
+        'plain_ms': plain_ms, 'plain_peak': plain_peak, 'plain_kept': plain_kept,
+        'arrays_ms': arrays_ms, 'arrays_peak': arrays_peak, 'arrays_kept': arrays_kept,
+        'columnar_ms': columnar_ms, 'columnar_peak': columnar_peak, 'columnar_kept': columnar_kept,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('response', nargs='?', help='TimeSeriesResponse JSON file to decode')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare against json.loads plus dict traversal on a synthetic ASIC payload')
+    parser.add_argument('--hashboards', type=int, default=3, help='synthetic hashboards')
+    parser.add_argument('--asics', type=int, default=114, help='synthetic ASICs per hashboard')
+    parser.add_argument('--points', type=int, default=288, help='synthetic points per series')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(hashboards=args.hashboards, asics=args.asics, points=args.points)
+        print(f"📊 {result['bytes']} byte response, {result['numbers']} values, ASIC frame {result['shape']}")
+        for label, key in (('json.loads + traversal', 'plain'), ('json.loads + np.array', 'arrays'),
+                           ('Columnar decoder', 'columnar')):
+            print(f"   - {label + ':':<24} {result[key + '_ms']:6.1f} ms, peak {result[key + '_peak'] / 1e6:5.1f} MB, "
+                  f"result {result[key + '_kept'] / 1e6:5.1f} MB")
+        return True
+
+    if not args.response:
+        parser.error('a response file or --benchmark is required')
+    with open(args.response, 'rb') as f:
+        decoded = decode_timeseries(f.read())
+    points = len(decoded.timestamps) if decoded.timestamps is not None else 0
+    print(f"✅ {points} points from {decoded.meta.get('start_time')} every {decoded.meta.get('interval')}")
+    for level, frame in decoded.levels.items():
+        print(f"   - {level:<10} {len(frame):>4} entities x {len(frame.metrics)} metrics "
+              f"({', '.join(frame.metrics)}) -> {frame.values.shape}")
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
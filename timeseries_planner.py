@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+Query planner for POST /api/v1/timeseries
+- Picks interval for a target number of points per series when the query
+  does not set one
+- Splits long ranges into sub-requests on interval boundaries, each sized
+  to a point and byte budget from the levels, fields and indexes requested
+- Runs the sub-requests concurrently on an AsyncClient (bounded by its
+  connection limit) or in turn on a Client, and stitches the
+  TimeSeriesMetricData.values back into one TimeSeriesResponse
+- Buckets returned by two sub-requests are merged by the query's
+  aggregation (mean, min, max, last, sum, count); series aggregates merge
+  min/max directly and avg weighted by each part's non-null count
+- --benchmark: one request vs. the planned sub-requests against a stub
+  miner whose query time grows with the points requested
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import operator
+import sys
+import time
+from datetime import datetime, timezone
+
+from timeseries_columnar import LEVELS, parse_duration
+
+# Candidate intervals in seconds, shortest first
+INTERVALS = (1, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600, 7200, 10800, 21600, 43200, 86400)
+DEFAULT_RESOLUTION = 720
+DEFAULT_MAX_POINTS = 250_000
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+# A serialized value with its comma, e.g. "72.513,"; nulls are shorter
+BYTES_PER_POINT = 8
+# Entities per level when the query has no indexes (ASICs per hashboard)
+DEFAULT_SHAPE = {'miner': 1, 'hashboard': 3, 'asic': 126, 'PSU': 2}
+RANGE_KEYS = ('start_time', 'end_time', 'duration', 'interval')
+
+# How two values for the same bucket combine, by TimeSeriesRequest.aggregation;
+# mean/avg are weighted by the share of the bucket each sub-request covered
+MERGE = {
+    'min': min,
+    'max': max,
+    'last': lambda earlier, later: later,
+    'sum': operator.add,
+    'count': operator.add,
+}
+
+
+def epoch(text):
+    """Unix seconds for an ISO 8601 timestamp (naive means UTC)"""
+    moment = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def isoformat(seconds):
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def format_duration(seconds):
+    """ISO 8601 duration for whole seconds, e.g. 300 -> PT5M, 86400 -> P1D"""
+    seconds = int(seconds)
+    if seconds <= 0:
+        raise ValueError(f"Interval must be positive, got {seconds}s")
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, seconds = divmod(rest, 60)
+    time_part = ''.join(f"{value}{unit}" for value, unit in ((hours, 'H'), (minutes, 'M'), (seconds, 'S')) if value)
+    return f"P{f'{days}D' if days else ''}{f'T{time_part}' if time_part else ''}"
+
+
+def time_range(query, now=None):
+    """(start, end) Unix seconds of a TimeSeriesRequest; end defaults to now"""
+    if not query.get('start_time'):
+        raise ValueError("TimeSeriesRequest needs start_time")
+    start = epoch(query['start_time'])
+    if query.get('end_time') and query.get('duration'):
+        raise ValueError("end_time and duration are mutually exclusive")
+    if query.get('end_time'):
+        end = epoch(query['end_time'])
+    elif query.get('duration'):
+        end = start + parse_duration(query['duration'])
+    else:
+        end = time.time() if now is None else now
+    if end <= start:
+        raise ValueError(f"Empty time range {query['start_time']} .. {isoformat(end)}")
+    return start, end
+
+
+def choose_interval(span, resolution=DEFAULT_RESOLUTION):
+    """The shortest candidate interval giving at most resolution points over span seconds"""
+    target = span / max(1, resolution)
+    for interval in INTERVALS:
+        if interval >= target:
+            return interval
+    return math.ceil(target / 86400) * 86400
+
+
+def series_count(levels, shape=None):
+    """Number of TimeSeriesMetricData series a query's levels return"""
+    shape = {**DEFAULT_SHAPE, **(shape or {})}
+    total = 0
+    for level in levels:
+        kind, indexes = level['type'], level.get('indexes')
+        if kind == 'miner':
+            entities = 1
+        elif kind == 'asic':
+            entities = shape['hashboard'] * (len(indexes) if indexes is not None else shape['asic'])
+        else:
+            entities = len(indexes) if indexes is not None else shape[kind]
+        total += entities * len(level.get('fields') or ())
+    return total
+
+
+class Plan:
+    """Sub-requests covering one logical TimeSeriesRequest"""
+
+    __slots__ = ('query', 'start', 'end', 'interval', 'series', 'chunks')
+
+    def __init__(self, query, start, end, interval, series, chunks):
+        self.query = query
+        self.start = start
+        self.end = end
+        self.interval = interval
+        self.series = series
+        self.chunks = chunks
+
+    @property
+    def aggregation(self):
+        return self.query.get('aggregation') or 'mean'
+
+    @property
+    def points(self):
+        """Estimated values across all series"""
+        return self.series * math.ceil((self.end - self.start) / self.interval)
+
+    @property
+    def requests(self):
+        base = {key: value for key, value in self.query.items() if key not in RANGE_KEYS}
+        interval = format_duration(self.interval)
+        return [{'start_time': isoformat(lo), 'end_time': isoformat(hi), 'interval': interval, **base}
+                for lo, hi in self.chunks]
+
+    def __repr__(self):
+        return (f"Plan({isoformat(self.start)}..{isoformat(self.end)} every {format_duration(self.interval)}, "
+                f"{self.series} series, {len(self.chunks)} requests)")
+
+
+def plan(query, resolution=DEFAULT_RESOLUTION, max_points=DEFAULT_MAX_POINTS, max_bytes=DEFAULT_MAX_BYTES,
+         shape=None, now=None):
+    """Split a TimeSeriesRequest into sub-requests of at most max_points / max_bytes each
+
+    Boundaries between sub-requests fall on multiples of the interval (from
+    the Unix epoch), so no bucket is shared by two sub-requests when the
+    miner aligns its buckets the same way.
+    """
+    start, end = time_range(query, now)
+    if query.get('interval'):
+        interval = parse_duration(query['interval'])
+    else:
+        interval = choose_interval(end - start, resolution)
+    series = max(1, series_count(query.get('levels') or (), shape))
+    budget = min(max_points, max_bytes // BYTES_PER_POINT)
+    buckets = max(1, budget // series)
+
+    boundaries = [start]
+    edge = (start // interval + buckets) * interval
+    while edge < end:
+        boundaries.append(edge)
+        edge += buckets * interval
+    boundaries.append(end)
+    return Plan(query, start, end, interval, series, list(zip(boundaries, boundaries[1:])))
+
+
+class _Series:
+    """One metric of one entity, accumulated across sub-responses
+
+    weights holds the seconds of a bucket covered so far, for buckets that
+    are partial or were merged; every other bucket covers the full interval.
+    """
+
+    __slots__ = ('unit', 'values', 'weights', 'parts')
+
+    def __init__(self):
+        self.unit = None
+        self.values = []
+        self.weights = {}
+        self.parts = []
+
+    def add(self, metric, first, step, lo, hi, final, origin, aggregation):
+        """Place one sub-response's values, whose buckets start at first, every step seconds"""
+        if self.unit is None:
+            self.unit = metric.get('unit')
+        values = metric.get('values') or []
+
+        def weight(position):
+            moment = first + position * step
+            return step if moment >= hi else min(moment + step, hi) - max(moment, lo)
+
+        # Drop buckets outside [lo, hi): leading ones, and inclusive end points
+        # except in the last sub-request
+        begin, stop = 0, len(values)
+        while begin < stop and first + (begin + 1) * step <= lo:
+            begin += 1
+        if not final:
+            while stop > begin and first + (stop - 1) * step >= hi:
+                stop -= 1
+        slot = math.floor((first + begin * step - origin) / step + 1e-9)
+
+        # Buckets another sub-request already filled are merged one by one;
+        # the rest are appended in one go
+        shared = max(0, min(len(self.values) - slot, stop - begin))
+        for offset in range(shared):
+            self._merge(slot + offset, values[begin + offset], weight(begin + offset), step, aggregation)
+        if slot > len(self.values):
+            self.values += [None] * (slot - len(self.values))
+        self.values += values[begin + shared:stop]
+        for position in {begin + shared, stop - 1}:
+            if begin + shared <= position < stop and weight(position) < step:
+                self.weights[slot + position - begin] = weight(position)
+        if metric.get('aggregates'):
+            self.parts.append((len(values) - values.count(None), metric['aggregates']))
+
+    def _merge(self, slot, value, weight, step, aggregation):
+        if value is None:
+            return
+        current = self.values[slot]
+        if current is None:
+            self.values[slot] = value
+            self.weights[slot] = weight
+            return
+        covered = self.weights.get(slot, step)
+        combine = MERGE.get(aggregation)
+        if combine is not None:
+            self.values[slot] = combine(current, value)
+        else:
+            self.values[slot] = (current * covered + value * weight) / (covered + weight)
+        self.weights[slot] = covered + weight
+
+    def render(self, length):
+        metric = {'unit': self.unit, 'values': self.values + [None] * (length - len(self.values))}
+        if self.unit is None:
+            del metric['unit']
+        aggregates = merge_aggregates(self.parts)
+        if aggregates:
+            metric['aggregates'] = aggregates
+        return metric
+
+
+def merge_aggregates(parts):
+    """TimeSeriesAggregates of a whole series from (non-null count, aggregates) per part"""
+    merged = {}
+    mins = [part['min'] for _, part in parts if part.get('min') is not None]
+    maxes = [part['max'] for _, part in parts if part.get('max') is not None]
+    means = [(count, part['avg']) for count, part in parts if part.get('avg') is not None and count]
+    if mins:
+        merged['min'] = min(mins)
+    if means:
+        merged['avg'] = sum(count * avg for count, avg in means) / sum(count for count, _ in means)
+    if maxes:
+        merged['max'] = max(maxes)
+    return merged
+
+
+def stitch(plan, responses):
+    """One TimeSeriesResponse from the sub-responses of a plan, in plan order"""
+    if len(responses) != len(plan.chunks):
+        raise ValueError(f"Expected {len(plan.chunks)} responses, got {len(responses)}")
+    origin = (plan.start // plan.interval) * plan.interval
+    entities = {}
+    for index, ((lo, hi), response) in enumerate(zip(plan.chunks, responses)):
+        meta = (response or {}).get('meta') or {}
+        data = (response or {}).get('data') or {}
+        first = epoch(meta['start_time']) if meta.get('start_time') else lo
+        step = parse_duration(meta['interval']) if meta.get('interval') else plan.interval
+        if abs(step - plan.interval) > 1e-6:
+            raise ValueError(f"Sub-request {index} came back every {meta['interval']}, "
+                             f"planned {format_duration(plan.interval)}")
+        final = index == len(plan.chunks) - 1
+        for response_key, (_, key_fields) in LEVELS.items():
+            records = data.get(response_key)
+            if records is None:
+                continue
+            for record in ([records] if isinstance(records, dict) else records):
+                key = (response_key, tuple(record.get(field) for field in key_fields))
+                entity = entities.setdefault(key, {})
+                for name, value in record.items():
+                    if isinstance(value, dict) and 'values' in value:
+                        series = entity.get(name)
+                        if not isinstance(series, _Series):
+                            series = entity[name] = _Series()
+                        series.add(value, first, step, lo, hi, final, origin, plan.aggregation)
+                    else:
+                        entity.setdefault(name, value)
+
+    length = max((len(value.values) for entity in entities.values() for value in entity.values()
+                  if isinstance(value, _Series)), default=0)
+    data = {}
+    for (response_key, _), entity in entities.items():
+        record = {name: value.render(length) if isinstance(value, _Series) else value
+                  for name, value in entity.items()}
+        if response_key == 'miner':
+            data['miner'] = record
+        else:
+            data.setdefault(response_key, []).append(record)
+    meta = {
+        'start_time': isoformat(plan.start),
+        'end_time': isoformat(plan.end),
+        'interval': format_duration(plan.interval),
+        'levels': plan.query.get('levels'),
+        'aggregation': plan.aggregation,
+    }
+    return {'meta': meta, 'data': data}
+
+
+def fetch(client, query, **options):
+    """Run a planned query on a generated Client, one sub-request at a time"""
+    planned = plan(query, **options)
+    responses = [client.transport.request('POST', '/api/v1/timeseries', body=request)
+                 for request in planned.requests]
+    return stitch(planned, responses)
+
+
+async def run_plan_async(transport, planned):
+    """Sub-responses of a plan, requested concurrently on an AsyncTransport"""
+    return await asyncio.gather(*(transport.request('POST', '/api/v1/timeseries', body=request)
+                                  for request in planned.requests))
+
+
+async def fetch_async(client, query, **options):
+    """Run a planned query on a generated AsyncClient, sub-requests in parallel
+
+    Parallelism is bounded by the transport's max_connections.
+    """
+    planned = plan(query, **options)
+    return stitch(planned, await run_plan_async(client.transport, planned))
+
+
+# -- benchmark -------------------------------------------------------------
+
+def _stub_value(entity, field, bucket):
+    """Deterministic value (or None) of a series at a bucket"""
+    mixed = (bucket * 2654435761 + entity * 40503 + field * 9973) % 1000
+    return None if mixed < 7 else round(50 + mixed / 20, 3)
+
+
+def _stub_response(request, shape, scan_rate):
+    """A TimeSeriesResponse for any TimeSeriesRequest, with buckets aligned to the epoch"""
+    start, end = time_range(request)
+    interval = parse_duration(request.get('interval') or 'PT5M')
+    buckets = range(int(start // interval), math.ceil(end / interval))
+    aggregation = request.get('aggregation') or 'mean'
+    points = 0
+
+    def metrics(entity, fields):
+        record = {}
+        for number, field in enumerate(fields):
+            values = [_stub_value(entity, number, bucket) for bucket in buckets]
+            present = [value for value in values if value is not None]
+            record[field] = {'unit': '', 'values': values}
+            if present:
+                record[field]['aggregates'] = {'min': min(present), 'avg': sum(present) / len(present),
+                                               'max': max(present)}
+        return record
+
+    data = {}
+    for level in request['levels']:
+        fields, indexes = level['fields'], level.get('indexes')
+        if level['type'] == 'miner':
+            data['miner'] = metrics(0, fields)
+        elif level['type'] == 'asic':
+            data['asics'] = [{'index': asic, 'hashboard_index': board, **metrics(1000 + board * 1000 + asic, fields)}
+                             for board in range(shape['hashboard'])
+                             for asic in (indexes if indexes is not None else range(shape['asic']))]
+        else:
+            key = 'hashboards' if level['type'] == 'hashboard' else 'PSUs'
+            base = 100 if key == 'hashboards' else 200
+            data[key] = [{'index': item, **metrics(base + item, fields)}
+                         for item in (indexes if indexes is not None else range(shape[level['type']]))]
+        points += series_count([level], shape) * len(buckets)
+    meta = {'start_time': isoformat(buckets.start * interval), 'end_time': isoformat(end),
+            'interval': format_duration(interval), 'levels': request['levels'], 'aggregation': aggregation}
+    body = json.dumps({'meta': meta, 'data': data}, separators=(',', ':')).encode('utf-8')
+    return body, points / scan_rate
+
+
+def _serve_stub(port, shape, scan_rate, ready):
+    """Keep-alive HTTP/1.1 stub miner answering POST /api/v1/timeseries
+
+    Each response waits points / scan_rate seconds, standing in for the
+    miner's own query time, before it is sent.
+    """
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                length = int(next((line.split(b':', 1)[1] for line in head.split(b'\r\n')
+                                   if line.lower().startswith(b'content-length:')), b'0'))
+                request = json.loads(await reader.readexactly(length))
+                body, delay = _stub_response(request, shape, scan_rate)
+                await asyncio.sleep(delay)
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: '
+                             + str(len(body)).encode() + b'\r\n\r\n' + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, '127.0.0.1', port)
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def _same(stitched, single):
+    """Whether two responses carry the same series (aggregates to rounding)"""
+    def close(a, b):
+        if isinstance(a, dict) and isinstance(b, dict):
+            return a.keys() == b.keys() and all(close(a[key], b[key]) for key in a)
+        if isinstance(a, list) and isinstance(b, list):
+            return len(a) == len(b) and all(close(x, y) for x, y in zip(a, b))
+        if isinstance(a, float) or isinstance(b, float):
+            return a is not None and b is not None and math.isclose(a, b, rel_tol=1e-9)
+        return a == b
+    return close(stitched['data'], single['data'])
+
+
+def benchmark(days=5.0, interval='PT1M', scan_rate=1_000_000, max_points=DEFAULT_MAX_POINTS, port=18490,
+              shape=None, timeout=None):
+    """One request for the whole range vs. the planned sub-requests, both with the same deadline"""
+    from proto_http import DEFAULT_TIMEOUT, AsyncTransport
+
+    timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+
+    shape = {**DEFAULT_SHAPE, **(shape or {})}
+    query = {'start_time': '2024-01-10T00:00:00Z', 'duration': format_duration(days * 86400), 'interval': interval,
+             'levels': [{'type': 'miner', 'fields': ['hashrate', 'temperature']},
+                        {'type': 'asic', 'fields': ['hashrate', 'temperature']}],
+             'aggregation': 'mean'}
+    planned = plan(query, max_points=max_points, shape=shape)
+
+    context = multiprocessing.get_context('spawn')
+    ready = context.Event()
+    server = context.Process(target=_serve_stub, args=(port, shape, scan_rate, ready), daemon=True)
+    server.start()
+    ready.wait(10)
+    url = f"http://127.0.0.1:{port}"
+    results = {'points': planned.points, 'requests': len(planned.chunks), 'timeout_s': timeout}
+
+    async def single(timeout):
+        transport = AsyncTransport(url, timeout=timeout)
+        try:
+            start = time.perf_counter()
+            response = await transport.request('POST', '/api/v1/timeseries', body=query)
+            return response, time.perf_counter() - start
+        finally:
+            await transport.close()
+
+    async def chunked():
+        transport = AsyncTransport(url, timeout=timeout)
+        try:
+            start = time.perf_counter()
+            responses = await run_plan_async(transport, planned)
+            fetched = time.perf_counter()
+            stitched = stitch(planned, responses)
+            return responses, stitched, time.perf_counter() - start, time.perf_counter() - fetched
+        finally:
+            await transport.close()
+
+    try:
+        try:
+            asyncio.run(single(timeout))
+            results['single_timed_out'] = False
+        except TimeoutError:
+            results['single_timed_out'] = True
+        whole, results['single_s'] = asyncio.run(single(600))
+        results['single_bytes'] = len(json.dumps(whole, separators=(',', ':')))
+        responses, stitched, results['planned_s'], results['stitch_s'] = asyncio.run(chunked())
+        results['largest_bytes'] = max(len(json.dumps(response, separators=(',', ':'))) for response in responses)
+        if not _same(stitched, whole):
+            raise AssertionError("Stitched response differs from the single request")
+    finally:
+        server.terminate()
+    return results
+
+
+def _load_query(text):
+    """A TimeSeriesRequest from inline JSON or a JSON file"""
+    if text.lstrip().startswith('{'):
+        return json.loads(text)
+    with open(text, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('query', nargs='?', help='TimeSeriesRequest as a JSON file or inline JSON')
+    parser.add_argument('--url', help='miner to run the plan against (otherwise the plan is printed)')
+    parser.add_argument('--token', help='bearer token for --url')
+    parser.add_argument('-o', '--output', help='write the stitched TimeSeriesResponse here')
+    parser.add_argument('--resolution', type=int, default=DEFAULT_RESOLUTION,
+                        help=f'target points per series when the query has no interval (default: {DEFAULT_RESOLUTION})')
+    parser.add_argument('--max-points', type=int, default=DEFAULT_MAX_POINTS,
+                        help=f'values per sub-request (default: {DEFAULT_MAX_POINTS})')
+    parser.add_argument('--max-bytes', type=int, default=DEFAULT_MAX_BYTES,
+                        help=f'estimated response bytes per sub-request (default: {DEFAULT_MAX_BYTES})')
+    parser.add_argument('--asics', type=int, default=DEFAULT_SHAPE['asic'],
+                        help='ASICs per hashboard, for sizing ASIC-level queries')
+    parser.add_argument('--benchmark', action='store_true', help='one request vs. planned sub-requests on a stub')
+    parser.add_argument('--days', type=float, default=5.0, help='benchmark range in days')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(days=args.days, max_points=args.max_points, shape={'asic': args.asics})
+        print(f"📊 {result['points']:,} points, {args.days:g} days of ASIC data every minute")
+        outcome = (f"timed out at the {result['timeout_s']:g} s deadline" if result['single_timed_out']
+                   else f"within the {result['timeout_s']:g} s deadline")
+        print(f"   - single request   {result['single_s']:6.2f} s, {result['single_bytes'] / 1e6:6.1f} MB response, "
+              f"{outcome}")
+        print(f"   - planned ({result['requests']:>3})    {result['planned_s']:6.2f} s, "
+              f"{result['largest_bytes'] / 1e6:6.1f} MB largest response, stitched in {result['stitch_s']:.2f} s")
+        print("✅ Stitched series match the single response")
+        return True
+
+    if not args.query:
+        parser.error('a query or --benchmark is required')
+    query = _load_query(args.query)
+    options = {'resolution': args.resolution, 'max_points': args.max_points, 'max_bytes': args.max_bytes,
+               'shape': {'asic': args.asics}}
+    planned = plan(query, **options)
+    if not args.url:
+        print(f"📊 {planned!r}, about {planned.points:,} points")
+        for request in planned.requests:
+            print(f"   {request['start_time']} .. {request['end_time']}")
+        return True
+
+    from proto_client import AsyncClient, BearerAuth
+
+    async def run():
+        async with AsyncClient(args.url, auth=BearerAuth(args.token) if args.token else None) as client:
+            return await fetch_async(client, query, **options)
+
+    start = time.perf_counter()
+    response = asyncio.run(run())
+    print(f"✅ {len(planned.chunks)} requests stitched in {time.perf_counter() - start:.2f} s")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(response, f, separators=(',', ':'))
+    else:
+        print(json.dumps(response['meta']))
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Streaming decoder for large TimeSeriesResponse and TelemetryData bodies
+- Yields one hashboard, ASIC or PSU block at a time as the bytes arrive, so
+  aggregation starts before the body is complete and memory stays bounded
+  by one block instead of the whole document
+- Block arrays come from the spec: arrays of indexed objects (items with an
+  'index' property) under the response schema; every other top-level value
+  (meta, miner, timestamp) is yielded whole
+- Works with the chunked stream() of the generated clients' transports
+- --benchmark: peak RSS and time-to-first-block against a full json.loads,
+  over a throttled local link
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import re
+import resource
+import sys
+import time
+
+from proto_http import Transport
+
+# A complete string token, a lone quote (string still arriving) or a structural
+# character; numbers and literals are skipped over at C speed
+TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|"|[\[\]{},:]')
+# Inside a block only nesting matters, so commas and colons are skipped too
+NESTED = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|"|[\[\]{}]')
+QUOTE, COMMA, COLON = ord('"'), ord(','), ord(':')
+OPEN = (ord('{'), ord('['))
+
+SCHEMAS = {
+    'timeseries': ('TimeSeriesResponse', 'POST', '/api/v1/timeseries'),
+    'telemetry': ('TelemetryData', 'GET', '/api/v1/telemetry'),
+}
+
+_layouts = {}
+
+
+def block_layout(schema='TimeSeriesResponse', spec=None):
+    """(block arrays, containers) as tuples of JSON keys for one response schema
+
+    Block arrays hold indexed objects and are split per element; containers
+    are the objects on the way to them. Anything else is a whole block.
+    """
+    default = spec is None
+    if default and schema in _layouts:
+        return _layouts[schema]
+    from spec_refs import RefGraph
+    if default:
+        from spec_pipeline import load_spec
+        spec, _ = load_spec()
+    root = RefGraph(spec).inline(schema)
+    arrays = set()
+
+    def walk(node, path):
+        for key, prop in node.get('properties', {}).items():
+            items = prop.get('items', {})
+            if prop.get('type') == 'array' and 'index' in items.get('properties', {}):
+                arrays.add(path + (key,))
+            elif prop.get('type', 'object') == 'object' and 'properties' in prop:
+                walk(prop, path + (key,))
+
+    walk(root, ())
+    containers = {array[:depth] for array in arrays for depth in range(len(array))} | {()}
+    layout = (frozenset(arrays), frozenset(containers))
+    if default:
+        _layouts[schema] = layout
+    return layout
+
+
+class Block:
+    """One decoded piece of a response
+
+    kind is the JSON key it sits under ('asics', 'hashboards', 'meta', ...);
+    position is its index within a block array, None for whole values.
+    """
+
+    __slots__ = ('kind', 'position', 'value')
+
+    def __init__(self, kind, position, value):
+        self.kind = kind
+        self.position = position
+        self.value = value
+
+    def __repr__(self):
+        where = '' if self.position is None else f"[{self.position}]"
+        return f"Block({self.kind}{where})"
+
+
+class StreamDecoder:
+    """Incremental decoder: feed() bytes as they arrive, get finished blocks back
+
+    Only the unfinished block (plus at most one chunk) is buffered. Values
+    inside a block are decoded with json.loads once the block is complete.
+    """
+
+    def __init__(self, schema='TimeSeriesResponse', spec=None, layout=None):
+        self._arrays, self._containers = layout or block_layout(schema, spec)
+        self._buffer = b''
+        self._pos = 0
+        # [is object, current key] per open container
+        self._frames = []
+        self._expect_key = False
+        # [start offset, nesting depth, kind, position] while inside a block
+        self._capture = None
+        self._counts = {}
+        self.done = False
+        self.bytes = 0
+
+    def feed(self, chunk):
+        """Blocks completed by chunk, in document order"""
+        self.bytes += len(chunk)
+        buffer = self._buffer = self._buffer + chunk if self._buffer else bytes(chunk)
+        pos = self._pos
+        blocks = []
+        while not self.done:
+            capture = self._capture
+            match = (NESTED if capture is not None and capture[1] else TOKEN).search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            start, pos = match.span()
+            char = buffer[start]
+            if char == QUOTE:
+                if pos - start == 1:
+                    # The string is split across chunks; rescan it next time
+                    pos = start
+                    break
+                if capture is None and self._expect_key:
+                    self._frames[-1][1] = json.loads(buffer[start:pos])
+                    self._expect_key = False
+                continue
+            if capture is not None:
+                if char in OPEN:
+                    capture[1] += 1
+                    continue
+                if capture[1]:
+                    capture[1] -= 1
+                    continue
+                if char == COLON:
+                    continue
+                # A comma or the enclosing bracket ends the block
+                text = buffer[capture[0]:start].strip()
+                if text:
+                    blocks.append(Block(capture[2], capture[3], json.loads(text)))
+                self._capture = None
+            self._structural(char, pos)
+
+        keep = self._capture[0] if self._capture is not None else pos
+        if keep:
+            self._buffer = buffer[keep:]
+            if self._capture is not None:
+                self._capture[0] = 0
+            pos -= keep
+        self._pos = pos
+        return blocks
+
+    def _structural(self, char, pos):
+        frames = self._frames
+        if char == ord('{'):
+            frames.append([True, None])
+            self._expect_key = True
+        elif char == ord('['):
+            path = tuple(frame[1] for frame in frames)
+            frames.append([False, None])
+            self._start(path, pos)
+        elif char == COLON:
+            path = tuple(frame[1] for frame in frames)
+            if path not in self._containers and path not in self._arrays:
+                self._capture = [pos, 0, path[-1], None]
+        elif char == COMMA:
+            if frames[-1][0]:
+                self._expect_key = True
+            else:
+                self._start(tuple(frame[1] for frame in frames[:-1]), pos)
+        else:
+            frames.pop()
+            self._expect_key = False
+            if not frames:
+                self.done = True
+
+    def _start(self, path, pos):
+        if path not in self._arrays:
+            raise ValueError(f"Unexpected array at {'.'.join(path) or 'top level'}")
+        position = self._counts.get(path, 0)
+        self._counts[path] = position + 1
+        self._capture = [pos, 0, path[-1], position]
+
+    def close(self):
+        """Raise ValueError when the body ended before the document did"""
+        if not self.done:
+            raise ValueError(f"Truncated response after {self.bytes} bytes")
+
+
+def split_document(document, schema='TimeSeriesResponse', spec=None, layout=None):
+    """The blocks of an already parsed document, in the order stream() yields them"""
+    arrays, containers = layout or block_layout(schema, spec)
+
+    def walk(node, path):
+        for key, value in node.items():
+            here = path + (key,)
+            if here in arrays:
+                for position, item in enumerate(value):
+                    yield Block(key, position, item)
+            elif here in containers and isinstance(value, dict):
+                yield from walk(value, here)
+            else:
+                yield Block(key, None, value)
+
+    return walk(document, ())
+
+
+def iter_blocks(chunks, schema='TimeSeriesResponse', spec=None, layout=None):
+    """Blocks from an iterable of body chunks"""
+    decoder = StreamDecoder(schema, spec, layout)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    decoder.close()
+
+
+async def iter_blocks_async(chunks, schema='TimeSeriesResponse', spec=None, layout=None):
+    """Blocks from an async iterable of body chunks"""
+    decoder = StreamDecoder(schema, spec, layout)
+    async for chunk in chunks:
+        for block in decoder.feed(chunk):
+            yield block
+    decoder.close()
+
+
+def stream_timeseries(client, request):
+    """POST /api/v1/timeseries with a generated Client, block by block"""
+    return iter_blocks(client.transport.stream('POST', '/api/v1/timeseries', body=request),
+                       'TimeSeriesResponse')
+
+
+def stream_telemetry(client, level=None):
+    """GET /api/v1/telemetry with a generated Client, block by block"""
+    return iter_blocks(client.transport.stream('GET', '/api/v1/telemetry', {'level': level}),
+                       'TelemetryData')
+
+
+def stream_timeseries_async(client, request):
+    """POST /api/v1/timeseries with a generated AsyncClient, block by block"""
+    return iter_blocks_async(client.transport.stream('POST', '/api/v1/timeseries', body=request),
+                             'TimeSeriesResponse')
+
+
+def stream_telemetry_async(client, level=None):
+    """GET /api/v1/telemetry with a generated AsyncClient, block by block"""
+    return iter_blocks_async(client.transport.stream('GET', '/api/v1/telemetry', {'level': level}),
+                             'TelemetryData')
+
+
+# -- benchmark -------------------------------------------------------------
+
+def synthetic_telemetry(hashboards=3, asics=126, psus=2, seed=11):
+    """A TelemetryData body with ASIC-level data, as bytes"""
+    import random
+    rng = random.Random(seed)
+
+    def metric_array(unit, base):
+        return {'unit': unit, 'values': [round(base + rng.gauss(0, base * 0.02), 3) for _ in range(asics)]}
+
+    body = {
+        'timestamp': '2024-01-15T14:30:00Z',
+        'miner': {'hashrate': {'value': 100.0 * hashboards, 'unit': 'TH/s'},
+                  'temperature': {'value': 65.5, 'unit': '°C'},
+                  'power': {'value': 3200, 'unit': 'W'},
+                  'efficiency': {'value': 33.9, 'unit': 'J/TH'}},
+        'hashboards': [{
+            'index': board, 'serial_number': f"HB{board:06d}",
+            'hashrate': {'value': 100.0, 'unit': 'TH/s'},
+            'temperature': {'unit': '°C', 'inlet': 45.0, 'outlet': 65.0, 'average': 56.0},
+            'power': {'value': 1080, 'unit': 'W'},
+            'efficiency': {'value': 33.9, 'unit': 'J/TH'},
+            'asics': {'hashrate': metric_array('TH/s', 100.0 / asics),
+                      'temperature': metric_array('°C', 72.0)},
+        } for board in range(hashboards)],
+        'PSUs': [{'index': psu, 'serial_number': f"PSU{psu:05d}",
+                  'voltage': {'unit': 'V', 'input': 240.0, 'output': 12.1},
+                  'current': {'unit': 'A', 'input': 14.5, 'output': 268.6},
+                  'power': {'unit': 'W', 'input': 3480, 'output': 3250},
+                  'temperature': {'unit': '°C', 'hotspot': 65.5, 'ambient': 45.2, 'average': 55.4}}
+                 for psu in range(psus)],
+    }
+    return json.dumps(body, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _serve_throttled(port, body, rate, ready):
+    """Keep-alive HTTP/1.1 server sending body at rate bytes/s"""
+    head = (b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+            b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n')
+    piece = 16384
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                request = await reader.readuntil(b'\r\n\r\n')
+                length = re.search(rb'(?i)\r\ncontent-length: *(\d+)', request)
+                if length:
+                    await reader.readexactly(int(length.group(1)))
+                writer.write(head)
+                start = time.perf_counter()
+                for offset in range(0, len(body), piece):
+                    writer.write(body[offset:offset + piece])
+                    await writer.drain()
+                    delay = start + (offset + piece) / rate - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, '127.0.0.1', port)
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def _consume(value):
+    """Stand-in for downstream aggregation: the mean of every values array"""
+    if isinstance(value, dict):
+        present = [v for v in value.get('values') or () if isinstance(v, (int, float))]
+        means = [sum(present) / len(present)] if present else []
+        for item in value.values():
+            if isinstance(item, dict):
+                means.extend(_consume(item))
+        return means
+    return []
+
+
+def _peak_rss_kb():
+    """High-water RSS of this process; ru_maxrss survives exec, VmHWM does not"""
+    try:
+        with open('/proc/self/status') as status:
+            return int(re.search(r'VmHWM:\s*(\d+)', status.read()).group(1))
+    except (OSError, AttributeError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure(mode, url, method, path, query, body, layout, results):
+    """Run in a fresh interpreter so ru_maxrss belongs to this decode alone"""
+    transport = Transport(url, timeout=60)
+    baseline = _peak_rss_kb()
+    first = None
+    count = 0
+    start = time.perf_counter()
+    if mode == 'full':
+        document = json.loads(transport.request(method, path, query, body, raw=True))
+        blocks = split_document(document, layout=layout)
+    else:
+        blocks = iter_blocks(transport.stream(method, path, query, body), layout=layout)
+    for block in blocks:
+        _consume(block.value)
+        count += 1
+        if first is None and block.position is not None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    peak = _peak_rss_kb()
+    transport.close()
+    results.put({'mode': mode, 'blocks': count, 'first_s': first, 'total_s': total,
+                 'peak_rss_kb': peak - baseline})
+
+
+def benchmark(payload='timeseries', rate_mbit=100.0, repeat=3, port=18480, **shape):
+    """Peak RSS and time-to-first-block: streaming vs. a full json.loads"""
+    import statistics
+    from timeseries_columnar import synthetic_response
+
+    schema, method, path = SCHEMAS[payload]
+    if payload == 'timeseries':
+        body = synthetic_response(**shape)
+        query, request = None, {'levels': [{'type': 'asic', 'fields': ['hashrate', 'temperature']}]}
+    else:
+        body = synthetic_telemetry(**shape)
+        query, request = {'level': 'asic'}, None
+    layout = block_layout(schema)
+    streamed = list(iter_blocks([body[i:i + 1000] for i in range(0, len(body), 1000)], layout=layout))
+    parsed = list(split_document(json.loads(body), layout=layout))
+    if [(b.kind, b.position, b.value) for b in streamed] != [(b.kind, b.position, b.value) for b in parsed]:
+        raise AssertionError("Streamed blocks differ from the parsed document")
+
+    context = multiprocessing.get_context('spawn')
+    ready = context.Event()
+    server = context.Process(target=_serve_throttled, args=(port, body, rate_mbit * 125000, ready), daemon=True)
+    server.start()
+    ready.wait(10)
+    results = {'payload': payload, 'body_bytes': len(body), 'blocks': len(parsed), 'rate_mbit': rate_mbit}
+    try:
+        for mode in ('full', 'stream'):
+            runs = []
+            for _ in range(repeat):
+                queue = context.Queue()
+                worker = context.Process(target=_measure, args=(mode, f"http://127.0.0.1:{port}", method, path,
+                                                                query, request, layout, queue))
+                worker.start()
+                worker.join()
+                if worker.exitcode:
+                    raise RuntimeError(f"{mode} run exited with {worker.exitcode}")
+                runs.append(queue.get())
+            results[mode] = {key: statistics.median(run[key] for run in runs)
+                             for key in ('first_s', 'total_s', 'peak_rss_kb')}
+    finally:
+        server.terminate()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('response', nargs='?', help='a saved response body to decode block by block')
+    parser.add_argument('--schema', choices=sorted(SCHEMAS), default='timeseries',
+                        help='response schema of the body (default: timeseries)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare peak RSS and time-to-first-block with a full json.loads')
+    parser.add_argument('--rate', type=float, default=100.0, help='benchmark link speed in Mbit/s')
+    parser.add_argument('--asics', type=int, default=126, help='benchmark ASICs per hashboard')
+    parser.add_argument('--points', type=int, default=1440, help='benchmark points per timeseries metric')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        shape = {'asics': args.asics}
+        if args.schema == 'timeseries':
+            shape['points'] = args.points
+        result = benchmark(args.schema, args.rate, **shape)
+        print(f"📊 {result['payload']}: {result['body_bytes'] / 1024:,.0f} KiB, {result['blocks']} blocks, "
+              f"served at {result['rate_mbit']:g} Mbit/s")
+        for mode, label in (('full', 'json.loads'), ('stream', 'streaming')):
+            run = result[mode]
+            print(f"   - {label:<10} first block {run['first_s'] * 1000:7.1f} ms, "
+                  f"all blocks {run['total_s'] * 1000:7.1f} ms, peak RSS +{run['peak_rss_kb'] / 1024:6.1f} MB")
+        return True
+
+    if not args.response:
+        parser.error('a response file or --benchmark is required')
+    schema = SCHEMAS[args.schema][0]
+    counts = {}
+    with open(args.response, 'rb') as body:
+        for block in iter_blocks(iter(lambda: body.read(65536), b''), schema):
+            counts[block.kind] = counts.get(block.kind, 0) + 1
+    print(f"✅ Decoded {sum(counts.values())} blocks: "
+          + ', '.join(f"{count} {kind}" for kind, count in counts.items()))
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -4,56 +4,30 @@ Update the /api/v1/hardware endpoint to include the Fans tag
 This allows the endpoint to appear under the Fans section in the API docs
 """
 
-import json
 import sys
 from pathlib import Path
 
+from spec_backup_store import BackupStore
+from spec_pipeline import SpecPipeline, add_operation_tag
+
 def update_fans_endpoint():
     """Add Fans tag to /api/v1/hardware endpoint"""
     
     spec_path = Path(__file__).parent / 'spec.json'
+    store = BackupStore()
     
-    # Read current spec
     print(f"Reading spec from: {spec_path}")
-    with open(spec_path, 'r') as f:
-        spec = json.load(f)
-    
-    # Create backup
-    backup_path = spec_path.with_suffix('.json.backup.fans-update')
-    print(f"Creating backup at: {backup_path}")
-    with open(backup_path, 'w') as f:
-        json.dump(spec, f, indent=2)
-    
-    # Check if /api/v1/hardware exists
-    if '/api/v1/hardware' not in spec['paths']:
-        print("❌ Error: /api/v1/hardware endpoint not found")
-        return False
-    
-    # Get the endpoint
-    hardware_endpoint = spec['paths']['/api/v1/hardware']
-    
-    # Update GET method tags
-    if 'get' in hardware_endpoint:
-        current_tags = hardware_endpoint['get'].get('tags', [])
-        print(f"\nCurrent tags for GET /api/v1/hardware: {current_tags}")
-        
-        # Add Fans tag if not already present
-        if 'Fans' not in current_tags:
-            # Add Fans tag while keeping existing tags
-            hardware_endpoint['get']['tags'] = current_tags + ['Fans']
-            print(f"Updated tags: {hardware_endpoint['get']['tags']}")
-        else:
-            print("Fans tag already present")
+    pipeline = SpecPipeline([add_operation_tag('/api/v1/hardware', 'get', 'Fans')])
+    result = pipeline.run(spec_path, store=store)
     
-    # Write updated spec
-    print(f"\nWriting updated spec to: {spec_path}")
-    with open(spec_path, 'w') as f:
-        json.dump(spec, f, indent=2)
+    if not result['changes']:
+        print("Fans tag already present")
+        return True
     
     print("\n✅ Successfully updated /api/v1/hardware endpoint")
-    print(f"   - Added 'Fans' tag to GET /api/v1/hardware")
-    print(f"   - Tags now: {hardware_endpoint['get']['tags']}")
-    print(f"   - Backup saved to: {backup_path.name}")
+    for change in result['changes']:
+        print(f"   - {change}")
+    print(f"   - Backup saved to: {store.path.name}/ ({store.versions()[-1]['id']})")
     
     return True
 
@@ -1,12 +1,8 @@
 #!/usr/bin/env python3
-import json
+from spec_pipeline import SpecPipeline, replace_tags
 
-# Read the current spec.json
-with open('spec.json', 'r') as f:
-    spec = json.load(f)
-
-# New tags data
-new_tags = [
+# Tag definitions for the docs site (also used by update_to_v1_7_2.py)
+TAGS = [
     {
       "name": "Mining",
       "description": "The mining endpoint group allows for control and configuration of mining functionality."
@@ -85,12 +81,9 @@ new_tags = [
     }
 ]
 
-# Update only the tags section
-spec['tags'] = new_tags
-
-# Write the updated spec back to spec.json
-with open('spec.json', 'w') as f:
-    json.dump(spec, f, indent=2)
+if __name__ == '__main__':
+    # Update only the tags section
+    SpecPipeline([replace_tags(TAGS)]).run('spec.json')
 
-print("✅ Successfully updated tags in spec.json")
-print(f"✅ Updated {len(new_tags)} tag definitions")
+    print("✅ Successfully updated tags in spec.json")
+    print(f"✅ Updated {len(TAGS)} tag definitions")